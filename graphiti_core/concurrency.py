@@ -0,0 +1,215 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import os
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DB_POOL = 'db'
+LLM_POOL = 'llm'
+EMBEDDER_POOL = 'embedder'
+RERANKER_POOL = 'reranker'
+
+_DEFAULT_LIMIT = int(os.getenv('SEMAPHORE_LIMIT', 20))
+DEFAULT_POOL_LIMITS = {
+    DB_POOL: int(os.getenv('DB_CONCURRENCY_LIMIT', _DEFAULT_LIMIT)),
+    LLM_POOL: int(os.getenv('LLM_CONCURRENCY_LIMIT', _DEFAULT_LIMIT)),
+    EMBEDDER_POOL: int(os.getenv('EMBEDDER_CONCURRENCY_LIMIT', _DEFAULT_LIMIT)),
+    RERANKER_POOL: int(os.getenv('RERANKER_CONCURRENCY_LIMIT', _DEFAULT_LIMIT)),
+}
+
+
+class ConcurrencyPool:
+    """Named counting limiter shared by every gather that draws from it.
+
+    Waiters are plain futures rather than an asyncio.Semaphore so that a pool can be shared by
+    Graphiti instances running on different event loops.
+    """
+
+    def __init__(self, name: str, limit: int):
+        if limit <= 0:
+            raise ValueError(f'Concurrency limit for pool {name!r} must be positive')
+        self.name = name
+        self.limit = limit
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    async def acquire(self) -> None:
+        while self.in_flight >= self.limit:
+            waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass a wake-up this waiter can no longer use on to the next one
+                self._wake_next()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake_next()
+
+    def _wake_next(self) -> None:
+        if self.in_flight >= self.limit:
+            return
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+
+class KeyedLocks:
+    """Locks created on demand for string keys and dropped once no task holds or awaits them."""
+
+    def __init__(self):
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._users: dict[str, int] = {}
+
+    async def acquire(self, keys: Iterable[str]) -> list[str]:
+        """Acquire the locks of `keys` and return the keys held, to be passed to `release`.
+
+        Keys are locked in sorted order so that tasks locking overlapping keys cannot deadlock.
+        """
+        held: list[str] = []
+        try:
+            for key in sorted(set(keys)):
+                lock = self._locks.setdefault(key, asyncio.Lock())
+                self._users[key] = self._users.get(key, 0) + 1
+                try:
+                    await lock.acquire()
+                except BaseException:
+                    self._drop(key)
+                    raise
+                held.append(key)
+        except BaseException:
+            self.release(held)
+            raise
+        return held
+
+    def release(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._locks[key].release()
+            self._drop(key)
+
+    def _drop(self, key: str) -> None:
+        self._users[key] -= 1
+        if self._users[key] == 0:
+            del self._users[key]
+            del self._locks[key]
+
+
+@dataclass
+class _Slot:
+    governor: 'ConcurrencyGovernor'
+    pool: ConcurrencyPool
+    held: bool = False
+
+
+# The slot held by the current task, if it runs inside a governed gather
+_current_slot: ContextVar[_Slot | None] = ContextVar('graphiti_concurrency_slot', default=None)
+
+
+class ConcurrencyGovernor:
+    """Process-level concurrency budget split into named pools (db, llm, embedder, reranker).
+
+    `semaphore_gather` calls made with a governor, or nested inside one, draw their slots from
+    the same pools, so the total load on each backend stays bounded however deep the call tree
+    is. A task waiting on a nested gather lends its slot to its children while it waits, which
+    keeps nested gathers on the same pool from deadlocking.
+    """
+
+    def __init__(self, default_limit: int | None = None, limits: dict[str, int] | None = None):
+        self.default_limit = default_limit or _DEFAULT_LIMIT
+        self.pools: dict[str, ConcurrencyPool] = {}
+        pool_limits = (
+            {name: self.default_limit for name in DEFAULT_POOL_LIMITS}
+            if default_limit
+            else dict(DEFAULT_POOL_LIMITS)
+        )
+        pool_limits.update(limits or {})
+        for name, limit in pool_limits.items():
+            self.pools[name] = ConcurrencyPool(name, limit)
+
+    def pool(self, name: str) -> ConcurrencyPool:
+        if name not in self.pools:
+            self.pools[name] = ConcurrencyPool(name, self.default_limit)
+        return self.pools[name]
+
+    @asynccontextmanager
+    async def slot(self, pool_name: str) -> AsyncIterator[None]:
+        """Hold a slot of `pool_name` for the duration of the block."""
+        slot = _Slot(self, self.pool(pool_name))
+        await slot.pool.acquire()
+        slot.held = True
+        token = _current_slot.set(slot)
+        try:
+            yield
+        finally:
+            _current_slot.reset(token)
+            if slot.held:
+                slot.pool.release()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {
+            name: {
+                'limit': pool.limit,
+                'in_flight': pool.in_flight,
+                'peak_in_flight': pool.peak_in_flight,
+            }
+            for name, pool in self.pools.items()
+        }
+
+
+def get_current_governor() -> ConcurrencyGovernor | None:
+    """Return the governor of the governed gather the current task runs in, if any."""
+    slot = _current_slot.get()
+    return slot.governor if slot is not None else None
+
+
+@asynccontextmanager
+async def lend_current_slot() -> AsyncIterator[str | None]:
+    """Release the current task's slot while it waits on nested work, then take it back.
+
+    Yields the name of the lent pool so nested gathers can default to it.
+    """
+    slot = _current_slot.get()
+    if slot is None or not slot.held:
+        yield None
+        return
+
+    slot.pool.release()
+    slot.held = False
+    try:
+        yield slot.pool.name
+    finally:
+        await slot.pool.acquire()
+        slot.held = True
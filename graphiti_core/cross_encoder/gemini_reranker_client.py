@@ -18,6 +18,7 @@ import logging
 import re
 from typing import TYPE_CHECKING
 
+from ..concurrency import RERANKER_POOL
 from ..helpers import semaphore_gather
 from ..llm_client import LLMConfig, RateLimitError
 from .client import CrossEncoderClient
@@ -113,7 +114,8 @@ Provide only a number between 0 and 100 (no explanation, just the number):"""
                         ),
                     )
                     for prompt_messages in scoring_prompts
-                ]
+                ],
+                pool=RERANKER_POOL,
             )
 
             # Extract scores and create results
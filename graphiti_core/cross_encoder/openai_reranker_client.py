@@ -21,6 +21,7 @@ import numpy as np
 import openai
 from openai import AsyncAzureOpenAI, AsyncOpenAI
 
+from ..concurrency import RERANKER_POOL
 from ..helpers import semaphore_gather
 from ..llm_client import LLMConfig, OpenAIClient, RateLimitError
 from ..prompts import Message
@@ -93,7 +94,8 @@ class OpenAIRerankerClient(CrossEncoderClient):
                         top_logprobs=2,
                     )
                     for openai_messages in openai_messages_list
-                ]
+                ],
+                pool=RERANKER_POOL,
             )
 
             responses_top_logprobs = [
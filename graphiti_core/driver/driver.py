@@ -17,15 +17,25 @@ limitations under the License.
 import copy
 import logging
 import os
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Coroutine
+from collections.abc import Coroutine, Generator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
 from dotenv import load_dotenv
 
 from graphiti_core.driver.graph_operations.graph_operations import GraphOperationsInterface
+from graphiti_core.driver.query_stats import (
+    QueryStats,
+    QueryTemplateStats,
+    estimate_size,
+    find_caller,
+)
 from graphiti_core.driver.search_interface.search_interface import SearchInterface
+from graphiti_core.tracer import NoOpSpan, NoOpTracer, Tracer
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +54,14 @@ class GraphProvider(Enum):
     FALKORDB = 'falkordb'
     KUZU = 'kuzu'
     NEPTUNE = 'neptune'
+    MEMORY = 'memory'
+
+
+@dataclass
+class QueryObservation:
+    """Outcome of an observed round-trip, filled in by the driver before the block exits."""
+
+    rows: list[int] = field(default_factory=list)
 
 
 class GraphDriverSession(ABC):
@@ -79,11 +97,103 @@ class GraphDriver(ABC):
     default_group_id: str = ''
     search_interface: SearchInterface | None = None
     graph_operations_interface: GraphOperationsInterface | None = None
+    tracer: Tracer = NoOpTracer()
+    collect_query_stats: bool = True
+    _query_stats: QueryStats | None = None
+
+    @property
+    def query_stats(self) -> QueryStats:
+        if self._query_stats is None:
+            self._query_stats = QueryStats()
+        return self._query_stats
+
+    def set_tracer(self, tracer: Tracer) -> None:
+        """Set the tracer that receives a span for every round-trip to the database."""
+        self.tracer = tracer
+
+    def stats(self) -> dict[str, QueryTemplateStats]:
+        """Return a snapshot of the query counters, per query template, most total time first.
+
+        Each template carries its call count, errors, rows returned, parameter bytes sent and a
+        latency histogram, overall and broken down by the function that issued the query.
+        """
+        return self.query_stats.snapshot()
+
+    @contextmanager
+    def observe_queries(
+        self, queries: Sequence[tuple[str, Mapping[str, Any]]]
+    ) -> Generator[QueryObservation, None, None]:
+        """Time one round-trip carrying `queries` and record it in the stats and the tracer.
+
+        Drivers wrap the call to their client in this block and set the row count of each query
+        on the yielded observation. Queries sent together share the round-trip's latency.
+        """
+        observation = QueryObservation(rows=[0] * len(queries))
+        failed = False
+        start = time.perf_counter()
+        with self.tracer.start_span('db.query') as span:
+            try:
+                yield observation
+            except Exception as e:
+                failed = True
+                span.set_status('error', str(e))
+                span.record_exception(e)
+                raise
+            finally:
+                duration_ms = (time.perf_counter() - start) * 1000
+                traced = not isinstance(span, NoOpSpan)
+                # Walking the stack and sizing the params are only worth it when recorded
+                if self.collect_query_stats or traced:
+                    stats = self.query_stats
+                    caller = find_caller()
+                    params_bytes = [estimate_size(params) for _, params in queries]
+                    if self.collect_query_stats:
+                        stats.round_trips += 1
+                        for (query, _), rows, size in zip(
+                            queries, observation.rows, params_bytes, strict=True
+                        ):
+                            stats.record(
+                                query,
+                                duration_ms / len(queries),
+                                rows=rows,
+                                params_bytes=size,
+                                caller=caller,
+                                error=failed,
+                            )
+                    if traced:
+                        span.add_attributes(
+                            {
+                                'db.system': self.provider.value,
+                                'db.query.fingerprint': ','.join(
+                                    stats.fingerprint(query)[0] for query, _ in queries
+                                ),
+                                'db.query.count': len(queries),
+                                'db.query.caller': caller,
+                                'db.query.rows': sum(observation.rows),
+                                'db.query.params_bytes': sum(params_bytes),
+                                'db.query.duration_ms': duration_ms,
+                            }
+                        )
+
+    @contextmanager
+    def observe_query(
+        self, query: str, params: Mapping[str, Any]
+    ) -> Generator[QueryObservation, None, None]:
+        """Time a round-trip carrying a single query, as `observe_queries` does."""
+        with self.observe_queries([(query, params)]) as observation:
+            yield observation
 
     @abstractmethod
     def execute_query(self, cypher_query_: str, **kwargs: Any) -> Coroutine:
         raise NotImplementedError()
 
+    async def execute_queries(self, queries: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """Run independent queries and return their results in order.
+
+        The queries run one after another unless the driver can send them in one round-trip.
+        """
+        return [await self.execute_query(query, **params) for query, params in queries]
+
     @abstractmethod
     def session(self, database: str | None = None) -> GraphDriverSession:
         raise NotImplementedError()
@@ -99,8 +209,10 @@ class GraphDriver(ABC):
     def with_database(self, database: str) -> 'GraphDriver':
         """
         Returns a shallow copy of this driver with a different default database.
-        Reuses the same connection (e.g. FalkorDB, Neo4j).
+        Reuses the same connection (e.g. FalkorDB, Neo4j) and the same query stats.
         """
+        # Create the stats first so that the copy shares them
+        _ = self.query_stats
         cloned = copy.copy(self)
         cloned._database = database
 
@@ -17,15 +17,18 @@ limitations under the License.
 import asyncio
 import datetime
 import logging
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
     from falkordb import Graph as FalkorGraph
     from falkordb.asyncio import FalkorDB
+    from falkordb.asyncio.query_result import QueryResult
 else:
     try:
         from falkordb import Graph as FalkorGraph
         from falkordb.asyncio import FalkorDB
+        from falkordb.asyncio.query_result import QueryResult
     except ImportError:
         # If falkordb is not installed, raise an ImportError
         raise ImportError(
@@ -76,11 +79,70 @@ STOPWORDS = [
 ]
 
 
+class FalkorRecord(Mapping[str, Any]):
+    """A result row that looks its fields up by name instead of being copied into a dict.
+
+    Rows of one result share the same header index. Fields missing at the end of a row read as
+    None.
+    """
+
+    __slots__ = ('_index', '_row')
+
+    def __init__(self, index: dict[str, int], row: list[Any]):
+        self._index = index
+        self._row = row
+
+    def __getitem__(self, key: str) -> Any:
+        i = self._index[key]
+        return self._row[i] if i < len(self._row) else None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f'FalkorRecord({dict(self)!r})'
+
+
+def _result_records(result: QueryResult) -> tuple[list[FalkorRecord], list[str]]:
+    header = [h[1] for h in result.header]
+    index = {field_name: i for i, field_name in enumerate(header)}
+    return [FalkorRecord(index, row) for row in result.result_set], header
+
+
+async def _pipeline_queries(
+    graph: FalkorGraph, queries: list[tuple[str, dict[str, Any]]]
+) -> list[QueryResult]:
+    """Send queries to a graph in one round-trip and parse their results in order."""
+    pipeline = graph.client.connection.pipeline(transaction=False)
+    for query, params in queries:
+        params = cast(dict[str, Any], convert_datetimes_to_strings(dict(params)))
+        pipeline.execute_command(
+            'GRAPH.QUERY',
+            graph.name,
+            graph._build_params_header(params) + str(query),
+            '--compact',
+        )
+
+    responses = await pipeline.execute(raise_on_error=False)
+    results = []
+    for response in responses:
+        if isinstance(response, Exception):
+            raise response
+        result = QueryResult(graph)
+        await result.parse(response)
+        results.append(result)
+    return results
+
+
 class FalkorDriverSession(GraphDriverSession):
     provider = GraphProvider.FALKORDB
 
-    def __init__(self, graph: FalkorGraph):
+    def __init__(self, graph: FalkorGraph, driver: 'FalkorDriver'):
         self.graph = graph
+        self.driver = driver
 
     async def __aenter__(self):
         return self
@@ -100,13 +162,14 @@ class FalkorDriverSession(GraphDriverSession):
     async def run(self, query: str | list, **kwargs: Any) -> Any:
         # FalkorDB does not support argument for Label Set, so it's converted into an array of queries
         if isinstance(query, list):
-            for cypher, params in query:
-                params = convert_datetimes_to_strings(params)
-                await self.graph.query(str(cypher), params)  # type: ignore[reportUnknownArgumentType]
+            with self.driver.observe_queries(query) as observation:
+                results = await _pipeline_queries(self.graph, query)
+                observation.rows = [len(result.result_set) for result in results]
         else:
-            params = dict(kwargs)
-            params = convert_datetimes_to_strings(params)
-            await self.graph.query(str(query), params)  # type: ignore[reportUnknownArgumentType]
+            params = cast(dict[str, Any], convert_datetimes_to_strings(dict(kwargs)))
+            with self.driver.observe_query(str(query), params) as observation:
+                result = await self.graph.query(str(query), params)  # type: ignore[reportUnknownArgumentType]
+                observation.rows = [len(result.result_set)]
         # Assuming `graph.query` is async (ideal); otherwise, wrap in executor
         return None
 
@@ -169,10 +232,12 @@ class FalkorDriver(GraphDriver):
         graph = self._get_graph(self._database)
 
         # Convert datetime objects to ISO strings (FalkorDB does not support datetime objects directly)
-        params = convert_datetimes_to_strings(dict(kwargs))
+        params = cast(dict[str, Any], convert_datetimes_to_strings(dict(kwargs)))
 
         try:
-            result = await graph.query(cypher_query_, params)  # type: ignore[reportUnknownArgumentType]
+            with self.observe_query(cypher_query_, params) as observation:
+                result = await graph.query(cypher_query_, params)  # type: ignore[reportUnknownArgumentType]
+                observation.rows = [len(result.result_set)]
         except Exception as e:
             if 'already indexed' in str(e):
                 # check if index already exists
@@ -181,25 +246,28 @@ class FalkorDriver(GraphDriver):
             logger.error(f'Error executing FalkorDB query: {e}\n{cypher_query_}\n{params}')
             raise
 
-        # Convert the result header to a list of strings
-        header = [h[1] for h in result.header]
-
-        # Convert FalkorDB's result format (list of lists) to the format expected by Graphiti (list of dicts)
-        records = []
-        for row in result.result_set:
-            record = {}
-            for i, field_name in enumerate(header):
-                if i < len(row):
-                    record[field_name] = row[i]
-                else:
-                    # If there are more fields in header than values in row, set to None
-                    record[field_name] = None
-            records.append(record)
-
+        records, header = _result_records(result)
         return records, header, None
 
+    async def execute_queries(
+        self, queries: list[tuple[str, dict[str, Any]]]
+    ) -> list[tuple[list[FalkorRecord], list[str], None]]:
+        """Run independent queries in one round-trip and return their results in order."""
+        if not queries:
+            return []
+        graph = self._get_graph(self._database)
+        try:
+            with self.observe_queries(queries) as observation:
+                results = await _pipeline_queries(graph, queries)
+                observation.rows = [len(result.result_set) for result in results]
+        except Exception as e:
+            logger.error(f'Error executing FalkorDB pipeline of {len(queries)} queries: {e}')
+            raise
+
+        return [(*_result_records(result), None) for result in results]
+
     def session(self, database: str | None = None) -> GraphDriverSession:
-        return FalkorDriverSession(self._get_graph(database))
+        return FalkorDriverSession(self._get_graph(database), self)
 
     async def close(self) -> None:
         """Close the driver connection."""
@@ -97,6 +97,12 @@ class GraphOperationsInterface(BaseModel):
         """Retrieve nodes by group IDs with optional pagination."""
         raise NotImplementedError
 
+    async def node_get_by_normalized_names(
+        self, _cls: Any, driver: Any, group_id: str, names: list[str]
+    ) -> list[Any]:
+        """Retrieve the group's nodes whose normalized name equals one of `names` normalized."""
+        raise NotImplementedError
+
     # --------------------------
     # Node: Embeddings (load)
     # --------------------------
@@ -195,6 +201,12 @@ class GraphOperationsInterface(BaseModel):
         """Retrieve episodic nodes by group IDs with optional pagination."""
         raise NotImplementedError
 
+    async def episodic_node_get_by_content_hashes(
+        self, _cls: Any, driver: Any, group_id: str, content_hashes: list[str]
+    ) -> list[Any]:
+        """Retrieve the group's episodic nodes whose content hash is one of `content_hashes`."""
+        raise NotImplementedError
+
     async def retrieve_episodes(
         self,
         driver: Any,
@@ -353,6 +365,21 @@ class GraphOperationsInterface(BaseModel):
         """Retrieve saga nodes by group IDs with optional pagination."""
         raise NotImplementedError
 
+    async def saga_node_get_by_name(
+        self, _cls: Any, driver: Any, name: str, group_id: str
+    ) -> Any | None:
+        """Retrieve the saga node with the given name in a group, or None if there is none."""
+        raise NotImplementedError
+
+    async def saga_get_latest_episode_uuid(
+        self, driver: Any, saga_uuid: str, exclude_uuid: str | None = None
+    ) -> str | None:
+        """Return the UUID of the saga's most recent episode, other than `exclude_uuid`.
+
+        Episodes are ordered by `valid_at`, then `created_at`. Returns None for an empty saga.
+        """
+        raise NotImplementedError
+
     # -----------------
     # Edge: Save/Delete
     # -----------------
@@ -407,6 +434,12 @@ class GraphOperationsInterface(BaseModel):
         """Retrieve edges by group IDs with optional pagination."""
         raise NotImplementedError
 
+    async def edge_get_by_fact_hashes(
+        self, _cls: Any, driver: Any, fact_hashes: list[str]
+    ) -> list[Any]:
+        """Retrieve edges whose fact hash is one of `fact_hashes`."""
+        raise NotImplementedError
+
     # -----------------
     # Edge: Embeddings (load)
     # -----------------
@@ -473,6 +506,12 @@ class GraphOperationsInterface(BaseModel):
         """Retrieve episodic edges by group IDs with optional pagination."""
         raise NotImplementedError
 
+    async def episodic_edge_get_by_episode_uuids(
+        self, _cls: Any, driver: Any, episode_uuids: list[str]
+    ) -> list[Any]:
+        """Retrieve the episodic edges (MENTIONS) from the given episodes."""
+        raise NotImplementedError
+
     # ---------------------------
     # CommunityEdge: Save/Delete
     # ---------------------------
@@ -652,6 +691,23 @@ class GraphOperationsInterface(BaseModel):
         """
         raise NotImplementedError
 
+    async def get_mention_counts(
+        self,
+        driver: Any,
+        node_uuids: list[str],
+    ) -> dict[str, int]:
+        """
+        Count the episodes mentioning each of the given entity nodes.
+
+        Args:
+            driver: GraphDriver instance
+            node_uuids: List of EntityNode UUIDs
+
+        Returns:
+            dict[str, int]: Number of MENTIONS relationships into each node
+        """
+        raise NotImplementedError
+
     async def get_communities_by_nodes(
         self,
         driver: Any,
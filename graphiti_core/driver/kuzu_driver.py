@@ -14,7 +14,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import logging
+import os
 from typing import Any
 
 import kuzu
@@ -37,7 +39,8 @@ SCHEMA_QUERIES = """
         source_description STRING,
         content STRING,
         valid_at TIMESTAMP,
-        entity_edges STRING[]
+        entity_edges STRING[],
+        content_hash STRING
     );
     CREATE NODE TABLE IF NOT EXISTS Entity (
         uuid STRING PRIMARY KEY,
@@ -47,7 +50,8 @@ SCHEMA_QUERIES = """
         created_at TIMESTAMP,
         name_embedding FLOAT[],
         summary STRING,
-        attributes STRING
+        attributes STRING,
+        name_normalized STRING
     );
     CREATE NODE TABLE IF NOT EXISTS Community (
         uuid STRING PRIMARY KEY,
@@ -68,7 +72,8 @@ SCHEMA_QUERIES = """
         expired_at TIMESTAMP,
         valid_at TIMESTAMP,
         invalid_at TIMESTAMP,
-        attributes STRING
+        attributes STRING,
+        fact_hash STRING
     );
     CREATE REL TABLE IF NOT EXISTS RELATES_TO(
         FROM Entity TO RelatesToNode_,
@@ -89,6 +94,52 @@ SCHEMA_QUERIES = """
     );
 """
 
+# Node table columns in schema order, as bulk loads COPY them
+EPISODIC_COLUMNS = [
+    'uuid',
+    'name',
+    'group_id',
+    'created_at',
+    'source',
+    'source_description',
+    'content',
+    'valid_at',
+    'entity_edges',
+    'content_hash',
+]
+ENTITY_COLUMNS = [
+    'uuid',
+    'name',
+    'group_id',
+    'labels',
+    'created_at',
+    'name_embedding',
+    'summary',
+    'attributes',
+    'name_normalized',
+]
+RELATES_TO_NODE_COLUMNS = [
+    'uuid',
+    'group_id',
+    'created_at',
+    'name',
+    'fact',
+    'fact_embedding',
+    'episodes',
+    'expired_at',
+    'valid_at',
+    'invalid_at',
+    'attributes',
+    'fact_hash',
+]
+
+# Columns added to the schema since it was first released, so existing databases pick them up
+SCHEMA_UPGRADE_QUERIES = [
+    'ALTER TABLE Episodic ADD IF NOT EXISTS content_hash STRING',
+    'ALTER TABLE Entity ADD IF NOT EXISTS name_normalized STRING',
+    'ALTER TABLE RelatesToNode_ ADD IF NOT EXISTS fact_hash STRING',
+]
+
 
 class KuzuDriver(GraphDriver):
     provider: GraphProvider = GraphProvider.KUZU
@@ -98,13 +149,32 @@ class KuzuDriver(GraphDriver):
         self,
         db: str = ':memory:',
         max_concurrent_queries: int = 1,
+        read_pool_size: int = 0,
     ):
+        """Open a Kuzu database and connect to it.
+
+        `max_concurrent_queries` sizes the connection that runs writes, and every query when
+        `read_pool_size` is 0. Otherwise queries marked as reads with `routing_='r'` are spread
+        over a separate pool of `read_pool_size` connections, `os.cpu_count()` being a good size
+        for search-heavy workloads, while writes keep going through the write connection.
+        """
         super().__init__()
         self.db = kuzu.Database(db)
 
         self.setup_schema()
 
         self.client = kuzu.AsyncConnection(self.db, max_concurrent_queries=max_concurrent_queries)
+        self.read_client: kuzu.AsyncConnection | None = None
+        if read_pool_size > 0:
+            # Share the cores between the pooled connections instead of oversubscribing them
+            threads_per_query = max(1, (os.cpu_count() or 1) // read_pool_size)
+            self.read_client = kuzu.AsyncConnection(
+                self.db,
+                max_concurrent_queries=read_pool_size,
+                max_threads_per_query=threads_per_query,
+            )
+        # A COPY that hits an existing primary key fails, so bulk loads check and copy one at a time
+        self.bulk_load_lock = asyncio.Lock()
 
     async def execute_query(
         self, cypher_query_: str, **kwargs: Any
@@ -112,22 +182,29 @@ class KuzuDriver(GraphDriver):
         params = {k: v for k, v in kwargs.items() if v is not None}
         # Kuzu does not support these parameters.
         params.pop('database_', None)
-        params.pop('routing_', None)
+        routing = params.pop('routing_', None)
+
+        client = self.client
+        if routing == 'r' and self.read_client is not None:
+            client = self.read_client
 
         try:
-            results = await self.client.execute(cypher_query_, parameters=params)
+            with self.observe_query(cypher_query_, params) as observation:
+                results = await client.execute(cypher_query_, parameters=params)
+                if not results:
+                    return [], None, None
+
+                if isinstance(results, list):
+                    dict_results = [list(result.rows_as_dict()) for result in results]
+                    observation.rows = [sum(len(rows) for rows in dict_results)]
+                else:
+                    dict_results = list(results.rows_as_dict())
+                    observation.rows = [len(dict_results)]
         except Exception as e:
             params = {k: (v[:5] if isinstance(v, list) else v) for k, v in params.items()}
             logger.error(f'Error executing Kuzu query: {e}\n{cypher_query_}\n{params}')
             raise
 
-        if not results:
-            return [], None, None
-
-        if isinstance(results, list):
-            dict_results = [list(result.rows_as_dict()) for result in results]
-        else:
-            dict_results = list(results.rows_as_dict())
         return dict_results, None, None  # type: ignore
 
     def session(self, _database: str | None = None) -> GraphDriverSession:
@@ -149,6 +226,8 @@ class KuzuDriver(GraphDriver):
     def setup_schema(self):
         conn = kuzu.Connection(self.db)
         conn.execute(SCHEMA_QUERIES)
+        for query in SCHEMA_UPGRADE_QUERIES:
+            conn.execute(query)
         conn.close()
 
 
@@ -0,0 +1,1512 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+import math
+import operator
+import re
+from collections import Counter, defaultdict
+from collections.abc import Callable, Hashable, Iterable
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel
+
+from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.driver.graph_operations.graph_operations import GraphOperationsInterface
+from graphiti_core.driver.search_interface.search_interface import SearchInterface
+from graphiti_core.edges import (
+    CommunityEdge,
+    Edge,
+    EntityEdge,
+    EpisodicEdge,
+    HasEpisodeEdge,
+    NextEpisodeEdge,
+)
+from graphiti_core.errors import EdgeNotFoundError, GroupsEdgesNotFoundError, NodeNotFoundError
+from graphiti_core.helpers import compute_fact_hash, normalize_exact
+from graphiti_core.nodes import CommunityNode, EntityNode, EpisodeType, EpisodicNode, SagaNode
+from graphiti_core.search.search_filters import ComparisonOperator, DateFilter, SearchFilters
+from graphiti_core.utils.datetime_utils import ensure_utc
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_CAPACITY = 1024
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+EdgeT = TypeVar('EdgeT', bound=Edge)
+
+NodeFilter = Callable[[EntityNode], bool]
+EdgeFilter = Callable[[EntityEdge, EntityNode, EntityNode], bool]
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+_COMPARISONS: dict[ComparisonOperator, Callable[[Any, Any], bool]] = {
+    ComparisonOperator.equals: operator.eq,
+    ComparisonOperator.not_equals: operator.ne,
+    ComparisonOperator.greater_than: operator.gt,
+    ComparisonOperator.less_than: operator.lt,
+    ComparisonOperator.greater_than_equal: operator.ge,
+    ComparisonOperator.less_than_equal: operator.le,
+}
+
+
+def _tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _detach(item: ModelT, **update: Any) -> ModelT:
+    # Stored items and the items handed to callers never share mutable state
+    return item.model_copy(update=update).model_copy(deep=True)
+
+
+def _add_to_index(index: dict[Any, set[str]], key: Hashable, uuid: str) -> None:
+    index.setdefault(key, set()).add(uuid)
+
+
+def _remove_from_index(index: dict[Any, set[str]], key: Hashable, uuid: str) -> None:
+    uuids = index.get(key)
+    if uuids is not None:
+        uuids.discard(uuid)
+        if not uuids:
+            del index[key]
+
+
+class EmbeddingMatrix:
+    """Embeddings of one kind of item, one row per uuid, scored against a query vector at once.
+
+    Rows of deleted items are zeroed and reused. The matrix doubles when it is full.
+    """
+
+    def __init__(self, initial_capacity: int = DEFAULT_EMBEDDING_CAPACITY):
+        self.initial_capacity = initial_capacity
+        self._vectors: NDArray[np.float32] | None = None
+        self._norms: NDArray[np.float32] = np.zeros(0, dtype=np.float32)
+        self._uuids: list[str | None] = []
+        self._rows: dict[str, int] = {}
+        self._free_rows: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _check_dimension(self, vector: NDArray[np.float32]) -> None:
+        if self._vectors is not None and vector.shape != (self._vectors.shape[1],):
+            raise ValueError(
+                f'Expected an embedding of dimension {self._vectors.shape[1]}, '
+                f'got {vector.shape[-1]}'
+            )
+
+    def _allocate_row(self, dimension: int) -> int:
+        if self._free_rows:
+            return self._free_rows.pop()
+
+        if self._vectors is None:
+            self._vectors = np.zeros((self.initial_capacity, dimension), dtype=np.float32)
+            self._norms = np.zeros(self.initial_capacity, dtype=np.float32)
+        elif len(self._uuids) == self._vectors.shape[0]:
+            self._vectors = np.concatenate([self._vectors, np.zeros_like(self._vectors)])
+            self._norms = np.concatenate([self._norms, np.zeros_like(self._norms)])
+
+        self._uuids.append(None)
+        return len(self._uuids) - 1
+
+    def set(self, uuid: str, embedding: NDArray | list[float]) -> None:
+        vector = np.asarray(embedding, dtype=np.float32)
+        self._check_dimension(vector)
+
+        row = self._rows.get(uuid)
+        if row is None:
+            row = self._allocate_row(vector.shape[0])
+            self._rows[uuid] = row
+            self._uuids[row] = uuid
+
+        assert self._vectors is not None
+        self._vectors[row] = vector
+        self._norms[row] = np.linalg.norm(vector)
+
+    def get(self, uuid: str) -> NDArray[np.float32] | None:
+        row = self._rows.get(uuid)
+        if row is None or self._vectors is None:
+            return None
+        # A copy, as rows are overwritten in place and moved when the matrix grows
+        return self._vectors[row].copy()
+
+    def discard(self, uuid: str) -> None:
+        row = self._rows.pop(uuid, None)
+        if row is None or self._vectors is None:
+            return
+        # A zero row scores NaN, which never passes a score threshold
+        self._vectors[row] = 0
+        self._norms[row] = 0
+        self._uuids[row] = None
+        self._free_rows.append(row)
+
+    def clear(self) -> None:
+        self.__init__(self.initial_capacity)
+
+    def search(self, embedding: list[float], min_score: float) -> list[tuple[str, float]]:
+        """Return the uuids whose cosine similarity to `embedding` exceeds `min_score`, best first."""
+        if self._vectors is None or not self._rows:
+            return []
+
+        query = np.asarray(embedding, dtype=np.float32)
+        self._check_dimension(query)
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return []
+
+        size = len(self._uuids)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = (self._vectors[:size] @ query) / (self._norms[:size] * query_norm)
+
+        rows = np.flatnonzero(scores > min_score)
+        rows = rows[np.argsort(-scores[rows], kind='stable')]
+
+        return [(self._uuids[row], float(scores[row])) for row in rows]  # type: ignore[misc]
+
+
+class InvertedIndex:
+    """Token postings of one kind of item, for fulltext search without a search engine.
+
+    Matches any query token, ranking items by the BM25 weights of the tokens they contain.
+    """
+
+    def __init__(self):
+        self._postings: dict[str, dict[str, int]] = {}
+        self._token_counts: dict[str, Counter[str]] = {}
+
+    def set(self, uuid: str, *texts: str | None) -> None:
+        self.discard(uuid)
+        counts = Counter(token for text in texts if text for token in _tokenize(text))
+        self._token_counts[uuid] = counts
+        for token, count in counts.items():
+            self._postings.setdefault(token, {})[uuid] = count
+
+    def discard(self, uuid: str) -> None:
+        counts = self._token_counts.pop(uuid, None)
+        if counts is None:
+            return
+        for token in counts:
+            postings = self._postings[token]
+            del postings[uuid]
+            if not postings:
+                del self._postings[token]
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self._token_counts.clear()
+
+    def search(self, query: str) -> list[tuple[str, float]]:
+        """Return the uuids containing any token of `query` with their scores, best first."""
+        item_count = len(self._token_counts)
+        scores: dict[str, float] = defaultdict(float)
+        for token in set(_tokenize(query)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + (item_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for uuid, count in postings.items():
+                scores[uuid] += idf * count / (count + 1)
+
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class EdgeTable(Generic[EdgeT]):
+    """Edges of one relationship type, indexed by the nodes they leave and enter."""
+
+    def __init__(self):
+        self.edges: dict[str, EdgeT] = {}
+        self.outgoing: dict[str, set[str]] = {}
+        self.incoming: dict[str, set[str]] = {}
+
+    def put(self, edge: EdgeT) -> None:
+        self.pop(edge.uuid)
+        self.edges[edge.uuid] = edge
+        _add_to_index(self.outgoing, edge.source_node_uuid, edge.uuid)
+        _add_to_index(self.incoming, edge.target_node_uuid, edge.uuid)
+
+    def pop(self, uuid: str) -> EdgeT | None:
+        edge = self.edges.pop(uuid, None)
+        if edge is not None:
+            _remove_from_index(self.outgoing, edge.source_node_uuid, uuid)
+            _remove_from_index(self.incoming, edge.target_node_uuid, uuid)
+        return edge
+
+    def from_node(self, node_uuid: str) -> list[EdgeT]:
+        return [self.edges[uuid] for uuid in self.outgoing.get(node_uuid, ())]
+
+    def to_node(self, node_uuid: str) -> list[EdgeT]:
+        return [self.edges[uuid] for uuid in self.incoming.get(node_uuid, ())]
+
+    def incident_uuids(self, node_uuid: str) -> set[str]:
+        return self.outgoing.get(node_uuid, set()) | self.incoming.get(node_uuid, set())
+
+    def clear(self) -> None:
+        self.edges.clear()
+        self.outgoing.clear()
+        self.incoming.clear()
+
+
+class MemoryGraph:
+    """The nodes, edges and indexes of a graph held in process memory.
+
+    Items are stored as copies without their embeddings, which live in one `EmbeddingMatrix` per
+    embedded property so that a similarity search is a single matrix product. Fulltext search
+    uses one `InvertedIndex` per item kind, and the exact-match lookups plain dictionaries.
+    Edges are only stored when both of their endpoints exist, and deleting a node deletes its
+    edges, as `MATCH ... MERGE` and `DETACH DELETE` would.
+    """
+
+    def __init__(self, embedding_capacity: int = DEFAULT_EMBEDDING_CAPACITY):
+        self.entities: dict[str, EntityNode] = {}
+        self.episodes: dict[str, EpisodicNode] = {}
+        self.communities: dict[str, CommunityNode] = {}
+        self.sagas: dict[str, SagaNode] = {}
+
+        self.entity_edges: EdgeTable[EntityEdge] = EdgeTable()
+        self.episodic_edges: EdgeTable[EpisodicEdge] = EdgeTable()
+        self.community_edges: EdgeTable[CommunityEdge] = EdgeTable()
+        self.has_episode_edges: EdgeTable[HasEpisodeEdge] = EdgeTable()
+        self.next_episode_edges: EdgeTable[NextEpisodeEdge] = EdgeTable()
+
+        self.entity_embeddings = EmbeddingMatrix(embedding_capacity)
+        self.fact_embeddings = EmbeddingMatrix(embedding_capacity)
+        self.community_embeddings = EmbeddingMatrix(embedding_capacity)
+
+        self.entity_text = InvertedIndex()
+        self.fact_text = InvertedIndex()
+        self.episode_text = InvertedIndex()
+        self.community_text = InvertedIndex()
+
+        self._entities_by_name: dict[tuple[str, str], set[str]] = {}
+        self._edges_by_fact_hash: dict[str, set[str]] = {}
+        self._episodes_by_content_hash: dict[tuple[str, str], set[str]] = {}
+
+    @property
+    def _edge_tables(self) -> tuple[EdgeTable[Any], ...]:
+        return (
+            self.entity_edges,
+            self.episodic_edges,
+            self.community_edges,
+            self.has_episode_edges,
+            self.next_episode_edges,
+        )
+
+    # Nodes
+
+    def put_entity(self, node: EntityNode) -> None:
+        self._unindex_entity(node.uuid)
+        stored = _detach(
+            node, name_embedding=None, labels=list(dict.fromkeys(node.labels + ['Entity']))
+        )
+        self.entities[node.uuid] = stored
+        _add_to_index(
+            self._entities_by_name, (stored.group_id, normalize_exact(stored.name)), node.uuid
+        )
+        self.entity_text.set(node.uuid, stored.name, stored.summary)
+        # Nodes read back without their embedding keep the stored one when saved again
+        if node.name_embedding is not None:
+            self.entity_embeddings.set(node.uuid, node.name_embedding)
+
+    def put_episode(self, episode: EpisodicNode) -> None:
+        self._unindex_episode(episode.uuid)
+        stored = _detach(episode)
+        self.episodes[episode.uuid] = stored
+        if stored.content_hash is not None:
+            _add_to_index(
+                self._episodes_by_content_hash, (stored.group_id, stored.content_hash), stored.uuid
+            )
+        self.episode_text.set(stored.uuid, stored.content, stored.source_description)
+
+    def put_community(self, community: CommunityNode) -> None:
+        stored = _detach(community, name_embedding=None)
+        self.communities[community.uuid] = stored
+        self.community_text.set(stored.uuid, stored.name)
+        if community.name_embedding is not None:
+            self.community_embeddings.set(community.uuid, community.name_embedding)
+
+    def put_saga(self, saga: SagaNode) -> None:
+        self.sagas[saga.uuid] = _detach(saga)
+
+    def _unindex_entity(self, uuid: str) -> None:
+        previous = self.entities.get(uuid)
+        if previous is not None:
+            _remove_from_index(
+                self._entities_by_name, (previous.group_id, normalize_exact(previous.name)), uuid
+            )
+
+    def _unindex_episode(self, uuid: str) -> None:
+        previous = self.episodes.get(uuid)
+        if previous is not None and previous.content_hash is not None:
+            _remove_from_index(
+                self._episodes_by_content_hash, (previous.group_id, previous.content_hash), uuid
+            )
+
+    def delete_node(self, uuid: str) -> None:
+        self._unindex_entity(uuid)
+        self._unindex_episode(uuid)
+        found = False
+        for nodes in (self.entities, self.episodes, self.communities, self.sagas):
+            found = nodes.pop(uuid, None) is not None or found
+        if not found:
+            return
+
+        self.entity_embeddings.discard(uuid)
+        self.community_embeddings.discard(uuid)
+        self.entity_text.discard(uuid)
+        self.episode_text.discard(uuid)
+        self.community_text.discard(uuid)
+
+        for table in self._edge_tables:
+            for edge_uuid in table.incident_uuids(uuid):
+                self.delete_edge(table, edge_uuid)
+
+    def nodes_in_groups(self, group_ids: Iterable[str]) -> list[str]:
+        groups = set(group_ids)
+        return [
+            node.uuid
+            for nodes in (self.entities, self.episodes, self.communities)
+            for node in nodes.values()
+            if node.group_id in groups
+        ]
+
+    # Edges
+
+    def put_entity_edge(self, edge: EntityEdge) -> bool:
+        if edge.source_node_uuid not in self.entities or edge.target_node_uuid not in self.entities:
+            return False
+
+        self.delete_edge(self.entity_edges, edge.uuid)
+        stored = _detach(edge, fact_embedding=None)
+        self.entity_edges.put(stored)
+        _add_to_index(
+            self._edges_by_fact_hash,
+            compute_fact_hash(stored.source_node_uuid, stored.target_node_uuid, stored.fact),
+            stored.uuid,
+        )
+        self.fact_text.set(stored.uuid, stored.name, stored.fact)
+        if edge.fact_embedding is not None:
+            self.fact_embeddings.set(edge.uuid, edge.fact_embedding)
+        return True
+
+    def put_edge(
+        self,
+        table: EdgeTable[EdgeT],
+        edge: EdgeT,
+        sources: dict[str, Any],
+        *targets: dict[str, Any],
+    ) -> bool:
+        if edge.source_node_uuid not in sources or not any(
+            edge.target_node_uuid in nodes for nodes in targets
+        ):
+            return False
+        table.put(_detach(edge))
+        return True
+
+    def delete_edge(self, table: EdgeTable[EdgeT], uuid: str) -> None:
+        edge = table.pop(uuid)
+        if isinstance(edge, EntityEdge):
+            _remove_from_index(
+                self._edges_by_fact_hash,
+                compute_fact_hash(edge.source_node_uuid, edge.target_node_uuid, edge.fact),
+                uuid,
+            )
+            self.fact_text.discard(uuid)
+            self.fact_embeddings.discard(uuid)
+
+    # Exact-match lookups
+
+    def entity_uuids_by_name(self, group_id: str, names: Iterable[str]) -> set[str]:
+        return {
+            uuid
+            for name in {normalize_exact(name) for name in names}
+            for uuid in self._entities_by_name.get((group_id, name), ())
+        }
+
+    def edge_uuids_by_fact_hash(self, fact_hashes: Iterable[str]) -> set[str]:
+        return {
+            uuid
+            for fact_hash in set(fact_hashes)
+            for uuid in self._edges_by_fact_hash.get(fact_hash, ())
+        }
+
+    def episode_uuids_by_content_hash(
+        self, group_id: str, content_hashes: Iterable[str]
+    ) -> set[str]:
+        return {
+            uuid
+            for content_hash in set(content_hashes)
+            for uuid in self._episodes_by_content_hash.get((group_id, content_hash), ())
+        }
+
+    def clear(self) -> None:
+        for nodes in (self.entities, self.episodes, self.communities, self.sagas):
+            nodes.clear()
+        for table in self._edge_tables:
+            table.clear()
+        for matrix in (self.entity_embeddings, self.fact_embeddings, self.community_embeddings):
+            matrix.clear()
+        for index in (self.entity_text, self.fact_text, self.episode_text, self.community_text):
+            index.clear()
+        self._entities_by_name.clear()
+        self._edges_by_fact_hash.clear()
+        self._episodes_by_content_hash.clear()
+
+
+def _graph(driver: Any) -> MemoryGraph:
+    return driver.graph
+
+
+def _get_one(items: dict[str, ModelT], uuid: str, error: type[Exception]) -> ModelT:
+    item = items.get(uuid)
+    if item is None:
+        raise error(uuid)
+    return _detach(item)
+
+
+def _get_many(items: dict[str, ModelT], uuids: Iterable[str]) -> list[ModelT]:
+    return [_detach(items[uuid]) for uuid in dict.fromkeys(uuids) if uuid in items]
+
+
+def _get_page(
+    items: Iterable[ModelT],
+    group_ids: list[str],
+    limit: int | None,
+    uuid_cursor: str | None,
+) -> list[ModelT]:
+    # Pages run in descending uuid order from the cursor, as the Cypher implementations do
+    groups = set(group_ids)
+    selected = sorted(
+        (
+            item
+            for item in items
+            if item.group_id in groups  # type: ignore[attr-defined]
+            and (not uuid_cursor or item.uuid < uuid_cursor)  # type: ignore[attr-defined]
+        ),
+        key=lambda item: item.uuid,  # type: ignore[attr-defined]
+        reverse=True,
+    )
+    if limit is not None:
+        selected = selected[:limit]
+    return [_detach(item) for item in selected]
+
+
+def _split_row(row: dict[str, Any], model: type[BaseModel], *ignored: str) -> dict[str, Any]:
+    # Bulk rows carry the custom attributes of entities and edges as top-level properties
+    fields = {key: value for key, value in row.items() if key in model.model_fields}
+    fields['attributes'] = {
+        key: value
+        for key, value in row.items()
+        if key not in model.model_fields and key not in ignored
+    }
+    return fields
+
+
+def _matches_date_filters(value: datetime | None, filters: list[list[DateFilter]]) -> bool:
+    def matches(date_filter: DateFilter) -> bool:
+        if date_filter.comparison_operator == ComparisonOperator.is_null:
+            return value is None
+        if date_filter.comparison_operator == ComparisonOperator.is_not_null:
+            return value is not None
+        if value is None or date_filter.date is None:
+            return False
+        return _COMPARISONS[date_filter.comparison_operator](
+            ensure_utc(value), ensure_utc(date_filter.date)
+        )
+
+    return any(all(matches(date_filter) for date_filter in and_list) for and_list in filters)
+
+
+class MemoryGraphOperations(GraphOperationsInterface):
+    """Storage operations of `MemoryDriver`, reading and writing its `MemoryGraph`."""
+
+    # Nodes
+
+    async def node_save(self, node: EntityNode, driver: Any) -> None:
+        _graph(driver).put_entity(node)
+
+    async def node_delete(self, node: Any, driver: Any) -> None:
+        _graph(driver).delete_node(node.uuid)
+
+    async def node_save_bulk(
+        self,
+        _cls: Any,
+        driver: Any,
+        transaction: Any,
+        nodes: list[dict[str, Any]],
+        batch_size: int = 100,
+    ) -> None:
+        graph = _graph(driver)
+        for row in nodes:
+            graph.put_entity(EntityNode(**_split_row(row, EntityNode, 'name_normalized')))
+
+    async def node_delete_by_group_id(
+        self, _cls: Any, driver: Any, group_id: str, batch_size: int = 100
+    ) -> None:
+        graph = _graph(driver)
+        for uuid in graph.nodes_in_groups([group_id]):
+            graph.delete_node(uuid)
+
+    async def node_delete_by_uuids(
+        self,
+        _cls: Any,
+        driver: Any,
+        uuids: list[str],
+        group_id: str | None = None,
+        batch_size: int = 100,
+    ) -> None:
+        graph = _graph(driver)
+        for uuid in uuids:
+            if uuid not in graph.sagas:
+                graph.delete_node(uuid)
+
+    async def node_get_by_uuid(self, _cls: Any, driver: Any, uuid: str) -> EntityNode:
+        return _get_one(_graph(driver).entities, uuid, NodeNotFoundError)
+
+    async def node_get_by_uuids(self, _cls: Any, driver: Any, uuids: list[str]) -> list[EntityNode]:
+        return _get_many(_graph(driver).entities, uuids)
+
+    async def node_get_by_normalized_names(
+        self, _cls: Any, driver: Any, group_id: str, names: list[str]
+    ) -> list[EntityNode]:
+        graph = _graph(driver)
+        return _get_many(graph.entities, graph.entity_uuids_by_name(group_id, names))
+
+    async def node_get_by_group_ids(
+        self,
+        _cls: Any,
+        driver: Any,
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[EntityNode]:
+        return _get_page(_graph(driver).entities.values(), group_ids, limit, uuid_cursor)
+
+    async def node_load_embeddings(self, node: EntityNode, driver: Any) -> None:
+        graph = _graph(driver)
+        if node.uuid not in graph.entities:
+            raise NodeNotFoundError(node.uuid)
+        node.name_embedding = graph.entity_embeddings.get(node.uuid)
+
+    async def node_load_embeddings_bulk(
+        self, driver: Any, nodes: list[EntityNode], batch_size: int = 100
+    ) -> dict[str, NDArray[np.float32]]:
+        embeddings = _graph(driver).entity_embeddings
+        loaded = {node.uuid: embeddings.get(node.uuid) for node in nodes}
+        return {uuid: embedding for uuid, embedding in loaded.items() if embedding is not None}
+
+    # Episodes
+
+    async def episodic_node_save(self, node: EpisodicNode, driver: Any) -> None:
+        _graph(driver).put_episode(node)
+
+    async def episodic_node_save_bulk(
+        self,
+        _cls: Any,
+        driver: Any,
+        transaction: Any,
+        nodes: list[dict[str, Any]],
+        batch_size: int = 100,
+    ) -> None:
+        graph = _graph(driver)
+        for row in nodes:
+            graph.put_episode(EpisodicNode(**row))
+
+    async def episodic_edge_save_bulk(
+        self,
+        _cls: Any,
+        driver: Any,
+        transaction: Any,
+        episodic_edges: list[dict[str, Any]],
+        batch_size: int = 100,
+    ) -> None:
+        graph = _graph(driver)
+        for row in episodic_edges:
+            graph.put_edge(
+                graph.episodic_edges, EpisodicEdge(**row), graph.episodes, graph.entities
+            )
+
+    async def episodic_node_get_by_uuid(self, _cls: Any, driver: Any, uuid: str) -> EpisodicNode:
+        return _get_one(_graph(driver).episodes, uuid, NodeNotFoundError)
+
+    async def episodic_node_get_by_uuids(
+        self, _cls: Any, driver: Any, uuids: list[str]
+    ) -> list[EpisodicNode]:
+        return _get_many(_graph(driver).episodes, uuids)
+
+    async def episodic_node_get_by_group_ids(
+        self,
+        _cls: Any,
+        driver: Any,
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[EpisodicNode]:
+        return _get_page(_graph(driver).episodes.values(), group_ids, limit, uuid_cursor)
+
+    async def episodic_node_get_by_content_hashes(
+        self, _cls: Any, driver: Any, group_id: str, content_hashes: list[str]
+    ) -> list[EpisodicNode]:
+        graph = _graph(driver)
+        episodes = _get_many(
+            graph.episodes, graph.episode_uuids_by_content_hash(group_id, content_hashes)
+        )
+        return sorted(episodes, key=lambda episode: ensure_utc(episode.created_at))  # type: ignore[arg-type, return-value]
+
+    async def episodic_node_get_by_entity_node_uuid(
+        self, _cls: Any, driver: Any, entity_node_uuid: str
+    ) -> list[EpisodicNode]:
+        graph = _graph(driver)
+        return _get_many(
+            graph.episodes,
+            [edge.source_node_uuid for edge in graph.episodic_edges.to_node(entity_node_uuid)],
+        )
+
+    async def retrieve_episodes(
+        self,
+        driver: Any,
+        reference_time: datetime,
+        last_n: int = 3,
+        group_ids: list[str] | None = None,
+        source: EpisodeType | None = None,
+        saga: str | None = None,
+    ) -> list[EpisodicNode]:
+        graph = _graph(driver)
+        if saga is not None:
+            group_id = group_ids[0] if group_ids else None
+            candidates = [
+                graph.episodes[edge.target_node_uuid]
+                for saga_node in graph.sagas.values()
+                if saga_node.name == saga and saga_node.group_id == group_id
+                for edge in graph.has_episode_edges.from_node(saga_node.uuid)
+            ]
+        else:
+            groups = set(group_ids) if group_ids else None
+            candidates = [
+                episode
+                for episode in graph.episodes.values()
+                if groups is None or episode.group_id in groups
+            ]
+
+        reference = ensure_utc(reference_time)
+        episodes = sorted(
+            (
+                episode
+                for episode in candidates
+                if ensure_utc(episode.valid_at) <= reference  # type: ignore[operator]
+                and (source is None or episode.source == source)
+            ),
+            key=lambda episode: ensure_utc(episode.valid_at),  # type: ignore[arg-type, return-value]
+            reverse=True,
+        )[:last_n]
+
+        return [_detach(episode) for episode in reversed(episodes)]
+
+    # Communities
+
+    async def community_node_save(self, node: CommunityNode, driver: Any) -> None:
+        _graph(driver).put_community(node)
+
+    async def community_node_get_by_uuid(self, _cls: Any, driver: Any, uuid: str) -> CommunityNode:
+        return _get_one(_graph(driver).communities, uuid, NodeNotFoundError)
+
+    async def community_node_get_by_uuids(
+        self, _cls: Any, driver: Any, uuids: list[str]
+    ) -> list[CommunityNode]:
+        return _get_many(_graph(driver).communities, uuids)
+
+    async def community_node_get_by_group_ids(
+        self,
+        _cls: Any,
+        driver: Any,
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[CommunityNode]:
+        return _get_page(_graph(driver).communities.values(), group_ids, limit, uuid_cursor)
+
+    async def community_node_load_name_embedding(self, node: CommunityNode, driver: Any) -> None:
+        graph = _graph(driver)
+        if node.uuid not in graph.communities:
+            raise NodeNotFoundError(node.uuid)
+        node.name_embedding = graph.community_embeddings.get(node.uuid)
+
+    # Sagas
+
+    async def saga_node_save(self, node: SagaNode, driver: Any) -> None:
+        _graph(driver).put_saga(node)
+
+    async def saga_node_delete(self, node: SagaNode, driver: Any) -> None:
+        _graph(driver).delete_node(node.uuid)
+
+    async def saga_node_get_by_uuid(self, _cls: Any, driver: Any, uuid: str) -> SagaNode:
+        return _get_one(_graph(driver).sagas, uuid, NodeNotFoundError)
+
+    async def saga_node_get_by_uuids(
+        self, _cls: Any, driver: Any, uuids: list[str]
+    ) -> list[SagaNode]:
+        return _get_many(_graph(driver).sagas, uuids)
+
+    async def saga_node_get_by_group_ids(
+        self,
+        _cls: Any,
+        driver: Any,
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[SagaNode]:
+        return _get_page(_graph(driver).sagas.values(), group_ids, limit, uuid_cursor)
+
+    async def saga_node_get_by_name(
+        self, _cls: Any, driver: Any, name: str, group_id: str
+    ) -> SagaNode | None:
+        for saga in _graph(driver).sagas.values():
+            if saga.name == name and saga.group_id == group_id:
+                return _detach(saga)
+        return None
+
+    async def saga_get_latest_episode_uuid(
+        self, driver: Any, saga_uuid: str, exclude_uuid: str | None = None
+    ) -> str | None:
+        graph = _graph(driver)
+        episodes = [
+            graph.episodes[edge.target_node_uuid]
+            for edge in graph.has_episode_edges.from_node(saga_uuid)
+            if edge.target_node_uuid != exclude_uuid
+        ]
+        if not episodes:
+            return None
+        return max(episodes, key=lambda episode: (episode.valid_at, episode.created_at)).uuid
+
+    # Entity edges
+
+    async def edge_save(self, edge: EntityEdge, driver: Any) -> None:
+        _graph(driver).put_entity_edge(edge)
+
+    async def edge_delete(self, edge: Any, driver: Any) -> None:
+        await self.edge_delete_by_uuids(None, driver, [edge.uuid])
+
+    async def edge_save_bulk(
+        self,
+        _cls: Any,
+        driver: Any,
+        transaction: Any,
+        edges: list[dict[str, Any]],
+        batch_size: int = 100,
+    ) -> None:
+        graph = _graph(driver)
+        for row in edges:
+            graph.put_entity_edge(EntityEdge(**_split_row(row, EntityEdge, 'fact_hash')))
+
+    async def edge_delete_by_uuids(
+        self, _cls: Any, driver: Any, uuids: list[str], group_id: str | None = None
+    ) -> None:
+        # Like the Cypher implementations, this covers MENTIONS, RELATES_TO and HAS_MEMBER edges
+        graph = _graph(driver)
+        for uuid in uuids:
+            graph.delete_edge(graph.entity_edges, uuid)
+            graph.delete_edge(graph.episodic_edges, uuid)
+            graph.delete_edge(graph.community_edges, uuid)
+
+    async def edge_get_by_uuid(self, _cls: Any, driver: Any, uuid: str) -> EntityEdge:
+        return _get_one(_graph(driver).entity_edges.edges, uuid, EdgeNotFoundError)
+
+    async def edge_get_by_uuids(self, _cls: Any, driver: Any, uuids: list[str]) -> list[EntityEdge]:
+        return _get_many(_graph(driver).entity_edges.edges, uuids)
+
+    async def edge_get_by_fact_hashes(
+        self, _cls: Any, driver: Any, fact_hashes: list[str]
+    ) -> list[EntityEdge]:
+        graph = _graph(driver)
+        return _get_many(graph.entity_edges.edges, graph.edge_uuids_by_fact_hash(fact_hashes))
+
+    async def edge_get_by_group_ids(
+        self,
+        _cls: Any,
+        driver: Any,
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[EntityEdge]:
+        edges = _get_page(_graph(driver).entity_edges.edges.values(), group_ids, limit, uuid_cursor)
+        if len(edges) == 0:
+            raise GroupsEdgesNotFoundError(group_ids)
+        return edges
+
+    async def edge_load_embeddings(self, edge: EntityEdge, driver: Any) -> None:
+        graph = _graph(driver)
+        if edge.uuid not in graph.entity_edges.edges:
+            raise EdgeNotFoundError(edge.uuid)
+        edge.fact_embedding = graph.fact_embeddings.get(edge.uuid)
+
+    async def edge_load_embeddings_bulk(
+        self, driver: Any, edges: list[EntityEdge], batch_size: int = 100
+    ) -> dict[str, NDArray[np.float32]]:
+        embeddings = _graph(driver).fact_embeddings
+        loaded = {edge.uuid: embeddings.get(edge.uuid) for edge in edges}
+        return {uuid: embedding for uuid, embedding in loaded.items() if embedding is not None}
+
+    async def edge_get_between_nodes(
+        self, _cls: Any, driver: Any, source_node_uuid: str, target_node_uuid: str
+    ) -> list[EntityEdge]:
+        return [
+            _detach(edge)
+            for edge in _graph(driver).entity_edges.from_node(source_node_uuid)
+            if edge.target_node_uuid == target_node_uuid
+        ]
+
+    async def edge_get_by_node_uuid(
+        self, _cls: Any, driver: Any, node_uuid: str
+    ) -> list[EntityEdge]:
+        table = _graph(driver).entity_edges
+        return _get_many(table.edges, table.incident_uuids(node_uuid))
+
+    # Episodic edges
+
+    async def episodic_edge_save(self, edge: EpisodicEdge, driver: Any) -> None:
+        graph = _graph(driver)
+        graph.put_edge(graph.episodic_edges, edge, graph.episodes, graph.entities)
+
+    async def episodic_edge_get_by_uuid(self, _cls: Any, driver: Any, uuid: str) -> EpisodicEdge:
+        return _get_one(_graph(driver).episodic_edges.edges, uuid, EdgeNotFoundError)
+
+    async def episodic_edge_get_by_uuids(
+        self, _cls: Any, driver: Any, uuids: list[str]
+    ) -> list[EpisodicEdge]:
+        edges = _get_many(_graph(driver).episodic_edges.edges, uuids)
+        if len(edges) == 0:
+            raise EdgeNotFoundError(uuids[0])
+        return edges
+
+    async def episodic_edge_get_by_episode_uuids(
+        self, _cls: Any, driver: Any, episode_uuids: list[str]
+    ) -> list[EpisodicEdge]:
+        table = _graph(driver).episodic_edges
+        return [_detach(edge) for uuid in episode_uuids for edge in table.from_node(uuid)]
+
+    async def episodic_edge_get_by_group_ids(
+        self,
+        _cls: Any,
+        driver: Any,
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[EpisodicEdge]:
+        edges = _get_page(
+            _graph(driver).episodic_edges.edges.values(), group_ids, limit, uuid_cursor
+        )
+        if len(edges) == 0:
+            raise GroupsEdgesNotFoundError(group_ids)
+        return edges
+
+    # Community edges
+
+    async def community_edge_save(self, edge: CommunityEdge, driver: Any) -> None:
+        graph = _graph(driver)
+        graph.put_edge(
+            graph.community_edges, edge, graph.communities, graph.entities, graph.communities
+        )
+
+    async def community_edge_get_by_uuid(self, _cls: Any, driver: Any, uuid: str) -> CommunityEdge:
+        return _get_one(_graph(driver).community_edges.edges, uuid, EdgeNotFoundError)
+
+    async def community_edge_get_by_uuids(
+        self, _cls: Any, driver: Any, uuids: list[str]
+    ) -> list[CommunityEdge]:
+        return _get_many(_graph(driver).community_edges.edges, uuids)
+
+    async def community_edge_get_by_group_ids(
+        self,
+        _cls: Any,
+        driver: Any,
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[CommunityEdge]:
+        return _get_page(
+            _graph(driver).community_edges.edges.values(), group_ids, limit, uuid_cursor
+        )
+
+    # Saga edges
+
+    async def has_episode_edge_save(self, edge: HasEpisodeEdge, driver: Any) -> None:
+        graph = _graph(driver)
+        graph.put_edge(graph.has_episode_edges, edge, graph.sagas, graph.episodes)
+
+    async def has_episode_edge_delete(self, edge: HasEpisodeEdge, driver: Any) -> None:
+        graph = _graph(driver)
+        graph.delete_edge(graph.has_episode_edges, edge.uuid)
+
+    async def has_episode_edge_get_by_uuid(
+        self, _cls: Any, driver: Any, uuid: str
+    ) -> HasEpisodeEdge:
+        return _get_one(_graph(driver).has_episode_edges.edges, uuid, EdgeNotFoundError)
+
+    async def has_episode_edge_get_by_uuids(
+        self, _cls: Any, driver: Any, uuids: list[str]
+    ) -> list[HasEpisodeEdge]:
+        return _get_many(_graph(driver).has_episode_edges.edges, uuids)
+
+    async def has_episode_edge_get_by_group_ids(
+        self,
+        _cls: Any,
+        driver: Any,
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[HasEpisodeEdge]:
+        return _get_page(
+            _graph(driver).has_episode_edges.edges.values(), group_ids, limit, uuid_cursor
+        )
+
+    async def next_episode_edge_save(self, edge: NextEpisodeEdge, driver: Any) -> None:
+        graph = _graph(driver)
+        graph.put_edge(graph.next_episode_edges, edge, graph.episodes, graph.episodes)
+
+    async def next_episode_edge_delete(self, edge: NextEpisodeEdge, driver: Any) -> None:
+        graph = _graph(driver)
+        graph.delete_edge(graph.next_episode_edges, edge.uuid)
+
+    async def next_episode_edge_get_by_uuid(
+        self, _cls: Any, driver: Any, uuid: str
+    ) -> NextEpisodeEdge:
+        return _get_one(_graph(driver).next_episode_edges.edges, uuid, EdgeNotFoundError)
+
+    async def next_episode_edge_get_by_uuids(
+        self, _cls: Any, driver: Any, uuids: list[str]
+    ) -> list[NextEpisodeEdge]:
+        return _get_many(_graph(driver).next_episode_edges.edges, uuids)
+
+    async def next_episode_edge_get_by_group_ids(
+        self,
+        _cls: Any,
+        driver: Any,
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[NextEpisodeEdge]:
+        return _get_page(
+            _graph(driver).next_episode_edges.edges.values(), group_ids, limit, uuid_cursor
+        )
+
+    # Search
+
+    async def get_mentioned_nodes(
+        self, driver: Any, episodes: list[EpisodicNode]
+    ) -> list[EntityNode]:
+        graph = _graph(driver)
+        return _get_many(
+            graph.entities,
+            [
+                edge.target_node_uuid
+                for episode in episodes
+                for edge in graph.episodic_edges.from_node(episode.uuid)
+            ],
+        )
+
+    async def get_mention_counts(self, driver: Any, node_uuids: list[str]) -> dict[str, int]:
+        incoming = _graph(driver).episodic_edges.incoming
+        return {uuid: len(incoming.get(uuid, ())) for uuid in node_uuids}
+
+    async def get_communities_by_nodes(
+        self, driver: Any, nodes: list[EntityNode]
+    ) -> list[CommunityNode]:
+        graph = _graph(driver)
+        return _get_many(
+            graph.communities,
+            [
+                edge.source_node_uuid
+                for node in nodes
+                for edge in graph.community_edges.to_node(node.uuid)
+            ],
+        )
+
+    # Maintenance
+
+    async def clear_data(self, driver: Any, group_ids: list[str] | None = None) -> None:
+        graph = _graph(driver)
+        if group_ids is None:
+            graph.clear()
+            return
+        for uuid in graph.nodes_in_groups(group_ids):
+            graph.delete_node(uuid)
+
+    async def get_community_clusters(
+        self, driver: Any, group_ids: list[str] | None
+    ) -> list[list[EntityNode]]:
+        from graphiti_core.utils.maintenance.community_operations import (
+            Neighbor,
+            label_propagation,
+        )
+
+        graph = _graph(driver)
+        if group_ids is None:
+            group_ids = list(dict.fromkeys(node.group_id for node in graph.entities.values()))
+
+        clusters: list[list[EntityNode]] = []
+        for group_id in group_ids:
+            projection: dict[str, list[Neighbor]] = {}
+            for node in graph.entities.values():
+                if node.group_id != group_id:
+                    continue
+                edge_counts: Counter[str] = Counter()
+                for edge_uuid in graph.entity_edges.incident_uuids(node.uuid):
+                    edge = graph.entity_edges.edges[edge_uuid]
+                    neighbor_uuid = (
+                        edge.target_node_uuid
+                        if edge.source_node_uuid == node.uuid
+                        else edge.source_node_uuid
+                    )
+                    if graph.entities[neighbor_uuid].group_id == group_id:
+                        edge_counts[neighbor_uuid] += 1
+                projection[node.uuid] = [
+                    Neighbor(node_uuid=uuid, edge_count=count)
+                    for uuid, count in edge_counts.items()
+                ]
+
+            clusters.extend(
+                _get_many(graph.entities, cluster) for cluster in label_propagation(projection)
+            )
+
+        return clusters
+
+    async def remove_communities(self, driver: Any) -> None:
+        graph = _graph(driver)
+        for uuid in list(graph.communities):
+            graph.delete_node(uuid)
+
+    async def determine_entity_community(
+        self, driver: Any, entity: EntityNode
+    ) -> tuple[CommunityNode | None, bool]:
+        graph = _graph(driver)
+        memberships = graph.community_edges.to_node(entity.uuid)
+        if memberships:
+            return _detach(graph.communities[memberships[0].source_node_uuid]), False
+
+        # Otherwise the entity joins the community most common among its neighbors
+        community_counts: Counter[str] = Counter()
+        for edge_uuid in graph.entity_edges.incident_uuids(entity.uuid):
+            edge = graph.entity_edges.edges[edge_uuid]
+            neighbor_uuid = (
+                edge.target_node_uuid
+                if edge.source_node_uuid == entity.uuid
+                else edge.source_node_uuid
+            )
+            for membership in graph.community_edges.to_node(neighbor_uuid):
+                community_counts[membership.source_node_uuid] += 1
+
+        if not community_counts:
+            return None, False
+
+        community_uuid, _ = community_counts.most_common(1)[0]
+        return _detach(graph.communities[community_uuid]), True
+
+
+class MemorySearch(SearchInterface):
+    """Search of `MemoryDriver`, over the embedding matrices and inverted indexes of its graph."""
+
+    def build_node_search_filters(self, search_filters: SearchFilters) -> NodeFilter:
+        labels = set(search_filters.node_labels or [])
+
+        def matches(node: EntityNode) -> bool:
+            # Like `n:A|B`, a node matches if it has any of the labels
+            return not labels or not labels.isdisjoint(node.labels)
+
+        return matches
+
+    def build_edge_search_filters(self, search_filters: SearchFilters) -> EdgeFilter:
+        matches_node = self.build_node_search_filters(search_filters)
+        edge_types = (
+            set(search_filters.edge_types) if search_filters.edge_types is not None else None
+        )
+        edge_uuids = (
+            set(search_filters.edge_uuids) if search_filters.edge_uuids is not None else None
+        )
+        date_filters = [
+            (attribute, date_filter)
+            for attribute in ('valid_at', 'invalid_at', 'created_at', 'expired_at')
+            if (date_filter := getattr(search_filters, attribute)) is not None
+        ]
+
+        def matches(edge: EntityEdge, source: EntityNode, target: EntityNode) -> bool:
+            return (
+                (edge_types is None or edge.name in edge_types)
+                and (edge_uuids is None or edge.uuid in edge_uuids)
+                and matches_node(source)
+                and matches_node(target)
+                and all(
+                    _matches_date_filters(getattr(edge, attribute), date_filter)
+                    for attribute, date_filter in date_filters
+                )
+            )
+
+        return matches
+
+    def _select_edges(
+        self,
+        graph: MemoryGraph,
+        ranked_uuids: Iterable[str],
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+        source_node_uuid: str | None = None,
+        target_node_uuid: str | None = None,
+    ) -> list[EntityEdge]:
+        matches = self.build_edge_search_filters(search_filter)
+        groups = set(group_ids) if group_ids is not None else None
+        edges: list[EntityEdge] = []
+        for uuid in ranked_uuids:
+            if len(edges) >= limit:
+                break
+            edge = graph.entity_edges.edges.get(uuid)
+            if (
+                edge is None
+                or (groups is not None and edge.group_id not in groups)
+                or (source_node_uuid is not None and edge.source_node_uuid != source_node_uuid)
+                or (target_node_uuid is not None and edge.target_node_uuid != target_node_uuid)
+            ):
+                continue
+            source = graph.entities[edge.source_node_uuid]
+            target = graph.entities[edge.target_node_uuid]
+            if matches(edge, source, target):
+                edges.append(_detach(edge))
+        return edges
+
+    def _select_nodes(
+        self,
+        graph: MemoryGraph,
+        ranked_uuids: Iterable[str],
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+    ) -> list[EntityNode]:
+        matches = self.build_node_search_filters(search_filter)
+        groups = set(group_ids) if group_ids is not None else None
+        nodes: list[EntityNode] = []
+        for uuid in ranked_uuids:
+            if len(nodes) >= limit:
+                break
+            node = graph.entities.get(uuid)
+            if node is None or (groups is not None and node.group_id not in groups):
+                continue
+            if matches(node):
+                nodes.append(_detach(node))
+        return nodes
+
+    @staticmethod
+    def _select_in_groups(
+        items: dict[str, ModelT],
+        ranked_uuids: Iterable[str],
+        group_ids: list[str] | None,
+        limit: int,
+    ) -> list[ModelT]:
+        groups = set(group_ids) if group_ids is not None else None
+        selected: list[ModelT] = []
+        for uuid in ranked_uuids:
+            if len(selected) >= limit:
+                break
+            item = items.get(uuid)
+            if item is not None and (groups is None or item.group_id in groups):  # type: ignore[attr-defined]
+                selected.append(_detach(item))
+        return selected
+
+    async def edge_fulltext_search(
+        self,
+        driver: Any,
+        query: str,
+        search_filter: SearchFilters,
+        group_ids: list[str] | None = None,
+        limit: int = 100,
+    ) -> list[EntityEdge]:
+        graph = _graph(driver)
+        ranked = (uuid for uuid, _ in graph.fact_text.search(query))
+        return self._select_edges(graph, ranked, search_filter, group_ids, limit)
+
+    async def edge_similarity_search(
+        self,
+        driver: Any,
+        search_vector: list[float],
+        source_node_uuid: str | None,
+        target_node_uuid: str | None,
+        search_filter: SearchFilters,
+        group_ids: list[str] | None = None,
+        limit: int = 100,
+        min_score: float = 0.7,
+    ) -> list[EntityEdge]:
+        graph = _graph(driver)
+        ranked = (uuid for uuid, _ in graph.fact_embeddings.search(search_vector, min_score))
+        return self._select_edges(
+            graph,
+            ranked,
+            search_filter,
+            group_ids,
+            limit,
+            source_node_uuid=source_node_uuid,
+            target_node_uuid=target_node_uuid,
+        )
+
+    async def node_fulltext_search(
+        self,
+        driver: Any,
+        query: str,
+        search_filter: SearchFilters,
+        group_ids: list[str] | None = None,
+        limit: int = 100,
+    ) -> list[EntityNode]:
+        graph = _graph(driver)
+        ranked = (uuid for uuid, _ in graph.entity_text.search(query))
+        return self._select_nodes(graph, ranked, search_filter, group_ids, limit)
+
+    async def node_similarity_search(
+        self,
+        driver: Any,
+        search_vector: list[float],
+        search_filter: SearchFilters,
+        group_ids: list[str] | None = None,
+        limit: int = 100,
+        min_score: float = 0.7,
+    ) -> list[EntityNode]:
+        graph = _graph(driver)
+        ranked = (uuid for uuid, _ in graph.entity_embeddings.search(search_vector, min_score))
+        return self._select_nodes(graph, ranked, search_filter, group_ids, limit)
+
+    async def episode_fulltext_search(
+        self,
+        driver: Any,
+        query: str,
+        search_filter: SearchFilters,
+        group_ids: list[str] | None = None,
+        limit: int = 100,
+    ) -> list[EpisodicNode]:
+        graph = _graph(driver)
+        ranked = (uuid for uuid, _ in graph.episode_text.search(query))
+        return self._select_in_groups(graph.episodes, ranked, group_ids, limit)
+
+    def _reachable_entities(
+        self, graph: MemoryGraph, origin_uuid: str, max_depth: int
+    ) -> dict[str, int]:
+        """Map the entities reachable from an entity or episode to their distance from it.
+
+        Paths follow MENTIONS and RELATES_TO edges in their direction, like
+        `(origin)-[:RELATES_TO|MENTIONS*1..max_depth]->(n:Entity)`.
+        """
+        distances: dict[str, int] = {}
+        frontier = [
+            edge.target_node_uuid for edge in graph.episodic_edges.from_node(origin_uuid)
+        ] + [edge.target_node_uuid for edge in graph.entity_edges.from_node(origin_uuid)]
+        depth = 1
+        while frontier and depth <= max_depth:
+            next_frontier = []
+            for uuid in frontier:
+                if uuid in distances:
+                    continue
+                distances[uuid] = depth
+                next_frontier.extend(
+                    edge.target_node_uuid for edge in graph.entity_edges.from_node(uuid)
+                )
+            frontier = next_frontier
+            depth += 1
+        return distances
+
+    def _origin_group_id(self, graph: MemoryGraph, uuid: str) -> str | None:
+        origin = graph.entities.get(uuid) or graph.episodes.get(uuid)
+        return origin.group_id if origin is not None else None
+
+    async def edge_bfs_search(
+        self,
+        driver: Any,
+        bfs_origin_node_uuids: list[str] | None,
+        bfs_max_depth: int,
+        search_filter: SearchFilters,
+        group_ids: list[str] | None = None,
+        limit: int = 100,
+    ) -> list[EntityEdge]:
+        if not bfs_origin_node_uuids or bfs_max_depth < 1:
+            return []
+
+        graph = _graph(driver)
+        edge_uuids: dict[str, None] = {}
+        for origin_uuid in bfs_origin_node_uuids:
+            # An edge lies on a path of at most bfs_max_depth hops if its source is closer
+            distances = self._reachable_entities(graph, origin_uuid, bfs_max_depth - 1)
+            sources = [origin_uuid, *distances]
+            for source_uuid in sources:
+                for edge in graph.entity_edges.from_node(source_uuid):
+                    edge_uuids[edge.uuid] = None
+
+        return self._select_edges(graph, edge_uuids, search_filter, group_ids, limit)
+
+    async def node_bfs_search(
+        self,
+        driver: Any,
+        bfs_origin_node_uuids: list[str] | None,
+        search_filter: SearchFilters,
+        bfs_max_depth: int,
+        group_ids: list[str] | None = None,
+        limit: int = 100,
+    ) -> list[EntityNode]:
+        if not bfs_origin_node_uuids or bfs_max_depth < 1:
+            return []
+
+        graph = _graph(driver)
+        groups = set(group_ids) if group_ids is not None else None
+        node_uuids: dict[str, None] = {}
+        for origin_uuid in bfs_origin_node_uuids:
+            origin_group_id = self._origin_group_id(graph, origin_uuid)
+            if origin_group_id is None or (groups is not None and origin_group_id not in groups):
+                continue
+            for uuid in self._reachable_entities(graph, origin_uuid, bfs_max_depth):
+                if graph.entities[uuid].group_id == origin_group_id:
+                    node_uuids[uuid] = None
+
+        return self._select_nodes(graph, node_uuids, search_filter, group_ids, limit)
+
+    async def community_fulltext_search(
+        self,
+        driver: Any,
+        query: str,
+        group_ids: list[str] | None = None,
+        limit: int = 100,
+    ) -> list[CommunityNode]:
+        graph = _graph(driver)
+        ranked = (uuid for uuid, _ in graph.community_text.search(query))
+        return self._select_in_groups(graph.communities, ranked, group_ids, limit)
+
+    async def community_similarity_search(
+        self,
+        driver: Any,
+        search_vector: list[float],
+        group_ids: list[str] | None = None,
+        limit: int = 100,
+        min_score: float = 0.6,
+    ) -> list[CommunityNode]:
+        graph = _graph(driver)
+        ranked = (uuid for uuid, _ in graph.community_embeddings.search(search_vector, min_score))
+        return self._select_in_groups(graph.communities, ranked, group_ids, limit)
+
+    async def get_embeddings_for_communities(
+        self, driver: Any, communities: list[CommunityNode]
+    ) -> dict[str, NDArray[np.float32]]:
+        embeddings = _graph(driver).community_embeddings
+        loaded = {community.uuid: embeddings.get(community.uuid) for community in communities}
+        return {uuid: embedding for uuid, embedding in loaded.items() if embedding is not None}
+
+    async def node_distance_reranker(
+        self,
+        driver: Any,
+        node_uuids: list[str],
+        center_node_uuid: str,
+        min_score: float = 0,
+    ) -> tuple[list[str], list[float]]:
+        table = _graph(driver).entity_edges
+        neighbors = {
+            edge.target_node_uuid
+            if edge.source_node_uuid == center_node_uuid
+            else edge.source_node_uuid
+            for edge in (table.edges[uuid] for uuid in table.incident_uuids(center_node_uuid))
+        }
+
+        filtered_uuids = [uuid for uuid in node_uuids if uuid != center_node_uuid]
+        distances = {uuid: 1.0 if uuid in neighbors else float('inf') for uuid in filtered_uuids}
+        filtered_uuids.sort(key=lambda uuid: distances[uuid])
+        if center_node_uuid in node_uuids:
+            distances[center_node_uuid] = 0.1
+            filtered_uuids = [center_node_uuid] + filtered_uuids
+
+        ranked = [(uuid, 1 / distances[uuid]) for uuid in filtered_uuids]
+        return (
+            [uuid for uuid, score in ranked if score >= min_score],
+            [score for _, score in ranked if score >= min_score],
+        )
+
+    async def episode_mentions_reranker(
+        self,
+        driver: Any,
+        node_uuids: list[list[str]],
+        min_score: float = 0,
+    ) -> tuple[list[str], list[float]]:
+        from graphiti_core.search.search_utils import rrf
+
+        table = _graph(driver).episodic_edges
+        sorted_uuids, _ = rrf(node_uuids)
+        # Unmentioned nodes score infinity and sort last, as with the Cypher implementation
+        scores = {
+            uuid: float(len(table.incoming[uuid])) if uuid in table.incoming else float('inf')
+            for uuid in sorted_uuids
+        }
+        sorted_uuids.sort(key=lambda uuid: scores[uuid])
+
+        return [uuid for uuid in sorted_uuids if scores[uuid] >= min_score], [
+            scores[uuid] for uuid in sorted_uuids if scores[uuid] >= min_score
+        ]
+
+
+class MemoryDriverSession(GraphDriverSession):
+    provider = GraphProvider.MEMORY
+
+    def __init__(self, driver: 'MemoryDriver'):
+        self.driver = driver
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+    async def close(self):
+        pass
+
+    async def execute_write(self, func, *args, **kwargs):
+        # Writes are applied as they are made, so there is no transaction to open
+        return await func(self, *args, **kwargs)
+
+    async def run(self, query: str | list, **kwargs: Any) -> Any:
+        await self.driver.execute_query(query, **kwargs)  # type: ignore[arg-type]
+
+
+class MemoryDriver(GraphDriver):
+    """A graph held in process memory, for tests, benchmarks and short-lived local graphs.
+
+    Storage and search go through `MemoryGraphOperations` and `MemorySearch` instead of Cypher,
+    so there is no query parsing and no round-trip: reads and writes take microseconds. Raw
+    Cypher passed to `execute_query` cannot be run and raises NotImplementedError. Nothing is
+    persisted, and drivers created with `with_database` or `clone` share the same graph.
+    """
+
+    provider = GraphProvider.MEMORY
+    aoss_client: None = None
+
+    def __init__(self, graph: MemoryGraph | None = None):
+        super().__init__()
+        self.graph = graph if graph is not None else MemoryGraph()
+        self._database = ''
+        self.graph_operations_interface = MemoryGraphOperations()
+        self.search_interface = MemorySearch()
+
+    async def execute_query(self, cypher_query_: str, **kwargs: Any):
+        raise NotImplementedError('MemoryDriver does not run Cypher queries')
+
+    def session(self, database: str | None = None) -> GraphDriverSession:
+        return MemoryDriverSession(self)
+
+    async def close(self):
+        pass
+
+    async def delete_all_indexes(self):
+        pass
+
+    async def build_indices_and_constraints(self, delete_existing: bool = False):
+        # The indexes are maintained as items are written
+        pass
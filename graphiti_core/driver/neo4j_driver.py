@@ -18,10 +18,18 @@ import logging
 from collections.abc import Coroutine
 from typing import Any
 
-from neo4j import AsyncGraphDatabase, EagerResult
+from neo4j import (
+    AsyncGraphDatabase,
+    AsyncManagedTransaction,
+    AsyncResult,
+    AsyncSession,
+    EagerResult,
+)
 from neo4j.exceptions import ClientError
+from pydantic import BaseModel, Field
 from typing_extensions import LiteralString
 
+from graphiti_core.concurrency import DB_POOL
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
 from graphiti_core.graph_queries import get_fulltext_indices, get_range_indices
 from graphiti_core.helpers import semaphore_gather
@@ -29,6 +37,28 @@ from graphiti_core.helpers import semaphore_gather
 logger = logging.getLogger(__name__)
 
 
+class Neo4jDriverConfig(BaseModel):
+    """Connection pool, fetch and retry settings of the underlying neo4j driver.
+
+    Settings left as None keep the neo4j driver's defaults. Timeouts and lifetimes are in
+    seconds.
+    """
+
+    max_connection_pool_size: int | None = None
+    connection_acquisition_timeout: float | None = None
+    connection_timeout: float | None = None
+    max_connection_lifetime: float | None = None
+    liveness_check_timeout: float | None = Field(
+        default=None, description='Idle time after which a pooled connection is checked first'
+    )
+    max_transaction_retry_time: float | None = None
+    fetch_size: int | None = Field(default=None, description='Records fetched per batch')
+    causal_consistency: bool = Field(
+        default=True,
+        description='Chain sessions and queries with bookmarks so reads see earlier writes',
+    )
+
+
 class Neo4jDriver(GraphDriver):
     provider = GraphProvider.NEO4J
     default_group_id: str = ''
@@ -39,11 +69,21 @@ class Neo4jDriver(GraphDriver):
         user: str | None,
         password: str | None,
         database: str = 'neo4j',
+        config: Neo4jDriverConfig | None = None,
     ):
+        """Connect to Neo4j.
+
+        With a `neo4j://` uri, queries run with `routing_='r'`, as searches do, are routed to
+        cluster followers. Unless `config.causal_consistency` is disabled, the bookmarks of
+        every write, including the write sessions of `add_episode`, are carried to later
+        queries, so a search run after an episode was added sees it even on a follower.
+        """
         super().__init__()
+        self.config = config or Neo4jDriverConfig()
         self.client = AsyncGraphDatabase.driver(
             uri=uri,
             auth=(user or '', password or ''),
+            **self.config.model_dump(exclude_none=True, exclude={'causal_consistency'}),
         )
         self._database = database
 
@@ -68,9 +108,15 @@ class Neo4jDriver(GraphDriver):
         if params is None:
             params = {}
         params.setdefault('database_', self._database)
+        if not self.config.causal_consistency:
+            kwargs.setdefault('bookmark_manager_', None)
 
         try:
-            result = await self.client.execute_query(cypher_query_, parameters_=params, **kwargs)
+            with self.observe_query(cypher_query_, params) as observation:
+                result = await self.client.execute_query(
+                    cypher_query_, parameters_=params, **kwargs
+                )
+                observation.rows = [len(result.records)]
         except Exception as e:
             logger.error(f'Error executing Neo4j query: {e}\n{cypher_query_}\n{params}')
             raise
@@ -79,7 +125,15 @@ class Neo4jDriver(GraphDriver):
 
     def session(self, database: str | None = None) -> GraphDriverSession:
         _database = database or self._database
-        return self.client.session(database=_database)  # type: ignore
+        if self.config.causal_consistency:
+            # Share the bookmarks of execute_query, so reads wait for the writes of sessions
+            session = self.client.session(
+                database=_database,
+                bookmark_manager=self.client.execute_query_bookmark_manager,
+            )
+        else:
+            session = self.client.session(database=_database)
+        return Neo4jDriverSession(session, self)
 
     async def close(self) -> None:
         return await self.client.close()
@@ -114,7 +168,9 @@ class Neo4jDriver(GraphDriver):
 
         index_queries: list[LiteralString] = range_indices + fulltext_indices
 
-        await semaphore_gather(*[self._execute_index_query(query) for query in index_queries])
+        await semaphore_gather(
+            *[self._execute_index_query(query) for query in index_queries], pool=DB_POOL
+        )
 
     async def health_check(self) -> None:
         """Check Neo4j connectivity by running the driver's verify_connectivity method."""
@@ -124,3 +180,52 @@ class Neo4jDriver(GraphDriver):
         except Exception as e:
             print(f'Neo4j health check failed: {e}')
             raise
+
+
+class Neo4jDriverSession(GraphDriverSession):
+    """A neo4j session whose queries, and those of its write transactions, are observed.
+
+    Results are streamed, so a round-trip is timed until the query is accepted and its rows
+    are not counted.
+    """
+
+    provider = GraphProvider.NEO4J
+
+    def __init__(self, session: AsyncSession, driver: Neo4jDriver):
+        self.session = session
+        self.driver = driver
+
+    async def __aenter__(self):
+        await self.session.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.__aexit__(exc_type, exc, tb)
+
+    async def close(self):
+        await self.session.close()
+
+    async def execute_write(self, func, *args, **kwargs):
+        async def observed_func(tx: AsyncManagedTransaction):
+            return await func(Neo4jDriverTransaction(tx, self.driver), *args, **kwargs)
+
+        return await self.session.execute_write(observed_func)
+
+    async def run(self, query: str, **kwargs: Any) -> AsyncResult:
+        with self.driver.observe_query(query, kwargs):
+            return await self.session.run(query, **kwargs)  # type: ignore[arg-type]
+
+
+class Neo4jDriverTransaction:
+    """A managed neo4j transaction whose queries are observed like those of its session."""
+
+    def __init__(self, tx: AsyncManagedTransaction, driver: Neo4jDriver):
+        self.tx = tx
+        self.driver = driver
+
+    async def run(self, query: str, **kwargs: Any) -> AsyncResult:
+        with self.driver.observe_query(query, kwargs):
+            return await self.tx.run(query, **kwargs)  # type: ignore[arg-type]
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.tx, name)
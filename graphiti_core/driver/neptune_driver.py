@@ -17,7 +17,10 @@ limitations under the License.
 import asyncio
 import datetime
 import logging
+import re
 from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import Any
 
 import boto3
@@ -25,9 +28,16 @@ from langchain_aws.graphs import NeptuneAnalyticsGraph, NeptuneGraph
 from opensearchpy import OpenSearch, Urllib3AWSV4SignerAuth, Urllib3HttpConnection, helpers
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.utils.embedding_encoding import (
+    EMBEDDING_PROPERTIES,
+    EmbeddingEncoding,
+    encode_embedding,
+)
 
 logger = logging.getLogger(__name__)
 DEFAULT_SIZE = 10
+# Threads running the blocking Neptune client calls, matching the OpenSearch connection pool
+DEFAULT_MAX_WORKERS = 20
 
 aoss_indices = [
     {
@@ -106,10 +116,54 @@ aoss_indices = [
 ]
 
 
+def _sanitize_value(value: Any, encoding: EmbeddingEncoding) -> Any:
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return [_sanitize_value(item, encoding) for item in value]
+    if isinstance(value, dict):
+        return _sanitize_map(value, encoding)
+    return value
+
+
+def _sanitize_map(values: dict[str, Any], encoding: EmbeddingEncoding) -> dict[str, Any]:
+    # Neptune has no vector type, so embeddings are stored as strings encoded here
+    return {
+        k: encode_embedding(v, encoding)
+        if k in EMBEDDING_PROPERTIES and not isinstance(v, str)
+        else _sanitize_value(v, encoding)
+        for k, v in values.items()
+    }
+
+
+@lru_cache(maxsize=512)
+def _compile_query(cypher_query: str, datetime_list_params: frozenset[str]) -> str:
+    """Rewrite a query so that the given list parameters are read as lists of datetimes.
+
+    Neptune receives datetimes as ISO strings. Scalar and nested datetime parameters are wrapped
+    in datetime() by the queries themselves, but top-level lists of datetimes are converted here.
+    The rewrite only depends on the query and on which parameters hold datetime lists, so it is
+    cached per query shape.
+    """
+    for name in datetime_list_params:
+        cypher_query = re.sub(
+            rf'\${re.escape(name)}\b', f'[x IN ${name} | datetime(x)]', cypher_query
+        )
+    return cypher_query
+
+
 class NeptuneDriver(GraphDriver):
     provider: GraphProvider = GraphProvider.NEPTUNE
 
-    def __init__(self, host: str, aoss_host: str, port: int = 8182, aoss_port: int = 443):
+    def __init__(
+        self,
+        host: str,
+        aoss_host: str,
+        port: int = 8182,
+        aoss_port: int = 443,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        embedding_encoding: EmbeddingEncoding = EmbeddingEncoding.CSV,
+    ):
         """This initializes a NeptuneDriver for use with Neptune as a backend
 
         Args:
@@ -117,6 +171,12 @@ class NeptuneDriver(GraphDriver):
             aoss_host (str): The OpenSearch host value
             port (int, optional): The Neptune Database port, ignored for Neptune Analytics. Defaults to 8182.
             aoss_port (int, optional): The OpenSearch port. Defaults to 443.
+            max_workers (int, optional): Threads running Neptune queries, which bounds the number
+                of queries in flight. Defaults to 20.
+            embedding_encoding (EmbeddingEncoding, optional): How embeddings are written. The
+                compact float32, float16 and int8 encodings are 3-16x smaller than the
+                comma-separated default; graphs mixing encodings read correctly, and
+                `reencode_embeddings` converts existing ones. Defaults to EmbeddingEncoding.CSV.
         """
         if not host:
             raise ValueError('You must provide an endpoint to create a NeptuneDriver')
@@ -135,6 +195,11 @@ class NeptuneDriver(GraphDriver):
             raise ValueError(
                 'You must provide an endpoint to create a NeptuneDriver as either neptune-db://<endpoint> or neptune-graph://<graphid>'
             )
+        self.embedding_encoding = embedding_encoding
+        # The Neptune client is blocking, so queries run on these threads off the event loop
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='graphiti-neptune'
+        )
 
         if not aoss_host:
             raise ValueError('You must provide an AOSS endpoint to create an OpenSearch driver.')
@@ -151,59 +216,52 @@ class NeptuneDriver(GraphDriver):
             pool_maxsize=20,
         )
 
-    def _sanitize_parameters(self, query, params: dict):
-        if isinstance(query, list):
-            queries = []
-            for q in query:
-                queries.append(self._sanitize_parameters(q, params))
-            return queries
-        else:
-            for k, v in params.items():
-                if isinstance(v, datetime.datetime):
-                    params[k] = v.isoformat()
-                elif isinstance(v, list):
-                    # Handle lists that might contain datetime objects
-                    for i, item in enumerate(v):
-                        if isinstance(item, datetime.datetime):
-                            v[i] = item.isoformat()
-                            query = str(query).replace(f'${k}', f'datetime(${k})')
-                        if isinstance(item, dict):
-                            query = self._sanitize_parameters(query, v[i])
-
-                    # If the list contains datetime objects, we need to wrap each element with datetime()
-                    if any(isinstance(item, str) and 'T' in item for item in v):
-                        # Create a new list expression with datetime() wrapped around each element
-                        datetime_list = (
-                            '['
-                            + ', '.join(
-                                f'datetime("{item}")'
-                                if isinstance(item, str) and 'T' in item
-                                else repr(item)
-                                for item in v
-                            )
-                            + ']'
-                        )
-                        query = str(query).replace(f'${k}', datetime_list)
-                elif isinstance(v, dict):
-                    query = self._sanitize_parameters(query, v)
-            return query
+    def _sanitize_parameters(self, query: str, params: dict) -> tuple[str, dict]:
+        """Convert datetimes in the parameters to ISO strings and adapt the query to them.
+
+        Embeddings are encoded with the driver's `embedding_encoding`. The caller's parameters
+        are left untouched.
+        """
+        datetime_list_params = frozenset(
+            k
+            for k, v in params.items()
+            if isinstance(v, list) and any(isinstance(item, datetime.datetime) for item in v)
+        )
+        sanitized = _sanitize_map(params, self.embedding_encoding)
+        return _compile_query(str(query), datetime_list_params), sanitized
 
     async def execute_query(
         self, cypher_query_, **kwargs: Any
     ) -> tuple[list[dict[str, Any]], None, None]:
+        """Run a query, or a list of (query, params) pairs, returning the last query's result.
+
+        Queries in a list run one after another, unless `routing_='r'` marks them as reads, in
+        which case they are independent and run concurrently.
+        """
         params = dict(kwargs)
         if isinstance(cypher_query_, list):
-            result: list[dict[str, Any]] = []
+            if params.get('routing_') == 'r':
+                results = await asyncio.gather(
+                    *[self._run_query(q[0], q[1]) for q in cypher_query_]
+                )
+                return results[-1] if results else ([], None, None)
+
+            result: tuple[list[dict[str, Any]], None, None] = ([], None, None)
             for q in cypher_query_:
-                result, _, _ = self._run_query(q[0], q[1])
-            return result, None, None
+                result = await self._run_query(q[0], q[1])
+            return result
         else:
-            return self._run_query(cypher_query_, params)
+            return await self._run_query(cypher_query_, params)
 
-    def _run_query(self, cypher_query_, params):
-        cypher_query_ = str(self._sanitize_parameters(cypher_query_, params))
+    async def _run_query(self, cypher_query_, params) -> tuple[list[dict[str, Any]], None, None]:
+        cypher_query_, params = self._sanitize_parameters(cypher_query_, params)
+        loop = asyncio.get_running_loop()
         try:
-            result = self.client.query(cypher_query_, params=params)
+            with self.observe_query(cypher_query_, params) as observation:
+                result = await loop.run_in_executor(
+                    self._executor, partial(self.client.query, cypher_query_, params=params)
+                )
+                observation.rows = [len(result)]
         except Exception as e:
             logger.error('Query: %s', cypher_query_)
             logger.error('Parameters: %s', params)
@@ -216,6 +274,7 @@ class NeptuneDriver(GraphDriver):
         return NeptuneDriverSession(driver=self)
 
     async def close(self) -> None:
+        self._executor.shutdown(wait=False)
         return self.client.client.close()
 
     async def _delete_all_data(self) -> Any:
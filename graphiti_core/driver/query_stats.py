@@ -0,0 +1,224 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import bisect
+import copy
+import hashlib
+import re
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds of the latency buckets in milliseconds; the last bucket is unbounded
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+MAX_TEMPLATE_LENGTH = 500
+MAX_CACHED_FINGERPRINTS = 4096
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_WHITESPACE = re.compile(r'\s+')
+
+# Frames of these modules are skipped when looking for the code that issued a query
+_INTERNAL_MODULES = ('graphiti_core.driver.', 'contextlib', 'asyncio.')
+
+
+def normalize_query(query: str) -> str:
+    """Reduce a query to its template: literals become `?` and whitespace is collapsed."""
+    query = _STRING_LITERAL.sub('?', query)
+    query = _NUMBER_LITERAL.sub('?', query)
+    return _WHITESPACE.sub(' ', query).strip()
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the number of bytes a parameter value takes on the wire.
+
+    Lists of numbers, such as embeddings, are sized from their length alone.
+    """
+    if value is None or isinstance(value, bool):
+        return 1
+    if isinstance(value, int | float):
+        return 8
+    if isinstance(value, str | bytes):
+        return len(value)
+    if isinstance(value, Mapping):
+        return sum(len(str(key)) + estimate_size(item) for key, item in value.items())
+    if isinstance(value, list | tuple | set):
+        if not value:
+            return 0
+        first = next(iter(value))
+        if isinstance(first, int | float) and not isinstance(first, bool):
+            return 8 * len(value)
+        return sum(estimate_size(item) for item in value)
+    return len(str(value))
+
+
+def find_caller() -> str:
+    """Name the innermost function outside the driver layer on the current call stack."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if not module.startswith(_INTERNAL_MODULES) and module != __name__:
+            code = frame.f_code
+            return f'{module}.{getattr(code, "co_qualname", code.co_name)}'
+        frame = frame.f_back  # type: ignore[assignment]
+    return 'unknown'
+
+
+@dataclass
+class LatencyHistogram:
+    """Query latencies counted into the fixed buckets of `LATENCY_BUCKETS_MS`."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def record(self, duration_ms: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def percentile(self, fraction: float) -> float:
+        """Return the upper bound of the bucket holding the given fraction of latencies.
+
+        Latencies beyond the last bucket report the largest latency seen.
+        """
+        count = self.count
+        if count == 0:
+            return 0.0
+        rank = fraction * count
+        seen = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS_MS, self.counts, strict=False):
+            seen += bucket_count
+            if seen >= rank:
+                return min(float(bound), self.max_ms)
+        return self.max_ms
+
+
+@dataclass
+class QueryCallStats:
+    """Counters of the queries of one template, overall or from one caller."""
+
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    params_bytes: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def record(self, duration_ms: float, rows: int, params_bytes: int, error: bool) -> None:
+        self.calls += 1
+        self.errors += int(error)
+        self.rows += rows
+        self.params_bytes += params_bytes
+        self.latency.record(duration_ms)
+
+    @property
+    def total_ms(self) -> float:
+        return self.latency.total_ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self.latency.total_ms / self.calls if self.calls else 0.0
+
+    @property
+    def p50_ms(self) -> float:
+        return self.latency.percentile(0.5)
+
+    @property
+    def p95_ms(self) -> float:
+        return self.latency.percentile(0.95)
+
+    @property
+    def p99_ms(self) -> float:
+        return self.latency.percentile(0.99)
+
+    @property
+    def rows_per_call(self) -> float:
+        return self.rows / self.calls if self.calls else 0.0
+
+
+@dataclass
+class QueryTemplateStats(QueryCallStats):
+    """Counters of one query template, with a breakdown by the function that issued it.
+
+    Many calls from one caller that each return a row or two are the mark of an N+1 pattern.
+    """
+
+    fingerprint: str = ''
+    template: str = ''
+    by_caller: dict[str, QueryCallStats] = field(default_factory=dict)
+
+
+class QueryStats:
+    """Latency, row and parameter-size counters of a driver's queries, per query template.
+
+    Queries are grouped by a fingerprint of their text with literals and whitespace normalized
+    away, so queries assembled from the same shape share their counters.
+    """
+
+    def __init__(self):
+        self.round_trips = 0
+        self._templates: dict[str, QueryTemplateStats] = {}
+        self._fingerprints: dict[str, tuple[str, str]] = {}
+
+    def fingerprint(self, query: str) -> tuple[str, str]:
+        """Return the fingerprint and normalized template of a query."""
+        cached = self._fingerprints.get(query)
+        if cached is not None:
+            return cached
+        template = normalize_query(query)
+        fingerprint = hashlib.blake2b(template.encode(), digest_size=8).hexdigest()
+        if len(self._fingerprints) >= MAX_CACHED_FINGERPRINTS:
+            self._fingerprints.clear()
+        self._fingerprints[query] = fingerprint, template
+        return fingerprint, template
+
+    def record(
+        self,
+        query: str,
+        duration_ms: float,
+        rows: int = 0,
+        params_bytes: int = 0,
+        caller: str = 'unknown',
+        error: bool = False,
+    ) -> None:
+        fingerprint, template = self.fingerprint(query)
+        stats = self._templates.get(fingerprint)
+        if stats is None:
+            stats = QueryTemplateStats(
+                fingerprint=fingerprint, template=template[:MAX_TEMPLATE_LENGTH]
+            )
+            self._templates[fingerprint] = stats
+        stats.record(duration_ms, rows, params_bytes, error)
+        caller_stats = stats.by_caller.get(caller)
+        if caller_stats is None:
+            caller_stats = stats.by_caller[caller] = QueryCallStats()
+        caller_stats.record(duration_ms, rows, params_bytes, error)
+
+    def snapshot(self) -> dict[str, QueryTemplateStats]:
+        """Return a copy of the counters keyed by fingerprint, most total time first."""
+        return {
+            stats.fingerprint: copy.deepcopy(stats)
+            for stats in sorted(self._templates.values(), key=lambda s: s.total_ms, reverse=True)
+        }
+
+    def reset(self) -> None:
+        self.round_trips = 0
+        self._templates.clear()
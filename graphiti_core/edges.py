@@ -27,8 +27,9 @@ from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.embedder import EmbedderClient
+from graphiti_core.embedder.embedding import Embedding, embedding_to_list, to_embedding
 from graphiti_core.errors import EdgeNotFoundError, GroupsEdgesNotFoundError
-from graphiti_core.helpers import parse_db_date
+from graphiti_core.helpers import compute_fact_hash, parse_db_date
 from graphiti_core.models.edges.edge_db_queries import (
     COMMUNITY_EDGE_RETURN,
     EPISODIC_EDGE_RETURN,
@@ -42,6 +43,7 @@ from graphiti_core.models.edges.edge_db_queries import (
     get_entity_edge_save_query,
 )
 from graphiti_core.nodes import Node
+from graphiti_core.utils.embedding_encoding import decode_embedding
 
 logger = logging.getLogger(__name__)
 
@@ -214,6 +216,35 @@ class EpisodicEdge(Edge):
             raise EdgeNotFoundError(uuids[0])
         return edges
 
+    @classmethod
+    async def get_by_episode_uuids(cls, driver: GraphDriver, episode_uuids: list[str]):
+        """Return the MENTIONS edges from the given episodes."""
+        if len(episode_uuids) == 0:
+            return []
+
+        if driver.graph_operations_interface:
+            try:
+                return await driver.graph_operations_interface.episodic_edge_get_by_episode_uuids(
+                    cls, driver, episode_uuids
+                )
+            except NotImplementedError:
+                pass
+
+        records, _, _ = await driver.execute_query(
+            """
+            MATCH (n:Episodic)-[e:MENTIONS]->(m:Entity)
+            WHERE n.uuid IN $episode_uuids
+            RETURN
+            """
+            + EPISODIC_EDGE_RETURN,
+            episode_uuids=episode_uuids,
+            routing_='r',
+        )
+
+        edges = [get_episodic_edge_from_record(record) for record in records]
+
+        return edges
+
     @classmethod
     async def get_by_group_ids(
         cls,
@@ -263,7 +294,7 @@ class EpisodicEdge(Edge):
 class EntityEdge(Edge):
     name: str = Field(description='name of the edge, relation name')
     fact: str = Field(description='fact representing the edge and nodes that it connects')
-    fact_embedding: list[float] | None = Field(default=None, description='embedding of the fact')
+    fact_embedding: Embedding | None = Field(default=None, description='embedding of the fact')
     episodes: list[str] = Field(
         default=[],
         description='list of episode ids that reference these entity edges',
@@ -285,7 +316,7 @@ class EntityEdge(Edge):
         start = time()
 
         text = self.fact.replace('\n', ' ')
-        self.fact_embedding = await embedder.create(input_data=[text])
+        self.fact_embedding = to_embedding(await embedder.create(input_data=[text]))
 
         end = time()
         logger.debug(f'embedded {text} in {end - start} ms')
@@ -304,12 +335,6 @@ class EntityEdge(Edge):
             RETURN e.fact_embedding AS fact_embedding
         """
 
-        if driver.provider == GraphProvider.NEPTUNE:
-            query = """
-                MATCH (n:Entity)-[e:RELATES_TO {uuid: $uuid}]->(m:Entity)
-                RETURN [x IN split(e.fact_embedding, ",") | toFloat(x)] as fact_embedding
-            """
-
         if driver.provider == GraphProvider.KUZU:
             query = """
                 MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_ {uuid: $uuid})-[:RELATES_TO]->(m:Entity)
@@ -325,7 +350,7 @@ class EntityEdge(Edge):
         if len(records) == 0:
             raise EdgeNotFoundError(self.uuid)
 
-        self.fact_embedding = records[0]['fact_embedding']
+        self.fact_embedding = decode_embedding(records[0]['fact_embedding'])
 
     async def save(self, driver: GraphDriver):
         if driver.graph_operations_interface:
@@ -341,7 +366,8 @@ class EntityEdge(Edge):
             'name': self.name,
             'group_id': self.group_id,
             'fact': self.fact,
-            'fact_embedding': self.fact_embedding,
+            'fact_hash': compute_fact_hash(self.source_node_uuid, self.target_node_uuid, self.fact),
+            'fact_embedding': embedding_to_list(self.fact_embedding),
             'episodes': self.episodes,
             'created_at': self.created_at,
             'expired_at': self.expired_at,
@@ -469,6 +495,50 @@ class EntityEdge(Edge):
 
         return edges
 
+    @classmethod
+    async def get_by_fact_hashes(cls, driver: GraphDriver, fact_hashes: list[str]):
+        """Return the edges stored under any of `fact_hashes` (see `compute_fact_hash`).
+
+        Edges saved before the `fact_hash` property existed are only found once
+        `backfill_exact_match_keys` has run.
+        """
+        if len(fact_hashes) == 0:
+            return []
+
+        if driver.graph_operations_interface:
+            try:
+                return await driver.graph_operations_interface.edge_get_by_fact_hashes(
+                    cls, driver, fact_hashes
+                )
+            except NotImplementedError:
+                pass
+
+        match_query = """
+            MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
+        """
+        if driver.provider == GraphProvider.KUZU:
+            match_query = """
+                MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity)
+            """
+
+        records, _, _ = await driver.execute_query(
+            """
+            UNWIND $fact_hashes AS fact_hash
+            """
+            + match_query
+            + """
+            WHERE e.fact_hash = fact_hash
+            RETURN
+            """
+            + get_entity_edge_return_query(driver.provider),
+            fact_hashes=list(dict.fromkeys(fact_hashes)),
+            routing_='r',
+        )
+
+        edges = [get_entity_edge_from_record(record, driver.provider) for record in records]
+
+        return edges
+
     @classmethod
     async def get_by_group_ids(
         cls,
@@ -968,6 +1038,7 @@ def get_entity_edge_from_record(record: Any, provider: GraphProvider) -> EntityE
         attributes.pop('target_node_uuid', None)
         attributes.pop('fact', None)
         attributes.pop('fact_embedding', None)
+        attributes.pop('fact_hash', None)
         attributes.pop('name', None)
         attributes.pop('group_id', None)
         attributes.pop('episodes', None)
@@ -981,7 +1052,7 @@ def get_entity_edge_from_record(record: Any, provider: GraphProvider) -> EntityE
         source_node_uuid=record['source_node_uuid'],
         target_node_uuid=record['target_node_uuid'],
         fact=record['fact'],
-        fact_embedding=record.get('fact_embedding'),
+        fact_embedding=decode_embedding(record.get('fact_embedding')),
         name=record['name'],
         group_id=record['group_id'],
         episodes=episodes,
@@ -1033,4 +1104,4 @@ async def create_entity_edge_embeddings(embedder: EmbedderClient, edges: list[En
         return
     fact_embeddings = await embedder.create_batch([edge.fact for edge in filtered_edges])
     for edge, fact_embedding in zip(filtered_edges, fact_embeddings, strict=True):
-        edge.fact_embedding = fact_embedding
+        edge.fact_embedding = to_embedding(fact_embedding)
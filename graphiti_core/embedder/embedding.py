@@ -0,0 +1,67 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from collections.abc import Sequence
+from typing import Annotated, Any
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import PlainSerializer, PlainValidator, WithJsonSchema
+
+EMBEDDING_DTYPE = np.float32
+
+
+def to_embedding(value: Any) -> NDArray[np.float32] | None:
+    """Convert an embedding from any source to the float32 array held by the models.
+
+    Float32 arrays are returned as they are; lists and other arrays are converted. A
+    1536-dimension embedding takes 6 KB as an array, against about 50 KB as a list of
+    Python floats.
+    """
+    if value is None:
+        return None
+    return np.asarray(value, dtype=EMBEDDING_DTYPE)
+
+
+def embedding_to_list(value: Any) -> list[float] | None:
+    """Convert an embedding to a list of floats, for drivers that cannot take arrays."""
+    if value is None or isinstance(value, list):
+        return value
+    return np.asarray(value).tolist()
+
+
+# Embeddings are held as float32 arrays and dumped as lists of floats
+Embedding = Annotated[
+    NDArray[np.float32],
+    PlainValidator(to_embedding),
+    PlainSerializer(embedding_to_list, return_type=list[float]),
+    WithJsonSchema({'type': 'array', 'items': {'type': 'number'}}),
+]
+
+
+def stack_embeddings(embeddings: Sequence[Any]) -> NDArray[np.float32]:
+    """Stack embeddings of the same dimension into a float32 matrix with one row each."""
+    if len(embeddings) == 0:
+        return np.empty((0, 0), dtype=EMBEDDING_DTYPE)
+    return np.stack([np.asarray(embedding) for embedding in embeddings]).astype(
+        EMBEDDING_DTYPE, copy=False
+    )
+
+
+def normalize_rows(matrix: NDArray) -> NDArray:
+    """Scale each row of a matrix to unit L2 norm, leaving zero rows as they are."""
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
@@ -29,15 +29,15 @@ def get_range_indices(provider: GraphProvider) -> list[LiteralString]:
     if provider == GraphProvider.FALKORDB:
         return [
             # Entity node
-            'CREATE INDEX FOR (n:Entity) ON (n.uuid, n.group_id, n.name, n.created_at)',
+            'CREATE INDEX FOR (n:Entity) ON (n.uuid, n.group_id, n.name, n.name_normalized, n.created_at)',
             # Episodic node
-            'CREATE INDEX FOR (n:Episodic) ON (n.uuid, n.group_id, n.created_at, n.valid_at)',
+            'CREATE INDEX FOR (n:Episodic) ON (n.uuid, n.group_id, n.created_at, n.valid_at, n.content_hash)',
             # Community node
             'CREATE INDEX FOR (n:Community) ON (n.uuid)',
             # Saga node
             'CREATE INDEX FOR (n:Saga) ON (n.uuid, n.group_id, n.name)',
             # RELATES_TO edge
-            'CREATE INDEX FOR ()-[e:RELATES_TO]-() ON (e.uuid, e.group_id, e.name, e.created_at, e.expired_at, e.valid_at, e.invalid_at)',
+            'CREATE INDEX FOR ()-[e:RELATES_TO]-() ON (e.uuid, e.group_id, e.name, e.fact_hash, e.created_at, e.expired_at, e.valid_at, e.invalid_at)',
             # MENTIONS edge
             'CREATE INDEX FOR ()-[e:MENTIONS]-() ON (e.uuid, e.group_id)',
             # HAS_MEMBER edge
@@ -70,11 +70,14 @@ def get_range_indices(provider: GraphProvider) -> list[LiteralString]:
         'CREATE INDEX has_episode_group_id IF NOT EXISTS FOR ()-[e:HAS_EPISODE]-() ON (e.group_id)',
         'CREATE INDEX next_episode_group_id IF NOT EXISTS FOR ()-[e:NEXT_EPISODE]-() ON (e.group_id)',
         'CREATE INDEX name_entity_index IF NOT EXISTS FOR (n:Entity) ON (n.name)',
+        'CREATE INDEX name_normalized_entity_index IF NOT EXISTS FOR (n:Entity) ON (n.name_normalized)',
         'CREATE INDEX saga_name IF NOT EXISTS FOR (n:Saga) ON (n.name)',
         'CREATE INDEX created_at_entity_index IF NOT EXISTS FOR (n:Entity) ON (n.created_at)',
         'CREATE INDEX created_at_episodic_index IF NOT EXISTS FOR (n:Episodic) ON (n.created_at)',
         'CREATE INDEX valid_at_episodic_index IF NOT EXISTS FOR (n:Episodic) ON (n.valid_at)',
+        'CREATE INDEX content_hash_episodic_index IF NOT EXISTS FOR (n:Episodic) ON (n.group_id, n.content_hash)',
         'CREATE INDEX name_edge_index IF NOT EXISTS FOR ()-[e:RELATES_TO]-() ON (e.name)',
+        'CREATE INDEX fact_hash_edge_index IF NOT EXISTS FOR ()-[e:RELATES_TO]-() ON (e.fact_hash)',
         'CREATE INDEX created_at_edge_index IF NOT EXISTS FOR ()-[e:RELATES_TO]-() ON (e.created_at)',
         'CREATE INDEX expired_at_edge_index IF NOT EXISTS FOR ()-[e:RELATES_TO]-() ON (e.expired_at)',
         'CREATE INDEX valid_at_edge_index IF NOT EXISTS FOR ()-[e:RELATES_TO]-() ON (e.valid_at)',
@@ -173,3 +176,26 @@ def get_relationships_query(name: str, limit: int, provider: GraphProvider) -> s
         return f"CALL QUERY_FTS_INDEX('{label}', '{name}', cast($query AS STRING), TOP := $limit)"
 
     return f'CALL db.index.fulltext.queryRelationships("{name}", $query, {{limit: $limit}})'
+
+
+def get_kuzu_copy_query(
+    table: str,
+    columns: list[str],
+    from_table: str | None = None,
+    to_table: str | None = None,
+) -> str:
+    """Build a COPY query loading `table` from the list of structs passed as `$rows`.
+
+    For a rel table, `columns` starts with the fields holding the uuids of the source and target
+    nodes and continues with the rel properties in table order; `from_table` and `to_table` pick
+    the node table pair of rel tables that have several.
+    """
+    row_columns = ', '.join(f'row.{column}' for column in columns)
+    if from_table is None:
+        query = (
+            f'COPY {table}({", ".join(columns)}) FROM (UNWIND $rows AS row RETURN {row_columns})'
+        )
+    else:
+        query = f'COPY {table} FROM (UNWIND $rows AS row RETURN {row_columns})'
+        query += f" (from='{from_table}', to='{to_table}')"
+    return query
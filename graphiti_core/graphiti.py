@@ -22,6 +22,13 @@ from dotenv import load_dotenv
 from pydantic import BaseModel
 from typing_extensions import LiteralString
 
+from graphiti_core.concurrency import (
+    DB_POOL,
+    EMBEDDER_POOL,
+    LLM_POOL,
+    ConcurrencyGovernor,
+    KeyedLocks,
+)
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.cross_encoder.openai_reranker_client import OpenAIRerankerClient
 from graphiti_core.decorators import handle_multiple_group_ids
@@ -40,6 +47,7 @@ from graphiti_core.embedder import EmbedderClient, OpenAIEmbedder
 from graphiti_core.errors import NodeNotFoundError
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import (
+    compute_content_hash,
     get_default_group_id,
     semaphore_gather,
     validate_excluded_entity_types,
@@ -78,7 +86,9 @@ from graphiti_core.utils.bulk_utils import (
     resolve_edge_pointers,
     retrieve_previous_episodes_bulk,
 )
-from graphiti_core.utils.datetime_utils import utc_now
+from graphiti_core.utils.datetime_utils import ensure_utc, utc_now
+from graphiti_core.utils.entity_name_cache import EntityNameCache
+from graphiti_core.utils.episode_context import EpisodeSummaryCache, assemble_previous_episodes
 from graphiti_core.utils.maintenance.community_operations import (
     build_communities,
     remove_communities,
@@ -100,6 +110,7 @@ from graphiti_core.utils.maintenance.node_operations import (
     resolve_extracted_nodes,
 )
 from graphiti_core.utils.ontology_utils.entity_types_utils import validate_entity_types
+from graphiti_core.utils.resolution_memo import EntityResolutionMemo
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +140,18 @@ class AddTripletResults(BaseModel):
     edges: list[EntityEdge]
 
 
+def _redelivery_key(episode: EpisodicNode) -> tuple:
+    return episode.source, ensure_utc(episode.valid_at), episode.content_hash
+
+
+def _ingest_lock_keys(group_id: str, episodes: list[EpisodicNode]) -> list[str]:
+    return [
+        f'{group_id}\x1f{episode.content_hash}'
+        for episode in episodes
+        if episode.content_hash is not None
+    ]
+
+
 class Graphiti:
     def __init__(
         self,
@@ -143,6 +166,10 @@ class Graphiti:
         max_coroutines: int | None = None,
         tracer: Tracer | None = None,
         trace_span_prefix: str = 'graphiti',
+        governor: ConcurrencyGovernor | None = None,
+        episode_summaries: EpisodeSummaryCache | None = None,
+        resolution_memo: EntityResolutionMemo | None = None,
+        entity_name_cache: EntityNameCache | None = None,
     ):
         """
         Initialize a Graphiti instance.
@@ -179,6 +206,26 @@ class Graphiti:
             An OpenTelemetry tracer instance for distributed tracing. If not provided, tracing is disabled (no-op).
         trace_span_prefix : str, optional
             Prefix to prepend to all span names. Defaults to 'graphiti'.
+        governor : ConcurrencyGovernor | None, optional
+            Shared concurrency budget with separate pools for database, LLM, embedder and reranker
+            calls. Nested operations draw from the same pools, so the load on each backend stays
+            bounded. Pass the same governor to several Graphiti instances to share one budget.
+            If not provided, one is created with every pool limited to max_coroutines
+            (or the *_CONCURRENCY_LIMIT / SEMAPHORE_LIMIT environment variables).
+        episode_summaries : EpisodeSummaryCache | None, optional
+            Rolling per-group summaries of the previous episodes that no longer fit in the
+            PREVIOUS_EPISODES_TOKEN_BUDGET. When set, add_episode folds the episodes left out of
+            the prompt context into the summary of their group, and extraction prompts include
+            that summary ahead of the recent episodes. Disabled by default.
+        resolution_memo : EntityResolutionMemo | None, optional
+            Durable map from (group_id, normalized name, labels) to the entity it resolved to,
+            e.g. a SQLiteEntityResolutionMemo. Entities seen before are then resolved without a
+            candidate search or a dedupe prompt. Disabled by default.
+        entity_name_cache : EntityNameCache | None, optional
+            In-process map from the exact names of each group's entities to their uuids, warmed
+            on first use and kept current by this instance's writes. Extracted entities whose
+            name belongs to exactly one existing entity then skip candidate search and dedupe.
+            Disabled by default.
 
         Returns
         -------
@@ -208,6 +255,7 @@ class Graphiti:
 
         self.store_raw_episode_content = store_raw_episode_content
         self.max_coroutines = max_coroutines
+        self.governor = governor or ConcurrencyGovernor(max_coroutines)
         if llm_client:
             self.llm_client = llm_client
         else:
@@ -226,6 +274,7 @@ class Graphiti:
 
         # Set tracer on clients
         self.llm_client.set_tracer(self.tracer)
+        self.driver.set_tracer(self.tracer)
 
         self.clients = GraphitiClients(
             driver=self.driver,
@@ -233,8 +282,15 @@ class Graphiti:
             embedder=self.embedder,
             cross_encoder=self.cross_encoder,
             tracer=self.tracer,
+            governor=self.governor,
+            episode_summaries=episode_summaries,
+            resolution_memo=resolution_memo,
+            entity_name_cache=entity_name_cache,
         )
 
+        # Serializes idempotent ingestion of identical content within this instance
+        self._ingest_locks = KeyedLocks()
+
         # Capture telemetry event
         self._capture_initialization_telemetry()
 
@@ -340,6 +396,28 @@ class Graphiti:
         SagaNode
             The existing or newly created saga node.
         """
+        existing_saga = await self._get_saga_by_name(saga_name, group_id)
+        if existing_saga is not None:
+            return existing_saga
+
+        # Create new saga
+        saga = SagaNode(
+            name=saga_name,
+            group_id=group_id,
+            created_at=now,
+        )
+        await saga.save(self.driver)
+        return saga
+
+    async def _get_saga_by_name(self, saga_name: str, group_id: str) -> SagaNode | None:
+        if self.driver.graph_operations_interface:
+            try:
+                return await self.driver.graph_operations_interface.saga_node_get_by_name(
+                    SagaNode, self.driver, saga_name, group_id
+                )
+            except NotImplementedError:
+                pass
+
         # Query for existing saga with this name in the group
         records, _, _ = await self.driver.execute_query(
             """
@@ -351,26 +429,44 @@ class Graphiti:
             routing_='r',
         )
 
-        if records:
-            # Saga exists, return it
-            from graphiti_core.helpers import parse_db_date
+        if not records:
+            return None
 
-            record = records[0]
-            return SagaNode(
-                uuid=record['uuid'],
-                name=record['name'],
-                group_id=record['group_id'],
-                created_at=parse_db_date(record['created_at']),  # type: ignore
-            )
+        from graphiti_core.helpers import parse_db_date
 
-        # Create new saga
-        saga = SagaNode(
-            name=saga_name,
-            group_id=group_id,
-            created_at=now,
+        record = records[0]
+        return SagaNode(
+            uuid=record['uuid'],
+            name=record['name'],
+            group_id=record['group_id'],
+            created_at=parse_db_date(record['created_at']),  # type: ignore
         )
-        await saga.save(self.driver)
-        return saga
+
+    async def _get_latest_saga_episode_uuid(
+        self, saga_uuid: str, exclude_uuid: str | None = None
+    ) -> str | None:
+        if self.driver.graph_operations_interface:
+            try:
+                return await self.driver.graph_operations_interface.saga_get_latest_episode_uuid(
+                    self.driver, saga_uuid, exclude_uuid
+                )
+            except NotImplementedError:
+                pass
+
+        exclude_filter = 'WHERE e.uuid <> $exclude_uuid' if exclude_uuid is not None else ''
+        records, _, _ = await self.driver.execute_query(
+            f"""
+            MATCH (s:Saga {{uuid: $saga_uuid}})-[:HAS_EPISODE]->(e:Episodic)
+            {exclude_filter}
+            RETURN e.uuid AS uuid
+            ORDER BY e.valid_at DESC, e.created_at DESC
+            LIMIT 1
+            """,
+            saga_uuid=saga_uuid,
+            exclude_uuid=exclude_uuid,
+            routing_='r',
+        )
+        return records[0]['uuid'] if records else None
 
     async def build_indices_and_constraints(self, delete_existing: bool = False):
         """
@@ -428,6 +524,81 @@ class Graphiti:
 
         return nodes, uuid_map, duplicates
 
+    async def _split_redelivered_episodes(
+        self, group_id: str, episodes: list[EpisodicNode]
+    ) -> tuple[list[EpisodicNode], list[EpisodicNode]]:
+        """Split episodes into those to ingest and the stored episodes redelivered among them.
+
+        An episode redelivers a stored one with another uuid when both have the same source,
+        reference time and content hash in the group. Of identical episodes within `episodes`
+        only the first is kept.
+        """
+        stored = await EpisodicNode.get_by_content_hashes(
+            self.driver,
+            group_id,
+            [episode.content_hash for episode in episodes if episode.content_hash is not None],
+        )
+        stored_uuids = {episode.uuid for episode in stored}
+        seen: dict[tuple, EpisodicNode] = {}
+        for stored_episode in stored:
+            seen.setdefault(_redelivery_key(stored_episode), stored_episode)
+
+        to_ingest: list[EpisodicNode] = []
+        redelivered: dict[str, EpisodicNode] = {}
+        for episode in episodes:
+            if episode.content_hash is None:
+                to_ingest.append(episode)
+                continue
+
+            key = _redelivery_key(episode)
+            match = seen.setdefault(key, episode)
+            if match.uuid == episode.uuid:
+                # New content, or a stored episode passed in to be processed again
+                to_ingest.append(episode)
+            elif match.uuid in stored_uuids:
+                redelivered[match.uuid] = match
+            # Otherwise it repeats an episode earlier in this batch and is dropped
+
+        return to_ingest, list(redelivered.values())
+
+    async def _load_episode_results(
+        self, episodes: list[EpisodicNode]
+    ) -> tuple[list[EpisodicEdge], list[EntityNode], list[EntityEdge]]:
+        """Load the episodic edges, entities and facts stored for already ingested episodes."""
+        episodic_edges, nodes, edges = await semaphore_gather(
+            EpisodicEdge.get_by_episode_uuids(self.driver, [episode.uuid for episode in episodes]),
+            get_mentioned_nodes(self.driver, episodes),
+            EntityEdge.get_by_uuids(
+                self.driver,
+                list(dict.fromkeys(uuid for episode in episodes for uuid in episode.entity_edges)),
+            ),
+            governor=self.clients.governor,
+            pool=DB_POOL,
+        )
+        return episodic_edges, nodes, edges
+
+    async def _fold_omitted_episodes(
+        self,
+        episode: EpisodicNode,
+        previous_episodes: list[EpisodicNode],
+        group_id: str,
+    ) -> None:
+        """Fold the previous episodes left out of the prompt budget into the rolling summary."""
+        summaries = self.clients.episode_summaries
+        if summaries is None:
+            return
+
+        omitted = assemble_previous_episodes(
+            previous_episodes, episode.content, older_summary=summaries.get(group_id)
+        ).omitted
+        if not omitted:
+            return
+        try:
+            await summaries.fold(self.llm_client, group_id, omitted)
+        except Exception as e:
+            # The summary only adds context, so a failure must not fail the episode
+            logger.warning(f'Could not update the summary of earlier episodes: {e}')
+
     async def _extract_and_resolve_edges(
         self,
         episode: EpisodicNode,
@@ -511,6 +682,7 @@ class Graphiti:
             nodes,
             entity_edges,
             self.embedder,
+            entity_name_cache=self.clients.entity_name_cache,
         )
 
         # Handle saga association if provided
@@ -525,20 +697,9 @@ class Graphiti:
             previous_episode_uuid: str | None = saga_previous_episode_uuid
             if previous_episode_uuid is None:
                 # Find the most recent episode in the saga (excluding the current one)
-                previous_episode_records, _, _ = await self.driver.execute_query(
-                    """
-                    MATCH (s:Saga {uuid: $saga_uuid})-[:HAS_EPISODE]->(e:Episodic)
-                    WHERE e.uuid <> $current_episode_uuid
-                    RETURN e.uuid AS uuid
-                    ORDER BY e.valid_at DESC, e.created_at DESC
-                    LIMIT 1
-                    """,
-                    saga_uuid=saga_node.uuid,
-                    current_episode_uuid=episode.uuid,
-                    routing_='r',
+                previous_episode_uuid = await self._get_latest_saga_episode_uuid(
+                    saga_node.uuid, exclude_uuid=episode.uuid
                 )
-                if previous_episode_records:
-                    previous_episode_uuid = previous_episode_records[0]['uuid']
 
             # Create NEXT_EPISODE edge from the previous episode to the new one
             if previous_episode_uuid is not None:
@@ -630,7 +791,9 @@ class Graphiti:
                     entity_types,
                 )
                 for episode, previous_episodes in episode_context
-            ]
+            ],
+            governor=self.clients.governor,
+            pool=LLM_POOL,
         )
 
         resolved_nodes: list[EntityNode] = []
@@ -663,7 +826,9 @@ class Graphiti:
                     entity_types,
                 )
                 for episode, previous_episodes in episode_context
-            ]
+            ],
+            governor=self.clients.governor,
+            pool=LLM_POOL,
         )
 
         final_hydrated_nodes = [node for nodes in hydrated_nodes_results for node in nodes]
@@ -691,7 +856,9 @@ class Graphiti:
                     edge_type_map,
                 )
                 for episode in episodes
-            ]
+            ],
+            governor=self.clients.governor,
+            pool=LLM_POOL,
         )
 
         resolved_edges: list[EntityEdge] = []
@@ -774,6 +941,7 @@ class Graphiti:
         custom_extraction_instructions: str | None = None,
         saga: str | SagaNode | None = None,
         saga_previous_episode_uuid: str | None = None,
+        idempotent: bool = False,
     ) -> AddEpisodeResults:
         """
         Process an episode and update the graph.
@@ -821,6 +989,12 @@ class Graphiti:
             query to find the most recent episode. Useful for efficiently adding multiple episodes
             to the same saga in sequence. The returned AddEpisodeResults.episode.uuid can be passed
             as this parameter for the next episode.
+        idempotent : bool
+            Optional. When True, an episode with the same group_id, source, reference_time and
+            content as one already stored is not processed again: the stored episode and the nodes
+            and edges it produced are returned without any LLM or embedding calls. When a uuid is
+            given, the stored episode is returned as is if its content matches `episode_body`. Use
+            this when the upstream may redeliver messages.
 
         Returns
         -------
@@ -861,19 +1035,8 @@ class Graphiti:
                 self.clients.driver = self.driver
 
         with self.tracer.start_span('add_episode') as span:
+            ingest_locks: list[str] = []
             try:
-                # Retrieve previous episodes for context
-                previous_episodes = (
-                    await self.retrieve_episodes(
-                        reference_time,
-                        last_n=RELEVANT_SCHEMA_LIMIT,
-                        group_ids=[group_id],
-                        source=source,
-                    )
-                    if previous_episode_uuids is None
-                    else await EpisodicNode.get_by_uuids(self.driver, previous_episode_uuids)
-                )
-
                 # Get or create episode
                 episode = (
                     await EpisodicNode.get_by_uuid(self.driver, uuid)
@@ -887,9 +1050,58 @@ class Graphiti:
                         source_description=source_description,
                         created_at=now,
                         valid_at=reference_time,
+                        content_hash=compute_content_hash(episode_body),
                     )
                 )
 
+                redelivered: list[EpisodicNode] = []
+                if idempotent and uuid is not None:
+                    # A stored episode sent again with the same content was already ingested
+                    if episode.content_hash == compute_content_hash(episode_body):
+                        redelivered = [episode]
+                elif idempotent:
+                    # Hold the content's lock until it is saved, so a concurrent redelivery
+                    # finds the stored episode instead of ingesting it again
+                    ingest_locks = await self._ingest_locks.acquire(
+                        _ingest_lock_keys(group_id, [episode])
+                    )
+                    _, redelivered = await self._split_redelivered_episodes(group_id, [episode])
+                if redelivered:
+                    stored_episode = redelivered[0]
+                    episodic_edges, nodes, edges = await self._load_episode_results(
+                        [stored_episode]
+                    )
+                    span.add_attributes(
+                        {
+                            'episode.uuid': stored_episode.uuid,
+                            'episode.redelivered': True,
+                            'group_id': group_id,
+                        }
+                    )
+                    logger.info(
+                        f'Episode {stored_episode.uuid} was already ingested, returning its stored results'
+                    )
+                    return AddEpisodeResults(
+                        episode=stored_episode,
+                        episodic_edges=episodic_edges,
+                        nodes=nodes,
+                        edges=edges,
+                        communities=[],
+                        community_edges=[],
+                    )
+
+                # Retrieve previous episodes for context
+                previous_episodes = (
+                    await self.retrieve_episodes(
+                        reference_time,
+                        last_n=RELEVANT_SCHEMA_LIMIT,
+                        group_ids=[group_id],
+                        source=source,
+                    )
+                    if previous_episode_uuids is None
+                    else await EpisodicNode.get_by_uuids(self.driver, previous_episode_uuids)
+                )
+
                 # Create default edge type map
                 edge_type_map_default = (
                     {('Entity', 'Entity'): list(edge_types.keys())}
@@ -961,8 +1173,12 @@ class Graphiti:
                             for node in nodes
                         ],
                         max_coroutines=self.max_coroutines,
+                        governor=self.clients.governor,
+                        pool=LLM_POOL,
                     )
 
+                await self._fold_omitted_episodes(episode, previous_episodes, group_id)
+
                 end = time()
 
                 # Add span attributes
@@ -999,6 +1215,8 @@ class Graphiti:
                 span.set_status('error', str(e))
                 span.record_exception(e)
                 raise e
+            finally:
+                self._ingest_locks.release(ingest_locks)
 
     async def add_episode_bulk(
         self,
@@ -1010,6 +1228,7 @@ class Graphiti:
         edge_type_map: dict[tuple[str, str], list[str]] | None = None,
         custom_extraction_instructions: str | None = None,
         saga: str | SagaNode | None = None,
+        idempotent: bool = False,
     ) -> AddBulkEpisodeResults:
         """
         Process multiple episodes in bulk and update the graph.
@@ -1040,6 +1259,11 @@ class Graphiti:
             If a string is provided and a saga with this name already exists in the group, the episodes
             will be added to it. Otherwise, a new saga will be created. Sagas are connected to episodes
             via HAS_EPISODE edges, and consecutive episodes are linked via NEXT_EPISODE edges.
+        idempotent : bool
+            Optional. When True, episodes with the same source, reference_time and content as an
+            episode already stored in the group, or as an earlier episode of the batch, are not
+            processed again. The stored episodes and their nodes and edges are included in the
+            results.
 
         Returns
         -------
@@ -1065,6 +1289,7 @@ class Graphiti:
         individual episode.
         """
         with self.tracer.start_span('add_episode_bulk') as bulk_span:
+            ingest_locks: list[str] = []
             bulk_span.add_attributes({'episode.count': len(bulk_episodes)})
 
             try:
@@ -1100,10 +1325,37 @@ class Graphiti:
                         group_id=group_id,
                         created_at=now,
                         valid_at=episode.reference_time,
+                        content_hash=compute_content_hash(episode.content),
                     )
                     for episode in bulk_episodes
                 ]
 
+                redelivered_episodes: list[EpisodicNode] = []
+                if idempotent:
+                    ingest_locks = await self._ingest_locks.acquire(
+                        _ingest_lock_keys(group_id, episodes)
+                    )
+                    episodes, redelivered_episodes = await self._split_redelivered_episodes(
+                        group_id, episodes
+                    )
+                    bulk_span.add_attributes(
+                        {'episode.redelivered_count': len(redelivered_episodes)}
+                    )
+                stored_results = (
+                    await self._load_episode_results(redelivered_episodes)
+                    if redelivered_episodes
+                    else ([], [], [])
+                )
+                if not episodes:
+                    return AddBulkEpisodeResults(
+                        episodes=redelivered_episodes,
+                        episodic_edges=stored_results[0],
+                        nodes=stored_results[1],
+                        edges=stored_results[2],
+                        communities=[],
+                        community_edges=[],
+                    )
+
                 # Save all episodes
                 await add_nodes_and_edges_bulk(
                     driver=self.driver,
@@ -1177,6 +1429,7 @@ class Graphiti:
                     final_hydrated_nodes,
                     resolved_edges + invalidated_edges,
                     self.embedder,
+                    entity_name_cache=self.clients.entity_name_cache,
                 )
 
                 # Handle saga association if provided
@@ -1191,20 +1444,7 @@ class Graphiti:
                     sorted_episodes = sorted(episodes, key=lambda e: e.valid_at)
 
                     # Find the most recent episode already in the saga
-                    previous_episode_records, _, _ = await self.driver.execute_query(
-                        """
-                        MATCH (s:Saga {uuid: $saga_uuid})-[:HAS_EPISODE]->(e:Episodic)
-                        RETURN e.uuid AS uuid
-                        ORDER BY e.valid_at DESC, e.created_at DESC
-                        LIMIT 1
-                        """,
-                        saga_uuid=saga_node.uuid,
-                        routing_='r',
-                    )
-
-                    previous_episode_uuid = (
-                        previous_episode_records[0]['uuid'] if previous_episode_records else None
-                    )
+                    previous_episode_uuid = await self._get_latest_saga_episode_uuid(saga_node.uuid)
 
                     for episode in sorted_episodes:
                         # Create NEXT_EPISODE edge from the previous episode
@@ -1243,11 +1483,16 @@ class Graphiti:
 
                 logger.info(f'Completed add_episode_bulk in {(end - start) * 1000} ms')
 
+                stored_episodic_edges, stored_nodes, stored_edges = stored_results
+                result_nodes = {node.uuid: node for node in stored_nodes + final_hydrated_nodes}
+                result_edges = {
+                    edge.uuid: edge for edge in stored_edges + resolved_edges + invalidated_edges
+                }
                 return AddBulkEpisodeResults(
-                    episodes=episodes,
-                    episodic_edges=resolved_episodic_edges,
-                    nodes=final_hydrated_nodes,
-                    edges=resolved_edges + invalidated_edges,
+                    episodes=episodes + redelivered_episodes,
+                    episodic_edges=resolved_episodic_edges + stored_episodic_edges,
+                    nodes=list(result_nodes.values()),
+                    edges=list(result_edges.values()),
                     communities=[],
                     community_edges=[],
                 )
@@ -1256,6 +1501,8 @@ class Graphiti:
                 bulk_span.set_status('error', str(e))
                 bulk_span.record_exception(e)
                 raise e
+            finally:
+                self._ingest_locks.release(ingest_locks)
 
     @handle_multiple_group_ids
     async def build_communities(
@@ -1281,15 +1528,21 @@ class Graphiti:
         await semaphore_gather(
             *[node.generate_name_embedding(self.embedder) for node in community_nodes],
             max_coroutines=self.max_coroutines,
+            governor=self.clients.governor,
+            pool=EMBEDDER_POOL,
         )
 
         await semaphore_gather(
             *[node.save(driver) for node in community_nodes],
             max_coroutines=self.max_coroutines,
+            governor=self.clients.governor,
+            pool=DB_POOL,
         )
         await semaphore_gather(
             *[edge.save(driver) for edge in community_edges],
             max_coroutines=self.max_coroutines,
+            governor=self.clients.governor,
+            pool=DB_POOL,
         )
 
         return community_nodes, community_edges
@@ -1405,6 +1658,8 @@ class Graphiti:
         edges_list = await semaphore_gather(
             *[EntityEdge.get_by_uuids(self.driver, episode.entity_edges) for episode in episodes],
             max_coroutines=self.max_coroutines,
+            governor=self.clients.governor,
+            pool=DB_POOL,
         )
 
         edges: list[EntityEdge] = [edge for lst in edges_list for edge in lst]
@@ -1510,9 +1765,35 @@ class Graphiti:
         await create_entity_edge_embeddings(self.embedder, edges)
         await create_entity_node_embeddings(self.embedder, nodes)
 
-        await add_nodes_and_edges_bulk(self.driver, [], [], nodes, edges, self.embedder)
+        await add_nodes_and_edges_bulk(
+            self.driver,
+            [],
+            [],
+            nodes,
+            edges,
+            self.embedder,
+            entity_name_cache=self.clients.entity_name_cache,
+        )
         return AddTripletResults(edges=edges, nodes=nodes)
 
+    async def _get_mention_counts(self, node_uuids: list[str]) -> dict[str, int]:
+        if self.driver.graph_operations_interface:
+            try:
+                return await self.driver.graph_operations_interface.get_mention_counts(
+                    self.driver, node_uuids
+                )
+            except NotImplementedError:
+                pass
+
+        mention_counts: dict[str, int] = {}
+        for node_uuid in node_uuids:
+            query: LiteralString = 'MATCH (e:Episodic)-[:MENTIONS]->(n:Entity {uuid: $uuid}) RETURN count(*) AS episode_count'
+            records, _, _ = await self.driver.execute_query(query, uuid=node_uuid, routing_='r')
+
+            for record in records:
+                mention_counts[node_uuid] = record['episode_count']
+        return mention_counts
+
     async def remove_episode(self, episode_uuid: str):
         # Find the episode to be deleted
         episode = await EpisodicNode.get_by_uuid(self.driver, episode_uuid)
@@ -1529,16 +1810,18 @@ class Graphiti:
         # Find nodes mentioned by the episode
         nodes = await get_mentioned_nodes(self.driver, [episode])
         # We should delete all nodes that are only mentioned in the deleted episode
-        nodes_to_delete: list[EntityNode] = []
-        for node in nodes:
-            query: LiteralString = 'MATCH (e:Episodic)-[:MENTIONS]->(n:Entity {uuid: $uuid}) RETURN count(*) AS episode_count'
-            records, _, _ = await self.driver.execute_query(query, uuid=node.uuid, routing_='r')
-
-            for record in records:
-                if record['episode_count'] == 1:
-                    nodes_to_delete.append(node)
+        mention_counts = await self._get_mention_counts([node.uuid for node in nodes])
+        nodes_to_delete: list[EntityNode] = [
+            node for node in nodes if mention_counts.get(node.uuid) == 1
+        ]
 
         await Edge.delete_by_uuids(self.driver, [edge.uuid for edge in edges_to_delete])
         await Node.delete_by_uuids(self.driver, [node.uuid for node in nodes_to_delete])
+        if self.clients.resolution_memo is not None:
+            await self.clients.resolution_memo.invalidate_uuids(
+                [node.uuid for node in nodes_to_delete]
+            )
+        if self.clients.entity_name_cache is not None:
+            self.clients.entity_name_cache.remove_uuids([node.uuid for node in nodes_to_delete])
 
         await episode.delete(self.driver)
@@ -14,13 +14,17 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
+from graphiti_core.concurrency import ConcurrencyGovernor
 from graphiti_core.cross_encoder import CrossEncoderClient
 from graphiti_core.driver.driver import GraphDriver
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.tracer import Tracer
+from graphiti_core.utils.entity_name_cache import EntityNameCache
+from graphiti_core.utils.episode_context import EpisodeSummaryCache
+from graphiti_core.utils.resolution_memo import EntityResolutionMemo
 
 
 class GraphitiClients(BaseModel):
@@ -29,5 +33,9 @@ class GraphitiClients(BaseModel):
     embedder: EmbedderClient
     cross_encoder: CrossEncoderClient
     tracer: Tracer
+    governor: ConcurrencyGovernor = Field(default_factory=ConcurrencyGovernor)
+    episode_summaries: EpisodeSummaryCache | None = None
+    resolution_memo: EntityResolutionMemo | None = None
+    entity_name_cache: EntityNameCache | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
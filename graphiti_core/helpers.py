@@ -19,6 +19,7 @@ import os
 import re
 from collections.abc import Coroutine
 from datetime import datetime
+from hashlib import blake2b
 from typing import Any
 
 import numpy as np
@@ -27,7 +28,14 @@ from neo4j import time as neo4j_time
 from numpy._typing import NDArray
 from pydantic import BaseModel
 
+from graphiti_core.concurrency import (
+    DB_POOL,
+    ConcurrencyGovernor,
+    get_current_governor,
+    lend_current_slot,
+)
 from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.embedder.embedding import normalize_rows
 from graphiti_core.errors import GroupIdValidationError
 
 load_dotenv()
@@ -52,6 +60,27 @@ CHUNK_MIN_TOKENS = int(os.getenv('CHUNK_MIN_TOKENS', 1000))
 # Examples that DON'T chunk at 0.15: meeting transcripts, news articles, documentation
 CHUNK_DENSITY_THRESHOLD = float(os.getenv('CHUNK_DENSITY_THRESHOLD', 0.15))
 
+# Edge resolution batching: up to this many new edges share one dedupe/contradiction prompt,
+# as long as their facts and candidates fit in the token budget. Set the size to 1 to disable.
+EDGE_RESOLUTION_BATCH_SIZE = int(os.getenv('EDGE_RESOLUTION_BATCH_SIZE', 10))
+EDGE_RESOLUTION_BATCH_TOKENS = int(os.getenv('EDGE_RESOLUTION_BATCH_TOKENS', 4000))
+# Up to this many entities of one episode get their attributes and summaries in a single prompt.
+NODE_HYDRATION_BATCH_SIZE = int(os.getenv('NODE_HYDRATION_BATCH_SIZE', 8))
+# Token budget for the previous episodes included in each prompt. Recent episodes are kept
+# verbatim; the oldest one that does not fit is cut down to its most relevant sentences.
+PREVIOUS_EPISODES_TOKEN_BUDGET = int(os.getenv('PREVIOUS_EPISODES_TOKEN_BUDGET', 2000))
+# Entity dedupe by name embedding, between the MinHash tier and the LLM: an extracted entity
+# whose best compatible candidate is at least MATCH similar (and MARGIN ahead of the runner-up)
+# is merged into it, one whose best candidate is below REJECT is kept as a new entity, and only
+# the band in between goes to the LLM. Set MATCH above 1 and REJECT to -1 to disable the tier.
+NODE_DEDUP_EMBEDDING_MATCH_THRESHOLD = float(
+    os.getenv('NODE_DEDUP_EMBEDDING_MATCH_THRESHOLD', 0.97)
+)
+NODE_DEDUP_EMBEDDING_REJECT_THRESHOLD = float(
+    os.getenv('NODE_DEDUP_EMBEDDING_REJECT_THRESHOLD', 0.6)
+)
+NODE_DEDUP_EMBEDDING_MARGIN = float(os.getenv('NODE_DEDUP_EMBEDDING_MARGIN', 0.03))
+
 
 def parse_db_date(input_date: neo4j_time.DateTime | str | None) -> datetime | None:
     if isinstance(input_date, neo4j_time.DateTime):
@@ -111,24 +140,69 @@ def lucene_sanitize(query: str) -> str:
     return sanitized
 
 
-def normalize_l2(embedding: list[float]) -> NDArray:
-    embedding_array = np.array(embedding)
-    norm = np.linalg.norm(embedding_array, 2, axis=0, keepdims=True)
-    return np.where(norm == 0, embedding_array, embedding_array / norm)
+def normalize_exact(text: str) -> str:
+    """Lowercase text and collapse whitespace so equal names map to the same key."""
+    return re.sub(r'[\s]+', ' ', text.lower()).strip()
+
+
+def compute_fact_hash(source_node_uuid: str, target_node_uuid: str, fact: str) -> str:
+    """Key under which an entity edge is stored for exact duplicate lookups.
+
+    Two edges share a fact hash when they connect the same nodes in the same direction and
+    their facts are equal once normalized with `normalize_exact`.
+    """
+    key = f'{source_node_uuid}\x1f{target_node_uuid}\x1f{normalize_exact(fact)}'
+    return blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def compute_content_hash(content: str) -> str:
+    """Hash of an episode's raw content, used to recognize redelivered episodes."""
+    return blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def normalize_l2(embedding: NDArray | list[float]) -> NDArray:
+    # Arrays, as held by the models, are normalized without being copied first
+    return normalize_rows(np.asarray(embedding))
 
 
 # Use this instead of asyncio.gather() to bound coroutines
 async def semaphore_gather(
     *coroutines: Coroutine,
     max_coroutines: int | None = None,
+    governor: ConcurrencyGovernor | None = None,
+    pool: str | None = None,
 ) -> list[Any]:
-    semaphore = asyncio.Semaphore(max_coroutines or SEMAPHORE_LIMIT)
+    """Run coroutines concurrently with bounded concurrency.
+
+    Without a governor (and outside of a governed gather) each call bounds its own coroutines
+    with a fresh semaphore of `max_coroutines` or SEMAPHORE_LIMIT. With one, every coroutine
+    holds a slot of the governor's `pool` while it runs, so nested gathers share one budget per
+    backend; `pool` defaults to the pool of the enclosing gather. `max_coroutines` still caps
+    this call when given.
+    """
+    governor = governor or get_current_governor()
+    if governor is None:
+        semaphore = asyncio.Semaphore(max_coroutines or SEMAPHORE_LIMIT)
+
+        async def _wrap_coroutine(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*(_wrap_coroutine(coroutine) for coroutine in coroutines))
+
+    call_semaphore = asyncio.Semaphore(max_coroutines) if max_coroutines else None
+
+    async with lend_current_slot() as lent_pool:
+        pool_name = pool or lent_pool or DB_POOL
 
-    async def _wrap_coroutine(coroutine):
-        async with semaphore:
-            return await coroutine
+        async def _governed_coroutine(coroutine):
+            if call_semaphore is None:
+                async with governor.slot(pool_name):
+                    return await coroutine
+            async with call_semaphore, governor.slot(pool_name):
+                return await coroutine
 
-    return await asyncio.gather(*(_wrap_coroutine(coroutine) for coroutine in coroutines))
+        return await asyncio.gather(*(_governed_coroutine(c) for c in coroutines))
 
 
 def validate_group_id(group_id: str | None) -> bool:
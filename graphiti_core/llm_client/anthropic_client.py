@@ -24,9 +24,9 @@ from typing import TYPE_CHECKING, Literal
 from pydantic import BaseModel, ValidationError
 
 from ..prompts.models import Message
-from .client import LLMClient
+from .client import LLMClient, coalesce_requests, get_response_schema, record_prompt_usage
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
-from .errors import RateLimitError, RefusalError
+from .errors import BatchError, RateLimitError, RefusalError
 
 if TYPE_CHECKING:
     import anthropic
@@ -188,7 +188,7 @@ class AnthropicClient(LLMClient):
         """
         if response_model is not None:
             # Use the response_model to define the tool
-            model_schema = response_model.model_json_schema()
+            model_schema = get_response_schema(response_model)
             tool_name = response_model.__name__
             description = model_schema.get('description', f'Extract {tool_name} information')
         else:
@@ -294,6 +294,7 @@ class AnthropicClient(LLMClient):
                 tools=tools,
                 tool_choice=tool_choice,
             )
+            record_prompt_usage(getattr(result, 'usage', None))
 
             # Extract the tool output from the response
             for content_item in result.content:
@@ -330,6 +331,7 @@ class AnthropicClient(LLMClient):
         except Exception as e:
             raise e
 
+    @coalesce_requests
     async def generate_response(
         self,
         messages: list[Message],
@@ -375,7 +377,7 @@ class AnthropicClient(LLMClient):
 
             while retry_count <= max_retries:
                 try:
-                    response = await self._generate_response(
+                    response = await self._rate_limited_generate_response(
                         messages, response_model, max_tokens, model_size
                     )
 
@@ -388,7 +390,7 @@ class AnthropicClient(LLMClient):
                     # If no validation needed, return the response
                     return response
 
-                except (RateLimitError, RefusalError):
+                except (RateLimitError, RefusalError, BatchError):
                     # These errors should not trigger retries
                     span.set_status('error', str(last_error))
                     raise
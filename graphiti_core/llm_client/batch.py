@@ -0,0 +1,253 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Sequence
+from enum import Enum
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+from ..concurrency import lend_current_slot
+from .errors import BatchError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 1000
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_POLL_INTERVAL = 30.0
+
+
+class BatchStatus(str, Enum):
+    in_progress = 'in_progress'
+    completed = 'completed'
+    failed = 'failed'
+
+
+class BatchRequest(BaseModel):
+    """One queued `generate_response` call, serialized as a line of the batch input JSONL."""
+
+    custom_id: str = Field(default_factory=lambda: uuid4().hex)
+    model: str | None = None
+    messages: list[dict[str, str]]
+    max_tokens: int
+    temperature: float | None = None
+    response_schema: dict[str, Any] | None = Field(
+        default=None, description='JSON schema the response must follow'
+    )
+    response_schema_name: str | None = None
+
+
+class BatchResult(BaseModel):
+    """One line of the batch output JSONL."""
+
+    custom_id: str
+    response: dict[str, Any] | None = None
+    error: str | None = None
+
+
+def write_jsonl(path: str | Path, records: Sequence[BaseModel]) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(record.model_dump_json() + '\n')
+
+
+def read_batch_results(path: str | Path) -> list[BatchResult]:
+    with open(path, encoding='utf-8') as f:
+        return [BatchResult.model_validate_json(line) for line in f if line.strip()]
+
+
+class BatchBackend(ABC):
+    """Submits batch files to a provider's batch API and retrieves their results.
+
+    Implementations translate `BatchRequest`s into the provider's request format and parse the
+    provider's output back into `BatchResult`s holding the JSON response objects.
+    """
+
+    @abstractmethod
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        """Submit a batch and return its id."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def poll(self, batch_id: str) -> BatchStatus:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def results(self, batch_id: str) -> list[BatchResult]:
+        raise NotImplementedError()
+
+
+class LocalFileBatchBackend(BatchBackend):
+    """Batch backend that exchanges JSONL files in a local directory.
+
+    Each batch is written to `<batch_id>.input.jsonl`. The batch completes when
+    `<batch_id>.output.jsonl` appears and fails when `<batch_id>.error` does. When a `handler`
+    is given it answers every request in-process and writes the output file itself, which makes
+    the backend a stand-in for a provider batch API in tests; otherwise an external process is
+    expected to produce the output file.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        handler: Callable[[BatchRequest], Awaitable[dict[str, Any]]] | None = None,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.handler = handler
+        self._handler_tasks: dict[str, asyncio.Task] = {}
+
+    def input_path(self, batch_id: str) -> Path:
+        return self.directory / f'{batch_id}.input.jsonl'
+
+    def output_path(self, batch_id: str) -> Path:
+        return self.directory / f'{batch_id}.output.jsonl'
+
+    def error_path(self, batch_id: str) -> Path:
+        return self.directory / f'{batch_id}.error'
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        batch_id = f'batch_{uuid4().hex}'
+        await asyncio.to_thread(write_jsonl, self.input_path(batch_id), requests)
+        if self.handler is not None:
+            self._handler_tasks[batch_id] = asyncio.create_task(
+                self._run_handler(batch_id, requests)
+            )
+        return batch_id
+
+    async def _run_handler(self, batch_id: str, requests: list[BatchRequest]) -> None:
+        assert self.handler is not None
+        results: list[BaseModel] = []
+        for request in requests:
+            try:
+                response = await self.handler(request)
+                results.append(BatchResult(custom_id=request.custom_id, response=response))
+            except Exception as e:
+                results.append(BatchResult(custom_id=request.custom_id, error=str(e)))
+
+        # Write to a temporary name first so that poll() never sees a partial file
+        temp_path = self.directory / f'{batch_id}.output.jsonl.tmp'
+        await asyncio.to_thread(write_jsonl, temp_path, results)
+        await asyncio.to_thread(os.replace, temp_path, self.output_path(batch_id))
+        self._handler_tasks.pop(batch_id, None)
+
+    async def poll(self, batch_id: str) -> BatchStatus:
+        if await asyncio.to_thread(self.output_path(batch_id).exists):
+            return BatchStatus.completed
+        if await asyncio.to_thread(self.error_path(batch_id).exists):
+            return BatchStatus.failed
+        return BatchStatus.in_progress
+
+    async def results(self, batch_id: str) -> list[BatchResult]:
+        return await asyncio.to_thread(read_batch_results, self.output_path(batch_id))
+
+
+class BatchExecutor:
+    """Queues LLM requests into batches and resolves each caller when its batch completes.
+
+    Requests are flushed to the backend once `max_batch_size` are queued or `flush_interval`
+    seconds after the first request of a batch was queued. Batches are then polled every
+    `poll_interval` seconds. Callers simply await their response, so an ingestion pipeline that
+    issues its prompts concurrently resumes as soon as the batch holding them completes.
+    """
+
+    def __init__(
+        self,
+        backend: BatchBackend,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        if max_batch_size <= 0:
+            raise ValueError('max_batch_size must be positive')
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.poll_interval = poll_interval
+        self._pending: list[tuple[BatchRequest, asyncio.Future[dict[str, Any]]]] = []
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task] = set()
+
+    async def submit(self, request: BatchRequest) -> dict[str, Any]:
+        """Queue a request and wait for its response."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        self._pending.append((request, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = loop.call_later(self.flush_interval, self.flush)
+
+        # Waiting on a batch can take hours; give the concurrency slot to other prompts meanwhile
+        async with lend_current_slot():
+            return await future
+
+    def flush(self) -> None:
+        """Submit everything queued so far as one batch."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        pending = [(request, future) for request, future in self._pending if not future.done()]
+        self._pending = []
+        if not pending:
+            return
+
+        task = asyncio.create_task(self._run_batch(pending))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(
+        self, pending: list[tuple[BatchRequest, asyncio.Future[dict[str, Any]]]]
+    ) -> None:
+        futures = {request.custom_id: future for request, future in pending}
+        try:
+            batch_id = await self.backend.submit([request for request, _ in pending])
+            logger.info(f'Submitted LLM batch {batch_id} with {len(pending)} requests')
+
+            status = await self.backend.poll(batch_id)
+            while status == BatchStatus.in_progress:
+                await asyncio.sleep(self.poll_interval)
+                status = await self.backend.poll(batch_id)
+
+            if status == BatchStatus.failed:
+                raise BatchError(f'LLM batch {batch_id} failed')
+
+            for result in await self.backend.results(batch_id):
+                future = futures.pop(result.custom_id, None)
+                if future is None or future.done():
+                    continue
+                if result.response is not None:
+                    future.set_result(result.response)
+                else:
+                    future.set_exception(
+                        BatchError(result.error or f'No response for {result.custom_id}')
+                    )
+
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(BatchError(f'LLM batch {batch_id} omitted a request'))
+        except Exception as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
@@ -0,0 +1,205 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import copy
+import logging
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+from diskcache import Cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = './llm_cache'
+DEFAULT_MEMORY_CACHE_ENTRIES = 1024
+DEFAULT_DISK_CACHE_SIZE_LIMIT = 2**30  # 1 GiB
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a single cache tier."""
+
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LLMCache(ABC):
+    """Async key/value store for LLM responses.
+
+    Keys are the request hashes computed by `LLMClient._get_cache_key`, values are the
+    JSON-like response dicts returned by `generate_response`.
+    """
+
+    name: str = 'cache'
+
+    def __init__(self):
+        self._stats = CacheStats()
+
+    @abstractmethod
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached response for `key`, or None on a miss."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store the response for `key`."""
+        raise NotImplementedError()
+
+    async def close(self) -> None:
+        """Release any resources held by the cache."""
+        return None
+
+    def stats(self) -> dict[str, CacheStats]:
+        """Return a snapshot of the hit/miss counters, keyed by tier name."""
+        return {self.name: copy.copy(self._stats)}
+
+
+class InMemoryLLMCache(LLMCache):
+    """Bounded in-process LRU cache with an optional time-to-live."""
+
+    name = 'memory'
+
+    def __init__(self, max_entries: int = DEFAULT_MEMORY_CACHE_ENTRIES, ttl: float | None = None):
+        super().__init__()
+        if max_entries <= 0:
+            raise ValueError('max_entries must be positive')
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float | None, dict[str, Any]]] = OrderedDict()
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= monotonic():
+            del self._entries[key]
+            self._stats.evictions += 1
+            self._stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        # Hand out copies so callers cannot mutate the cached response
+        return copy.deepcopy(value)
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        expires_at = monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (expires_at, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        self._stats.sets += 1
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskLLMCache(LLMCache):
+    """diskcache-backed cache whose SQLite I/O runs in a worker thread.
+
+    Eviction is delegated to diskcache's `size_limit` (least-recently-stored by default) and
+    entries expire after `ttl` seconds when set.
+    """
+
+    name = 'disk'
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        size_limit: int = DEFAULT_DISK_CACHE_SIZE_LIMIT,
+        ttl: float | None = None,
+    ):
+        super().__init__()
+        self.ttl = ttl
+        self._cache = Cache(directory, size_limit=size_limit)
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        value = await asyncio.to_thread(self._cache.get, key)
+        if value is None:
+            self._stats.misses += 1
+            return None
+
+        self._stats.hits += 1
+        return value  # type: ignore[return-value]
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        await asyncio.to_thread(self._cache.set, key, value, expire=self.ttl)
+        self._stats.sets += 1
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._cache.close)
+
+
+class TieredLLMCache(LLMCache):
+    """Looks tiers up in order and back-fills faster tiers on a hit in a slower one."""
+
+    name = 'tiered'
+
+    def __init__(self, tiers: list[LLMCache]):
+        super().__init__()
+        if not tiers:
+            raise ValueError('TieredLLMCache requires at least one tier')
+        self.tiers = tiers
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        for index, tier in enumerate(self.tiers):
+            value = await tier.get(key)
+            if value is None:
+                continue
+
+            for faster_tier in self.tiers[:index]:
+                await faster_tier.set(key, value)
+            self._stats.hits += 1
+            return value
+
+        self._stats.misses += 1
+        return None
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        for tier in self.tiers:
+            await tier.set(key, value)
+        self._stats.sets += 1
+
+    async def close(self) -> None:
+        for tier in self.tiers:
+            await tier.close()
+
+    def stats(self) -> dict[str, CacheStats]:
+        stats = super().stats()
+        for tier in self.tiers:
+            stats.update(tier.stats())
+        return stats
+
+
+def create_default_cache(directory: str = DEFAULT_CACHE_DIR) -> LLMCache:
+    """Memory LRU in front of the on-disk cache, used when an LLMClient is created with cache=True."""
+    return TieredLLMCache([InMemoryLLMCache(), DiskLLMCache(directory)])
@@ -14,24 +14,129 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
+import copy
+import functools
 import hashlib
 import json
 import logging
 import typing
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Mapping
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
 
 import httpx
-from diskcache import Cache
 from pydantic import BaseModel
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
 from ..prompts.models import Message
 from ..tracer import NoOpTracer, Tracer
+from .batch import BatchExecutor, BatchRequest
+from .cache import DEFAULT_CACHE_DIR, LLMCache, create_default_cache
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError
+from .rate_limiter import (
+    ProviderRateLimiter,
+    estimate_message_tokens,
+    get_rate_limit_headers,
+    get_rate_limiter,
+)
 
 DEFAULT_TEMPERATURE = 0
-DEFAULT_CACHE_DIR = './llm_cache'
+RESPONSE_SCHEMA_CACHE_SIZE = 1024
+
+# Request key computed by `coalesce_requests`, reused as the cache key by `generate_response`
+_request_key: ContextVar[str | None] = ContextVar('llm_request_key', default=None)
+
+# Control characters other than newlines, returns and tabs, plus zero-width characters
+_CLEAN_INPUT_TABLE = dict.fromkeys(
+    [code for code in range(32) if chr(code) not in '\n\r\t']
+    + [ord(char) for char in '\u200b\u200c\u200d\ufeff\u2060']
+)
+
+
+@functools.lru_cache(maxsize=RESPONSE_SCHEMA_CACHE_SIZE)
+def get_response_schema(response_model: type[BaseModel]) -> dict[str, typing.Any]:
+    """JSON schema of a response model, generated once per model.
+
+    The schema is shared between callers and must not be modified.
+    """
+    return response_model.model_json_schema()
+
+
+@functools.lru_cache(maxsize=RESPONSE_SCHEMA_CACHE_SIZE)
+def get_serialized_response_schema(response_model: type[BaseModel]) -> str:
+    return json.dumps(get_response_schema(response_model))
+
+
+@dataclass
+class PromptUsage:
+    """Input token counts and rate limit headers reported by the provider for one request."""
+
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+    response_headers: Mapping[str, str] = field(default_factory=dict)
+
+    @property
+    def cached_token_ratio(self) -> float:
+        return self.cached_input_tokens / self.input_tokens if self.input_tokens else 0.0
+
+
+# Usage of the provider request currently running in this task, see `record_prompt_usage`
+_prompt_usage: ContextVar[PromptUsage | None] = ContextVar('llm_prompt_usage', default=None)
+
+
+def _int_attribute(obj: typing.Any, *path: str) -> int | None:
+    for name in path:
+        obj = getattr(obj, name, None)
+    return obj if isinstance(obj, int) else None
+
+
+def record_response_headers(headers: Mapping[str, str] | None) -> None:
+    """Record the HTTP headers of a successful provider response.
+
+    The rate limiter learns request and token budgets from them. Does nothing outside of a
+    provider request.
+    """
+    prompt_usage = _prompt_usage.get()
+    if prompt_usage is None or headers is None:
+        return
+    prompt_usage.response_headers = headers
+
+
+def record_prompt_usage(usage: typing.Any) -> None:
+    """Record the input and cached input tokens of a provider response's usage object.
+
+    Understands the usage objects of OpenAI chat completions and responses, Anthropic messages
+    and Gemini `usage_metadata`. Does nothing outside of a provider request.
+    """
+    prompt_usage = _prompt_usage.get()
+    if prompt_usage is None or usage is None:
+        return
+
+    # Anthropic reports cache reads and writes separately from the uncached input tokens
+    cache_read = _int_attribute(usage, 'cache_read_input_tokens')
+    if cache_read is not None:
+        prompt_usage.input_tokens = (
+            (_int_attribute(usage, 'input_tokens') or 0)
+            + cache_read
+            + (_int_attribute(usage, 'cache_creation_input_tokens') or 0)
+        )
+        prompt_usage.cached_input_tokens = cache_read
+        return
+
+    for total_path, cached_path in (
+        (('prompt_tokens',), ('prompt_tokens_details', 'cached_tokens')),
+        (('input_tokens',), ('input_tokens_details', 'cached_tokens')),
+        (('prompt_token_count',), ('cached_content_token_count',)),
+    ):
+        total = _int_attribute(usage, *total_path)
+        if total is not None:
+            prompt_usage.input_tokens = total
+            prompt_usage.cached_input_tokens = _int_attribute(usage, *cached_path) or 0
+            return
 
 
 def get_extraction_language_instruction(group_id: str | None = None) -> str:
@@ -58,6 +163,11 @@ def get_extraction_language_instruction(group_id: str | None = None) -> str:
 logger = logging.getLogger(__name__)
 
 
+GenerateResponseFunc = typing.TypeVar(
+    'GenerateResponseFunc', bound=Callable[..., Awaitable[dict[str, typing.Any]]]
+)
+
+
 def is_server_or_retry_error(exception):
     if isinstance(exception, RateLimitError | json.decoder.JSONDecodeError):
         return True
@@ -67,6 +177,68 @@ def is_server_or_retry_error(exception):
     )
 
 
+def coalesce_requests(func: GenerateResponseFunc) -> GenerateResponseFunc:
+    """
+    Decorator for `generate_response` implementations that collapses concurrent identical
+    requests into a single provider call.
+
+    The first caller for a given request key starts the call; callers that arrive while it is
+    still in flight await the same task and receive their own copy of the response. The key
+    comes from `_get_cache_key` and is computed once, before the wrapped method mutates the
+    messages; it is exposed to the wrapped method so the response cache can reuse it.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(
+        self: 'LLMClient',
+        messages: list[Message],
+        response_model: type[BaseModel] | None = None,
+        max_tokens: int | None = None,
+        model_size: ModelSize = ModelSize.medium,
+        group_id: str | None = None,
+        prompt_name: str | None = None,
+    ) -> dict[str, typing.Any]:
+        if not self.coalesce_enabled:
+            return await func(
+                self, messages, response_model, max_tokens, model_size, group_id, prompt_name
+            )
+
+        request_key = self._get_cache_key(
+            messages, response_model, max_tokens, model_size, group_id
+        )
+
+        task = self._in_flight.get(request_key)
+        if task is None:
+            token = _request_key.set(request_key)
+            try:
+                # The task copies the current context, so it sees the request key
+                task = asyncio.ensure_future(
+                    func(
+                        self,
+                        messages,
+                        response_model,
+                        max_tokens,
+                        model_size,
+                        group_id,
+                        prompt_name,
+                    )
+                )
+            finally:
+                _request_key.reset(token)
+            self._in_flight[request_key] = task
+            task.add_done_callback(functools.partial(self._release_in_flight, request_key))
+        else:
+            logger.debug(f'Coalescing in-flight LLM request {request_key}')
+            with self.tracer.start_span('llm.coalesced') as span:
+                span.add_attributes({'prompt.name': prompt_name, 'request.key': request_key})
+
+        # Shield the shared task so that one cancelled caller does not cancel the others
+        response = await asyncio.shield(task)
+        return copy.deepcopy(response)
+
+    return wrapper  # type: ignore
+
+
 class LLMClient(ABC):
     def __init__(self, config: LLMConfig | None, cache: bool = False):
         if config is None:
@@ -78,17 +250,110 @@ class LLMClient(ABC):
         self.temperature = config.temperature
         self.max_tokens = config.max_tokens
         self.cache_enabled = cache
-        self.cache_dir = None
+        self.cache: LLMCache | None = None
         self.tracer: Tracer = NoOpTracer()
+        self.coalesce_enabled = True
+        self._in_flight: dict[str, asyncio.Future[dict[str, typing.Any]]] = {}
+        self.batch_executor: BatchExecutor | None = None
 
         # Only create the cache directory if caching is enabled
         if self.cache_enabled:
-            self.cache_dir = Cache(DEFAULT_CACHE_DIR)
+            self.cache = create_default_cache(DEFAULT_CACHE_DIR)
 
     def set_tracer(self, tracer: Tracer) -> None:
         """Set the tracer for this LLM client."""
         self.tracer = tracer
 
+    def set_cache(self, cache: LLMCache | None) -> None:
+        """Replace the response cache for this LLM client. Pass None to disable caching."""
+        self.cache = cache
+        self.cache_enabled = cache is not None
+
+    def set_batch_executor(self, batch_executor: BatchExecutor | None) -> None:
+        """Send requests through a batch API instead of live calls; None restores live calls.
+
+        Batched requests complete when their batch does, which trades latency for the lower price
+        and separate rate limits of provider batch APIs; use it for offline bulk ingestion.
+        """
+        self.batch_executor = batch_executor
+
+    def _get_rate_limiter(self, model_size: ModelSize) -> ProviderRateLimiter:
+        """Return the limiter shared by all clients of this provider and model."""
+        model = self.small_model if model_size == ModelSize.small else self.model
+        return get_rate_limiter(
+            self._get_provider_type(),
+            model or 'default',
+            requests_per_minute=self.config.requests_per_minute,
+            tokens_per_minute=self.config.tokens_per_minute,
+            max_concurrency=self.config.max_concurrency,
+        )
+
+    async def _rate_limited_generate_response(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        model_size: ModelSize = ModelSize.medium,
+    ) -> dict[str, typing.Any]:
+        """Call `_generate_response` within the provider's request, token and concurrency limits.
+
+        Rate limit errors shrink the shared concurrency limit and pause new requests for the
+        provider's Retry-After interval; successes grow the limit back.
+        """
+        if self.batch_executor is not None:
+            return await self._batch_generate_response(
+                self.batch_executor, messages, response_model, max_tokens, model_size
+            )
+
+        limiter = self._get_rate_limiter(model_size)
+        prompt_chars = sum(len(m.content) for m in messages)
+        estimated_tokens = estimate_message_tokens([m.content for m in messages])
+        async with limiter.limit(estimated_tokens):
+            with self.tracer.start_span('llm.request') as span:
+                usage = PromptUsage()
+                token = _prompt_usage.set(usage)
+                try:
+                    response = await self._generate_response(
+                        messages, response_model, max_tokens, model_size
+                    )
+                except RateLimitError as e:
+                    limiter.record_rate_limit(get_rate_limit_headers(e))
+                    raise
+                finally:
+                    _prompt_usage.reset(token)
+
+                limiter.record_success(usage.response_headers)
+                attributes: dict[str, typing.Any] = {'prompt.chars': prompt_chars}
+                if usage.input_tokens:
+                    attributes.update(
+                        {
+                            'llm.input_tokens': usage.input_tokens,
+                            'llm.cached_input_tokens': usage.cached_input_tokens,
+                            'llm.cached_token_ratio': usage.cached_token_ratio,
+                        }
+                    )
+                span.add_attributes(attributes)
+                return response
+
+    async def _batch_generate_response(
+        self,
+        batch_executor: BatchExecutor,
+        messages: list[Message],
+        response_model: type[BaseModel] | None,
+        max_tokens: int,
+        model_size: ModelSize,
+    ) -> dict[str, typing.Any]:
+        """Queue the request on the batch executor and wait for the batch to complete."""
+        request = BatchRequest(
+            model=self.small_model if model_size == ModelSize.small else self.model,
+            messages=[{'role': m.role, 'content': self._clean_input(m.content)} for m in messages],
+            max_tokens=max_tokens,
+            temperature=self.temperature,
+            response_schema=get_response_schema(response_model) if response_model else None,
+            response_schema_name=response_model.__name__ if response_model else None,
+        )
+        return await batch_executor.submit(request)
+
     def _clean_input(self, input: str) -> str:
         """Clean input string of invalid unicode and control characters.
 
@@ -98,18 +363,43 @@ class LLMClient(ABC):
         Returns:
             Cleaned string safe for LLM processing
         """
-        # Clean any invalid Unicode
-        cleaned = input.encode('utf-8', errors='ignore').decode('utf-8')
+        # Clean any invalid Unicode; ASCII text cannot contain any
+        if not input.isascii():
+            input = input.encode('utf-8', errors='ignore').decode('utf-8')
+
+        # Remove control characters except newlines, returns, and tabs, and zero-width characters
+        return input.translate(_CLEAN_INPUT_TABLE)
+
+    def _prepare_messages(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None,
+        group_id: str | None,
+    ) -> float:
+        """Add the language instruction and response schema to the messages and clean them.
+
+        Both are appended to the first (system) message, so that the static part of a prompt -
+        its instructions, the language instruction and the schema - forms a prefix shared by
+        every request for that prompt, which lets provider prompt caching apply. Pass no
+        response model when the provider enforces the schema natively.
+
+        Returns the time spent building the prompt, in milliseconds.
+        """
+        start = perf_counter()
+
+        # Add multilingual extraction instructions
+        messages[0].content += get_extraction_language_instruction(group_id)
 
-        # Remove zero-width characters and other invisible unicode
-        zero_width = '\u200b\u200c\u200d\ufeff\u2060'
-        for char in zero_width:
-            cleaned = cleaned.replace(char, '')
+        if response_model is not None:
+            messages[0].content += (
+                '\n\nRespond with a JSON object in the following format:\n\n'
+                f'{get_serialized_response_schema(response_model)}'
+            )
 
-        # Remove control characters except newlines, returns, and tabs
-        cleaned = ''.join(char for char in cleaned if ord(char) >= 32 or char in '\n\r\t')
+        for message in messages:
+            message.content = self._clean_input(message.content)
 
-        return cleaned
+        return (perf_counter() - start) * 1000
 
     @retry(
         stop=stop_after_attempt(4),
@@ -130,7 +420,9 @@ class LLMClient(ABC):
         model_size: ModelSize = ModelSize.medium,
     ) -> dict[str, typing.Any]:
         try:
-            return await self._generate_response(messages, response_model, max_tokens, model_size)
+            return await self._rate_limited_generate_response(
+                messages, response_model, max_tokens, model_size
+            )
         except (httpx.HTTPStatusError, RateLimitError) as e:
             raise e
 
@@ -144,12 +436,38 @@ class LLMClient(ABC):
     ) -> dict[str, typing.Any]:
         pass
 
-    def _get_cache_key(self, messages: list[Message]) -> str:
-        # Create a unique cache key based on the messages and model
+    def _get_cache_key(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None = None,
+        max_tokens: int | None = None,
+        model_size: ModelSize = ModelSize.medium,
+        group_id: str | None = None,
+    ) -> str:
+        # Create a unique cache key based on the messages and model. The response model, token
+        # limit, model size and group (language instruction) all change the provider request,
+        # so they are part of the key as well.
         message_str = json.dumps([m.model_dump() for m in messages], sort_keys=True)
-        key_str = f'{self.model}:{message_str}'
+        response_model_name = (
+            f'{response_model.__module__}.{response_model.__qualname__}'
+            if response_model is not None
+            else ''
+        )
+        key_str = (
+            f'{self.model}:{model_size.value}:{max_tokens}:{group_id}:{response_model_name}:'
+            f'{message_str}'
+        )
         return hashlib.md5(key_str.encode()).hexdigest()
 
+    def _release_in_flight(self, request_key: str, task: asyncio.Future) -> None:
+        if self._in_flight.get(request_key) is task:
+            del self._in_flight[request_key]
+        # Retrieve the exception so that it is not reported as unhandled when every caller
+        # was cancelled before the shared task finished
+        if not task.cancelled():
+            task.exception()
+
+    @coalesce_requests
     async def generate_response(
         self,
         messages: list[Message],
@@ -159,22 +477,16 @@ class LLMClient(ABC):
         group_id: str | None = None,
         prompt_name: str | None = None,
     ) -> dict[str, typing.Any]:
-        if max_tokens is None:
-            max_tokens = self.max_tokens
-
-        if response_model is not None:
-            serialized_model = json.dumps(response_model.model_json_schema())
-            messages[
-                -1
-            ].content += (
-                f'\n\nRespond with a JSON object in the following format:\n\n{serialized_model}'
+        cache_key = _request_key.get()
+        if cache_key is None and self.cache_enabled and self.cache is not None:
+            cache_key = self._get_cache_key(
+                messages, response_model, max_tokens, model_size, group_id
             )
 
-        # Add multilingual extraction instructions
-        messages[0].content += get_extraction_language_instruction(group_id)
+        if max_tokens is None:
+            max_tokens = self.max_tokens
 
-        for message in messages:
-            message.content = self._clean_input(message.content)
+        prompt_build_ms = self._prepare_messages(messages, response_model, group_id)
 
         # Wrap entire operation in tracing span
         with self.tracer.start_span('llm.generate') as span:
@@ -183,15 +495,15 @@ class LLMClient(ABC):
                 'model.size': model_size.value,
                 'max_tokens': max_tokens,
                 'cache.enabled': self.cache_enabled,
+                'prompt.build_ms': prompt_build_ms,
             }
             if prompt_name:
                 attributes['prompt.name'] = prompt_name
             span.add_attributes(attributes)
 
             # Check cache first
-            if self.cache_enabled and self.cache_dir is not None:
-                cache_key = self._get_cache_key(messages)
-                cached_response = self.cache_dir.get(cache_key)
+            if self.cache_enabled and self.cache is not None and cache_key is not None:
+                cached_response = await self.cache.get(cache_key)
                 if cached_response is not None:
                     logger.debug(f'Cache hit for {cache_key}')
                     span.add_attributes({'cache.hit': True})
@@ -210,9 +522,8 @@ class LLMClient(ABC):
                 raise
 
             # Cache response if enabled
-            if self.cache_enabled and self.cache_dir is not None:
-                cache_key = self._get_cache_key(messages)
-                self.cache_dir.set(cache_key, response)
+            if self.cache_enabled and self.cache is not None and cache_key is not None:
+                await self.cache.set(cache_key, response)
 
             return response
 
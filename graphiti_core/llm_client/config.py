@@ -42,6 +42,9 @@ class LLMConfig:
         temperature: float = DEFAULT_TEMPERATURE,
         max_tokens: int = DEFAULT_MAX_TOKENS,
         small_model: str | None = None,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        max_concurrency: int | None = None,
     ):
         """
         Initialize the LLMConfig with the provided parameters.
@@ -59,6 +62,15 @@ class LLMConfig:
 
                 small_model (str, optional): The specific LLM model to use for generating responses of simpler prompts.
                                                                 Defaults to "gpt-4.1-nano".
+
+                requests_per_minute (float, optional): Request budget shared by every client of the same provider and model.
+                                                                Learned from rate limit headers when not set.
+
+                tokens_per_minute (float, optional): Prompt token budget shared by every client of the same provider and model.
+                                                                Learned from rate limit headers when not set.
+
+                max_concurrency (int, optional): Upper bound on concurrent requests per provider and model.
+                                                                Unbounded until the provider returns a rate limit error when not set.
         """
         self.base_url = base_url
         self.api_key = api_key
@@ -66,3 +78,6 @@ class LLMConfig:
         self.small_model = small_model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max_concurrency
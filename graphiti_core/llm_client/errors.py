@@ -37,3 +37,11 @@ class EmptyResponseError(Exception):
     def __init__(self, message: str):
         self.message = message
         super().__init__(self.message)
+
+
+class BatchError(Exception):
+    """Exception raised when a batch, or a single request in it, does not produce a response."""
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
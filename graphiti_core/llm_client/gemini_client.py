@@ -23,9 +23,14 @@ from typing import TYPE_CHECKING, ClassVar
 from pydantic import BaseModel
 
 from ..prompts.models import Message
-from .client import LLMClient, get_extraction_language_instruction
+from .client import (
+    LLMClient,
+    coalesce_requests,
+    get_serialized_response_schema,
+    record_prompt_usage,
+)
 from .config import LLMConfig, ModelSize
-from .errors import RateLimitError
+from .errors import BatchError, RateLimitError
 
 if TYPE_CHECKING:
     from google import genai
@@ -258,12 +263,10 @@ class GeminiClient(LLMClient):
             # If a response model is provided, add schema for structured output
             system_prompt = ''
             if response_model is not None:
-                # Get the schema from the Pydantic model
-                pydantic_schema = response_model.model_json_schema()
-
                 # Create instruction to output in the desired JSON format
                 system_prompt += (
-                    f'Output ONLY valid JSON matching this schema: {json.dumps(pydantic_schema)}.\n'
+                    'Output ONLY valid JSON matching this schema: '
+                    f'{get_serialized_response_schema(response_model)}.\n'
                     'Do not include any explanatory text before or after the JSON.\n\n'
                 )
 
@@ -303,6 +306,8 @@ class GeminiClient(LLMClient):
                 config=generation_config,
             )
 
+            record_prompt_usage(getattr(response, 'usage_metadata', None))
+
             # Always capture the raw output for debugging
             raw_output = getattr(response, 'text', None)
 
@@ -350,6 +355,7 @@ class GeminiClient(LLMClient):
             logger.error(f'Error in generating LLM response: {e}')
             raise Exception from e
 
+    @coalesce_requests
     async def generate_response(
         self,
         messages: list[Message],
@@ -374,8 +380,8 @@ class GeminiClient(LLMClient):
         Returns:
             dict[str, typing.Any]: The response from the language model.
         """
-        # Add multilingual extraction instructions
-        messages[0].content += get_extraction_language_instruction(group_id)
+        # Structured output is enforced natively, so only the language instruction is added
+        prompt_build_ms = self._prepare_messages(messages, None, group_id)
 
         # Wrap entire operation in tracing span
         with self.tracer.start_span('llm.generate') as span:
@@ -383,6 +389,7 @@ class GeminiClient(LLMClient):
                 'llm.provider': 'gemini',
                 'model.size': model_size.value,
                 'max_tokens': max_tokens or self.max_tokens,
+                'prompt.build_ms': prompt_build_ms,
             }
             if prompt_name:
                 attributes['prompt.name'] = prompt_name
@@ -394,10 +401,12 @@ class GeminiClient(LLMClient):
 
             while retry_count < self.MAX_RETRIES:
                 try:
-                    response = await self._generate_response(
+                    response = await self._rate_limited_generate_response(
                         messages=messages,
                         response_model=response_model,
-                        max_tokens=max_tokens,
+                        max_tokens=self._resolve_max_tokens(
+                            max_tokens, self._get_model_for_size(model_size)
+                        ),
                         model_size=model_size,
                     )
                     last_output = (
@@ -406,8 +415,8 @@ class GeminiClient(LLMClient):
                         else None
                     )
                     return response
-                except RateLimitError as e:
-                    # Rate limit errors should not trigger retries (fail fast)
+                except (RateLimitError, BatchError) as e:
+                    # Rate limit and batch errors should not trigger retries (fail fast)
                     span.set_status('error', str(e))
                     raise e
                 except Exception as e:
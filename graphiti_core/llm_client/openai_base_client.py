@@ -25,9 +25,9 @@ from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
 from ..prompts.models import Message
-from .client import LLMClient, get_extraction_language_instruction
+from .client import LLMClient, coalesce_requests, record_prompt_usage
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
-from .errors import RateLimitError, RefusalError
+from .errors import BatchError, RateLimitError, RefusalError
 
 logger = logging.getLogger(__name__)
 
@@ -151,6 +151,7 @@ class BaseOpenAIClient(LLMClient):
                     reasoning=self.reasoning,
                     verbosity=self.verbosity,
                 )
+                record_prompt_usage(getattr(response, 'usage', None))
                 return self._handle_structured_response(response)
             else:
                 response = await self._create_completion(
@@ -159,6 +160,7 @@ class BaseOpenAIClient(LLMClient):
                     temperature=self.temperature,
                     max_tokens=max_tokens or self.max_tokens,
                 )
+                record_prompt_usage(getattr(response, 'usage', None))
                 return self._handle_json_response(response)
 
         except openai.LengthFinishReasonError as e:
@@ -181,6 +183,7 @@ class BaseOpenAIClient(LLMClient):
                 logger.error(f'Error in generating LLM response: {e}')
             raise
 
+    @coalesce_requests
     async def generate_response(
         self,
         messages: list[Message],
@@ -194,8 +197,8 @@ class BaseOpenAIClient(LLMClient):
         if max_tokens is None:
             max_tokens = self.max_tokens
 
-        # Add multilingual extraction instructions
-        messages[0].content += get_extraction_language_instruction(group_id)
+        # Structured output is enforced natively, so only the language instruction is added
+        prompt_build_ms = self._prepare_messages(messages, None, group_id)
 
         # Wrap entire operation in tracing span
         with self.tracer.start_span('llm.generate') as span:
@@ -203,6 +206,7 @@ class BaseOpenAIClient(LLMClient):
                 'llm.provider': 'openai',
                 'model.size': model_size.value,
                 'max_tokens': max_tokens,
+                'prompt.build_ms': prompt_build_ms,
             }
             if prompt_name:
                 attributes['prompt.name'] = prompt_name
@@ -213,11 +217,11 @@ class BaseOpenAIClient(LLMClient):
 
             while retry_count <= self.MAX_RETRIES:
                 try:
-                    response = await self._generate_response(
+                    response = await self._rate_limited_generate_response(
                         messages, response_model, max_tokens, model_size
                     )
                     return response
-                except (RateLimitError, RefusalError):
+                except (RateLimitError, RefusalError, BatchError):
                     # These errors should not trigger retries
                     span.set_status('error', str(last_error))
                     raise
@@ -20,6 +20,7 @@ from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
+from .client import record_response_headers
 from .config import DEFAULT_MAX_TOKENS, LLMConfig
 from .openai_base_client import DEFAULT_REASONING, DEFAULT_VERBOSITY, BaseOpenAIClient
 
@@ -96,9 +97,11 @@ class OpenAIClient(BaseOpenAIClient):
         if is_reasoning_model and verbosity is not None:
             request_kwargs['text'] = {'verbosity': verbosity}  # type: ignore
 
-        response = await self.client.responses.parse(**request_kwargs)
+        # The raw response carries the rate limit headers the limiter learns budgets from
+        raw_response = await self.client.responses.with_raw_response.parse(**request_kwargs)
+        record_response_headers(raw_response.headers)
 
-        return response
+        return raw_response.parse()
 
     async def _create_completion(
         self,
@@ -116,10 +119,13 @@ class OpenAIClient(BaseOpenAIClient):
             model.startswith('gpt-5') or model.startswith('o1') or model.startswith('o3')
         )
 
-        return await self.client.chat.completions.create(
+        raw_response = await self.client.chat.completions.with_raw_response.create(
             model=model,
             messages=messages,
             temperature=temperature if not is_reasoning_model else None,
             max_tokens=max_tokens,
             response_format={'type': 'json_object'},
         )
+        record_response_headers(raw_response.headers)
+
+        return raw_response.parse()
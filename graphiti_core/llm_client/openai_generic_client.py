@@ -25,9 +25,9 @@ from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
 from ..prompts.models import Message
-from .client import LLMClient, get_extraction_language_instruction
+from .client import LLMClient, coalesce_requests, get_response_schema, record_prompt_usage
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
-from .errors import RateLimitError, RefusalError
+from .errors import BatchError, RateLimitError, RefusalError
 
 logger = logging.getLogger(__name__)
 
@@ -111,7 +111,7 @@ class OpenAIGenericClient(LLMClient):
             response_format: dict[str, Any] = {'type': 'json_object'}
             if response_model is not None:
                 schema_name = getattr(response_model, '__name__', 'structured_response')
-                json_schema = response_model.model_json_schema()
+                json_schema = get_response_schema(response_model)
                 response_format = {
                     'type': 'json_schema',
                     'json_schema': {
@@ -127,6 +127,7 @@ class OpenAIGenericClient(LLMClient):
                 max_tokens=self.max_tokens,
                 response_format=response_format,  # type: ignore[arg-type]
             )
+            record_prompt_usage(getattr(response, 'usage', None))
             result = response.choices[0].message.content or ''
             return json.loads(result)
         except openai.RateLimitError as e:
@@ -135,6 +136,7 @@ class OpenAIGenericClient(LLMClient):
             logger.error(f'Error in generating LLM response: {e}')
             raise
 
+    @coalesce_requests
     async def generate_response(
         self,
         messages: list[Message],
@@ -147,8 +149,8 @@ class OpenAIGenericClient(LLMClient):
         if max_tokens is None:
             max_tokens = self.max_tokens
 
-        # Add multilingual extraction instructions
-        messages[0].content += get_extraction_language_instruction(group_id)
+        # Structured output is enforced natively, so only the language instruction is added
+        prompt_build_ms = self._prepare_messages(messages, None, group_id)
 
         # Wrap entire operation in tracing span
         with self.tracer.start_span('llm.generate') as span:
@@ -156,6 +158,7 @@ class OpenAIGenericClient(LLMClient):
                 'llm.provider': 'openai',
                 'model.size': model_size.value,
                 'max_tokens': max_tokens,
+                'prompt.build_ms': prompt_build_ms,
             }
             if prompt_name:
                 attributes['prompt.name'] = prompt_name
@@ -166,11 +169,11 @@ class OpenAIGenericClient(LLMClient):
 
             while retry_count <= self.MAX_RETRIES:
                 try:
-                    response = await self._generate_response(
+                    response = await self._rate_limited_generate_response(
                         messages, response_model, max_tokens=max_tokens, model_size=model_size
                     )
                     return response
-                except (RateLimitError, RefusalError):
+                except (RateLimitError, RefusalError, BatchError):
                     # These errors should not trigger retries
                     span.set_status('error', str(last_error))
                     raise
@@ -0,0 +1,354 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+import re
+from collections import deque
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from time import monotonic
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+# Number of consecutive successes required before the concurrency limit grows by one
+DEFAULT_INCREASE_AFTER = 10
+DEFAULT_DECREASE_FACTOR = 0.5
+
+# Rate limit headers sent by OpenAI-compatible APIs and Anthropic
+_REQUEST_LIMIT_HEADERS = ('x-ratelimit-limit-requests', 'anthropic-ratelimit-requests-limit')
+_REQUEST_REMAINING_HEADERS = (
+    'x-ratelimit-remaining-requests',
+    'anthropic-ratelimit-requests-remaining',
+)
+_TOKEN_LIMIT_HEADERS = ('x-ratelimit-limit-tokens', 'anthropic-ratelimit-tokens-limit')
+_TOKEN_REMAINING_HEADERS = (
+    'x-ratelimit-remaining-tokens',
+    'anthropic-ratelimit-tokens-remaining',
+)
+_DURATION_PATTERN = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+
+
+def estimate_message_tokens(texts: list[str]) -> int:
+    """Rough prompt size used to charge the token budget before the provider reports usage."""
+    return sum(len(text) for text in texts) // CHARS_PER_TOKEN + 1
+
+
+def _parse_duration(value: str) -> float | None:
+    """Parse a Retry-After style value: plain seconds or OpenAI durations such as '1m30s'."""
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    matches = _DURATION_PATTERN.findall(value)
+    if not matches:
+        return None
+
+    multipliers = {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+    return sum(float(amount) * multipliers[unit] for amount, unit in matches)
+
+
+def _first_header(headers: Mapping[str, str], names: tuple[str, ...]) -> float | None:
+    lowered = {key.lower(): value for key, value in headers.items()}
+    for name in names:
+        value = lowered.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except ValueError:
+            continue
+    return None
+
+
+def get_rate_limit_headers(error: BaseException) -> Mapping[str, str]:
+    """Return the HTTP headers attached to a provider error, if there are any.
+
+    Provider SDK errors are usually re-raised as graphiti's RateLimitError, so the original
+    exception (and its response) is found on the exception chain.
+    """
+    current: BaseException | None = error
+    while current is not None:
+        response = getattr(current, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if headers is not None:
+            return headers
+        current = current.__cause__ or current.__context__
+    return {}
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `capacity` units per minute."""
+
+    def __init__(self, per_minute: float):
+        if per_minute <= 0:
+            raise ValueError('per_minute must be positive')
+        self.capacity = per_minute
+        self.tokens = per_minute
+        self._updated_at = monotonic()
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / 60.0
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def set_capacity(self, per_minute: float) -> None:
+        self._refill()
+        self.capacity = per_minute
+        self.tokens = min(self.tokens, per_minute)
+
+    def set_remaining(self, remaining: float) -> None:
+        self._refill()
+        self.tokens = min(self.tokens, remaining)
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        # Requests larger than the bucket would never fit, so they only wait for a full bucket
+        amount = min(amount, self.capacity)
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self.rate)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limit with additive increase and multiplicative decrease (AIMD).
+
+    The limit starts at `max_concurrency` (unbounded when None). Each rate limit response
+    multiplies it by `decrease_factor`, and every `increase_after` consecutive successes add
+    one slot back, up to `max_concurrency`.
+
+    Waiters are plain futures rather than an asyncio.Condition so that the limiter can be
+    shared between clients that run on different event loops.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        min_concurrency: int = 1,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        increase_after: int = DEFAULT_INCREASE_AFTER,
+    ):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.decrease_factor = decrease_factor
+        self.increase_after = increase_after
+        self.limit: int | None = max_concurrency
+        self.in_flight = 0
+        self._successes = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    def _has_capacity(self) -> bool:
+        return self.limit is None or self.in_flight < self.limit
+
+    async def acquire(self) -> None:
+        while not self._has_capacity():
+            waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                # A wake-up given to a waiter that is leaving goes to the next one instead
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_waiters()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        available = (
+            len(self._waiters) if self.limit is None else max(self.limit - self.in_flight, 0)
+        )
+        while available > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                available -= 1
+
+    def record_success(self) -> None:
+        self._successes += 1
+        if self.limit is None or self._successes < self.increase_after:
+            return
+
+        self._successes = 0
+        if self.max_concurrency is None or self.limit < self.max_concurrency:
+            self.limit += 1
+            self._wake_waiters()
+
+    def record_rate_limit(self) -> None:
+        self._successes = 0
+        # When unbounded, start from the concurrency that triggered the rate limit
+        current = self.limit if self.limit is not None else max(self.in_flight, 1)
+        self.limit = max(self.min_concurrency, int(current * self.decrease_factor))
+
+
+class ProviderRateLimiter:
+    """Request/token budgets and adaptive concurrency shared by every client of one model.
+
+    Budgets that are not configured explicitly are learned from rate limit headers when the
+    provider sends them.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        max_concurrency: int | None = None,
+    ):
+        self.provider = provider
+        self.model = model
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.concurrency = AdaptiveConcurrencyLimiter(max_concurrency)
+        self._paused_until = 0.0
+        self._explicit_requests = requests_per_minute is not None
+        self._explicit_tokens = tokens_per_minute is not None
+
+    def configure(
+        self,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        if requests_per_minute:
+            self._explicit_requests = True
+            if self.request_bucket is None:
+                self.request_bucket = TokenBucket(requests_per_minute)
+            else:
+                self.request_bucket.set_capacity(requests_per_minute)
+        if tokens_per_minute:
+            self._explicit_tokens = True
+            if self.token_bucket is None:
+                self.token_bucket = TokenBucket(tokens_per_minute)
+            else:
+                self.token_bucket.set_capacity(tokens_per_minute)
+        if max_concurrency:
+            self.concurrency.max_concurrency = max_concurrency
+            if self.concurrency.limit is None or self.concurrency.limit > max_concurrency:
+                self.concurrency.limit = max_concurrency
+
+    @asynccontextmanager
+    async def limit(self, estimated_tokens: int = 0) -> AsyncIterator[None]:
+        """Wait for a concurrency slot and for the request and token budgets."""
+        await self.concurrency.acquire()
+        try:
+            pause = self._paused_until - monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+            if self.request_bucket is not None:
+                await self.request_bucket.acquire(1)
+            if self.token_bucket is not None and estimated_tokens > 0:
+                await self.token_bucket.acquire(estimated_tokens)
+            yield
+        finally:
+            self.concurrency.release()
+
+    def record_success(self, headers: Mapping[str, str] | None = None) -> None:
+        self.concurrency.record_success()
+        if headers:
+            self.update_from_headers(headers)
+
+    def record_rate_limit(self, headers: Mapping[str, str] | None = None) -> None:
+        self.concurrency.record_rate_limit()
+        retry_after = None
+        if headers:
+            self.update_from_headers(headers)
+            lowered = {key.lower(): value for key, value in headers.items()}
+            for name in ('retry-after', 'x-ratelimit-reset-requests', 'x-ratelimit-reset-tokens'):
+                if name in lowered:
+                    retry_after = _parse_duration(lowered[name])
+                    if retry_after is not None:
+                        break
+
+        # Without a Retry-After hint the caller's retry backoff paces the next attempt
+        if retry_after is not None:
+            self._paused_until = max(self._paused_until, monotonic() + retry_after)
+        logger.warning(
+            f'Rate limited by {self.provider}/{self.model}; concurrency limit is now '
+            f'{self.concurrency.limit}, pausing new requests for {retry_after or 0:.1f}s'
+        )
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Adopt the limits and remaining budgets reported by the provider."""
+        request_limit = _first_header(headers, _REQUEST_LIMIT_HEADERS)
+        if request_limit and not self._explicit_requests:
+            if self.request_bucket is None:
+                self.request_bucket = TokenBucket(request_limit)
+            else:
+                self.request_bucket.set_capacity(request_limit)
+        request_remaining = _first_header(headers, _REQUEST_REMAINING_HEADERS)
+        if request_remaining is not None and self.request_bucket is not None:
+            self.request_bucket.set_remaining(request_remaining)
+
+        token_limit = _first_header(headers, _TOKEN_LIMIT_HEADERS)
+        if token_limit and not self._explicit_tokens:
+            if self.token_bucket is None:
+                self.token_bucket = TokenBucket(token_limit)
+            else:
+                self.token_bucket.set_capacity(token_limit)
+        token_remaining = _first_header(headers, _TOKEN_REMAINING_HEADERS)
+        if token_remaining is not None and self.token_bucket is not None:
+            self.token_bucket.set_remaining(token_remaining)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            'provider': self.provider,
+            'model': self.model,
+            'concurrency.limit': self.concurrency.limit,
+            'concurrency.in_flight': self.concurrency.in_flight,
+            'requests_per_minute': self.request_bucket.capacity if self.request_bucket else None,
+            'tokens_per_minute': self.token_bucket.capacity if self.token_bucket else None,
+        }
+
+
+_rate_limiters: dict[tuple[str, str], ProviderRateLimiter] = {}
+
+
+def get_rate_limiter(
+    provider: str,
+    model: str,
+    requests_per_minute: float | None = None,
+    tokens_per_minute: float | None = None,
+    max_concurrency: int | None = None,
+) -> ProviderRateLimiter:
+    """Return the process-wide limiter for (provider, model), creating it on first use."""
+    key = (provider, model)
+    limiter = _rate_limiters.get(key)
+    if limiter is None:
+        limiter = ProviderRateLimiter(
+            provider, model, requests_per_minute, tokens_per_minute, max_concurrency
+        )
+        _rate_limiters[key] = limiter
+    else:
+        limiter.configure(requests_per_minute, tokens_per_minute, max_concurrency)
+    return limiter
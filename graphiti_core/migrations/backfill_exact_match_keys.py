@@ -0,0 +1,138 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+
+from graphiti_core.driver.driver import GraphDriver, GraphProvider
+from graphiti_core.helpers import compute_fact_hash, normalize_exact
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKFILL_BATCH_SIZE = 1000
+
+
+async def _backfill_entity_names(driver: GraphDriver, batch_size: int) -> int:
+    updated = 0
+    while True:
+        records, _, _ = await driver.execute_query(
+            """
+            MATCH (n:Entity)
+            WHERE n.name_normalized IS NULL
+            RETURN n.uuid AS uuid, n.name AS name
+            LIMIT $limit
+            """,
+            limit=batch_size,
+        )
+        rows = [
+            {'uuid': record['uuid'], 'name_normalized': normalize_exact(record['name'] or '')}
+            for record in records
+        ]
+        if driver.provider == GraphProvider.KUZU:
+            # Kuzu cannot UNWIND a list of structs, so rows are written one by one
+            for row in rows:
+                await driver.execute_query(
+                    """
+                    MATCH (n:Entity {uuid: $uuid})
+                    SET n.name_normalized = $name_normalized
+                    """,
+                    **row,
+                )
+        elif rows:
+            await driver.execute_query(
+                """
+                UNWIND $rows AS row
+                MATCH (n:Entity {uuid: row.uuid})
+                SET n.name_normalized = row.name_normalized
+                """,
+                rows=rows,
+            )
+
+        updated += len(rows)
+        if len(rows) < batch_size:
+            return updated
+
+
+async def _backfill_fact_hashes(driver: GraphDriver, batch_size: int) -> int:
+    match_query = 'MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)'
+    if driver.provider == GraphProvider.KUZU:
+        match_query = 'MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity)'
+
+    updated = 0
+    while True:
+        records, _, _ = await driver.execute_query(
+            match_query
+            + """
+            WHERE e.fact_hash IS NULL
+            RETURN e.uuid AS uuid, n.uuid AS source_node_uuid, m.uuid AS target_node_uuid,
+                e.fact AS fact
+            LIMIT $limit
+            """,
+            limit=batch_size,
+        )
+        rows = [
+            {
+                'uuid': record['uuid'],
+                'fact_hash': compute_fact_hash(
+                    record['source_node_uuid'], record['target_node_uuid'], record['fact'] or ''
+                ),
+            }
+            for record in records
+        ]
+        if driver.provider == GraphProvider.KUZU:
+            for row in rows:
+                await driver.execute_query(
+                    """
+                    MATCH (e:RelatesToNode_ {uuid: $uuid})
+                    SET e.fact_hash = $fact_hash
+                    """,
+                    **row,
+                )
+        elif rows:
+            await driver.execute_query(
+                """
+                UNWIND $rows AS row
+                MATCH ()-[e:RELATES_TO {uuid: row.uuid}]->()
+                SET e.fact_hash = row.fact_hash
+                """,
+                rows=rows,
+            )
+
+        updated += len(rows)
+        if len(rows) < batch_size:
+            return updated
+
+
+async def backfill_exact_match_keys(
+    driver: GraphDriver, batch_size: int = DEFAULT_BACKFILL_BATCH_SIZE
+) -> tuple[int, int]:
+    """Set `name_normalized` on entity nodes and `fact_hash` on entity edges saved without them.
+
+    Graphs written before these properties existed need this once for the indexed exact-match
+    lookups (`EntityNode.get_by_normalized_names`, `EntityEdge.get_by_fact_hashes`) to find
+    their older entities and facts; until then those fall back to search. Only rows missing a
+    key are touched, in batches of `batch_size`, so the migration can be interrupted and re-run.
+
+    Returns the number of nodes and edges updated.
+    """
+    if batch_size <= 0:
+        raise ValueError('batch_size must be positive')
+
+    nodes_updated = await _backfill_entity_names(driver, batch_size)
+    edges_updated = await _backfill_fact_hashes(driver, batch_size)
+    logger.info(
+        f'Backfilled exact-match keys on {nodes_updated} entity nodes and {edges_updated} entity edges'
+    )
+    return nodes_updated, edges_updated
@@ -0,0 +1,124 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+
+from graphiti_core.driver.driver import GraphDriver, GraphProvider
+from graphiti_core.utils.embedding_encoding import (
+    COMPACT_PREFIXES,
+    EmbeddingEncoding,
+    decode_embedding,
+    encode_embedding,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REENCODE_BATCH_SIZE = 500
+
+# (match, property, update) for each kind of item holding an embedding
+_EMBEDDED_ITEMS = [
+    ('MATCH (n:Entity)', 'n.name_embedding', 'MATCH (n:Entity {uuid: row.uuid})'),
+    ('MATCH (n:Community)', 'n.name_embedding', 'MATCH (n:Community {uuid: row.uuid})'),
+    (
+        'MATCH (:Entity)-[n:RELATES_TO]->(:Entity)',
+        'n.fact_embedding',
+        'MATCH (:Entity)-[n:RELATES_TO {uuid: row.uuid}]->(:Entity)',
+    ),
+]
+
+
+def _stale_condition(property_name: str, encoding: EmbeddingEncoding) -> str:
+    """Match the non-empty embeddings that are not in `encoding` yet."""
+    prefix = COMPACT_PREFIXES.get(encoding)
+    if prefix is None:
+        return ' OR '.join(
+            f"{property_name} STARTS WITH '{other}'" for other in COMPACT_PREFIXES.values()
+        )
+    return f"{property_name} <> '' AND NOT {property_name} STARTS WITH '{prefix}'"
+
+
+async def _reencode_items(
+    driver: GraphDriver,
+    match_query: str,
+    property_name: str,
+    update_query: str,
+    encoding: EmbeddingEncoding,
+    batch_size: int,
+) -> int:
+    updated = 0
+    while True:
+        records, _, _ = await driver.execute_query(
+            f"""
+            {match_query}
+            WHERE {_stale_condition(property_name, encoding)}
+            RETURN n.uuid AS uuid, {property_name} AS embedding
+            LIMIT $limit
+            """,
+            limit=batch_size,
+        )
+        rows = [
+            {
+                'uuid': record['uuid'],
+                'embedding': encode_embedding(decode_embedding(record['embedding']), encoding),
+            }
+            for record in records
+        ]
+        if rows:
+            await driver.execute_query(
+                f"""
+                UNWIND $rows AS row
+                {update_query}
+                SET {property_name} = row.embedding
+                """,
+                rows=rows,
+            )
+
+        updated += len(rows)
+        if len(rows) < batch_size:
+            return updated
+
+
+async def reencode_embeddings(
+    driver: GraphDriver,
+    encoding: EmbeddingEncoding | None = None,
+    batch_size: int = DEFAULT_REENCODE_BATCH_SIZE,
+) -> int:
+    """Rewrite the embeddings of a Neptune graph in another `EmbeddingEncoding`.
+
+    Converts entity and community name embeddings and entity edge fact embeddings, by default to
+    the driver's `embedding_encoding`. Only embeddings in another encoding are touched, in batches
+    of `batch_size`, so the migration can be interrupted and re-run; the graph reads correctly
+    throughout since every encoding is decoded. Converting to float16 or int8 rounds the stored vectors.
+
+    Returns the number of embeddings rewritten.
+    """
+    if driver.provider != GraphProvider.NEPTUNE:
+        raise ValueError('Only Neptune graphs store embeddings in an EmbeddingEncoding')
+    if batch_size <= 0:
+        raise ValueError('batch_size must be positive')
+    target_encoding: EmbeddingEncoding = (
+        encoding
+        if encoding is not None
+        else getattr(driver, 'embedding_encoding', EmbeddingEncoding.CSV)
+    )
+
+    updated = 0
+    for match_query, property_name, update_query in _EMBEDDED_ITEMS:
+        updated += await _reencode_items(
+            driver, match_query, property_name, update_query, target_encoding, batch_size
+        )
+    logger.info(f'Re-encoded {updated} embeddings as {target_encoding.value}')
+    return updated
@@ -77,7 +77,7 @@ def get_entity_edge_save_query(provider: GraphProvider, has_aoss: bool = False)
                 MATCH (target:Entity {uuid: $edge_data.target_uuid})
                 MERGE (source)-[e:RELATES_TO {uuid: $edge_data.uuid}]->(target)
                 SET e = removeKeyFromMap(removeKeyFromMap($edge_data, "fact_embedding"), "episodes")
-                SET e.fact_embedding = join([x IN coalesce($edge_data.fact_embedding, []) | toString(x) ], ",")
+                SET e.fact_embedding = $edge_data.fact_embedding
                 SET e.episodes = join($edge_data.episodes, ",")
                 RETURN $edge_data.uuid AS uuid
             """
@@ -96,7 +96,8 @@ def get_entity_edge_save_query(provider: GraphProvider, has_aoss: bool = False)
                     e.expired_at = $expired_at,
                     e.valid_at = $valid_at,
                     e.invalid_at = $invalid_at,
-                    e.attributes = $attributes
+                    e.attributes = $attributes,
+                    e.fact_hash = $fact_hash
                 RETURN e.uuid AS uuid
             """
         case _:  # Neo4j
@@ -141,7 +142,7 @@ def get_entity_edge_save_bulk_query(provider: GraphProvider, has_aoss: bool = Fa
                 MATCH (target:Entity {uuid: edge.target_node_uuid})
                 MERGE (source)-[r:RELATES_TO {uuid: edge.uuid}]->(target)
                 SET r = removeKeyFromMap(removeKeyFromMap(edge, "fact_embedding"), "episodes")
-                SET r.fact_embedding = join([x IN coalesce(edge.fact_embedding, []) | toString(x) ], ",")
+                SET r.fact_embedding = edge.fact_embedding
                 SET r.episodes = join(edge.episodes, ",")
                 RETURN edge.uuid AS uuid
             """
@@ -160,7 +161,8 @@ def get_entity_edge_save_bulk_query(provider: GraphProvider, has_aoss: bool = Fa
                     e.expired_at = $expired_at,
                     e.valid_at = $valid_at,
                     e.invalid_at = $invalid_at,
-                    e.attributes = $attributes
+                    e.attributes = $attributes,
+                    e.fact_hash = $fact_hash
                 RETURN e.uuid AS uuid
             """
         case _:
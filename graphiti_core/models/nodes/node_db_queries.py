@@ -25,7 +25,8 @@ def get_episode_node_save_query(provider: GraphProvider) -> str:
             return """
                 MERGE (n:Episodic {uuid: $uuid})
                 SET n = {uuid: $uuid, name: $name, group_id: $group_id, source_description: $source_description, source: $source, content: $content,
-                entity_edges: join([x IN coalesce($entity_edges, []) | toString(x) ], '|'), created_at: $created_at, valid_at: $valid_at}
+                entity_edges: join([x IN coalesce($entity_edges, []) | toString(x) ], '|'), created_at: $created_at, valid_at: $valid_at,
+                content_hash: $content_hash}
                 RETURN n.uuid AS uuid
             """
         case GraphProvider.KUZU:
@@ -39,21 +40,22 @@ def get_episode_node_save_query(provider: GraphProvider) -> str:
                     n.source_description = $source_description,
                     n.content = $content,
                     n.valid_at = $valid_at,
-                    n.entity_edges = $entity_edges
+                    n.entity_edges = $entity_edges,
+                    n.content_hash = $content_hash
                 RETURN n.uuid AS uuid
             """
         case GraphProvider.FALKORDB:
             return """
                 MERGE (n:Episodic {uuid: $uuid})
                 SET n = {uuid: $uuid, name: $name, group_id: $group_id, source_description: $source_description, source: $source, content: $content,
-                entity_edges: $entity_edges, created_at: $created_at, valid_at: $valid_at}
+                entity_edges: $entity_edges, created_at: $created_at, valid_at: $valid_at, content_hash: $content_hash}
                 RETURN n.uuid AS uuid
             """
         case _:  # Neo4j
             return """
                 MERGE (n:Episodic {uuid: $uuid})
                 SET n = {uuid: $uuid, name: $name, group_id: $group_id, source_description: $source_description, source: $source, content: $content,
-                entity_edges: $entity_edges, created_at: $created_at, valid_at: $valid_at}
+                entity_edges: $entity_edges, created_at: $created_at, valid_at: $valid_at, content_hash: $content_hash}
                 RETURN n.uuid AS uuid
             """
 
@@ -66,7 +68,8 @@ def get_episode_node_save_bulk_query(provider: GraphProvider) -> str:
                 MERGE (n:Episodic {uuid: episode.uuid})
                 SET n = {uuid: episode.uuid, name: episode.name, group_id: episode.group_id, source_description: episode.source_description,
                     source: episode.source, content: episode.content,
-                entity_edges: join([x IN coalesce(episode.entity_edges, []) | toString(x) ], '|'), created_at: episode.created_at, valid_at: episode.valid_at}
+                entity_edges: join([x IN coalesce(episode.entity_edges, []) | toString(x) ], '|'), created_at: episode.created_at, valid_at: episode.valid_at,
+                content_hash: episode.content_hash}
                 RETURN n.uuid AS uuid
             """
         case GraphProvider.KUZU:
@@ -80,7 +83,8 @@ def get_episode_node_save_bulk_query(provider: GraphProvider) -> str:
                     n.source_description = $source_description,
                     n.content = $content,
                     n.valid_at = $valid_at,
-                    n.entity_edges = $entity_edges
+                    n.entity_edges = $entity_edges,
+                    n.content_hash = $content_hash
                 RETURN n.uuid AS uuid
             """
         case GraphProvider.FALKORDB:
@@ -88,7 +92,7 @@ def get_episode_node_save_bulk_query(provider: GraphProvider) -> str:
                 UNWIND $episodes AS episode
                 MERGE (n:Episodic {uuid: episode.uuid})
                 SET n = {uuid: episode.uuid, name: episode.name, group_id: episode.group_id, source_description: episode.source_description, source: episode.source, content: episode.content, 
-                entity_edges: episode.entity_edges, created_at: episode.created_at, valid_at: episode.valid_at}
+                entity_edges: episode.entity_edges, created_at: episode.created_at, valid_at: episode.valid_at, content_hash: episode.content_hash}
                 RETURN n.uuid AS uuid
             """
         case _:  # Neo4j
@@ -96,7 +100,7 @@ def get_episode_node_save_bulk_query(provider: GraphProvider) -> str:
                 UNWIND $episodes AS episode
                 MERGE (n:Episodic {uuid: episode.uuid})
                 SET n = {uuid: episode.uuid, name: episode.name, group_id: episode.group_id, source_description: episode.source_description, source: episode.source, content: episode.content, 
-                entity_edges: episode.entity_edges, created_at: episode.created_at, valid_at: episode.valid_at}
+                entity_edges: episode.entity_edges, created_at: episode.created_at, valid_at: episode.valid_at, content_hash: episode.content_hash}
                 RETURN n.uuid AS uuid
             """
 
@@ -110,7 +114,8 @@ EPISODIC_NODE_RETURN = """
     e.source_description AS source_description,
     e.content AS content,
     e.valid_at AS valid_at,
-    e.entity_edges AS entity_edges
+    e.entity_edges AS entity_edges,
+    e.content_hash AS content_hash
 """
 
 EPISODIC_NODE_RETURN_NEPTUNE = """
@@ -122,7 +127,8 @@ EPISODIC_NODE_RETURN_NEPTUNE = """
     e.group_id AS group_id,
     e.source_description AS source_description,
     e.source AS source,
-    split(e.entity_edges, ",") AS entity_edges
+    split(e.entity_edges, ",") AS entity_edges,
+    e.content_hash AS content_hash
 """
 
 
@@ -146,7 +152,8 @@ def get_entity_node_save_query(provider: GraphProvider, labels: str, has_aoss: b
                     n.created_at = $created_at,
                     n.name_embedding = $name_embedding,
                     n.summary = $summary,
-                    n.attributes = $attributes
+                    n.attributes = $attributes,
+                    n.name_normalized = $name_normalized
                 WITH n
                 RETURN n.uuid AS uuid
             """
@@ -158,7 +165,7 @@ def get_entity_node_save_query(provider: GraphProvider, labels: str, has_aoss: b
                 MERGE (n:Entity {{uuid: $entity_data.uuid}})
                 {label_subquery}
                 SET n = removeKeyFromMap(removeKeyFromMap($entity_data, "labels"), "name_embedding")
-                SET n.name_embedding = join([x IN coalesce($entity_data.name_embedding, []) | toString(x) ], ",")
+                SET n.name_embedding = $entity_data.name_embedding
                 RETURN n.uuid AS uuid
             """
         case _:
@@ -215,7 +222,7 @@ def get_entity_node_save_bulk_query(
                         MERGE (n:Entity {{uuid: node.uuid}})
                         {labels}
                         SET n = removeKeyFromMap(removeKeyFromMap(node, "labels"), "name_embedding")
-                        SET n.name_embedding = join([x IN coalesce(node.name_embedding, []) | toString(x) ], ",")
+                        SET n.name_embedding = node.name_embedding
                         RETURN n.uuid AS uuid
                     """
                 )
@@ -230,7 +237,8 @@ def get_entity_node_save_bulk_query(
                     n.created_at = $created_at,
                     n.name_embedding = $name_embedding,
                     n.summary = $summary,
-                    n.attributes = $attributes
+                    n.attributes = $attributes,
+                    n.name_normalized = $name_normalized
                 RETURN n.uuid AS uuid
             """
         case _:  # Neo4j
@@ -289,7 +297,7 @@ def get_community_node_save_query(provider: GraphProvider) -> str:
             return """
                 MERGE (n:Community {uuid: $uuid})
                 SET n = {uuid: $uuid, name: $name, group_id: $group_id, summary: $summary, created_at: $created_at}
-                SET n.name_embedding = join([x IN coalesce($name_embedding, []) | toString(x) ], ",")
+                SET n.name_embedding = $name_embedding
                 RETURN n.uuid AS uuid
             """
         case GraphProvider.KUZU:
@@ -324,7 +332,7 @@ COMMUNITY_NODE_RETURN = """
 COMMUNITY_NODE_RETURN_NEPTUNE = """
     n.uuid AS uuid,
     n.name AS name,
-    [x IN split(n.name_embedding, ",") | toFloat(x)] AS name_embedding,
+    n.name_embedding AS name_embedding,
     n.group_id AS group_id,
     n.summary AS summary,
     n.created_at AS created_at
@@ -31,8 +31,9 @@ from graphiti_core.driver.driver import (
     GraphProvider,
 )
 from graphiti_core.embedder import EmbedderClient
+from graphiti_core.embedder.embedding import Embedding, embedding_to_list, to_embedding
 from graphiti_core.errors import NodeNotFoundError
-from graphiti_core.helpers import parse_db_date
+from graphiti_core.helpers import normalize_exact, parse_db_date
 from graphiti_core.models.nodes.node_db_queries import (
     COMMUNITY_NODE_RETURN,
     COMMUNITY_NODE_RETURN_NEPTUNE,
@@ -47,6 +48,7 @@ from graphiti_core.models.nodes.node_db_queries import (
     get_saga_node_save_query,
 )
 from graphiti_core.utils.datetime_utils import utc_now
+from graphiti_core.utils.embedding_encoding import decode_embedding
 
 logger = logging.getLogger(__name__)
 
@@ -315,6 +317,10 @@ class EpisodicNode(Node):
         description='list of entity edges referenced in this episode',
         default_factory=list,
     )
+    content_hash: str | None = Field(
+        default=None,
+        description='hash of the raw episode content, kept when the content itself is not stored',
+    )
 
     async def save(self, driver: GraphDriver):
         if driver.graph_operations_interface:
@@ -333,6 +339,7 @@ class EpisodicNode(Node):
             'created_at': self.created_at,
             'valid_at': self.valid_at,
             'source': self.source.value,
+            'content_hash': self.content_hash,
         }
 
         result = await driver.execute_query(
@@ -403,6 +410,45 @@ class EpisodicNode(Node):
 
         return episodes
 
+    @classmethod
+    async def get_by_content_hashes(
+        cls, driver: GraphDriver, group_id: str, content_hashes: list[str]
+    ):
+        """Return the group's episodes whose content hash is one of `content_hashes`."""
+        if len(content_hashes) == 0:
+            return []
+
+        if driver.graph_operations_interface:
+            try:
+                return await driver.graph_operations_interface.episodic_node_get_by_content_hashes(
+                    cls, driver, group_id, content_hashes
+                )
+            except NotImplementedError:
+                pass
+
+        records, _, _ = await driver.execute_query(
+            """
+            MATCH (e:Episodic)
+            WHERE e.group_id = $group_id AND e.content_hash IN $content_hashes
+            RETURN
+            """
+            + (
+                EPISODIC_NODE_RETURN_NEPTUNE
+                if driver.provider == GraphProvider.NEPTUNE
+                else EPISODIC_NODE_RETURN
+            )
+            + """
+            ORDER BY e.created_at
+            """,
+            group_id=group_id,
+            content_hashes=list(dict.fromkeys(content_hashes)),
+            routing_='r',
+        )
+
+        episodes = [get_episodic_node_from_record(record) for record in records]
+
+        return episodes
+
     @classmethod
     async def get_by_group_ids(
         cls,
@@ -482,7 +528,7 @@ class EpisodicNode(Node):
 
 
 class EntityNode(Node):
-    name_embedding: list[float] | None = Field(default=None, description='embedding of the name')
+    name_embedding: Embedding | None = Field(default=None, description='embedding of the name')
     summary: str = Field(description='regional summary of surrounding edges', default_factory=str)
     attributes: dict[str, Any] = Field(
         default={}, description='Additional attributes of the node. Dependent on node labels'
@@ -491,7 +537,7 @@ class EntityNode(Node):
     async def generate_name_embedding(self, embedder: EmbedderClient):
         start = time()
         text = self.name.replace('\n', ' ')
-        self.name_embedding = await embedder.create(input_data=[text])
+        self.name_embedding = to_embedding(await embedder.create(input_data=[text]))
         end = time()
         logger.debug(f'embedded {text} in {end - start} ms')
 
@@ -504,17 +550,10 @@ class EntityNode(Node):
             except NotImplementedError:
                 pass
 
-        if driver.provider == GraphProvider.NEPTUNE:
-            query: LiteralString = """
-                MATCH (n:Entity {uuid: $uuid})
-                RETURN [x IN split(n.name_embedding, ",") | toFloat(x)] as name_embedding
-            """
-
-        else:
-            query: LiteralString = """
-                MATCH (n:Entity {uuid: $uuid})
-                RETURN n.name_embedding AS name_embedding
-            """
+        query: LiteralString = """
+            MATCH (n:Entity {uuid: $uuid})
+            RETURN n.name_embedding AS name_embedding
+        """
         records, _, _ = await driver.execute_query(
             query,
             uuid=self.uuid,
@@ -524,7 +563,7 @@ class EntityNode(Node):
         if len(records) == 0:
             raise NodeNotFoundError(self.uuid)
 
-        self.name_embedding = records[0]['name_embedding']
+        self.name_embedding = decode_embedding(records[0]['name_embedding'])
 
     async def save(self, driver: GraphDriver):
         if driver.graph_operations_interface:
@@ -536,10 +575,11 @@ class EntityNode(Node):
         entity_data: dict[str, Any] = {
             'uuid': self.uuid,
             'name': self.name,
-            'name_embedding': self.name_embedding,
+            'name_embedding': embedding_to_list(self.name_embedding),
             'group_id': self.group_id,
             'summary': self.summary,
             'created_at': self.created_at,
+            'name_normalized': normalize_exact(self.name),
         }
 
         if driver.provider == GraphProvider.KUZU:
@@ -610,6 +650,41 @@ class EntityNode(Node):
 
         return nodes
 
+    @classmethod
+    async def get_by_normalized_names(cls, driver: GraphDriver, group_id: str, names: list[str]):
+        """Return the group's entities whose name equals one of `names` once normalized.
+
+        This is an equality match on the indexed `name_normalized` property, so entities saved
+        before that property existed are only found once `backfill_exact_match_keys` has run.
+        """
+        if len(names) == 0:
+            return []
+
+        if driver.graph_operations_interface:
+            try:
+                return await driver.graph_operations_interface.node_get_by_normalized_names(
+                    cls, driver, group_id, names
+                )
+            except NotImplementedError:
+                pass
+
+        records, _, _ = await driver.execute_query(
+            """
+            UNWIND $names AS name
+            MATCH (n:Entity)
+            WHERE n.group_id = $group_id AND n.name_normalized = name
+            RETURN
+            """
+            + get_entity_node_return_query(driver.provider),
+            names=list({normalize_exact(name) for name in names}),
+            group_id=group_id,
+            routing_='r',
+        )
+
+        nodes = [get_entity_node_from_record(record, driver.provider) for record in records]
+
+        return nodes
+
     @classmethod
     async def get_by_group_ids(
         cls,
@@ -664,7 +739,7 @@ class EntityNode(Node):
 
 
 class CommunityNode(Node):
-    name_embedding: list[float] | None = Field(default=None, description='embedding of the name')
+    name_embedding: Embedding | None = Field(default=None, description='embedding of the name')
     summary: str = Field(description='region summary of member nodes', default_factory=str)
 
     async def save(self, driver: GraphDriver):
@@ -685,7 +760,7 @@ class CommunityNode(Node):
             name=self.name,
             group_id=self.group_id,
             summary=self.summary,
-            name_embedding=self.name_embedding,
+            name_embedding=embedding_to_list(self.name_embedding),
             created_at=self.created_at,
         )
 
@@ -696,7 +771,7 @@ class CommunityNode(Node):
     async def generate_name_embedding(self, embedder: EmbedderClient):
         start = time()
         text = self.name.replace('\n', ' ')
-        self.name_embedding = await embedder.create(input_data=[text])
+        self.name_embedding = to_embedding(await embedder.create(input_data=[text]))
         end = time()
         logger.debug(f'embedded {text} in {end - start} ms')
 
@@ -711,16 +786,10 @@ class CommunityNode(Node):
             except NotImplementedError:
                 pass
 
-        if driver.provider == GraphProvider.NEPTUNE:
-            query: LiteralString = """
-                MATCH (c:Community {uuid: $uuid})
-                RETURN [x IN split(c.name_embedding, ",") | toFloat(x)] as name_embedding
-            """
-        else:
-            query: LiteralString = """
+        query: LiteralString = """
             MATCH (c:Community {uuid: $uuid})
             RETURN c.name_embedding AS name_embedding
-            """
+        """
 
         records, _, _ = await driver.execute_query(
             query,
@@ -731,7 +800,7 @@ class CommunityNode(Node):
         if len(records) == 0:
             raise NodeNotFoundError(self.uuid)
 
-        self.name_embedding = records[0]['name_embedding']
+        self.name_embedding = decode_embedding(records[0]['name_embedding'])
 
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str):
@@ -1006,6 +1075,7 @@ def get_episodic_node_from_record(record: Any) -> EpisodicNode:
         name=record['name'],
         source_description=record['source_description'],
         entity_edges=record['entity_edges'],
+        content_hash=record.get('content_hash'),
     )
 
 
@@ -1021,6 +1091,7 @@ def get_entity_node_from_record(record: Any, provider: GraphProvider) -> EntityN
         attributes.pop('summary', None)
         attributes.pop('created_at', None)
         attributes.pop('labels', None)
+        attributes.pop('name_normalized', None)
 
     labels = record.get('labels', [])
     group_id = record.get('group_id')
@@ -1030,7 +1101,7 @@ def get_entity_node_from_record(record: Any, provider: GraphProvider) -> EntityN
     entity_node = EntityNode(
         uuid=record['uuid'],
         name=record['name'],
-        name_embedding=record.get('name_embedding'),
+        name_embedding=decode_embedding(record.get('name_embedding')),
         group_id=group_id,
         labels=labels,
         created_at=parse_db_date(record['created_at']),  # type: ignore
@@ -1046,7 +1117,7 @@ def get_community_node_from_record(record: Any) -> CommunityNode:
         uuid=record['uuid'],
         name=record['name'],
         group_id=record['group_id'],
-        name_embedding=record['name_embedding'],
+        name_embedding=decode_embedding(record['name_embedding']),
         created_at=parse_db_date(record['created_at']),  # type: ignore
         summary=record['summary'],
     )
@@ -1070,4 +1141,4 @@ async def create_entity_node_embeddings(embedder: EmbedderClient, nodes: list[En
 
     name_embeddings = await embedder.create_batch([node.name for node in filtered_nodes])
     for node, name_embedding in zip(filtered_nodes, name_embeddings, strict=True):
-        node.name_embedding = name_embedding
+        node.name_embedding = to_embedding(name_embedding)
@@ -19,6 +19,7 @@ from typing import Any, Protocol, TypedDict
 from pydantic import BaseModel, Field
 
 from .models import Message, PromptFunction, PromptVersion
+from .prompt_helpers import to_prompt_json
 
 
 class EdgeDuplicate(BaseModel):
@@ -32,12 +33,32 @@ class EdgeDuplicate(BaseModel):
     )
 
 
+class EdgeResolution(BaseModel):
+    id: int = Field(..., description='id of the NEW FACT this resolution is for')
+    duplicate_facts: list[int] = Field(
+        ...,
+        description='List of idx values from the EXISTING FACTS of this new fact that are duplicates of it. If no duplicate facts are found, default to empty list.',
+    )
+    contradicted_facts: list[int] = Field(
+        ...,
+        description='List of idx values from the FACT INVALIDATION CANDIDATES of this new fact that should be invalidated. If no facts should be invalidated, the list should be empty.',
+    )
+
+
+class EdgeResolutions(BaseModel):
+    edge_resolutions: list[EdgeResolution] = Field(
+        ..., description='One resolution for each NEW FACT'
+    )
+
+
 class Prompt(Protocol):
     resolve_edge: PromptVersion
+    resolve_edges: PromptVersion
 
 
 class Versions(TypedDict):
     resolve_edge: PromptFunction
+    resolve_edges: PromptFunction
 
 
 def resolve_edge(context: dict[str, Any]) -> list[Message]:
@@ -89,4 +110,47 @@ def resolve_edge(context: dict[str, Any]) -> list[Message]:
     ]
 
 
-versions: Versions = {'resolve_edge': resolve_edge}
+def resolve_edges(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are a helpful assistant that de-duplicates facts from fact lists and determines which existing '
+            'facts are contradicted by new facts.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+        Task:
+        You will receive a list of NEW FACTS. Each new fact has an 'id' and comes with TWO separate lists of its own:
+        'existing_facts' and 'invalidation_candidates'. Each of these lists uses 'idx' as its index field, starting from 0,
+        and the idx values only refer to the list of that same new fact.
+
+        For EACH new fact:
+
+        1. DUPLICATE DETECTION:
+           - If the new fact represents identical factual information as any fact in its existing_facts, return those idx values in duplicate_facts.
+           - Facts with similar information that contain key differences should NOT be marked as duplicates.
+           - If no duplicates, return an empty list for duplicate_facts.
+
+        2. CONTRADICTION DETECTION:
+           - Based on its invalidation_candidates, determine which facts the new fact contradicts.
+           - Return idx values from its invalidation_candidates in contradicted_facts.
+           - If no contradictions, return an empty list for contradicted_facts.
+
+        IMPORTANT:
+        - Return exactly one resolution per new fact, using the new fact's 'id'.
+        - Never use idx values from the lists of a different new fact.
+
+        Guidelines:
+        1. Some facts may be very similar but will have key differences, particularly around numeric values in the facts.
+            Do not mark these facts as duplicates.
+
+        <NEW FACTS>
+        {to_prompt_json(context['new_edges'])}
+        </NEW FACTS>
+        """,
+        ),
+    ]
+
+
+versions: Versions = {'resolve_edge': resolve_edge, 'resolve_edges': resolve_edges}
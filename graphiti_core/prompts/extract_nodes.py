@@ -48,6 +48,8 @@ class Prompt(Protocol):
     classify_nodes: PromptVersion
     extract_attributes: PromptVersion
     extract_summary: PromptVersion
+    extract_attributes_and_summary: PromptVersion
+    extract_attributes_and_summaries: PromptVersion
 
 
 class Versions(TypedDict):
@@ -57,6 +59,8 @@ class Versions(TypedDict):
     classify_nodes: PromptFunction
     extract_attributes: PromptFunction
     extract_summary: PromptFunction
+    extract_attributes_and_summary: PromptFunction
+    extract_attributes_and_summaries: PromptFunction
 
 
 def extract_message(context: dict[str, Any]) -> list[Message]:
@@ -260,6 +264,75 @@ def extract_summary(context: dict[str, Any]) -> list[Message]:
     ]
 
 
+def extract_attributes_and_summary(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are a helpful assistant that extracts entity properties and summaries from the provided text.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+        Given the MESSAGES and the following ENTITY:
+        1. Update any of its attributes based on the information provided in MESSAGES. Use the provided attribute
+           descriptions to better understand how each attribute should be determined.
+        2. Update the summary that combines relevant information about the entity from the messages and relevant
+           information from the existing summary. Summary must be under {MAX_SUMMARY_CHARS} characters.
+
+        Guidelines:
+        1. Do not hallucinate entity property values if they cannot be found in the current context.
+        2. Only use the provided MESSAGES and ENTITY to set attribute values.
+
+        {summary_instructions}
+
+        <MESSAGES>
+        {to_prompt_json(context['previous_episodes'])}
+        {to_prompt_json(context['episode_content'])}
+        </MESSAGES>
+
+        <ENTITY>
+        {context['node']}
+        </ENTITY>
+        """,
+        ),
+    ]
+
+
+def extract_attributes_and_summaries(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are a helpful assistant that extracts entity properties and summaries from the provided text.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+        Given the MESSAGES and the following ENTITIES, fill in the response field entity_<id> for every entity.
+        Each entity lists the tasks to perform for it:
+        - attributes: update any of its attributes based on the information provided in MESSAGES. Use the
+          attribute descriptions in the response format to understand how each attribute should be determined.
+        - summary: update the summary that combines relevant information about the entity from the messages and
+          relevant information from its existing summary. Summary must be under {MAX_SUMMARY_CHARS} characters.
+
+        Guidelines:
+        1. Do not hallucinate entity property values if they cannot be found in the current context.
+        2. Only use the provided MESSAGES and the entity itself to set its attribute values and summary.
+
+        {summary_instructions}
+
+        <MESSAGES>
+        {to_prompt_json(context['previous_episodes'])}
+        {to_prompt_json(context['episode_content'])}
+        </MESSAGES>
+
+        <ENTITIES>
+        {context['nodes']}
+        </ENTITIES>
+        """,
+        ),
+    ]
+
+
 versions: Versions = {
     'extract_message': extract_message,
     'extract_json': extract_json,
@@ -267,4 +340,6 @@ versions: Versions = {
     'extract_summary': extract_summary,
     'classify_nodes': classify_nodes,
     'extract_attributes': extract_attributes,
+    'extract_attributes_and_summary': extract_attributes_and_summary,
+    'extract_attributes_and_summaries': extract_attributes_and_summaries,
 }
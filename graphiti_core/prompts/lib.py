@@ -33,6 +33,9 @@ from .extract_nodes import Versions as ExtractNodesVersions
 from .extract_nodes import versions as extract_nodes_versions
 from .models import Message, PromptFunction
 from .prompt_helpers import DO_NOT_ESCAPE_UNICODE
+from .summarize_episodes import Prompt as SummarizeEpisodesPrompt
+from .summarize_episodes import Versions as SummarizeEpisodesVersions
+from .summarize_episodes import versions as summarize_episodes_versions
 from .summarize_nodes import Prompt as SummarizeNodesPrompt
 from .summarize_nodes import Versions as SummarizeNodesVersions
 from .summarize_nodes import versions as summarize_nodes_versions
@@ -44,6 +47,7 @@ class PromptLibrary(Protocol):
     extract_edges: ExtractEdgesPrompt
     dedupe_edges: DedupeEdgesPrompt
     summarize_nodes: SummarizeNodesPrompt
+    summarize_episodes: SummarizeEpisodesPrompt
     eval: EvalPrompt
 
 
@@ -53,6 +57,7 @@ class PromptLibraryImpl(TypedDict):
     extract_edges: ExtractEdgesVersions
     dedupe_edges: DedupeEdgesVersions
     summarize_nodes: SummarizeNodesVersions
+    summarize_episodes: SummarizeEpisodesVersions
     eval: EvalVersions
 
 
@@ -85,6 +90,7 @@ PROMPT_LIBRARY_IMPL: PromptLibraryImpl = {
     'extract_edges': extract_edges_versions,
     'dedupe_edges': dedupe_edges_versions,
     'summarize_nodes': summarize_nodes_versions,
+    'summarize_episodes': summarize_episodes_versions,
     'eval': eval_versions,
 }
 prompt_library: PromptLibrary = PromptLibraryWrapper(PROMPT_LIBRARY_IMPL)  # type: ignore[assignment]
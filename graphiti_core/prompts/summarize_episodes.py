@@ -0,0 +1,72 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from typing import Any, Protocol, TypedDict
+
+from pydantic import BaseModel, Field
+
+from .models import Message, PromptFunction, PromptVersion
+from .prompt_helpers import to_prompt_json
+
+
+class EpisodesSummary(BaseModel):
+    summary: str = Field(
+        ...,
+        description='Summary of the facts, entities and relationships stated in the episodes',
+    )
+
+
+class Prompt(Protocol):
+    rolling_summary: PromptVersion
+
+
+class Versions(TypedDict):
+    rolling_summary: PromptFunction
+
+
+def rolling_summary(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are a helpful assistant that keeps a running summary of a conversation or document stream.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+        Update the PREVIOUS SUMMARY with the information from the NEW EPISODES, listed oldest first.
+        The summary is given as context when extracting entities and facts from later episodes.
+
+        Guidelines:
+        1. Keep the entities, facts and relationships stated in the episodes, with their dates when given.
+        2. When the new episodes contradict the previous summary, keep the newer information.
+        3. Leave out greetings, filler and anything that is not a fact about an entity.
+        4. Only use information from the PREVIOUS SUMMARY and the NEW EPISODES.
+
+        IMPORTANT: THE SUMMARY MUST BE LESS THAN {context['max_characters']} CHARACTERS.
+
+        <PREVIOUS SUMMARY>
+        {context['previous_summary']}
+        </PREVIOUS SUMMARY>
+
+        <NEW EPISODES>
+        {to_prompt_json(context['episodes'])}
+        </NEW EPISODES>
+        """,
+        ),
+    ]
+
+
+versions: Versions = {'rolling_summary': rolling_summary}
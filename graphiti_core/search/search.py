@@ -18,6 +18,7 @@ import logging
 from collections import defaultdict
 from time import time
 
+from graphiti_core.concurrency import DB_POOL
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.driver.driver import GraphDriver
 from graphiti_core.edges import EntityEdge
@@ -163,6 +164,8 @@ async def search(
             config.limit,
             config.reranker_min_score,
         ),
+        governor=clients.governor,
+        pool=DB_POOL,
     )
 
     results = SearchResults(
@@ -233,7 +236,7 @@ async def edge_search(
     # Execute only the configured search methods
     search_results: list[list[EntityEdge]] = []
     if search_tasks:
-        search_results = list(await semaphore_gather(*search_tasks))
+        search_results = list(await semaphore_gather(*search_tasks, pool=DB_POOL))
 
     if EdgeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is None:
         source_node_uuids = [edge.source_node_uuid for result in search_results for edge in result]
@@ -354,7 +357,7 @@ async def node_search(
     # Execute only the configured search methods
     search_results: list[list[EntityNode]] = []
     if search_tasks:
-        search_results = list(await semaphore_gather(*search_tasks))
+        search_results = list(await semaphore_gather(*search_tasks, pool=DB_POOL))
 
     if NodeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is None:
         origin_node_uuids = [node.uuid for result in search_results for node in result]
@@ -433,7 +436,8 @@ async def episode_search(
         await semaphore_gather(
             *[
                 episode_fulltext_search(driver, query, search_filter, group_ids, 2 * limit),
-            ]
+            ],
+            pool=DB_POOL,
         )
     )
 
@@ -485,7 +489,8 @@ async def community_search(
                 community_similarity_search(
                     driver, query_vector, group_ids, 2 * limit, config.sim_min_score
                 ),
-            ]
+            ],
+            pool=DB_POOL,
         )
     )
 
@@ -16,18 +16,26 @@ limitations under the License.
 
 import logging
 from collections import defaultdict
+from collections.abc import Mapping
 from time import time
 from typing import Any
 
 import numpy as np
-from numpy._typing import NDArray
+from numpy.typing import NDArray
 from typing_extensions import LiteralString
 
+from graphiti_core.concurrency import DB_POOL
 from graphiti_core.driver.driver import (
     GraphDriver,
     GraphProvider,
 )
 from graphiti_core.edges import EntityEdge, get_entity_edge_from_record
+from graphiti_core.embedder.embedding import (
+    embedding_to_list,
+    normalize_rows,
+    stack_embeddings,
+    to_embedding,
+)
 from graphiti_core.graph_queries import (
     get_nodes_query,
     get_relationships_query,
@@ -35,7 +43,6 @@ from graphiti_core.graph_queries import (
 )
 from graphiti_core.helpers import (
     lucene_sanitize,
-    normalize_l2,
     semaphore_gather,
 )
 from graphiti_core.models.edges.edge_db_queries import get_entity_edge_return_query
@@ -57,6 +64,7 @@ from graphiti_core.search.search_filters import (
     edge_search_filter_query_constructor,
     node_search_filter_query_constructor,
 )
+from graphiti_core.utils.embedding_encoding import decode_embedding
 
 logger = logging.getLogger(__name__)
 
@@ -67,13 +75,18 @@ MAX_SEARCH_DEPTH = 3
 MAX_QUERY_LENGTH = 128
 
 
-def calculate_cosine_similarity(vector1: list[float], vector2: list[float]) -> float:
+def calculate_cosine_similarity(
+    vector1: NDArray | list[float],
+    vector2: NDArray | list[float],
+) -> float:
     """
     Calculates the cosine similarity between two vectors using NumPy.
     """
-    dot_product = np.dot(vector1, vector2)
-    norm_vector1 = np.linalg.norm(vector1)
-    norm_vector2 = np.linalg.norm(vector2)
+    array1 = np.asarray(vector1)
+    array2 = np.asarray(vector2)
+    dot_product = np.dot(array1, array2)
+    norm_vector1 = np.linalg.norm(array1)
+    norm_vector2 = np.linalg.norm(array2)
 
     if norm_vector1 == 0 or norm_vector2 == 0:
         return 0  # Handle cases where one or both vectors are zero vectors
@@ -296,7 +309,7 @@ async def edge_fulltext_search(
 
 async def edge_similarity_search(
     driver: GraphDriver,
-    search_vector: list[float],
+    search_vector: NDArray | list[float],
     source_node_uuid: str | None,
     target_node_uuid: str | None,
     search_filter: SearchFilters,
@@ -304,6 +317,8 @@ async def edge_similarity_search(
     limit: int = RELEVANT_SCHEMA_LIMIT,
     min_score: float = DEFAULT_MIN_SCORE,
 ) -> list[EntityEdge]:
+    # Embeddings from the models are arrays, which drivers do not take as parameters
+    search_vector = embedding_to_list(search_vector) or []
     if driver.search_interface:
         return await driver.search_interface.edge_similarity_search(
             driver,
@@ -371,12 +386,12 @@ async def edge_similarity_search(
             # Calculate Cosine similarity then return the edge ids
             input_ids = []
             for r in resp:
-                if r['embedding']:
-                    score = calculate_cosine_similarity(
-                        search_vector, list(map(float, r['embedding'].split(',')))
-                    )
-                    if score > min_score:
-                        input_ids.append({'id': r['id'], 'score': score})
+                embedding = decode_embedding(r['embedding'])
+                if embedding is None or not embedding.size:
+                    continue
+                score = calculate_cosine_similarity(search_vector, embedding)
+                if score > min_score:
+                    input_ids.append({'id': r['id'], 'score': score})
 
             # Match the edge ides and return the values
             query = """
@@ -668,12 +683,14 @@ async def node_fulltext_search(
 
 async def node_similarity_search(
     driver: GraphDriver,
-    search_vector: list[float],
+    search_vector: NDArray | list[float],
     search_filter: SearchFilters,
     group_ids: list[str] | None = None,
     limit=RELEVANT_SCHEMA_LIMIT,
     min_score: float = DEFAULT_MIN_SCORE,
 ) -> list[EntityNode]:
+    # Embeddings from the models are arrays, which drivers do not take as parameters
+    search_vector = embedding_to_list(search_vector) or []
     if driver.search_interface:
         return await driver.search_interface.node_similarity_search(
             driver, search_vector, search_filter, group_ids, limit, min_score
@@ -718,12 +735,12 @@ async def node_similarity_search(
             # Calculate Cosine similarity then return the edge ids
             input_ids = []
             for r in resp:
-                if r['embedding']:
-                    score = calculate_cosine_similarity(
-                        search_vector, list(map(float, r['embedding'].split(',')))
-                    )
-                    if score > min_score:
-                        input_ids.append({'id': r['id'], 'score': score})
+                embedding = decode_embedding(r['embedding'])
+                if embedding is None or not embedding.size:
+                    continue
+                score = calculate_cosine_similarity(search_vector, embedding)
+                if score > min_score:
+                    input_ids.append({'id': r['id'], 'score': score})
 
             # Match the edge ides and return the values
             query = (
@@ -1014,7 +1031,7 @@ async def community_fulltext_search(
                     comm.name AS name,
                     comm.created_at AS created_at,
                     comm.summary AS summary,
-                    [x IN split(comm.name_embedding, ",") | toFloat(x)]AS name_embedding
+                    comm.name_embedding AS name_embedding
                 ORDER BY i.score DESC
                 LIMIT $limit
             """
@@ -1057,11 +1074,13 @@ async def community_fulltext_search(
 
 async def community_similarity_search(
     driver: GraphDriver,
-    search_vector: list[float],
+    search_vector: NDArray | list[float],
     group_ids: list[str] | None = None,
     limit=RELEVANT_SCHEMA_LIMIT,
     min_score=DEFAULT_MIN_SCORE,
 ) -> list[CommunityNode]:
+    # Embeddings from the models are arrays, which drivers do not take as parameters
+    search_vector = embedding_to_list(search_vector) or []
     if driver.search_interface:
         try:
             return await driver.search_interface.community_similarity_search(
@@ -1101,12 +1120,12 @@ async def community_similarity_search(
             # Calculate Cosine similarity then return the edge ids
             input_ids = []
             for r in resp:
-                if r['embedding']:
-                    score = calculate_cosine_similarity(
-                        search_vector, list(map(float, r['embedding'].split(',')))
-                    )
-                    if score > min_score:
-                        input_ids.append({'id': r['id'], 'score': score})
+                embedding = decode_embedding(r['embedding'])
+                if embedding is None or not embedding.size:
+                    continue
+                score = calculate_cosine_similarity(search_vector, embedding)
+                if score > min_score:
+                    input_ids.append({'id': r['id'], 'score': score})
 
             # Match the edge ides and return the values
             query = """
@@ -1230,6 +1249,7 @@ async def hybrid_node_search(
                 node_similarity_search(driver, e, search_filter, group_ids, 2 * limit)
                 for e in embeddings
             ],
+            pool=DB_POOL,
         )
     )
 
@@ -1262,7 +1282,7 @@ async def get_relevant_nodes(
         {
             'uuid': node.uuid,
             'name': node.name,
-            'name_embedding': node.name_embedding,
+            'name_embedding': embedding_to_list(node.name_embedding),
             'fulltext_query': fulltext_query(node.name, [node.group_id], driver),
         }
         for node in nodes
@@ -1444,9 +1464,11 @@ async def get_relevant_edges(
         # Calculate Cosine similarity then return the edge ids
         input_ids = []
         for r in resp:
-            score = calculate_cosine_similarity(
-                list(map(float, r['source_embedding'].split(','))), r['target_embedding']
-            )
+            source_embedding = decode_embedding(r['source_embedding'])
+            target_embedding = decode_embedding(r['target_embedding'])
+            if source_embedding is None or target_embedding is None:
+                continue
+            score = calculate_cosine_similarity(source_embedding, target_embedding)
             if score > min_score:
                 input_ids.append({'id': r['id'], 'score': score, 'uuid': r['search_edge_uuid']})
 
@@ -1466,7 +1488,7 @@ async def get_relevant_edges(
                 name: e.name,
                 group_id: e.group_id,
                 fact: e.fact,
-                fact_embedding: [x IN split(e.fact_embedding, ",") | toFloat(x)],
+                fact_embedding: e.fact_embedding,
                 episodes: split(e.episodes, ","),
                 expired_at: e.expired_at,
                 valid_at: e.valid_at,
@@ -1631,9 +1653,11 @@ async def get_edge_invalidation_candidates(
         # Calculate Cosine similarity then return the edge ids
         input_ids = []
         for r in resp:
-            score = calculate_cosine_similarity(
-                list(map(float, r['source_embedding'].split(','))), r['target_embedding']
-            )
+            source_embedding = decode_embedding(r['source_embedding'])
+            target_embedding = decode_embedding(r['target_embedding'])
+            if source_embedding is None or target_embedding is None:
+                continue
+            score = calculate_cosine_similarity(source_embedding, target_embedding)
             if score > min_score:
                 input_ids.append({'id': r['id'], 'score': score, 'uuid': r['search_edge_uuid']})
 
@@ -1653,7 +1677,7 @@ async def get_edge_invalidation_candidates(
                 name: e.name,
                 group_id: e.group_id,
                 fact: e.fact,
-                fact_embedding: [x IN split(e.fact_embedding, ",") | toFloat(x)],
+                fact_embedding: e.fact_embedding,
                 episodes: split(e.episodes, ","),
                 expired_at: e.expired_at,
                 valid_at: e.valid_at,
@@ -1897,34 +1921,26 @@ async def episode_mentions_reranker(
 
 def maximal_marginal_relevance(
     query_vector: list[float],
-    candidates: dict[str, list[float]],
+    candidates: Mapping[str, NDArray | list[float]],
     mmr_lambda: float = DEFAULT_MMR_LAMBDA,
     min_score: float = -2.0,
 ) -> tuple[list[str], list[float]]:
     start = time()
-    query_array = np.array(query_vector)
-    candidate_arrays: dict[str, NDArray] = {}
-    for uuid, embedding in candidates.items():
-        candidate_arrays[uuid] = normalize_l2(embedding)
-
-    uuids: list[str] = list(candidate_arrays.keys())
+    uuids: list[str] = list(candidates.keys())
+    if not uuids:
+        return [], []
 
-    similarity_matrix = np.zeros((len(uuids), len(uuids)))
+    query_array = np.asarray(query_vector, dtype=np.float32)
+    candidate_matrix = normalize_rows(stack_embeddings(list(candidates.values())))
 
-    for i, uuid_1 in enumerate(uuids):
-        for j, uuid_2 in enumerate(uuids[:i]):
-            u = candidate_arrays[uuid_1]
-            v = candidate_arrays[uuid_2]
-            similarity = np.dot(u, v)
+    similarity_matrix = candidate_matrix @ candidate_matrix.T
+    np.fill_diagonal(similarity_matrix, 0)
+    max_sims = similarity_matrix.max(axis=1)
 
-            similarity_matrix[i, j] = similarity
-            similarity_matrix[j, i] = similarity
-
-    mmr_scores: dict[str, float] = {}
-    for i, uuid in enumerate(uuids):
-        max_sim = np.max(similarity_matrix[i, :])
-        mmr = mmr_lambda * np.dot(query_array, candidate_arrays[uuid]) + (mmr_lambda - 1) * max_sim
-        mmr_scores[uuid] = mmr
+    scores = mmr_lambda * (candidate_matrix @ query_array) + (mmr_lambda - 1) * max_sims
+    mmr_scores: dict[str, float] = {
+        uuid: float(score) for uuid, score in zip(uuids, scores, strict=True)
+    }
 
     uuids.sort(reverse=True, key=lambda c: mmr_scores[c])
 
@@ -1936,37 +1952,37 @@ def maximal_marginal_relevance(
     ]
 
 
+def _to_embeddings(embeddings: Mapping[str, Any]) -> dict[str, NDArray[np.float32]]:
+    # Driver hooks may return embeddings as lists of floats
+    converted = {uuid: to_embedding(embedding) for uuid, embedding in embeddings.items()}
+    return {uuid: embedding for uuid, embedding in converted.items() if embedding is not None}
+
+
 async def get_embeddings_for_nodes(
     driver: GraphDriver, nodes: list[EntityNode]
-) -> dict[str, list[float]]:
+) -> dict[str, NDArray[np.float32]]:
     if driver.graph_operations_interface:
-        return await driver.graph_operations_interface.node_load_embeddings_bulk(driver, nodes)
-    elif driver.provider == GraphProvider.NEPTUNE:
-        query = """
-        MATCH (n:Entity)
-        WHERE n.uuid IN $node_uuids
-        RETURN DISTINCT
-            n.uuid AS uuid,
-            split(n.name_embedding, ",") AS name_embedding
-        """
-    else:
-        query = """
-        MATCH (n:Entity)
-        WHERE n.uuid IN $node_uuids
-        RETURN DISTINCT
-            n.uuid AS uuid,
-            n.name_embedding AS name_embedding
-        """
+        return _to_embeddings(
+            await driver.graph_operations_interface.node_load_embeddings_bulk(driver, nodes)
+        )
+
+    query = """
+    MATCH (n:Entity)
+    WHERE n.uuid IN $node_uuids
+    RETURN DISTINCT
+        n.uuid AS uuid,
+        n.name_embedding AS name_embedding
+    """
     results, _, _ = await driver.execute_query(
         query,
         node_uuids=[node.uuid for node in nodes],
         routing_='r',
     )
 
-    embeddings_dict: dict[str, list[float]] = {}
+    embeddings_dict: dict[str, NDArray[np.float32]] = {}
     for result in results:
         uuid: str = result.get('uuid')
-        embedding: list[float] = result.get('name_embedding')
+        embedding = decode_embedding(result.get('name_embedding'))
         if uuid is not None and embedding is not None:
             embeddings_dict[uuid] = embedding
 
@@ -1975,39 +1991,32 @@ async def get_embeddings_for_nodes(
 
 async def get_embeddings_for_communities(
     driver: GraphDriver, communities: list[CommunityNode]
-) -> dict[str, list[float]]:
+) -> dict[str, NDArray[np.float32]]:
     if driver.search_interface:
         try:
-            return await driver.search_interface.get_embeddings_for_communities(driver, communities)
+            return _to_embeddings(
+                await driver.search_interface.get_embeddings_for_communities(driver, communities)
+            )
         except NotImplementedError:
             pass
 
-    if driver.provider == GraphProvider.NEPTUNE:
-        query = """
-        MATCH (c:Community)
-        WHERE c.uuid IN $community_uuids
-        RETURN DISTINCT
-            c.uuid AS uuid,
-            split(c.name_embedding, ",") AS name_embedding
-        """
-    else:
-        query = """
-        MATCH (c:Community)
-        WHERE c.uuid IN $community_uuids
-        RETURN DISTINCT
-            c.uuid AS uuid,
-            c.name_embedding AS name_embedding
-        """
+    query = """
+    MATCH (c:Community)
+    WHERE c.uuid IN $community_uuids
+    RETURN DISTINCT
+        c.uuid AS uuid,
+        c.name_embedding AS name_embedding
+    """
     results, _, _ = await driver.execute_query(
         query,
         community_uuids=[community.uuid for community in communities],
         routing_='r',
     )
 
-    embeddings_dict: dict[str, list[float]] = {}
+    embeddings_dict: dict[str, NDArray[np.float32]] = {}
     for result in results:
         uuid: str = result.get('uuid')
-        embedding: list[float] = result.get('name_embedding')
+        embedding = decode_embedding(result.get('name_embedding'))
         if uuid is not None and embedding is not None:
             embeddings_dict[uuid] = embedding
 
@@ -2016,45 +2025,39 @@ async def get_embeddings_for_communities(
 
 async def get_embeddings_for_edges(
     driver: GraphDriver, edges: list[EntityEdge]
-) -> dict[str, list[float]]:
+) -> dict[str, NDArray[np.float32]]:
     if driver.graph_operations_interface:
-        return await driver.graph_operations_interface.edge_load_embeddings_bulk(driver, edges)
-    elif driver.provider == GraphProvider.NEPTUNE:
-        query = """
+        return _to_embeddings(
+            await driver.graph_operations_interface.edge_load_embeddings_bulk(driver, edges)
+        )
+
+    match_query = """
         MATCH (n:Entity)-[e:RELATES_TO]-(m:Entity)
-        WHERE e.uuid IN $edge_uuids
-        RETURN DISTINCT
-            e.uuid AS uuid,
-            split(e.fact_embedding, ",") AS fact_embedding
-        """
-    else:
+    """
+    if driver.provider == GraphProvider.KUZU:
         match_query = """
-            MATCH (n:Entity)-[e:RELATES_TO]-(m:Entity)
+            MATCH (n:Entity)-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(m:Entity)
         """
-        if driver.provider == GraphProvider.KUZU:
-            match_query = """
-                MATCH (n:Entity)-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(m:Entity)
-            """
 
-        query = (
-            match_query
-            + """
-        WHERE e.uuid IN $edge_uuids
-        RETURN DISTINCT
-            e.uuid AS uuid,
-            e.fact_embedding AS fact_embedding
-        """
-        )
+    query = (
+        match_query
+        + """
+    WHERE e.uuid IN $edge_uuids
+    RETURN DISTINCT
+        e.uuid AS uuid,
+        e.fact_embedding AS fact_embedding
+    """
+    )
     results, _, _ = await driver.execute_query(
         query,
         edge_uuids=[edge.uuid for edge in edges],
         routing_='r',
     )
 
-    embeddings_dict: dict[str, list[float]] = {}
+    embeddings_dict: dict[str, NDArray[np.float32]] = {}
     for result in results:
         uuid: str = result.get('uuid')
-        embedding: list[float] = result.get('fact_embedding')
+        embedding = decode_embedding(result.get('fact_embedding'))
         if uuid is not None and embedding is not None:
             embeddings_dict[uuid] = embedding
 
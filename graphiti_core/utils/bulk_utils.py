@@ -23,6 +23,7 @@ import numpy as np
 from pydantic import BaseModel, Field
 from typing_extensions import Any
 
+from graphiti_core.concurrency import DB_POOL, EMBEDDER_POOL, LLM_POOL
 from graphiti_core.driver.driver import (
     GraphDriver,
     GraphDriverSession,
@@ -30,8 +31,15 @@ from graphiti_core.driver.driver import (
 )
 from graphiti_core.edges import Edge, EntityEdge, EpisodicEdge, create_entity_edge_embeddings
 from graphiti_core.embedder import EmbedderClient
+from graphiti_core.embedder.embedding import embedding_to_list
+from graphiti_core.graph_queries import get_kuzu_copy_query
 from graphiti_core.graphiti_types import GraphitiClients
-from graphiti_core.helpers import normalize_l2, semaphore_gather
+from graphiti_core.helpers import (
+    compute_fact_hash,
+    normalize_exact,
+    normalize_l2,
+    semaphore_gather,
+)
 from graphiti_core.models.edges.edge_db_queries import (
     get_entity_edge_save_bulk_query,
     get_episodic_edge_save_bulk_query,
@@ -42,6 +50,7 @@ from graphiti_core.models.nodes.node_db_queries import (
 )
 from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
 from graphiti_core.utils.datetime_utils import convert_datetimes_to_strings
+from graphiti_core.utils.entity_name_cache import EntityNameCache
 from graphiti_core.utils.maintenance.dedup_helpers import (
     DedupResolutionState,
     _build_candidate_indexes,
@@ -116,7 +125,8 @@ async def retrieve_previous_episodes_bulk(
                 driver, episode.valid_at, last_n=EPISODE_WINDOW_LEN, group_ids=[episode.group_id]
             )
             for episode in episodes
-        ]
+        ],
+        pool=DB_POOL,
     )
     episode_tuples: list[tuple[EpisodicNode, list[EpisodicNode]]] = [
         (episode, previous_episodes_list[i]) for i, episode in enumerate(episodes)
@@ -132,6 +142,7 @@ async def add_nodes_and_edges_bulk(
     entity_nodes: list[EntityNode],
     entity_edges: list[EntityEdge],
     embedder: EmbedderClient,
+    entity_name_cache: EntityNameCache | None = None,
 ):
     session = driver.session()
     try:
@@ -147,6 +158,10 @@ async def add_nodes_and_edges_bulk(
     finally:
         await session.close()
 
+    # Only once the transaction has committed, so a retried or failed write is never cached
+    if entity_name_cache is not None:
+        entity_name_cache.add(entity_nodes)
+
 
 async def add_nodes_and_edges_bulk_tx(
     tx: GraphDriverSession,
@@ -174,8 +189,9 @@ async def add_nodes_and_edges_bulk_tx(
             'group_id': node.group_id,
             'summary': node.summary,
             'created_at': node.created_at,
-            'name_embedding': node.name_embedding,
+            'name_embedding': embedding_to_list(node.name_embedding),
             'labels': list(set(node.labels + ['Entity'])),
+            'name_normalized': normalize_exact(node.name),
         }
 
         if driver.provider == GraphProvider.KUZU:
@@ -196,13 +212,14 @@ async def add_nodes_and_edges_bulk_tx(
             'target_node_uuid': edge.target_node_uuid,
             'name': edge.name,
             'fact': edge.fact,
+            'fact_hash': compute_fact_hash(edge.source_node_uuid, edge.target_node_uuid, edge.fact),
             'group_id': edge.group_id,
             'episodes': edge.episodes,
             'created_at': edge.created_at,
             'expired_at': edge.expired_at,
             'valid_at': edge.valid_at,
             'invalid_at': edge.invalid_at,
-            'fact_embedding': edge.fact_embedding,
+            'fact_embedding': embedding_to_list(edge.fact_embedding),
         }
 
         if driver.provider == GraphProvider.KUZU:
@@ -222,19 +239,14 @@ async def add_nodes_and_edges_bulk_tx(
         await driver.graph_operations_interface.edge_save_bulk(None, driver, tx, edges)
 
     elif driver.provider == GraphProvider.KUZU:
-        # FIXME: Kuzu's UNWIND does not currently support STRUCT[] type properly, so we insert the data one by one instead for now.
-        episode_query = get_episode_node_save_bulk_query(driver.provider)
-        for episode in episodes:
-            await tx.run(episode_query, **episode)
-        entity_node_query = get_entity_node_save_bulk_query(driver.provider, nodes)
-        for node in nodes:
-            await tx.run(entity_node_query, **node)
-        entity_edge_query = get_entity_edge_save_bulk_query(driver.provider)
-        for edge in edges:
-            await tx.run(entity_edge_query, **edge)
-        episodic_edge_query = get_episodic_edge_save_bulk_query(driver.provider)
-        for edge in episodic_edges:
-            await tx.run(episodic_edge_query, **edge.model_dump())
+        from graphiti_core.driver.kuzu_driver import KuzuDriver
+
+        if not isinstance(driver, KuzuDriver):
+            raise TypeError(f'Expected a KuzuDriver for the Kuzu provider, got {type(driver)}')
+        async with driver.bulk_load_lock:
+            await _save_bulk_kuzu(
+                tx, driver, episodes, nodes, edges, [edge.model_dump() for edge in episodic_edges]
+            )
     else:
         await tx.run(get_episode_node_save_bulk_query(driver.provider), episodes=episodes)
         await tx.run(
@@ -251,6 +263,148 @@ async def add_nodes_and_edges_bulk_tx(
         )
 
 
+def _dedupe_rows_by_uuid(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # Later rows win, as they would when merged one by one
+    return list({row['uuid']: row for row in rows}.values())
+
+
+async def _get_existing_uuids(driver: GraphDriver, match_query: str, uuids: list[str]) -> set[str]:
+    if not uuids:
+        return set()
+    records, _, _ = await driver.execute_query(
+        match_query + ' WHERE n.uuid IN $uuids RETURN n.uuid AS uuid', uuids=uuids
+    )
+    return {record['uuid'] for record in records}
+
+
+async def _save_bulk_kuzu(
+    tx: GraphDriverSession,
+    driver: GraphDriver,
+    episodes: list[dict[str, Any]],
+    nodes: list[dict[str, Any]],
+    edges: list[dict[str, Any]],
+    episodic_edges: list[dict[str, Any]],
+):
+    """Write bulk rows to Kuzu, loading new rows with COPY and merging existing ones.
+
+    Kuzu cannot MERGE from an UNWIND of structs, so rows used to be written one statement at a
+    time. A COPY per table loads all new rows at once instead, but fails on primary keys that
+    already exist, so rows whose uuid is already stored are still merged one by one. Edges whose
+    endpoints do not exist are skipped, as the MATCH of the per-row queries would.
+    """
+    from graphiti_core.driver.kuzu_driver import (
+        ENTITY_COLUMNS,
+        EPISODIC_COLUMNS,
+        RELATES_TO_NODE_COLUMNS,
+    )
+
+    episodes = _dedupe_rows_by_uuid(episodes)
+    nodes = _dedupe_rows_by_uuid(nodes)
+    edges = _dedupe_rows_by_uuid(edges)
+    episodic_edges = _dedupe_rows_by_uuid(episodic_edges)
+
+    (
+        existing_episodes,
+        existing_nodes,
+        existing_edges,
+        existing_episodic_edges,
+    ) = await semaphore_gather(
+        _get_existing_uuids(
+            driver, 'MATCH (n:Episodic)', [episode['uuid'] for episode in episodes]
+        ),
+        _get_existing_uuids(driver, 'MATCH (n:Entity)', [node['uuid'] for node in nodes]),
+        _get_existing_uuids(driver, 'MATCH (n:RelatesToNode_)', [edge['uuid'] for edge in edges]),
+        _get_existing_uuids(
+            driver, 'MATCH ()-[n:MENTIONS]->()', [edge['uuid'] for edge in episodic_edges]
+        ),
+        pool=DB_POOL,
+    )
+
+    episode_query = get_episode_node_save_bulk_query(driver.provider)
+    new_episodes = []
+    for episode in episodes:
+        if episode['uuid'] in existing_episodes:
+            await tx.run(episode_query, **episode)
+        else:
+            new_episodes.append(episode)
+    if new_episodes:
+        await tx.run(get_kuzu_copy_query('Episodic', EPISODIC_COLUMNS), rows=new_episodes)
+
+    entity_node_query = get_entity_node_save_bulk_query(driver.provider, nodes)
+    new_nodes = []
+    for node in nodes:
+        if node['uuid'] in existing_nodes:
+            await tx.run(entity_node_query, **node)
+        else:
+            new_nodes.append(node)
+    if new_nodes:
+        await tx.run(get_kuzu_copy_query('Entity', ENTITY_COLUMNS), rows=new_nodes)
+
+    # Edges may point at nodes stored before this batch, or at nodes that do not exist
+    stored_entities, stored_episodes = await semaphore_gather(
+        _get_existing_uuids(
+            driver,
+            'MATCH (n:Entity)',
+            list(
+                {edge['source_node_uuid'] for edge in edges}
+                | {edge['target_node_uuid'] for edge in edges + episodic_edges}
+            ),
+        ),
+        _get_existing_uuids(
+            driver,
+            'MATCH (n:Episodic)',
+            list({edge['source_node_uuid'] for edge in episodic_edges}),
+        ),
+        pool=DB_POOL,
+    )
+
+    entity_edge_query = get_entity_edge_save_bulk_query(driver.provider)
+    new_edges = []
+    for edge in edges:
+        if edge['uuid'] in existing_edges:
+            await tx.run(entity_edge_query, **edge)
+        elif (
+            edge['source_node_uuid'] in stored_entities
+            and edge['target_node_uuid'] in stored_entities
+        ):
+            new_edges.append(edge)
+    if new_edges:
+        await tx.run(get_kuzu_copy_query('RelatesToNode_', RELATES_TO_NODE_COLUMNS), rows=new_edges)
+        await tx.run(
+            get_kuzu_copy_query(
+                'RELATES_TO', ['source_node_uuid', 'uuid'], 'Entity', 'RelatesToNode_'
+            ),
+            rows=new_edges,
+        )
+        await tx.run(
+            get_kuzu_copy_query(
+                'RELATES_TO', ['uuid', 'target_node_uuid'], 'RelatesToNode_', 'Entity'
+            ),
+            rows=new_edges,
+        )
+
+    episodic_edge_query = get_episodic_edge_save_bulk_query(driver.provider)
+    new_episodic_edges = []
+    for edge in episodic_edges:
+        if edge['uuid'] in existing_episodic_edges:
+            await tx.run(episodic_edge_query, **edge)
+        elif (
+            edge['source_node_uuid'] in stored_episodes
+            and edge['target_node_uuid'] in stored_entities
+        ):
+            new_episodic_edges.append(edge)
+    if new_episodic_edges:
+        await tx.run(
+            get_kuzu_copy_query(
+                'MENTIONS',
+                ['source_node_uuid', 'target_node_uuid', 'uuid', 'group_id', 'created_at'],
+                'Episodic',
+                'Entity',
+            ),
+            rows=new_episodic_edges,
+        )
+
+
 async def extract_nodes_and_edges_bulk(
     clients: GraphitiClients,
     episode_tuples: list[tuple[EpisodicNode, list[EpisodicNode]]],
@@ -271,7 +425,9 @@ async def extract_nodes_and_edges_bulk(
                 custom_extraction_instructions=custom_extraction_instructions,
             )
             for episode, previous_episodes in episode_tuples
-        ]
+        ],
+        governor=clients.governor,
+        pool=LLM_POOL,
     )
 
     extracted_edges_bulk: list[list[EntityEdge]] = await semaphore_gather(
@@ -287,7 +443,9 @@ async def extract_nodes_and_edges_bulk(
                 custom_extraction_instructions=custom_extraction_instructions,
             )
             for i, (episode, previous_episodes) in enumerate(episode_tuples)
-        ]
+        ],
+        governor=clients.governor,
+        pool=LLM_POOL,
     )
 
     return extracted_nodes_bulk, extracted_edges_bulk
@@ -318,7 +476,9 @@ async def dedupe_nodes_bulk(
                 entity_types,
             )
             for i, nodes in enumerate(extracted_nodes)
-        ]
+        ],
+        governor=clients.governor,
+        pool=LLM_POOL,
     )
 
     episode_resolutions: list[tuple[str, list[EntityNode]]] = []
@@ -421,9 +581,20 @@ async def dedupe_edges_bulk(
 
     # generate embeddings
     await semaphore_gather(
-        *[create_entity_edge_embeddings(embedder, edges) for edges in extracted_edges]
+        *[create_entity_edge_embeddings(embedder, edges) for edges in extracted_edges],
+        governor=clients.governor,
+        pool=EMBEDDER_POOL,
     )
 
+    # Normalize each fact embedding once rather than once per compared pair
+    unit_embeddings = {
+        edge.uuid: normalize_l2(
+            edge.fact_embedding if edge.fact_embedding is not None else np.empty(0)
+        )
+        for edges in extracted_edges
+        for edge in edges
+    }
+
     # Find similar results
     dedupe_tuples: list[tuple[EpisodicNode, EntityEdge, list[EntityEdge]]] = []
     for i, edges_i in enumerate(extracted_edges):
@@ -453,10 +624,7 @@ async def dedupe_edges_bulk(
                     continue
 
                 # Check for semantic similarity even if there is no overlap
-                similarity = np.dot(
-                    normalize_l2(edge.fact_embedding or []),
-                    normalize_l2(existing_edge.fact_embedding or []),
-                )
+                similarity = np.dot(unit_embeddings[edge.uuid], unit_embeddings[existing_edge.uuid])
                 if similarity >= min_score:
                     candidates.append(existing_edge)
 
@@ -475,7 +643,9 @@ async def dedupe_edges_bulk(
                 edge_types,
             )
             for episode, edge, candidates in dedupe_tuples
-        ]
+        ],
+        governor=clients.governor,
+        pool=LLM_POOL,
     )
 
     # For now we won't track edge invalidation
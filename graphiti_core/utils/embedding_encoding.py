@@ -0,0 +1,105 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import base64
+from enum import Enum
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from graphiti_core.embedder.embedding import EMBEDDING_DTYPE, to_embedding
+
+# Properties holding embeddings, on entity and community nodes and on entity edges
+EMBEDDING_PROPERTIES = ('name_embedding', 'fact_embedding')
+
+
+class EmbeddingEncoding(Enum):
+    """How embeddings are stored by graph databases without a vector type.
+
+    `csv` is the comma-separated decimal text graphiti has always written. The compact encodings
+    store the little-endian bytes of the vector in base64 behind a short prefix, which is 3-4x
+    smaller with float32 and 6-8x smaller with float16, and decodes without parsing numbers.
+    `int8` stores the vector quantized to int8 with its float32 scale, 12-16x smaller than `csv`
+    at the cost of rounding each component to 1/127 of the largest one.
+    """
+
+    CSV = 'csv'
+    FLOAT32 = 'float32'
+    FLOAT16 = 'float16'
+    INT8 = 'int8'
+
+
+_DTYPES = {
+    EmbeddingEncoding.FLOAT32: np.dtype('<f4'),
+    EmbeddingEncoding.FLOAT16: np.dtype('<f2'),
+}
+COMPACT_PREFIXES = {
+    EmbeddingEncoding.FLOAT32: 'f32:',
+    EmbeddingEncoding.FLOAT16: 'f16:',
+    EmbeddingEncoding.INT8: 'i8s:',
+}
+_DTYPES_BY_PREFIX = {COMPACT_PREFIXES[encoding]: dtype for encoding, dtype in _DTYPES.items()}
+_PREFIX_LENGTH = 4
+# Quantized vectors are preceded by their scale
+_SCALE_DTYPE = np.dtype('<f4')
+_INT8_MAX = 127
+
+
+def encode_embedding(embedding: Any, encoding: EmbeddingEncoding = EmbeddingEncoding.CSV) -> str:
+    """Encode an embedding as a string property; a missing embedding becomes an empty string."""
+    if embedding is None or len(embedding) == 0:
+        return ''
+    if encoding == EmbeddingEncoding.CSV:
+        if isinstance(embedding, np.ndarray) and embedding.dtype == EMBEDDING_DTYPE:
+            # str() of a float32 is the shortest text that reads back as the same value
+            return ','.join(str(x) for x in embedding)
+        return ','.join(str(float(x)) for x in embedding)
+    if encoding == EmbeddingEncoding.INT8:
+        # Scale by the largest component so that the full int8 range is used
+        vector = np.asarray(embedding, dtype=EMBEDDING_DTYPE)
+        max_abs = float(np.abs(vector).max())
+        scale = max_abs / _INT8_MAX if max_abs else 1.0
+        values = np.clip(np.rint(vector / scale), -_INT8_MAX, _INT8_MAX).astype(np.int8)
+        payload = np.asarray(scale, dtype=_SCALE_DTYPE).tobytes() + values.tobytes()
+        return COMPACT_PREFIXES[encoding] + base64.b64encode(payload).decode('ascii')
+    vector = np.asarray(embedding, dtype=_DTYPES[encoding])
+    return COMPACT_PREFIXES[encoding] + base64.b64encode(vector.tobytes()).decode('ascii')
+
+
+def decode_embedding(value: Any) -> NDArray[np.float32] | None:
+    """Decode an embedding as returned by any graph database into a float32 array.
+
+    Strings may use any `EmbeddingEncoding`, so graphs holding a mix of encodings read correctly
+    while they are migrated; compact encodings are read straight from their bytes.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        if value == '':
+            return None
+        dtype = _DTYPES_BY_PREFIX.get(value[:_PREFIX_LENGTH])
+        if dtype is not None:
+            vector = np.frombuffer(base64.b64decode(value[_PREFIX_LENGTH:]), dtype=dtype)
+            return vector.astype(EMBEDDING_DTYPE)
+        if value.startswith(COMPACT_PREFIXES[EmbeddingEncoding.INT8]):
+            payload = base64.b64decode(value[_PREFIX_LENGTH:])
+            scale = np.frombuffer(payload, dtype=_SCALE_DTYPE, count=1)[0]
+            values = np.frombuffer(payload, dtype=np.int8, offset=_SCALE_DTYPE.itemsize)
+            return values.astype(EMBEDDING_DTYPE) * scale
+        return np.asarray(value.split(','), dtype=EMBEDDING_DTYPE)
+    # Lists of numbers, or of strings as split in Cypher by older queries
+    return to_embedding(value)
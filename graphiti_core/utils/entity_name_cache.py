@@ -0,0 +1,147 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.helpers import normalize_exact
+from graphiti_core.nodes import EntityNode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_GROUPS = 128
+# Entities loaded per group when it is first used; larger groups are cached only partially
+DEFAULT_WARM_LIMIT = 10000
+DEFAULT_WARM_PAGE_SIZE = 1000
+
+
+@dataclass
+class _GroupNames:
+    uuids_by_name: dict[str, set[str]] = field(default_factory=dict)
+    name_by_uuid: dict[str, str] = field(default_factory=dict)
+    warm_task: asyncio.Task | None = None
+
+    def add(self, uuid: str, name: str) -> None:
+        previous = self.name_by_uuid.get(uuid)
+        if previous is not None and previous != name:
+            self.discard(uuid)
+        self.name_by_uuid[uuid] = name
+        self.uuids_by_name.setdefault(name, set()).add(uuid)
+
+    def discard(self, uuid: str) -> None:
+        name = self.name_by_uuid.pop(uuid, None)
+        if name is None:
+            return
+        uuids = self.uuids_by_name.get(name)
+        if uuids is not None:
+            uuids.discard(uuid)
+            if not uuids:
+                del self.uuids_by_name[name]
+
+
+class EntityNameCache:
+    """Per-group map from exact-normalized entity names to the uuids of the entities bearing them.
+
+    A group is warmed lazily from `EntityNode.get_by_group_ids` pages the first time it is looked
+    up, and kept current by `add_nodes_and_edges_bulk` and `remove_episode`. Only hits are acted
+    upon, so a partially warmed group or a name added by another process merely falls back to
+    candidate search; hits on entities deleted elsewhere are dropped when they are next used.
+    Groups are evicted least recently used first.
+    """
+
+    def __init__(
+        self,
+        max_groups: int = DEFAULT_MAX_GROUPS,
+        warm_limit: int = DEFAULT_WARM_LIMIT,
+        page_size: int = DEFAULT_WARM_PAGE_SIZE,
+    ):
+        if max_groups <= 0:
+            raise ValueError('max_groups must be positive')
+        self.max_groups = max_groups
+        self.warm_limit = warm_limit
+        self.page_size = page_size
+        self._groups: OrderedDict[str, _GroupNames] = OrderedDict()
+
+    def _group(self, group_id: str) -> _GroupNames:
+        group = self._groups.get(group_id)
+        if group is None:
+            group = _GroupNames()
+            self._groups[group_id] = group
+            while len(self._groups) > self.max_groups:
+                self._groups.popitem(last=False)
+        else:
+            self._groups.move_to_end(group_id)
+        return group
+
+    async def _warm(self, driver: GraphDriver, group_id: str, group: _GroupNames) -> None:
+        cursor: str | None = None
+        loaded = 0
+        while loaded < self.warm_limit:
+            page = await EntityNode.get_by_group_ids(
+                driver,
+                [group_id],
+                limit=min(self.page_size, self.warm_limit - loaded),
+                uuid_cursor=cursor,
+            )
+            for node in page:
+                group.add(node.uuid, normalize_exact(node.name))
+            loaded += len(page)
+            if len(page) < self.page_size:
+                break
+            cursor = page[-1].uuid
+        logger.debug(f'Warmed the entity name cache of group {group_id} with {loaded} entities')
+
+    async def lookup(
+        self, driver: GraphDriver, group_id: str, names: Iterable[str]
+    ) -> dict[str, set[str]]:
+        """Return the uuids of the group's entities for each name that has any."""
+        group = self._group(group_id)
+        if group.warm_task is None:
+            group.warm_task = asyncio.ensure_future(self._warm(driver, group_id, group))
+        try:
+            await asyncio.shield(group.warm_task)
+        except Exception:
+            # Let the next lookup try again; until then only names written since are known
+            group.warm_task = None
+            raise
+
+        results: dict[str, set[str]] = {}
+        for name in names:
+            uuids = group.uuids_by_name.get(normalize_exact(name))
+            if uuids:
+                results[name] = set(uuids)
+        return results
+
+    def add(self, nodes: Iterable[EntityNode]) -> None:
+        """Record entities that were just written."""
+        for node in nodes:
+            self._group(node.group_id).add(node.uuid, normalize_exact(node.name))
+
+    def remove_uuids(self, uuids: Iterable[str]) -> None:
+        """Forget deleted entities."""
+        for uuid in uuids:
+            for group in self._groups.values():
+                group.discard(uuid)
+
+    def clear(self, group_id: str | None = None) -> None:
+        if group_id is None:
+            self._groups.clear()
+        else:
+            self._groups.pop(group_id, None)
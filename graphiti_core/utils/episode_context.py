@@ -0,0 +1,218 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+
+from graphiti_core.helpers import PREVIOUS_EPISODES_TOKEN_BUDGET
+from graphiti_core.llm_client import LLMClient
+from graphiti_core.llm_client.config import ModelSize
+from graphiti_core.nodes import EpisodicNode
+from graphiti_core.prompts import prompt_library
+from graphiti_core.prompts.summarize_episodes import EpisodesSummary
+from graphiti_core.utils.content_chunking import CHARS_PER_TOKEN, estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# An episode is only truncated into the context when at least this much budget is left for it
+MIN_TRUNCATED_EPISODE_TOKENS = 50
+OLDER_EPISODES_SUMMARY_PREFIX = 'Summary of earlier episodes: '
+# The rolling summary may take up this fraction of the previous-episode token budget
+OLDER_EPISODES_SUMMARY_SHARE = 0.25
+
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|\n+')
+_WORD_PATTERN = re.compile(r'\w{3,}')
+
+
+@dataclass
+class PreviousEpisodesContext:
+    """Previous-episode texts to put in a prompt, oldest first.
+
+    `omitted` holds the episodes that did not fit in the token budget at all.
+    """
+
+    contents: list[str] = field(default_factory=list)
+    omitted: list[EpisodicNode] = field(default_factory=list)
+
+
+def split_sentences(text: str) -> list[str]:
+    return [sentence.strip() for sentence in _SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+
+
+def truncate_to_relevant_sentences(text: str, token_budget: int, query: str = '') -> str:
+    """Shorten text to the sentences most relevant to `query` that fit in `token_budget`.
+
+    Sentences are ranked by the number of words they share with the query, ties going to the
+    later sentence, so without a query the text is cut down to its most recent sentences. The
+    chosen sentences keep their original order.
+    """
+    if estimate_tokens(text) <= token_budget:
+        return text
+
+    sentences = split_sentences(text)
+    query_words = set(_WORD_PATTERN.findall(query.lower()))
+    ranked = sorted(
+        range(len(sentences)),
+        key=lambda i: (len(query_words & set(_WORD_PATTERN.findall(sentences[i].lower()))), i),
+        reverse=True,
+    )
+
+    selected: list[int] = []
+    remaining = token_budget
+    for i in ranked:
+        # Account for the space joining the sentence to its neighbours
+        cost = estimate_tokens(sentences[i] + ' ')
+        if cost <= remaining:
+            selected.append(i)
+            remaining -= cost
+
+    if not selected:
+        # A single run-on sentence: keep its end, which is closest to the current episode
+        return text[-token_budget * CHARS_PER_TOKEN :]
+    return ' '.join(sentences[i] for i in sorted(selected))
+
+
+def assemble_previous_episodes(
+    previous_episodes: list[EpisodicNode] | None,
+    query: str = '',
+    token_budget: int = PREVIOUS_EPISODES_TOKEN_BUDGET,
+    older_summary: str | None = None,
+) -> PreviousEpisodesContext:
+    """Fit previous episodes into a token budget, keeping recent context verbatim.
+
+    Episodes are taken newest first and included whole while they fit. The first episode that
+    does not fit is truncated to its sentences most relevant to `query`, and older episodes are
+    left out; `older_summary`, a rolling summary of earlier episodes, is put first when given.
+
+    The result is in chronological order and does not depend on the order the episodes were
+    passed in, so every prompt of one episode starts with the same previous-episode prefix and
+    provider prompt caching can hit.
+    """
+    context = PreviousEpisodesContext()
+    if not previous_episodes:
+        return context
+
+    episodes = sorted(previous_episodes, key=lambda ep: (ep.valid_at, ep.created_at, ep.uuid))
+    remaining = token_budget
+    summary_content = None
+    if older_summary:
+        summary_content = OLDER_EPISODES_SUMMARY_PREFIX + older_summary
+        remaining -= estimate_tokens(summary_content)
+
+    newest_first: list[str] = []
+    for index in range(len(episodes) - 1, -1, -1):
+        content = episodes[index].content
+        tokens = estimate_tokens(content)
+        if tokens <= remaining:
+            newest_first.append(content)
+            remaining -= tokens
+            continue
+
+        truncated = remaining >= MIN_TRUNCATED_EPISODE_TOKENS
+        if truncated:
+            newest_first.append(truncate_to_relevant_sentences(content, remaining, query))
+        context.omitted = episodes[: index if truncated else index + 1]
+        break
+
+    if summary_content is not None:
+        context.contents.append(summary_content)
+    context.contents.extend(reversed(newest_first))
+    return context
+
+
+def previous_episodes_context(
+    previous_episodes: list[EpisodicNode] | None,
+    episode: EpisodicNode | None = None,
+    summaries: 'EpisodeSummaryCache | None' = None,
+) -> list[str]:
+    """Previous-episode texts for a prompt about `episode`, within the default token budget."""
+    older_summary = None
+    if summaries is not None and episode is not None:
+        older_summary = summaries.get(episode.group_id)
+    return assemble_previous_episodes(
+        previous_episodes,
+        query=episode.content if episode is not None else '',
+        older_summary=older_summary,
+    ).contents
+
+
+@dataclass
+class _RollingSummary:
+    summary: str = ''
+    episode_uuids: set[str] = field(default_factory=set)
+
+
+class EpisodeSummaryCache:
+    """Rolling per-group summaries of the episodes that no longer fit in the prompt budget.
+
+    `fold` merges episodes into their group's summary with one small-model call, and each
+    episode is folded in only once. The summary is then prepended to the previous-episode
+    context of extraction prompts so that older context is kept in compressed form.
+    """
+
+    def __init__(self, token_budget: int = PREVIOUS_EPISODES_TOKEN_BUDGET):
+        self.token_budget = token_budget
+        self.summary_max_characters = (
+            max(int(token_budget * OLDER_EPISODES_SUMMARY_SHARE), MIN_TRUNCATED_EPISODE_TOKENS)
+            * CHARS_PER_TOKEN
+        )
+        self._summaries: dict[str, _RollingSummary] = {}
+
+    def get(self, group_id: str) -> str | None:
+        rolling = self._summaries.get(group_id)
+        return rolling.summary if rolling is not None and rolling.summary else None
+
+    async def fold(
+        self, llm_client: LLMClient, group_id: str, episodes: list[EpisodicNode]
+    ) -> str | None:
+        rolling = self._summaries.setdefault(group_id, _RollingSummary())
+        new_episodes = [ep for ep in episodes if ep.uuid not in rolling.episode_uuids]
+        if not new_episodes:
+            return self.get(group_id)
+
+        # Claim the episodes up front so concurrent folds do not summarize them twice
+        rolling.episode_uuids.update(ep.uuid for ep in new_episodes)
+        episode_budget = max(self.token_budget // len(new_episodes), MIN_TRUNCATED_EPISODE_TOKENS)
+        context = {
+            'previous_summary': rolling.summary,
+            'episodes': [
+                truncate_to_relevant_sentences(ep.content, episode_budget)
+                for ep in sorted(new_episodes, key=lambda ep: (ep.valid_at, ep.created_at, ep.uuid))
+            ],
+            'max_characters': self.summary_max_characters,
+        }
+
+        try:
+            llm_response = await llm_client.generate_response(
+                prompt_library.summarize_episodes.rolling_summary(context),
+                response_model=EpisodesSummary,
+                model_size=ModelSize.small,
+                group_id=group_id,
+                prompt_name='summarize_episodes.rolling_summary',
+            )
+        except Exception:
+            rolling.episode_uuids.difference_update(ep.uuid for ep in new_episodes)
+            raise
+
+        rolling.summary = llm_response.get('summary', rolling.summary)
+        return self.get(group_id)
+
+    def clear(self, group_id: str | None = None) -> None:
+        if group_id is None:
+            self._summaries.clear()
+        else:
+            self._summaries.pop(group_id, None)
@@ -4,6 +4,7 @@ from collections import defaultdict
 
 from pydantic import BaseModel
 
+from graphiti_core.concurrency import DB_POOL, LLM_POOL
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.edges import CommunityEdge
 from graphiti_core.embedder import EmbedderClient
@@ -17,6 +18,7 @@ from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.edge_operations import build_community_edges
 
 MAX_COMMUNITY_BUILD_CONCURRENCY = 10
+NEIGHBOR_QUERY_CHUNK_SIZE = 500
 
 logger = logging.getLogger(__name__)
 
@@ -52,36 +54,41 @@ async def get_community_clusters(
     for group_id in group_ids:
         projection: dict[str, list[Neighbor]] = {}
         nodes = await EntityNode.get_by_group_ids(driver, [group_id])
-        for node in nodes:
+        match_query = """
+            MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[e:RELATES_TO]-(m: Entity {group_id: $group_id})
+        """
+        if driver.provider == GraphProvider.KUZU:
             match_query = """
-                MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[e:RELATES_TO]-(m: Entity {group_id: $group_id})
+            MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(m: Entity {group_id: $group_id})
             """
-            if driver.provider == GraphProvider.KUZU:
-                match_query = """
-                MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(m: Entity {group_id: $group_id})
-                """
-            records, _, _ = await driver.execute_query(
-                match_query
-                + """
-                WITH count(e) AS count, m.uuid AS uuid
-                RETURN
-                    uuid,
-                    count
-                """,
-                uuid=node.uuid,
-                group_id=group_id,
+        neighbor_query = (
+            match_query
+            + """
+            WITH count(e) AS count, m.uuid AS uuid
+            RETURN
+                uuid,
+                count
+            """
+        )
+        # Drivers that support it send each chunk of neighbor queries in one round-trip
+        for i in range(0, len(nodes), NEIGHBOR_QUERY_CHUNK_SIZE):
+            chunk = nodes[i : i + NEIGHBOR_QUERY_CHUNK_SIZE]
+            results = await driver.execute_queries(
+                [(neighbor_query, {'uuid': node.uuid, 'group_id': group_id}) for node in chunk]
             )
-
-            projection[node.uuid] = [
-                Neighbor(node_uuid=record['uuid'], edge_count=record['count']) for record in records
-            ]
+            for node, (records, _, _) in zip(chunk, results, strict=True):
+                projection[node.uuid] = [
+                    Neighbor(node_uuid=record['uuid'], edge_count=record['count'])
+                    for record in records
+                ]
 
         cluster_uuids = label_propagation(projection)
 
         community_clusters.extend(
             list(
                 await semaphore_gather(
-                    *[EntityNode.get_by_uuids(driver, cluster) for cluster in cluster_uuids]
+                    *[EntityNode.get_by_uuids(driver, cluster) for cluster in cluster_uuids],
+                    pool=DB_POOL,
                 )
             )
         )
@@ -187,7 +194,8 @@ async def build_community(
                     for left_summary, right_summary in zip(
                         summaries[: int(length / 2)], summaries[int(length / 2) :], strict=False
                     )
-                ]
+                ],
+                pool=LLM_POOL,
             )
         )
         if odd_one_out is not None:
@@ -227,7 +235,8 @@ async def build_communities(
 
     communities: list[tuple[CommunityNode, list[CommunityEdge]]] = list(
         await semaphore_gather(
-            *[limited_build_community(cluster) for cluster in community_clusters]
+            *[limited_build_community(cluster) for cluster in community_clusters],
+            pool=LLM_POOL,
         )
     )
 
@@ -23,7 +23,17 @@ from collections.abc import Iterable
 from dataclasses import dataclass, field
 from functools import lru_cache
 from hashlib import blake2b
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from graphiti_core.embedder.embedding import normalize_rows, stack_embeddings
+from graphiti_core.helpers import (
+    NODE_DEDUP_EMBEDDING_MARGIN,
+    NODE_DEDUP_EMBEDDING_MATCH_THRESHOLD,
+    NODE_DEDUP_EMBEDDING_REJECT_THRESHOLD,
+    normalize_exact,
+)
 
 if TYPE_CHECKING:
     from graphiti_core.nodes import EntityNode
@@ -34,12 +44,13 @@ _MIN_TOKEN_COUNT = 2
 _FUZZY_JACCARD_THRESHOLD = 0.9
 _MINHASH_PERMUTATIONS = 32
 _MINHASH_BAND_SIZE = 4
+# Mersenne prime 2**31 - 1 for the universal hashes that derive the MinHash permutations
+_MINHASH_PRIME = (1 << 31) - 1
 
 
 def _normalize_string_exact(name: str) -> str:
     """Lowercase text and collapse whitespace so equal names map to the same key."""
-    normalized = re.sub(r'[\s]+', ' ', name.lower())
-    return normalized.strip()
+    return normalize_exact(name)
 
 
 def _normalize_name_for_fuzzy(name: str) -> str:
@@ -94,24 +105,58 @@ def _shingles(normalized_name: str) -> set[str]:
     return {cleaned[i : i + 3] for i in range(len(cleaned) - 2)}
 
 
-def _hash_shingle(shingle: str, seed: int) -> int:
-    """Generate a deterministic 64-bit hash for a shingle given the permutation seed."""
-    digest = blake2b(f'{seed}:{shingle}'.encode(), digest_size=8)
+def _hash_shingle(shingle: str) -> int:
+    """Generate a deterministic 64-bit hash for a shingle."""
+    digest = blake2b(shingle.encode(), digest_size=8)
     return int.from_bytes(digest.digest(), 'big')
 
 
+def _permutation_coefficient(seed: int, role: str) -> int:
+    digest = blake2b(f'{seed}:{role}'.encode(), digest_size=8)
+    return int.from_bytes(digest.digest(), 'big') % _MINHASH_PRIME
+
+
+# Universal hash coefficients, one (a, b) pair per permutation. They are derived from blake2b
+# rather than a random generator so signatures stay stable across processes and NumPy versions.
+_MINHASH_A = np.array(
+    [max(_permutation_coefficient(seed, 'a'), 1) for seed in range(_MINHASH_PERMUTATIONS)],
+    dtype=np.uint64,
+)
+_MINHASH_B = np.array(
+    [_permutation_coefficient(seed, 'b') for seed in range(_MINHASH_PERMUTATIONS)],
+    dtype=np.uint64,
+)
+
+
+def _minhash_signatures(shingle_sets: list[set[str]]) -> np.ndarray:
+    """Compute the MinHash signatures of many shingle sets in one array operation.
+
+    Each shingle is hashed once and reduced into the prime field; every permutation is then the
+    universal hash (a * x + b) mod p of those values. With p < 2**31 the products fit in uint64.
+    Returns a (len(shingle_sets), _MINHASH_PERMUTATIONS) array; rows of empty sets are zero.
+    """
+    signatures = np.zeros((len(shingle_sets), _MINHASH_PERMUTATIONS), dtype=np.uint64)
+    rows = [row for row, shingles in enumerate(shingle_sets) if shingles]
+    if not rows:
+        return signatures
+
+    values = np.array(
+        [_hash_shingle(shingle) % _MINHASH_PRIME for row in rows for shingle in shingle_sets[row]],
+        dtype=np.uint64,
+    )
+    offsets = np.cumsum([0] + [len(shingle_sets[row]) for row in rows[:-1]])
+    permuted = (values[:, None] * _MINHASH_A + _MINHASH_B) % np.uint64(_MINHASH_PRIME)
+    signatures[rows] = np.minimum.reduceat(permuted, offsets, axis=0)
+    return signatures
+
+
 def _minhash_signature(shingles: Iterable[str]) -> tuple[int, ...]:
     """Compute the MinHash signature for the shingle set across predefined permutations."""
-    if not shingles:
+    shingle_set = set(shingles)
+    if not shingle_set:
         return tuple()
 
-    seeds = range(_MINHASH_PERMUTATIONS)
-    signature: list[int] = []
-    for seed in seeds:
-        min_hash = min(_hash_shingle(shingle, seed) for shingle in shingles)
-        signature.append(min_hash)
-
-    return tuple(signature)
+    return tuple(_minhash_signatures([shingle_set])[0].tolist())
 
 
 def _lsh_bands(signature: Iterable[int]) -> list[tuple[int, ...]]:
@@ -174,6 +219,7 @@ def _build_candidate_indexes(existing_nodes: list[EntityNode]) -> DedupCandidate
     shingles_by_candidate: dict[str, set[str]] = {}
     lsh_buckets: defaultdict[tuple[int, tuple[int, ...]], list[str]] = defaultdict(list)
 
+    candidate_shingles: list[set[str]] = []
     for candidate in existing_nodes:
         normalized = _normalize_string_exact(candidate.name)
         normalized_existing[normalized].append(candidate)
@@ -181,8 +227,14 @@ def _build_candidate_indexes(existing_nodes: list[EntityNode]) -> DedupCandidate
 
         shingles = _cached_shingles(_normalize_name_for_fuzzy(candidate.name))
         shingles_by_candidate[candidate.uuid] = shingles
+        candidate_shingles.append(shingles)
 
-        signature = _minhash_signature(shingles)
+    signatures = _minhash_signatures(candidate_shingles)
+    for candidate, shingles, signature in zip(
+        existing_nodes, candidate_shingles, signatures.tolist(), strict=True
+    ):
+        if not shingles:
+            continue
         for band_index, band in enumerate(_lsh_bands(signature)):
             lsh_buckets[(band_index, band)].append(candidate.uuid)
 
@@ -200,8 +252,14 @@ def _resolve_with_similarity(
     indexes: DedupCandidateIndexes,
     state: DedupResolutionState,
 ) -> None:
-    """Attempt deterministic resolution using exact name hits and fuzzy MinHash comparisons."""
+    """Attempt deterministic resolution using exact name hits and fuzzy MinHash comparisons.
+
+    Nodes already resolved by an earlier tier are left as they are.
+    """
     for idx, node in enumerate(extracted_nodes):
+        if state.resolved_nodes[idx] is not None:
+            continue
+
         normalized_exact = _normalize_string_exact(node.name)
         normalized_fuzzy = _normalize_name_for_fuzzy(node.name)
 
@@ -246,6 +304,91 @@ def _resolve_with_similarity(
         state.unresolved_indices.append(idx)
 
 
+def _labels_compatible(node: EntityNode, candidate: EntityNode) -> bool:
+    """Generic entities match anything; typed entities need a type in common."""
+    node_types = set(node.labels) - {'Entity'}
+    candidate_types = set(candidate.labels) - {'Entity'}
+    return not node_types or not candidate_types or bool(node_types & candidate_types)
+
+
+def _embedding_size(embedding: Any) -> int:
+    return len(embedding) if embedding is not None else 0
+
+
+def _resolve_with_embeddings(
+    extracted_nodes: list[EntityNode],
+    indexes: DedupCandidateIndexes,
+    state: DedupResolutionState,
+    match_threshold: float = NODE_DEDUP_EMBEDDING_MATCH_THRESHOLD,
+    reject_threshold: float = NODE_DEDUP_EMBEDDING_REJECT_THRESHOLD,
+    margin: float = NODE_DEDUP_EMBEDDING_MARGIN,
+) -> None:
+    """Settle unresolved nodes whose name embeddings leave no doubt, leaving the rest to the LLM.
+
+    A node is merged into its most similar label-compatible candidate when the cosine similarity
+    reaches `match_threshold`, beats the runner-up by `margin` and the name is specific enough to
+    trust. A node whose most similar candidate of any label is below `reject_threshold` is kept
+    as a new entity. Nodes or candidates without a name embedding are left unresolved.
+    """
+    if not state.unresolved_indices:
+        return
+
+    dimension = next(
+        (
+            size
+            for idx in state.unresolved_indices
+            if (size := _embedding_size(extracted_nodes[idx].name_embedding))
+        ),
+        0,
+    )
+    if not dimension:
+        return
+    candidates = [
+        candidate
+        for candidate in indexes.existing_nodes
+        if _embedding_size(candidate.name_embedding) == dimension
+    ]
+    if not candidates:
+        return
+
+    candidate_matrix = normalize_rows(
+        stack_embeddings([candidate.name_embedding for candidate in candidates])
+    )
+
+    still_unresolved: list[int] = []
+    for idx in state.unresolved_indices:
+        node = extracted_nodes[idx]
+        if _embedding_size(node.name_embedding) != dimension:
+            still_unresolved.append(idx)
+            continue
+
+        scores = candidate_matrix @ normalize_rows(np.asarray(node.name_embedding))
+
+        if float(scores.max()) < reject_threshold:
+            state.resolved_nodes[idx] = node
+            state.uuid_map[node.uuid] = node.uuid
+            continue
+
+        compatible = [
+            i for i, candidate in enumerate(candidates) if _labels_compatible(node, candidate)
+        ]
+        ranked = sorted(compatible, key=lambda i: scores[i], reverse=True)
+        if ranked and _has_high_entropy(_normalize_name_for_fuzzy(node.name)):
+            best_score = float(scores[ranked[0]])
+            runner_up = float(scores[ranked[1]]) if len(ranked) > 1 else -1.0
+            if best_score >= match_threshold and best_score - runner_up >= margin:
+                match = candidates[ranked[0]]
+                state.resolved_nodes[idx] = match
+                state.uuid_map[node.uuid] = match.uuid
+                if match.uuid != node.uuid:
+                    state.duplicate_pairs.append((node, match))
+                continue
+
+        still_unresolved.append(idx)
+
+    state.unresolved_indices = still_unresolved
+
+
 __all__ = [
     'DedupCandidateIndexes',
     'DedupResolutionState',
@@ -253,10 +396,12 @@ __all__ = [
     '_normalize_name_for_fuzzy',
     '_has_high_entropy',
     '_minhash_signature',
+    '_minhash_signatures',
     '_lsh_bands',
     '_jaccard_similarity',
     '_cached_shingles',
     '_FUZZY_JACCARD_THRESHOLD',
     '_build_candidate_indexes',
     '_resolve_with_similarity',
+    '_resolve_with_embeddings',
 ]
@@ -21,6 +21,7 @@ from time import time
 from pydantic import BaseModel
 from typing_extensions import LiteralString
 
+from graphiti_core.concurrency import DB_POOL, EMBEDDER_POOL, LLM_POOL
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.edges import (
     CommunityEdge,
@@ -29,20 +30,26 @@ from graphiti_core.edges import (
     create_entity_edge_embeddings,
 )
 from graphiti_core.graphiti_types import GraphitiClients
-from graphiti_core.helpers import semaphore_gather
+from graphiti_core.helpers import (
+    EDGE_RESOLUTION_BATCH_SIZE,
+    EDGE_RESOLUTION_BATCH_TOKENS,
+    compute_fact_hash,
+    semaphore_gather,
+)
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.llm_client.config import ModelSize
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
 from graphiti_core.prompts import prompt_library
-from graphiti_core.prompts.dedupe_edges import EdgeDuplicate
+from graphiti_core.prompts.dedupe_edges import EdgeDuplicate, EdgeResolution, EdgeResolutions
 from graphiti_core.prompts.extract_edges import Edge as ExtractedEdge
 from graphiti_core.prompts.extract_edges import ExtractedEdges
 from graphiti_core.search.search import search
 from graphiti_core.search.search_config import SearchResults
 from graphiti_core.search.search_config_recipes import EDGE_HYBRID_SEARCH_RRF
 from graphiti_core.search.search_filters import SearchFilters
-from graphiti_core.utils.content_chunking import generate_covering_chunks
+from graphiti_core.utils.content_chunking import estimate_tokens, generate_covering_chunks
 from graphiti_core.utils.datetime_utils import ensure_utc, utc_now
+from graphiti_core.utils.episode_context import previous_episodes_context
 from graphiti_core.utils.maintenance.dedup_helpers import _normalize_string_exact
 
 MAX_NODES = 15
@@ -122,6 +129,11 @@ async def extract_edges(
         else []
     )
 
+    # Every chunk prompt shares the same previous-episode context
+    episodes_context = previous_episodes_context(
+        previous_episodes, episode, clients.episode_summaries
+    )
+
     # Generate covering chunks to ensure all node pairs are processed.
     # Uses a greedy approach based on the Handshake Flights Problem.
     covering_chunks = generate_covering_chunks(nodes, MAX_NODES)
@@ -157,7 +169,7 @@ async def extract_edges(
         context = {
             'episode_content': episode.content,
             'nodes': [{'name': node.name, 'entity_types': node.labels} for node in chunk],
-            'previous_episodes': [ep.content for ep in previous_episodes],
+            'previous_episodes': episodes_context,
             'reference_time': episode.valid_at,
             'edge_types': edge_types_context,
             'custom_extraction_instructions': custom_extraction_instructions or '',
@@ -215,7 +227,9 @@ async def extract_edges(
                 for (chunk, global_indices), assigned_pairs in zip(
                     covering_chunks, chunk_assigned_pairs, strict=True
                 )
-            ]
+            ],
+            governor=clients.governor,
+            pool=LLM_POOL,
         )
     )
 
@@ -304,31 +318,46 @@ async def resolve_extracted_edges(
     edge_type_map: dict[tuple[str, str], list[str]],
 ) -> tuple[list[EntityEdge], list[EntityEdge]]:
     # Fast path: deduplicate exact matches within the extracted edges before parallel processing
-    seen: dict[tuple[str, str, str], EntityEdge] = {}
+    fact_hashes: list[str] = []
     deduplicated_edges: list[EntityEdge] = []
 
     for edge in extracted_edges:
-        key = (
-            edge.source_node_uuid,
-            edge.target_node_uuid,
-            _normalize_string_exact(edge.fact),
-        )
-        if key not in seen:
-            seen[key] = edge
+        fact_hash = compute_fact_hash(edge.source_node_uuid, edge.target_node_uuid, edge.fact)
+        if fact_hash not in fact_hashes:
+            fact_hashes.append(fact_hash)
             deduplicated_edges.append(edge)
 
-    extracted_edges = deduplicated_edges
-
     driver = clients.driver
     llm_client = clients.llm_client
     embedder = clients.embedder
+
+    # Facts already stored verbatim between the same nodes resolve to the stored edge through
+    # one indexed fact_hash lookup, without searches or an LLM call
+    stored_edges = {
+        compute_fact_hash(edge.source_node_uuid, edge.target_node_uuid, edge.fact): edge
+        for edge in await EntityEdge.get_by_fact_hashes(driver, fact_hashes)
+    }
+    stored_duplicates: dict[int, EntityEdge] = {}
+    for i, fact_hash in enumerate(fact_hashes):
+        stored_edge = stored_edges.get(fact_hash)
+        if stored_edge is None:
+            continue
+        if episode is not None and episode.uuid not in stored_edge.episodes:
+            stored_edge.episodes.append(episode.uuid)
+        stored_duplicates[i] = stored_edge
+
+    extracted_edges = [
+        edge for i, edge in enumerate(deduplicated_edges) if i not in stored_duplicates
+    ]
     await create_entity_edge_embeddings(embedder, extracted_edges)
 
     valid_edges_list: list[list[EntityEdge]] = await semaphore_gather(
         *[
             EntityEdge.get_between_nodes(driver, edge.source_node_uuid, edge.target_node_uuid)
             for edge in extracted_edges
-        ]
+        ],
+        governor=clients.governor,
+        pool=DB_POOL,
     )
 
     related_edges_results: list[SearchResults] = await semaphore_gather(
@@ -341,7 +370,9 @@ async def resolve_extracted_edges(
                 search_filter=SearchFilters(edge_uuids=[edge.uuid for edge in valid_edges]),
             )
             for extracted_edge, valid_edges in zip(extracted_edges, valid_edges_list, strict=True)
-        ]
+        ],
+        governor=clients.governor,
+        pool=DB_POOL,
     )
 
     related_edges_lists: list[list[EntityEdge]] = [result.edges for result in related_edges_results]
@@ -356,7 +387,9 @@ async def resolve_extracted_edges(
                 search_filter=SearchFilters(),
             )
             for extracted_edge in extracted_edges
-        ]
+        ],
+        governor=clients.governor,
+        pool=DB_POOL,
     )
 
     edge_invalidation_candidates: list[list[EntityEdge]] = [
@@ -415,29 +448,62 @@ async def resolve_extracted_edges(
 
         edge_types_lst.append(extracted_edge_types)
 
-    # resolve edges with related edges in the graph and find invalidation candidates
-    results: list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]] = list(
-        await semaphore_gather(
-            *[
-                resolve_extracted_edge(
-                    llm_client,
-                    extracted_edge,
-                    related_edges,
-                    existing_edges,
-                    episode,
-                    extracted_edge_types,
-                )
-                for extracted_edge, related_edges, existing_edges, extracted_edge_types in zip(
-                    extracted_edges,
-                    related_edges_lists,
-                    edge_invalidation_candidates,
-                    edge_types_lst,
-                    strict=True,
-                )
-            ]
+    # Edges that need the LLM are packed into multi-edge prompts; the rest resolve one by one
+    llm_batches = _batch_edges_for_resolution(
+        [
+            i
+            for i, (extracted_edge, related_edges, existing_edges) in enumerate(
+                zip(extracted_edges, related_edges_lists, edge_invalidation_candidates, strict=True)
+            )
+            if _needs_llm_resolution(extracted_edge, related_edges, existing_edges)
+        ],
+        extracted_edges,
+        related_edges_lists,
+        edge_invalidation_candidates,
+    )
+    batched_indices = {i for batch in llm_batches if len(batch) > 1 for i in batch}
+
+    async def resolve_single(i: int) -> list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]]:
+        return [
+            await resolve_extracted_edge(
+                llm_client,
+                extracted_edges[i],
+                related_edges_lists[i],
+                edge_invalidation_candidates[i],
+                episode,
+                edge_types_lst[i],
+            )
+        ]
+
+    async def resolve_batch(
+        batch: list[int],
+    ) -> list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]]:
+        return await resolve_extracted_edges_batch(
+            llm_client,
+            [extracted_edges[i] for i in batch],
+            [related_edges_lists[i] for i in batch],
+            [edge_invalidation_candidates[i] for i in batch],
+            episode,
+            [edge_types_lst[i] for i in batch],
         )
+
+    # resolve edges with related edges in the graph and find invalidation candidates
+    single_indices = [i for i in range(len(extracted_edges)) if i not in batched_indices]
+    multi_edge_batches = [batch for batch in llm_batches if len(batch) > 1]
+    resolution_groups = await semaphore_gather(
+        *[resolve_single(i) for i in single_indices],
+        *[resolve_batch(batch) for batch in multi_edge_batches],
+        governor=clients.governor,
+        pool=LLM_POOL,
     )
 
+    results_by_index: dict[int, tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]] = {}
+    for indices, group in zip(
+        [[i] for i in single_indices] + multi_edge_batches, resolution_groups, strict=True
+    ):
+        results_by_index.update(zip(indices, group, strict=True))
+    results = [results_by_index[i] for i in range(len(extracted_edges))]
+
     resolved_edges: list[EntityEdge] = []
     invalidated_edges: list[EntityEdge] = []
     for result in results:
@@ -447,11 +513,20 @@ async def resolve_extracted_edges(
         resolved_edges.append(resolved_edge)
         invalidated_edges.extend(invalidated_edge_chunk)
 
+    # Put the stored duplicates back in extraction order
+    resolved_iter = iter(resolved_edges)
+    resolved_edges = [
+        stored_duplicates[i] if i in stored_duplicates else next(resolved_iter)
+        for i in range(len(deduplicated_edges))
+    ]
+
     logger.debug(f'Resolved edges: {[(e.name, e.uuid) for e in resolved_edges]}')
 
     await semaphore_gather(
         create_entity_edge_embeddings(embedder, resolved_edges),
         create_entity_edge_embeddings(embedder, invalidated_edges),
+        governor=clients.governor,
+        pool=EMBEDDER_POOL,
     )
 
     return resolved_edges, invalidated_edges
@@ -525,21 +600,9 @@ async def resolve_extracted_edge(
     tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]
         The resolved edge, any duplicates, and edges to invalidate.
     """
-    if len(related_edges) == 0 and len(existing_edges) == 0:
-        return extracted_edge, [], []
-
-    # Fast path: if the fact text and endpoints already exist verbatim, reuse the matching edge.
-    normalized_fact = _normalize_string_exact(extracted_edge.fact)
-    for edge in related_edges:
-        if (
-            edge.source_node_uuid == extracted_edge.source_node_uuid
-            and edge.target_node_uuid == extracted_edge.target_node_uuid
-            and _normalize_string_exact(edge.fact) == normalized_fact
-        ):
-            resolved = edge
-            if episode is not None and episode.uuid not in resolved.episodes:
-                resolved.episodes.append(episode.uuid)
-            return resolved, [], []
+    resolution = _resolve_edge_without_llm(extracted_edge, related_edges, existing_edges, episode)
+    if resolution is not None:
+        return resolution
 
     start = time()
 
@@ -572,8 +635,75 @@ async def resolve_extracted_edge(
         prompt_name='dedupe_edges.resolve_edge',
     )
     response_object = EdgeDuplicate(**llm_response)
-    duplicate_facts = response_object.duplicate_facts
 
+    return await _apply_edge_resolution(
+        llm_client,
+        extracted_edge,
+        related_edges,
+        existing_edges,
+        episode,
+        edge_type_candidates,
+        response_object.duplicate_facts,
+        response_object.contradicted_facts,
+        start,
+    )
+
+
+def _find_verbatim_duplicate(
+    extracted_edge: EntityEdge, related_edges: list[EntityEdge]
+) -> EntityEdge | None:
+    """Return the related edge with the same endpoints and (normalized) fact text, if any."""
+    normalized_fact = _normalize_string_exact(extracted_edge.fact)
+    for edge in related_edges:
+        if (
+            edge.source_node_uuid == extracted_edge.source_node_uuid
+            and edge.target_node_uuid == extracted_edge.target_node_uuid
+            and _normalize_string_exact(edge.fact) == normalized_fact
+        ):
+            return edge
+    return None
+
+
+def _needs_llm_resolution(
+    extracted_edge: EntityEdge, related_edges: list[EntityEdge], existing_edges: list[EntityEdge]
+) -> bool:
+    if len(related_edges) == 0 and len(existing_edges) == 0:
+        return False
+    return _find_verbatim_duplicate(extracted_edge, related_edges) is None
+
+
+def _resolve_edge_without_llm(
+    extracted_edge: EntityEdge,
+    related_edges: list[EntityEdge],
+    existing_edges: list[EntityEdge],
+    episode: EpisodicNode,
+) -> tuple[EntityEdge, list[EntityEdge], list[EntityEdge]] | None:
+    """Resolve edges that need no LLM call: no candidates at all, or a verbatim duplicate."""
+    if len(related_edges) == 0 and len(existing_edges) == 0:
+        return extracted_edge, [], []
+
+    # Fast path: if the fact text and endpoints already exist verbatim, reuse the matching edge.
+    resolved = _find_verbatim_duplicate(extracted_edge, related_edges)
+    if resolved is not None:
+        if episode is not None and episode.uuid not in resolved.episodes:
+            resolved.episodes.append(episode.uuid)
+        return resolved, [], []
+
+    return None
+
+
+async def _apply_edge_resolution(
+    llm_client: LLMClient,
+    extracted_edge: EntityEdge,
+    related_edges: list[EntityEdge],
+    existing_edges: list[EntityEdge],
+    episode: EpisodicNode,
+    edge_type_candidates: dict[str, type[BaseModel]] | None,
+    duplicate_facts: list[int],
+    contradicted_facts: list[int],
+    start: float,
+) -> tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]:
+    """Turn the LLM's duplicate/contradiction idx values into the resolved and invalidated edges."""
     # Validate duplicate_facts are in valid range for EXISTING FACTS
     invalid_duplicates = [i for i in duplicate_facts if i < 0 or i >= len(related_edges)]
     if invalid_duplicates:
@@ -593,8 +723,6 @@ async def resolve_extracted_edge(
     if duplicate_fact_ids and episode is not None:
         resolved_edge.episodes.append(episode.uuid)
 
-    contradicted_facts: list[int] = response_object.contradicted_facts
-
     # Validate contradicted_facts are in valid range for INVALIDATION CANDIDATES
     invalid_contradictions = [i for i in contradicted_facts if i < 0 or i >= len(existing_edges)]
     if invalid_contradictions:
@@ -664,6 +792,141 @@ async def resolve_extracted_edge(
     return resolved_edge, invalidated_edges, duplicate_edges
 
 
+def _batch_edges_for_resolution(
+    indices: list[int],
+    extracted_edges: list[EntityEdge],
+    related_edges_lists: list[list[EntityEdge]],
+    existing_edges_lists: list[list[EntityEdge]],
+) -> list[list[int]]:
+    """Greedily pack edge indices into batches bounded by size and estimated prompt tokens."""
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+    for i in indices:
+        edge_tokens = estimate_tokens(extracted_edges[i].fact) + sum(
+            estimate_tokens(edge.fact) for edge in related_edges_lists[i] + existing_edges_lists[i]
+        )
+        if current and (
+            len(current) >= EDGE_RESOLUTION_BATCH_SIZE
+            or current_tokens + edge_tokens > EDGE_RESOLUTION_BATCH_TOKENS
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += edge_tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def resolve_extracted_edges_batch(
+    llm_client: LLMClient,
+    extracted_edges: list[EntityEdge],
+    related_edges_lists: list[list[EntityEdge]],
+    existing_edges_lists: list[list[EntityEdge]],
+    episode: EpisodicNode,
+    edge_type_candidates_lst: list[dict[str, type[BaseModel]]],
+) -> list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]]:
+    """Resolve several extracted edges with a single dedupe/contradiction prompt.
+
+    Each edge is sent with its own candidate lists and the response holds one resolution per
+    edge. Edges the response does not cover, or every edge when the response cannot be parsed,
+    fall back to `resolve_extracted_edge`. Results are returned in input order.
+    """
+    results: list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]] | None] = [
+        _resolve_edge_without_llm(edge, related_edges, existing_edges, episode)
+        for edge, related_edges, existing_edges in zip(
+            extracted_edges, related_edges_lists, existing_edges_lists, strict=True
+        )
+    ]
+    pending = [i for i, result in enumerate(results) if result is None]
+
+    start = time()
+    resolutions: dict[int, EdgeResolution] = {}
+    if len(pending) > 1:
+        context = {
+            'new_edges': [
+                {
+                    'id': batch_id,
+                    'fact': extracted_edges[i].fact,
+                    'existing_facts': [
+                        {'idx': idx, 'fact': edge.fact}
+                        for idx, edge in enumerate(related_edges_lists[i])
+                    ],
+                    'invalidation_candidates': [
+                        {'idx': idx, 'fact': edge.fact}
+                        for idx, edge in enumerate(existing_edges_lists[i])
+                    ],
+                }
+                for batch_id, i in enumerate(pending)
+            ]
+        }
+        try:
+            llm_response = await llm_client.generate_response(
+                prompt_library.dedupe_edges.resolve_edges(context),
+                response_model=EdgeResolutions,
+                model_size=ModelSize.small,
+                prompt_name='dedupe_edges.resolve_edges',
+            )
+            edge_resolutions = EdgeResolutions(**llm_response).edge_resolutions
+        except (ValueError, TypeError, KeyError) as e:
+            logger.warning(
+                'Could not parse batched edge resolutions, resolving %d edges one by one: %s',
+                len(pending),
+                e,
+            )
+            edge_resolutions = []
+
+        valid_ids = range(len(pending))
+        for resolution in edge_resolutions:
+            if resolution.id not in valid_ids:
+                logger.warning(
+                    'Skipping invalid edge resolution id %d (valid range: 0-%d)',
+                    resolution.id,
+                    len(pending) - 1,
+                )
+                continue
+            if resolution.id in resolutions:
+                logger.warning('Duplicate edge resolution id %d received; ignoring.', resolution.id)
+                continue
+            resolutions[resolution.id] = resolution
+
+        missing_ids = [batch_id for batch_id in valid_ids if batch_id not in resolutions]
+        if edge_resolutions and missing_ids:
+            logger.warning('LLM did not return edge resolutions for ids: %s', missing_ids)
+
+    async def resolve(
+        batch_id: int, i: int
+    ) -> tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]:
+        resolution = resolutions.get(batch_id)
+        if resolution is None:
+            return await resolve_extracted_edge(
+                llm_client,
+                extracted_edges[i],
+                related_edges_lists[i],
+                existing_edges_lists[i],
+                episode,
+                edge_type_candidates_lst[i],
+            )
+        return await _apply_edge_resolution(
+            llm_client,
+            extracted_edges[i],
+            related_edges_lists[i],
+            existing_edges_lists[i],
+            episode,
+            edge_type_candidates_lst[i],
+            resolution.duplicate_facts,
+            resolution.contradicted_facts,
+            start,
+        )
+
+    resolved = await semaphore_gather(*[resolve(batch_id, i) for batch_id, i in enumerate(pending)])
+    for i, result in zip(pending, resolved, strict=True):
+        results[i] = result
+
+    return [result for result in results if result is not None]
+
+
 async def filter_existing_duplicate_of_edges(
     driver: GraphDriver, duplicates_node_tuples: list[tuple[EntityNode, EntityNode]]
 ) -> list[tuple[EntityNode, EntityNode]]:
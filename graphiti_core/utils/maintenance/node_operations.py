@@ -14,16 +14,21 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import functools
 import logging
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from time import time
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, create_model
 
+from graphiti_core.concurrency import DB_POOL, LLM_POOL, ConcurrencyGovernor
+from graphiti_core.driver.driver import GraphDriver
 from graphiti_core.edges import EntityEdge
+from graphiti_core.embedder.embedding import embedding_to_list, to_embedding
 from graphiti_core.graphiti_types import GraphitiClients
-from graphiti_core.helpers import semaphore_gather
+from graphiti_core.helpers import NODE_HYDRATION_BATCH_SIZE, normalize_exact, semaphore_gather
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.llm_client.config import ModelSize
 from graphiti_core.nodes import (
@@ -43,6 +48,7 @@ from graphiti_core.search.search import search
 from graphiti_core.search.search_config import SearchResults
 from graphiti_core.search.search_config_recipes import NODE_HYBRID_SEARCH_RRF
 from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_utils import get_embeddings_for_nodes
 from graphiti_core.utils.content_chunking import (
     chunk_json_content,
     chunk_message_content,
@@ -50,12 +56,19 @@ from graphiti_core.utils.content_chunking import (
     should_chunk,
 )
 from graphiti_core.utils.datetime_utils import utc_now
+from graphiti_core.utils.entity_name_cache import EntityNameCache
+from graphiti_core.utils.episode_context import previous_episodes_context
 from graphiti_core.utils.maintenance.dedup_helpers import (
     DedupCandidateIndexes,
     DedupResolutionState,
     _build_candidate_indexes,
+    _resolve_with_embeddings,
     _resolve_with_similarity,
 )
+from graphiti_core.utils.resolution_memo import (
+    EntityResolutionMemo,
+    resolution_memo_key,
+)
 from graphiti_core.utils.text_utils import MAX_SUMMARY_CHARS, truncate_at_sentence
 
 logger = logging.getLogger(__name__)
@@ -86,7 +99,9 @@ async def extract_nodes(
     context = {
         'episode_content': episode.content,
         'episode_timestamp': episode.valid_at.isoformat(),
-        'previous_episodes': [ep.content for ep in previous_episodes],
+        'previous_episodes': previous_episodes_context(
+            previous_episodes, episode, clients.episode_summaries
+        ),
         'custom_extraction_instructions': custom_extraction_instructions or '',
         'entity_types': entity_types_context,
         'source_description': episode.source_description,
@@ -94,7 +109,9 @@ async def extract_nodes(
 
     # Check if chunking is needed (based on entity density)
     if should_chunk(episode.content, episode.source):
-        extracted_entities = await _extract_nodes_chunked(llm_client, episode, context)
+        extracted_entities = await _extract_nodes_chunked(
+            llm_client, episode, context, clients.governor
+        )
     else:
         extracted_entities = await _extract_nodes_single(llm_client, episode, context)
 
@@ -156,6 +173,7 @@ async def _extract_nodes_chunked(
     llm_client: LLMClient,
     episode: EpisodicNode,
     context: dict,
+    governor: ConcurrencyGovernor | None = None,
 ) -> list[ExtractedEntity]:
     """Extract entities from large content using chunking."""
     # Chunk the content based on episode type
@@ -170,7 +188,9 @@ async def _extract_nodes_chunked(
 
     # Extract entities from each chunk in parallel
     chunk_results = await semaphore_gather(
-        *[_extract_from_chunk(llm_client, chunk, context, episode) for chunk in chunks]
+        *[_extract_from_chunk(llm_client, chunk, context, episode) for chunk in chunks],
+        governor=governor,
+        pool=LLM_POOL,
     )
 
     # Merge and deduplicate entities across chunks
@@ -284,6 +304,12 @@ async def _collect_candidate_nodes(
     existing_nodes_override: list[EntityNode] | None,
 ) -> list[EntityNode]:
     """Search per extracted name and return unique candidates with overrides honored in order."""
+    # Embed every name in one batch; the embeddings serve as search vectors and are kept on
+    # the nodes for the embedding dedupe tier and for saving
+    await create_entity_node_embeddings(
+        clients.embedder, [node for node in extracted_nodes if node.name_embedding is None]
+    )
+
     search_results: list[SearchResults] = await semaphore_gather(
         *[
             search(
@@ -292,9 +318,12 @@ async def _collect_candidate_nodes(
                 group_ids=[node.group_id],
                 search_filter=SearchFilters(),
                 config=NODE_HYBRID_SEARCH_RRF,
+                query_vector=embedding_to_list(node.name_embedding),
             )
             for node in extracted_nodes
-        ]
+        ],
+        governor=clients.governor,
+        pool=DB_POOL,
     )
 
     candidate_nodes: list[EntityNode] = [node for result in search_results for node in result.nodes]
@@ -313,6 +342,149 @@ async def _collect_candidate_nodes(
     return ordered_candidates
 
 
+async def _resolve_with_memo(
+    driver: GraphDriver,
+    memo: EntityResolutionMemo,
+    extracted_nodes: list[EntityNode],
+    state: DedupResolutionState,
+) -> set[int]:
+    """Resolve nodes whose surface form the memo already maps to an existing entity.
+
+    Returns the indices of the resolved nodes. Memo entries whose entity no longer exists are
+    invalidated and their nodes go through the regular resolution.
+    """
+    keys = [resolution_memo_key(node) for node in extracted_nodes]
+    hits = await memo.get_many(list(dict.fromkeys(keys)))
+    known_uuids = {idx: hits[key] for idx, key in enumerate(keys) if key in hits}
+
+    resolved, stale_uuids = await _resolve_to_known_entities(
+        driver, extracted_nodes, known_uuids, state
+    )
+    if stale_uuids:
+        await memo.invalidate_uuids(stale_uuids)
+
+    logger.debug(f'Resolved {len(resolved)} nodes from the resolution memo')
+    return resolved
+
+
+async def _resolve_with_name_cache(
+    driver: GraphDriver,
+    name_cache: EntityNameCache,
+    extracted_nodes: list[EntityNode],
+    state: DedupResolutionState,
+) -> set[int]:
+    """Resolve unresolved nodes whose exact name belongs to exactly one entity of their group.
+
+    Names shared by several entities are left to candidate search and the dedupe tiers.
+    """
+    indices_by_group: dict[str, list[int]] = {}
+    for idx, node in enumerate(extracted_nodes):
+        if state.resolved_nodes[idx] is None:
+            indices_by_group.setdefault(node.group_id, []).append(idx)
+
+    known_uuids: dict[int, str] = {}
+    for group_id, indices in indices_by_group.items():
+        hits = await name_cache.lookup(
+            driver, group_id, [extracted_nodes[idx].name for idx in indices]
+        )
+        for idx in indices:
+            uuids = hits.get(extracted_nodes[idx].name, set())
+            if len(uuids) == 1:
+                known_uuids[idx] = next(iter(uuids))
+
+    resolved, stale_uuids = await _resolve_to_known_entities(
+        driver, extracted_nodes, known_uuids, state
+    )
+    name_cache.remove_uuids(stale_uuids)
+
+    logger.debug(f'Resolved {len(resolved)} nodes from the entity name cache')
+    return resolved
+
+
+async def _resolve_with_exact_names(
+    driver: GraphDriver,
+    extracted_nodes: list[EntityNode],
+    state: DedupResolutionState,
+) -> set[int]:
+    """Resolve unresolved nodes whose normalized name belongs to exactly one entity of their group.
+
+    One indexed `name_normalized` lookup per group; names shared by several entities are left
+    to candidate search and the dedupe tiers, as in `_resolve_with_similarity`.
+    """
+    indices_by_group: dict[str, list[int]] = {}
+    for idx, node in enumerate(extracted_nodes):
+        if state.resolved_nodes[idx] is None:
+            indices_by_group.setdefault(node.group_id, []).append(idx)
+
+    resolved: set[int] = set()
+    for group_id, indices in indices_by_group.items():
+        matches = await EntityNode.get_by_normalized_names(
+            driver, group_id, [extracted_nodes[idx].name for idx in indices]
+        )
+        matches_by_name: dict[str, list[EntityNode]] = {}
+        for match in matches:
+            matches_by_name.setdefault(normalize_exact(match.name), []).append(match)
+
+        for idx in indices:
+            node_matches = matches_by_name.get(normalize_exact(extracted_nodes[idx].name), [])
+            if len(node_matches) == 1:
+                _record_resolution(state, idx, extracted_nodes[idx], node_matches[0])
+                resolved.add(idx)
+
+    logger.debug(f'Resolved {len(resolved)} nodes by exact name')
+    return resolved
+
+
+def _record_resolution(
+    state: DedupResolutionState, idx: int, node: EntityNode, match: EntityNode
+) -> None:
+    state.resolved_nodes[idx] = match
+    state.uuid_map[node.uuid] = match.uuid
+    if match.uuid != node.uuid:
+        state.duplicate_pairs.append((node, match))
+
+
+async def _resolve_to_known_entities(
+    driver: GraphDriver,
+    extracted_nodes: list[EntityNode],
+    known_uuids: dict[int, str],
+    state: DedupResolutionState,
+) -> tuple[set[int], list[str]]:
+    """Resolve nodes (by index) to entities already known by uuid.
+
+    Returns the resolved indices and the known uuids whose entity no longer exists.
+    """
+    if not known_uuids:
+        return set(), []
+
+    target_uuids = list(dict.fromkeys(known_uuids.values()))
+    targets = {node.uuid: node for node in await EntityNode.get_by_uuids(driver, target_uuids)}
+    stale_uuids = [uuid for uuid in target_uuids if uuid not in targets]
+
+    resolved: set[int] = set()
+    for idx, uuid in known_uuids.items():
+        match = targets.get(uuid)
+        if match is None:
+            continue
+        _record_resolution(state, idx, extracted_nodes[idx], match)
+        resolved.add(idx)
+
+    return resolved, stale_uuids
+
+
+async def _load_candidate_embeddings(driver: GraphDriver, candidates: list[EntityNode]) -> None:
+    """Load the stored name embeddings of candidates returned without them by search."""
+    missing = [candidate for candidate in candidates if candidate.name_embedding is None]
+    if not missing:
+        return
+
+    embeddings = await get_embeddings_for_nodes(driver, missing)
+    for candidate in missing:
+        embedding = embeddings.get(candidate.uuid)
+        if embedding is not None:
+            candidate.name_embedding = to_embedding(embedding)
+
+
 async def _resolve_with_llm(
     llm_client: LLMClient,
     extracted_nodes: list[EntityNode],
@@ -388,9 +560,7 @@ async def _resolve_with_llm(
         'extracted_nodes': extracted_nodes_context,
         'existing_nodes': existing_nodes_context,
         'episode_content': episode.content if episode is not None else '',
-        'previous_episodes': (
-            [ep.content for ep in previous_episodes] if previous_episodes is not None else []
-        ),
+        'previous_episodes': previous_episodes_context(previous_episodes, episode),
     }
 
     llm_response = await llm_client.generate_response(
@@ -474,15 +644,14 @@ async def resolve_extracted_nodes(
     entity_types: dict[str, type[BaseModel]] | None = None,
     existing_nodes_override: list[EntityNode] | None = None,
 ) -> tuple[list[EntityNode], dict[str, str], list[tuple[EntityNode, EntityNode]]]:
-    """Search for existing nodes, resolve deterministic matches, then escalate holdouts to the LLM dedupe prompt."""
-    llm_client = clients.llm_client
-    existing_nodes = await _collect_candidate_nodes(
-        clients,
-        extracted_nodes,
-        existing_nodes_override,
-    )
+    """Search for existing nodes, resolve deterministic matches, then escalate holdouts to the LLM dedupe prompt.
 
-    indexes: DedupCandidateIndexes = _build_candidate_indexes(existing_nodes)
+    Nodes whose normalized name belongs to exactly one existing entity of their group are
+    resolved up front by an indexed lookup and skip all of that, as do surface forms found in
+    the resolution memo or the entity name cache when those are configured.
+    """
+    llm_client = clients.llm_client
+    memo = clients.resolution_memo
 
     state = DedupResolutionState(
         resolved_nodes=[None] * len(extracted_nodes),
@@ -490,8 +659,38 @@ async def resolve_extracted_nodes(
         unresolved_indices=[],
     )
 
+    memo_hits: set[int] = set()
+    if memo is not None:
+        memo_hits = await _resolve_with_memo(clients.driver, memo, extracted_nodes, state)
+
+    if clients.entity_name_cache is not None:
+        await _resolve_with_name_cache(
+            clients.driver, clients.entity_name_cache, extracted_nodes, state
+        )
+
+    await _resolve_with_exact_names(clients.driver, extracted_nodes, state)
+
+    pending_nodes = [
+        node for idx, node in enumerate(extracted_nodes) if state.resolved_nodes[idx] is None
+    ]
+    existing_nodes = (
+        await _collect_candidate_nodes(
+            clients,
+            pending_nodes,
+            existing_nodes_override,
+        )
+        if pending_nodes
+        else []
+    )
+
+    indexes: DedupCandidateIndexes = _build_candidate_indexes(existing_nodes)
+
     _resolve_with_similarity(extracted_nodes, indexes, state)
 
+    if state.unresolved_indices and existing_nodes:
+        await _load_candidate_embeddings(clients.driver, existing_nodes)
+        _resolve_with_embeddings(extracted_nodes, indexes, state)
+
     await _resolve_with_llm(
         llm_client,
         extracted_nodes,
@@ -507,6 +706,15 @@ async def resolve_extracted_nodes(
             state.resolved_nodes[idx] = node
             state.uuid_map[node.uuid] = node.uuid
 
+    if memo is not None:
+        await memo.set_many(
+            {
+                resolution_memo_key(node): state.uuid_map[node.uuid]
+                for idx, node in enumerate(extracted_nodes)
+                if idx not in memo_hits
+            }
+        )
+
     logger.debug(
         'Resolved nodes: %s',
         [(node.name, node.uuid) for node in state.resolved_nodes if node is not None],
@@ -549,13 +757,11 @@ async def extract_attributes_from_nodes(
     # Pre-build edges lookup for O(E + N) instead of O(N * E)
     edges_by_node = _build_edges_by_node(edges)
 
-    updated_nodes: list[EntityNode] = await semaphore_gather(
+    plans: list[_NodeHydrationPlan] = await semaphore_gather(
         *[
-            extract_attributes_from_node(
-                llm_client,
+            _plan_node_hydration(
                 node,
                 episode,
-                previous_episodes,
                 (
                     entity_types.get(next((item for item in node.labels if item != 'Entity'), ''))
                     if entity_types is not None
@@ -568,6 +774,26 @@ async def extract_attributes_from_nodes(
         ]
     )
 
+    # Nodes that need the LLM share one prompt per batch, so the episode is only sent once
+    pending = [plan for plan in plans if plan.needs_attributes or plan.needs_summary]
+    batches = [
+        pending[i : i + NODE_HYDRATION_BATCH_SIZE]
+        for i in range(0, len(pending), NODE_HYDRATION_BATCH_SIZE)
+    ]
+    await semaphore_gather(
+        *[
+            (
+                _hydrate_nodes_batch(llm_client, batch, episode, previous_episodes)
+                if len(batch) > 1
+                else _hydrate_node(llm_client, batch[0], episode, previous_episodes)
+            )
+            for batch in batches
+        ],
+        governor=clients.governor,
+        pool=LLM_POOL,
+    )
+
+    updated_nodes = [plan.node for plan in plans]
     await create_entity_node_embeddings(embedder, updated_nodes)
 
     return updated_nodes
@@ -582,66 +808,77 @@ async def extract_attributes_from_node(
     should_summarize_node: NodeSummaryFilter | None = None,
     edges: list[EntityEdge] | None = None,
 ) -> EntityNode:
-    # Extract attributes if entity type is defined and has attributes
-    llm_response = await _extract_entity_attributes(
-        llm_client, node, episode, previous_episodes, entity_type
-    )
+    plan = await _plan_node_hydration(node, episode, entity_type, should_summarize_node, edges)
+    if plan.needs_attributes or plan.needs_summary:
+        await _hydrate_node(llm_client, plan, episode, previous_episodes)
 
-    # Extract summary if needed
-    await _extract_entity_summary(
-        llm_client, node, episode, previous_episodes, should_summarize_node, edges
-    )
+    return node
 
-    node.attributes.update(llm_response)
 
-    return node
+@dataclass
+class _NodeHydrationPlan:
+    """What the LLM still has to produce for a node: typed attributes, a summary, or both."""
+
+    node: EntityNode
+    entity_type: type[BaseModel] | None
+    needs_attributes: bool
+    needs_summary: bool
+
+    @property
+    def response_model(self) -> type[BaseModel]:
+        if not self.needs_attributes:
+            return EntitySummary
+        assert self.entity_type is not None
+        if not self.needs_summary:
+            return self.entity_type
+        return _attributes_and_summary_model(self.entity_type)
+
+    @property
+    def node_data(self) -> dict[str, Any]:
+        node_data: dict[str, Any] = {'name': self.node.name}
+        # The attributes-only prompt should not include the summary
+        if self.needs_summary:
+            node_data['summary'] = self.node.summary
+        node_data['entity_types'] = self.node.labels
+        node_data['attributes'] = self.node.attributes
+        return node_data
+
+
+@functools.cache
+def _attributes_and_summary_model(entity_type: type[BaseModel]) -> type[BaseModel]:
+    """Response model holding the entity type's attributes plus an updated summary."""
+    return create_model(
+        f'{entity_type.__name__}WithSummary',
+        __base__=entity_type,
+        summary=(str, Field(..., description='Summary of the entity')),
+    )
 
 
-async def _extract_entity_attributes(
-    llm_client: LLMClient,
+async def _plan_node_hydration(
     node: EntityNode,
     episode: EpisodicNode | None,
-    previous_episodes: list[EpisodicNode] | None,
     entity_type: type[BaseModel] | None,
-) -> dict[str, Any]:
-    if entity_type is None or len(entity_type.model_fields) == 0:
-        return {}
-
-    attributes_context = _build_episode_context(
-        # should not include summary
-        node_data={
-            'name': node.name,
-            'entity_types': node.labels,
-            'attributes': node.attributes,
-        },
-        episode=episode,
-        previous_episodes=previous_episodes,
-    )
-
-    llm_response = await llm_client.generate_response(
-        prompt_library.extract_nodes.extract_attributes(attributes_context),
-        response_model=entity_type,
-        model_size=ModelSize.small,
-        group_id=node.group_id,
-        prompt_name='extract_nodes.extract_attributes',
+    should_summarize_node: NodeSummaryFilter | None,
+    edges: list[EntityEdge] | None = None,
+) -> _NodeHydrationPlan:
+    """Decide which LLM work a node needs, applying summaries that need no LLM call directly."""
+    needs_attributes = entity_type is not None and len(entity_type.model_fields) != 0
+    return _NodeHydrationPlan(
+        node=node,
+        entity_type=entity_type,
+        needs_attributes=needs_attributes,
+        needs_summary=await _needs_llm_summary(node, episode, should_summarize_node, edges),
     )
 
-    # validate response
-    entity_type(**llm_response)
-
-    return llm_response
 
-
-async def _extract_entity_summary(
-    llm_client: LLMClient,
+async def _needs_llm_summary(
     node: EntityNode,
     episode: EpisodicNode | None,
-    previous_episodes: list[EpisodicNode] | None,
     should_summarize_node: NodeSummaryFilter | None,
     edges: list[EntityEdge] | None = None,
-) -> None:
+) -> bool:
     if should_summarize_node is not None and not await should_summarize_node(node):
-        return
+        return False
 
     # Build summary with edge facts appended
     summary_with_edges = node.summary
@@ -652,32 +889,130 @@ async def _extract_entity_summary(
     # If we have summary content and it's short enough, use it directly
     if summary_with_edges and len(summary_with_edges) <= MAX_SUMMARY_CHARS * 4:
         node.summary = summary_with_edges
-        return
+        return False
 
     # Skip if no summary content and no episode to generate from
-    if not summary_with_edges and episode is None:
-        return
+    return bool(summary_with_edges) or episode is not None
 
-    summary_context = _build_episode_context(
-        node_data={
-            'name': node.name,
-            'summary': node.summary,
-            'entity_types': node.labels,
-            'attributes': node.attributes,
-        },
-        episode=episode,
-        previous_episodes=previous_episodes,
+
+def _apply_node_hydration(plan: _NodeHydrationPlan, llm_response: dict[str, Any]) -> None:
+    """Validate the LLM response for a node and copy its attributes and summary onto it."""
+    # validate response
+    plan.response_model(**llm_response)
+
+    response = dict(llm_response)
+    summary = response.pop('summary', '') if plan.needs_summary else None
+
+    if plan.needs_attributes:
+        plan.node.attributes.update(response)
+    if plan.needs_summary:
+        plan.node.summary = truncate_at_sentence(summary or '', MAX_SUMMARY_CHARS)
+
+
+async def _hydrate_node(
+    llm_client: LLMClient,
+    plan: _NodeHydrationPlan,
+    episode: EpisodicNode | None,
+    previous_episodes: list[EpisodicNode] | None,
+) -> None:
+    """Extract a node's attributes and/or summary with a single LLM call."""
+    context = _build_episode_context(
+        node_data=plan.node_data, episode=episode, previous_episodes=previous_episodes
     )
 
-    summary_response = await llm_client.generate_response(
-        prompt_library.extract_nodes.extract_summary(summary_context),
-        response_model=EntitySummary,
+    if plan.needs_attributes and plan.needs_summary:
+        prompt_name = 'extract_nodes.extract_attributes_and_summary'
+        messages = prompt_library.extract_nodes.extract_attributes_and_summary(context)
+    elif plan.needs_attributes:
+        prompt_name = 'extract_nodes.extract_attributes'
+        messages = prompt_library.extract_nodes.extract_attributes(context)
+    else:
+        prompt_name = 'extract_nodes.extract_summary'
+        messages = prompt_library.extract_nodes.extract_summary(context)
+
+    llm_response = await llm_client.generate_response(
+        messages,
+        response_model=plan.response_model,
         model_size=ModelSize.small,
-        group_id=node.group_id,
-        prompt_name='extract_nodes.extract_summary',
+        group_id=plan.node.group_id,
+        prompt_name=prompt_name,
     )
 
-    node.summary = truncate_at_sentence(summary_response.get('summary', ''), MAX_SUMMARY_CHARS)
+    _apply_node_hydration(plan, llm_response)
+
+
+async def _hydrate_nodes_batch(
+    llm_client: LLMClient,
+    plans: list[_NodeHydrationPlan],
+    episode: EpisodicNode | None,
+    previous_episodes: list[EpisodicNode] | None,
+) -> None:
+    """Extract attributes and summaries for several nodes of one episode in a single LLM call.
+
+    The response model has one field per node, typed with that node's own response model.
+    Nodes whose part of the response is missing or invalid, or every node when the response
+    cannot be used at all, fall back to `_hydrate_node`.
+    """
+    response_model = create_model(
+        'EntityHydrations',
+        **{
+            f'entity_{i}': (
+                plan.response_model,
+                Field(..., description=f'Attributes and/or summary for the entity with id {i}'),
+            )
+            for i, plan in enumerate(plans)
+        },  # type: ignore[call-overload]
+    )
+    nodes_context = []
+    for i, plan in enumerate(plans):
+        tasks = (['attributes'] if plan.needs_attributes else []) + (
+            ['summary'] if plan.needs_summary else []
+        )
+        nodes_context.append({'id': i, **plan.node_data, 'tasks': tasks})
+
+    context = {
+        'nodes': nodes_context,
+        'episode_content': episode.content if episode is not None else '',
+        'previous_episodes': previous_episodes_context(previous_episodes, episode),
+    }
+
+    # Fall back per node for anything the batched response does not cover
+    fallback: list[_NodeHydrationPlan] = []
+    group_id = plans[0].node.group_id
+    try:
+        llm_response = await llm_client.generate_response(
+            prompt_library.extract_nodes.extract_attributes_and_summaries(context),
+            response_model=response_model,
+            model_size=ModelSize.small,
+            group_id=group_id,
+            prompt_name='extract_nodes.extract_attributes_and_summaries',
+        )
+    except (ValueError, TypeError, KeyError) as e:
+        logger.warning(
+            'Could not parse batched node attributes, hydrating %d nodes one by one: %s',
+            len(plans),
+            e,
+        )
+        llm_response = {}
+
+    for i, plan in enumerate(plans):
+        node_response = llm_response.get(f'entity_{i}')
+        if not isinstance(node_response, dict):
+            fallback.append(plan)
+            continue
+        try:
+            _apply_node_hydration(plan, node_response)
+        except (ValueError, TypeError) as e:
+            logger.warning('Invalid batched attributes for node %s: %s', plan.node.uuid, e)
+            fallback.append(plan)
+
+    if fallback and llm_response:
+        logger.warning(
+            'LLM did not return usable attributes for %d of %d nodes', len(fallback), len(plans)
+        )
+    await semaphore_gather(
+        *[_hydrate_node(llm_client, plan, episode, previous_episodes) for plan in fallback]
+    )
 
 
 def _build_episode_context(
@@ -688,7 +1023,5 @@ def _build_episode_context(
     return {
         'node': node_data,
         'episode_content': episode.content if episode is not None else '',
-        'previous_episodes': (
-            [ep.content for ep in previous_episodes] if previous_episodes is not None else []
-        ),
+        'previous_episodes': previous_episodes_context(previous_episodes, episode),
     }
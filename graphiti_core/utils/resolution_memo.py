@@ -0,0 +1,153 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from pathlib import Path
+
+from graphiti_core.helpers import normalize_exact
+from graphiti_core.nodes import EntityNode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESOLUTION_MEMO_PATH = './entity_resolution_memo.sqlite'
+
+# (group_id, normalized name, label set)
+MemoKey = tuple[str, str, str]
+
+
+def resolution_memo_key(node: EntityNode) -> MemoKey:
+    """Key an extracted node by its group, exact-normalized name and specific labels."""
+    labels = ','.join(sorted(set(node.labels) - {'Entity'}))
+    return node.group_id, normalize_exact(node.name), labels
+
+
+class EntityResolutionMemo(ABC):
+    """Durable map from an entity's surface form in a group to the canonical entity uuid.
+
+    `resolve_extracted_nodes` consults it before searching for candidates and records every
+    resolution it confirms, so a surface form seen before resolves without a search or an LLM
+    call. Entries pointing to nodes that no longer exist are dropped when they are next used.
+    """
+
+    @abstractmethod
+    async def get_many(self, keys: list[MemoKey]) -> dict[MemoKey, str]:
+        """Return the canonical uuid of every key that has one."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def set_many(self, entries: dict[MemoKey, str]) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def invalidate_uuids(self, uuids: Iterable[str]) -> None:
+        """Forget every surface form that resolves to one of `uuids`, e.g. after a delete."""
+        raise NotImplementedError()
+
+    async def close(self) -> None:
+        return None
+
+
+class InMemoryEntityResolutionMemo(EntityResolutionMemo):
+    """Process-local memo, mainly for tests and short-lived ingestion jobs."""
+
+    def __init__(self):
+        self._entries: dict[MemoKey, str] = {}
+
+    async def get_many(self, keys: list[MemoKey]) -> dict[MemoKey, str]:
+        return {key: self._entries[key] for key in keys if key in self._entries}
+
+    async def set_many(self, entries: dict[MemoKey, str]) -> None:
+        self._entries.update(entries)
+
+    async def invalidate_uuids(self, uuids: Iterable[str]) -> None:
+        stale = set(uuids)
+        self._entries = {key: uuid for key, uuid in self._entries.items() if uuid not in stale}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteEntityResolutionMemo(EntityResolutionMemo):
+    """Memo stored in a local SQLite file; queries run in a worker thread."""
+
+    def __init__(self, path: str | Path = DEFAULT_RESOLUTION_MEMO_PATH):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entity_resolution (
+                    group_id TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    labels TEXT NOT NULL,
+                    uuid TEXT NOT NULL,
+                    PRIMARY KEY (group_id, name, labels)
+                )
+                """
+            )
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS entity_resolution_uuid ON entity_resolution (uuid)'
+            )
+
+    def _get_many(self, keys: list[MemoKey]) -> dict[MemoKey, str]:
+        results: dict[MemoKey, str] = {}
+        with self._lock:
+            for key in keys:
+                row = self._connection.execute(
+                    'SELECT uuid FROM entity_resolution '
+                    'WHERE group_id = ? AND name = ? AND labels = ?',
+                    key,
+                ).fetchone()
+                if row is not None:
+                    results[key] = row[0]
+        return results
+
+    def _set_many(self, entries: dict[MemoKey, str]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO entity_resolution (group_id, name, labels, uuid) '
+                'VALUES (?, ?, ?, ?)',
+                [(*key, uuid) for key, uuid in entries.items()],
+            )
+
+    def _invalidate_uuids(self, uuids: list[str]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'DELETE FROM entity_resolution WHERE uuid = ?', [(uuid,) for uuid in uuids]
+            )
+
+    async def get_many(self, keys: list[MemoKey]) -> dict[MemoKey, str]:
+        if not keys:
+            return {}
+        return await asyncio.to_thread(self._get_many, keys)
+
+    async def set_many(self, entries: dict[MemoKey, str]) -> None:
+        if entries:
+            await asyncio.to_thread(self._set_many, entries)
+
+    async def invalidate_uuids(self, uuids: Iterable[str]) -> None:
+        uuid_list = list(uuids)
+        if uuid_list:
+            await asyncio.to_thread(self._invalidate_uuids, uuid_list)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._connection.close)
@@ -62,6 +62,7 @@ async def add_messages(
             reference_time=m.timestamp,
             source=EpisodeType.message,
             source_description=m.source_description,
+            idempotent=True,
         )
 
     for m in request.messages:
@@ -24,7 +24,14 @@ import pytest
 from graphiti_core.driver.driver import GraphProvider
 
 try:
-    from graphiti_core.driver.falkordb_driver import FalkorDriver, FalkorDriverSession
+    from falkordb.asyncio.graph import AsyncGraph
+    from redis.exceptions import ResponseError
+
+    from graphiti_core.driver.falkordb_driver import (
+        FalkorDriver,
+        FalkorDriverSession,
+        FalkorRecord,
+    )
 
     HAS_FALKORDB = True
 except ImportError:
@@ -112,6 +119,64 @@ class TestFalkorDriver:
         assert header == ['column1', 'column2']
         assert summary is None
 
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_execute_queries_pipelines_in_one_round_trip(self):
+        """Test that a list of queries is sent as one pipeline and parsed in order."""
+        self.mock_client.select_graph.return_value = AsyncGraph(self.mock_client, 'default_db')
+        pipeline = MagicMock()
+        pipeline.execute = AsyncMock(
+            return_value=[
+                [[[1, 'uuid']], [[[2, 'a']]], ['Query internal execution time: 0.1 ms']],
+                [[[1, 'count']], [[[3, 2]], [[3, 5]]], ['Query internal execution time: 0.1 ms']],
+            ]
+        )
+        self.mock_client.connection.pipeline.return_value = pipeline
+
+        results = await self.driver.execute_queries(
+            [
+                ('MATCH (n {uuid: $uuid}) RETURN n.uuid AS uuid', {'uuid': 'a'}),
+                ('MATCH (n) RETURN count(n) AS count', {}),
+            ]
+        )
+
+        self.mock_client.connection.pipeline.assert_called_once_with(transaction=False)
+        pipeline.execute.assert_awaited_once()
+        commands = [c.args for c in pipeline.execute_command.call_args_list]
+        assert commands[0][0] == 'GRAPH.QUERY'
+        assert commands[0][2].endswith('MATCH (n {uuid: $uuid}) RETURN n.uuid AS uuid')
+        assert commands[0][2].startswith('CYPHER `uuid`="a" ')
+        assert [records for records, _, _ in results] == [
+            [{'uuid': 'a'}],
+            [{'count': 2}, {'count': 5}],
+        ]
+        assert results[1][1] == ['count']
+
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_execute_queries_raises_query_errors(self):
+        """Test that an error returned for one pipelined query is raised."""
+        self.mock_client.select_graph.return_value = AsyncGraph(self.mock_client, 'default_db')
+        pipeline = MagicMock()
+        pipeline.execute = AsyncMock(return_value=[ResponseError('Invalid input')])
+        self.mock_client.connection.pipeline.return_value = pipeline
+
+        with pytest.raises(ResponseError, match='Invalid input'):
+            await self.driver.execute_queries([('INVALID QUERY', {})])
+
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    def test_falkor_record_reads_fields_on_access(self):
+        """Test that records look fields up by name and pad short rows with None."""
+        index = {'uuid': 0, 'name': 1}
+        record = FalkorRecord(index, ['a'])
+
+        assert record['uuid'] == 'a'
+        assert record['name'] is None
+        assert record.get('missing', 'default') == 'default'
+        assert list(record) == ['uuid', 'name']
+        assert dict(record) == {'uuid': 'a', 'name': None}
+        assert record == {'uuid': 'a', 'name': None}
+
     @pytest.mark.asyncio
     @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
     async def test_execute_query_handles_index_already_exists_error(self):
@@ -196,9 +261,7 @@ class TestFalkorDriver:
             # hasattr(self.client, 'aclose') returns False
             # hasattr(self.client.connection, 'aclose') returns False
             # hasattr(self.client.connection, 'close') returns True
-            mock_hasattr.side_effect = lambda obj, attr: (
-                attr == 'close' and obj is mock_connection
-            )
+            mock_hasattr.side_effect = lambda obj, attr: attr == 'close' and obj is mock_connection
 
             await self.driver.close()
 
@@ -224,7 +287,8 @@ class TestFalkorDriverSession:
     def setup_method(self):
         """Set up test fixtures."""
         self.mock_graph = MagicMock()
-        self.session = FalkorDriverSession(self.mock_graph)
+        self.driver = FalkorDriver(falkor_db=MagicMock())
+        self.session = FalkorDriverSession(self.mock_graph, self.driver)
 
     @pytest.mark.asyncio
     @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
@@ -268,8 +332,12 @@ class TestFalkorDriverSession:
     @pytest.mark.asyncio
     @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
     async def test_run_multiple_queries_as_list(self):
-        """Test running multiple queries passed as list."""
-        self.mock_graph.query = AsyncMock()
+        """Test running multiple queries passed as list in one pipeline."""
+        self.mock_graph.name = 'test_graph'
+        self.mock_graph._build_params_header = lambda params: f'CYPHER {params} '
+        pipeline = MagicMock()
+        pipeline.execute = AsyncMock(return_value=[['stats'], ['stats']])
+        self.mock_graph.client.connection.pipeline.return_value = pipeline
 
         queries = [
             ('MATCH (n) RETURN n', {'param1': 'value1'}),
@@ -278,10 +346,33 @@ class TestFalkorDriverSession:
 
         await self.session.run(queries)
 
-        assert self.mock_graph.query.call_count == 2
-        calls = self.mock_graph.query.call_args_list
-        assert calls[0][0] == ('MATCH (n) RETURN n', {'param1': 'value1'})
-        assert calls[1][0] == ('CREATE (n:Node)', {'param2': 'value2'})
+        pipeline.execute.assert_awaited_once()
+        calls = pipeline.execute_command.call_args_list
+        assert calls[0].args == (
+            'GRAPH.QUERY',
+            'test_graph',
+            "CYPHER {'param1': 'value1'} MATCH (n) RETURN n",
+            '--compact',
+        )
+        assert calls[1].args == (
+            'GRAPH.QUERY',
+            'test_graph',
+            "CYPHER {'param2': 'value2'} CREATE (n:Node)",
+            '--compact',
+        )
+
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_run_is_recorded_in_driver_stats(self):
+        """Test that session queries are observed like those of execute_query."""
+        self.mock_graph.query = AsyncMock(return_value=MagicMock(result_set=[[1], [2]]))
+
+        await self.session.run('MATCH (n) RETURN n', param1='value1')
+
+        (template,) = self.driver.stats().values()
+        assert template.calls == 1
+        assert template.rows == 2
+        assert self.driver.query_stats.round_trips == 1
 
     @pytest.mark.asyncio
     @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
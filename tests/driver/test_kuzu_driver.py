@@ -0,0 +1,117 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+try:
+    from graphiti_core.driver.kuzu_driver import KuzuDriver
+
+    HAS_KUZU = True
+except ImportError:
+    KuzuDriver = None
+    HAS_KUZU = False
+
+pytestmark = pytest.mark.skipif(not HAS_KUZU, reason='Kuzu is not installed')
+
+
+class TestKuzuReadPool:
+    @pytest.mark.asyncio
+    async def test_reads_use_the_read_pool_and_see_writes(self):
+        driver = KuzuDriver(read_pool_size=2)
+        assert driver.read_client is not None
+        assert len(driver.read_client.connections) == 2
+
+        await driver.execute_query(
+            "CREATE (:Entity {uuid: $uuid, name: 'Alice', group_id: 'g'})", uuid='a'
+        )
+        with (
+            patch.object(driver.client, 'execute', wraps=driver.client.execute) as write_execute,
+            patch.object(
+                driver.read_client, 'execute', wraps=driver.read_client.execute
+            ) as read_execute,
+        ):
+            results = await asyncio.gather(
+                *[
+                    driver.execute_query(
+                        'MATCH (n:Entity {uuid: $uuid}) RETURN n.name AS name',
+                        uuid='a',
+                        routing_='r',
+                    )
+                    for _ in range(4)
+                ]
+            )
+
+        assert [records for records, _, _ in results] == [[{'name': 'Alice'}]] * 4
+        assert read_execute.call_count == 4
+        write_execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_without_read_pool_reads_use_the_single_connection(self):
+        driver = KuzuDriver()
+        assert driver.read_client is None
+
+        records, _, _ = await driver.execute_query('RETURN 1 AS one', routing_='r')
+
+        assert records == [{'one': 1}]
+
+
+class TestKuzuSchemaUpgrade:
+    @pytest.mark.asyncio
+    async def test_existing_databases_gain_the_new_columns(self, tmp_path):
+        import kuzu
+
+        from graphiti_core.driver.kuzu_driver import SCHEMA_QUERIES
+        from graphiti_core.nodes import EntityNode
+
+        # A database created before name_normalized was added to the Entity table
+        path = str(tmp_path / 'graph.kuzu')
+        old_schema = SCHEMA_QUERIES.replace(',\n        name_normalized STRING', '')
+        assert old_schema != SCHEMA_QUERIES
+        database = kuzu.Database(path)
+        connection = kuzu.Connection(database)
+        connection.execute(old_schema)
+        connection.close()
+        database.close()
+
+        driver = KuzuDriver(db=path)
+        await EntityNode(name='Alice', group_id='g').save(driver)
+
+        records, _, _ = await driver.execute_query(
+            'MATCH (n:Entity) RETURN n.name_normalized AS name_normalized'
+        )
+        assert records == [{'name_normalized': 'alice'}]
+
+
+class TestKuzuBulkColumns:
+    @pytest.mark.parametrize(
+        'table, columns_name',
+        [
+            ('Episodic', 'EPISODIC_COLUMNS'),
+            ('Entity', 'ENTITY_COLUMNS'),
+            ('RelatesToNode_', 'RELATES_TO_NODE_COLUMNS'),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_bulk_columns_match_the_schema(self, table, columns_name):
+        from graphiti_core.driver import kuzu_driver
+
+        records, _, _ = await KuzuDriver().execute_query(f"CALL table_info('{table}') RETURN name")
+        schema_columns = [record['name'] for record in records]
+
+        assert getattr(kuzu_driver, columns_name) == schema_columns
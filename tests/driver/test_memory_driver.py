@@ -0,0 +1,353 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.driver.memory_driver import EmbeddingMatrix, InvertedIndex, MemoryDriver
+from graphiti_core.edges import EntityEdge, EpisodicEdge, HasEpisodeEdge
+from graphiti_core.embedder import EmbedderClient
+from graphiti_core.errors import NodeNotFoundError
+from graphiti_core.graphiti import Graphiti
+from graphiti_core.helpers import compute_fact_hash
+from graphiti_core.llm_client import LLMClient
+from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.search.search_filters import ComparisonOperator, DateFilter, SearchFilters
+from graphiti_core.search.search_utils import (
+    edge_fulltext_search,
+    edge_similarity_search,
+    node_bfs_search,
+    node_fulltext_search,
+    node_similarity_search,
+)
+from graphiti_core.utils.bulk_utils import add_nodes_and_edges_bulk
+from graphiti_core.utils.maintenance.graph_data_operations import retrieve_episodes
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _entity(name: str, embedding: list[float], group_id: str = 'g') -> EntityNode:
+    return EntityNode(
+        name=name,
+        group_id=group_id,
+        labels=['Person'],
+        summary=f'{name} is a person',
+        name_embedding=embedding,
+        created_at=NOW,
+    )
+
+
+def _edge(source: EntityNode, target: EntityNode, fact: str, embedding: list[float]) -> EntityEdge:
+    return EntityEdge(
+        source_node_uuid=source.uuid,
+        target_node_uuid=target.uuid,
+        name='KNOWS',
+        fact=fact,
+        fact_embedding=embedding,
+        group_id=source.group_id,
+        created_at=NOW,
+        valid_at=NOW,
+    )
+
+
+def _episode(content: str, valid_at: datetime, group_id: str = 'g') -> EpisodicNode:
+    return EpisodicNode(
+        name='episode',
+        group_id=group_id,
+        source=EpisodeType.text,
+        source_description='chat',
+        content=content,
+        valid_at=valid_at,
+        created_at=valid_at,
+    )
+
+
+@pytest.fixture
+async def graph():
+    driver = MemoryDriver()
+    alice = _entity('Alice', [1.0, 0.0, 0.0])
+    bob = _entity('Bob', [0.0, 1.0, 0.0])
+    carol = _entity('Carol', [0.0, 0.0, 1.0])
+    for node in (alice, bob, carol):
+        await node.save(driver)
+    knows = _edge(alice, bob, 'Alice knows Bob from work', [1.0, 1.0, 0.0])
+    likes = _edge(bob, carol, 'Bob likes Carol', [0.0, 1.0, 1.0])
+    for edge in (knows, likes):
+        await edge.save(driver)
+    return driver, alice, bob, carol, knows, likes
+
+
+class TestEmbeddingMatrix:
+    def test_search_ranks_by_cosine_similarity(self):
+        matrix = EmbeddingMatrix(initial_capacity=1)
+        matrix.set('a', [1.0, 0.0])
+        matrix.set('b', [1.0, 1.0])
+        matrix.set('c', [0.0, 1.0])
+
+        results = matrix.search([1.0, 0.2], min_score=0.5)
+
+        assert [uuid for uuid, _ in results] == ['a', 'b']
+        assert results[0][1] == pytest.approx(1 / (1.04**0.5), rel=1e-5)
+
+    def test_discarded_rows_are_reused_and_never_match(self):
+        matrix = EmbeddingMatrix(initial_capacity=2)
+        matrix.set('a', [1.0, 0.0])
+        matrix.discard('a')
+        matrix.set('b', [0.0, 1.0])
+
+        assert matrix.get('a') is None
+        assert matrix.search([1.0, 0.0], min_score=-1) == [('b', 0.0)]
+        assert len(matrix) == 1
+
+    def test_rejects_other_dimensions(self):
+        matrix = EmbeddingMatrix()
+        matrix.set('a', [1.0, 0.0])
+
+        with pytest.raises(ValueError):
+            matrix.set('b', [1.0, 0.0, 0.0])
+
+
+class TestInvertedIndex:
+    def test_rarer_tokens_rank_higher(self):
+        index = InvertedIndex()
+        index.set('a', 'Alice works at Acme')
+        index.set('b', 'Bob works at Initech')
+        index.set('c', 'Carol')
+
+        results = index.search('Acme works')
+
+        assert [uuid for uuid, _ in results] == ['a', 'b']
+
+    def test_updates_replace_previous_tokens(self):
+        index = InvertedIndex()
+        index.set('a', 'Alice')
+        index.set('a', 'Bob')
+
+        assert index.search('alice') == []
+        assert [uuid for uuid, _ in index.search('bob')] == ['a']
+
+
+class TestMemoryDriver:
+    @pytest.mark.asyncio
+    async def test_nodes_round_trip_with_embeddings(self, graph):
+        driver, alice, *_ = graph
+
+        node = await EntityNode.get_by_uuid(driver, alice.uuid)
+
+        assert node.name == 'Alice'
+        assert set(node.labels) == {'Person', 'Entity'}
+        assert node.name_embedding is None
+        await node.load_name_embedding(driver)
+        assert node.name_embedding.tolist() == [1.0, 0.0, 0.0]
+
+        # Saving a node read without its embedding keeps the stored one
+        node.summary = 'Alice is an engineer'
+        await node.save(driver)
+        stored = await EntityNode.get_by_uuid(driver, alice.uuid)
+        await stored.load_name_embedding(driver)
+        assert stored.summary == 'Alice is an engineer'
+        assert stored.name_embedding.tolist() == [1.0, 0.0, 0.0]
+
+    @pytest.mark.asyncio
+    async def test_returned_items_are_copies(self, graph):
+        driver, alice, *_ = graph
+
+        node = await EntityNode.get_by_uuid(driver, alice.uuid)
+        node.labels.append('Changed')
+
+        assert 'Changed' not in (await EntityNode.get_by_uuid(driver, alice.uuid)).labels
+
+    @pytest.mark.asyncio
+    async def test_deleting_a_node_deletes_its_edges(self, graph):
+        driver, alice, bob, carol, knows, likes = graph
+
+        await bob.delete(driver)
+
+        with pytest.raises(NodeNotFoundError):
+            await EntityNode.get_by_uuid(driver, bob.uuid)
+        assert await EntityEdge.get_by_node_uuid(driver, alice.uuid) == []
+        assert await EntityEdge.get_by_uuids(driver, [knows.uuid, likes.uuid]) == []
+        assert driver.graph.fact_text.search('Alice') == []
+
+    @pytest.mark.asyncio
+    async def test_edges_need_both_endpoints(self, graph):
+        driver, alice, *_ = graph
+        orphan = _edge(alice, _entity('Dave', [1.0, 0.0, 0.0]), 'Alice met Dave', [1.0, 0.0, 0.0])
+
+        await orphan.save(driver)
+
+        assert await EntityEdge.get_by_uuids(driver, [orphan.uuid]) == []
+
+    @pytest.mark.asyncio
+    async def test_exact_match_lookups(self, graph):
+        driver, alice, bob, _, knows, _ = graph
+
+        nodes = await EntityNode.get_by_normalized_names(driver, 'g', ['  ALICE ', 'Zed'])
+        edges = await EntityEdge.get_by_fact_hashes(
+            driver, [compute_fact_hash(alice.uuid, bob.uuid, knows.fact)]
+        )
+
+        assert [node.uuid for node in nodes] == [alice.uuid]
+        assert [edge.uuid for edge in edges] == [knows.uuid]
+        assert await EntityNode.get_by_normalized_names(driver, 'other', ['Alice']) == []
+
+    @pytest.mark.asyncio
+    async def test_group_pages_run_in_descending_uuid_order(self, graph):
+        driver, alice, bob, carol, *_ = graph
+        uuids = sorted([alice.uuid, bob.uuid, carol.uuid], reverse=True)
+
+        first = await EntityNode.get_by_group_ids(driver, ['g'], limit=2)
+        rest = await EntityNode.get_by_group_ids(driver, ['g'], limit=2, uuid_cursor=first[-1].uuid)
+
+        assert [node.uuid for node in first + rest] == uuids
+
+    @pytest.mark.asyncio
+    async def test_search(self, graph):
+        driver, alice, bob, carol, knows, likes = graph
+        filters = SearchFilters()
+
+        assert [n.uuid for n in await node_fulltext_search(driver, 'carol', filters, ['g'])] == [
+            carol.uuid
+        ]
+        assert [
+            n.uuid
+            for n in await node_similarity_search(driver, [1.0, 0.1, 0.0], filters, ['g'], 10, 0.5)
+        ] == [alice.uuid]
+        assert [e.uuid for e in await edge_fulltext_search(driver, 'work', filters, ['g'])] == [
+            knows.uuid
+        ]
+        assert [
+            e.uuid
+            for e in await edge_similarity_search(
+                driver, [0.0, 1.0, 1.0], None, None, filters, ['g'], 10, 0.5
+            )
+        ] == [likes.uuid, knows.uuid]
+        assert {
+            n.uuid for n in await node_bfs_search(driver, [alice.uuid], filters, 2, ['g'], 10)
+        } == {bob.uuid, carol.uuid}
+        assert await node_fulltext_search(driver, 'carol', filters, ['other']) == []
+
+    @pytest.mark.asyncio
+    async def test_search_filters(self, graph):
+        driver, _, _, _, knows, likes = graph
+        knows.invalid_at = NOW + timedelta(days=1)
+        await knows.save(driver)
+
+        edges = await edge_similarity_search(
+            driver,
+            [0.0, 1.0, 0.0],
+            None,
+            None,
+            SearchFilters(
+                invalid_at=[[DateFilter(comparison_operator=ComparisonOperator.is_null)]]
+            ),
+            ['g'],
+            10,
+            0.5,
+        )
+        nodes = await node_fulltext_search(
+            driver, 'person', SearchFilters(node_labels=['Organization']), ['g']
+        )
+
+        assert [edge.uuid for edge in edges] == [likes.uuid]
+        assert nodes == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_save_and_retrieve_episodes(self):
+        driver = MemoryDriver()
+        alice = _entity('Alice', [1.0, 0.0, 0.0])
+        alice.attributes = {'age': 30}
+        episodes = [_episode(f'message {i}', NOW + timedelta(hours=i)) for i in range(4)]
+        mentions = [
+            EpisodicEdge(
+                source_node_uuid=episode.uuid,
+                target_node_uuid=alice.uuid,
+                group_id='g',
+                created_at=NOW,
+            )
+            for episode in episodes
+        ]
+
+        await add_nodes_and_edges_bulk(driver, episodes, mentions, [alice], [], Mock())
+
+        node = await EntityNode.get_by_uuid(driver, alice.uuid)
+        recent = await retrieve_episodes(
+            driver, NOW + timedelta(hours=2), last_n=2, group_ids=['g']
+        )
+        assert node.attributes == {'age': 30}
+        assert [episode.content for episode in recent] == ['message 1', 'message 2']
+        assert len(await EpisodicEdge.get_by_episode_uuids(driver, [episodes[0].uuid])) == 1
+        assert len(await EpisodicNode.get_by_entity_node_uuid(driver, alice.uuid)) == 4
+
+    @pytest.mark.asyncio
+    async def test_clear_data_by_group(self, graph):
+        from graphiti_core.utils.maintenance.graph_data_operations import clear_data
+
+        driver, alice, *_ = graph
+        other = _entity('Alice', [1.0, 0.0, 0.0], group_id='other')
+        await other.save(driver)
+
+        await clear_data(driver, ['g'])
+
+        assert await EntityNode.get_by_group_ids(driver, ['g']) == []
+        assert [n.uuid for n in await EntityNode.get_by_group_ids(driver, ['other'])] == [
+            other.uuid
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sagas_and_episode_removal_run_without_cypher(self, graph):
+        driver, alice, bob, carol, *_ = graph
+        graphiti = Graphiti(
+            graph_driver=driver,
+            llm_client=Mock(spec=LLMClient),
+            embedder=Mock(spec=EmbedderClient),
+            cross_encoder=Mock(spec=CrossEncoderClient),
+        )
+        first, second = _episode('first', NOW), _episode('second', NOW + timedelta(hours=1))
+        for episode in (first, second):
+            await episode.save(driver)
+        for episode, mentioned in ((first, [alice, bob]), (second, [bob])):
+            for node in mentioned:
+                await EpisodicEdge(
+                    source_node_uuid=episode.uuid,
+                    target_node_uuid=node.uuid,
+                    group_id='g',
+                    created_at=NOW,
+                ).save(driver)
+
+        saga = await graphiti._get_or_create_saga('trip', 'g', NOW)
+        for episode in (first, second):
+            await HasEpisodeEdge(
+                source_node_uuid=saga.uuid,
+                target_node_uuid=episode.uuid,
+                group_id='g',
+                created_at=NOW,
+            ).save(driver)
+
+        assert (await graphiti._get_or_create_saga('trip', 'g', NOW)).uuid == saga.uuid
+        assert await graphiti._get_latest_saga_episode_uuid(saga.uuid) == second.uuid
+        assert await graphiti._get_latest_saga_episode_uuid(saga.uuid, second.uuid) == first.uuid
+
+        await graphiti.remove_episode(first.uuid)
+
+        # Alice was only mentioned by the removed episode, Bob is still mentioned by the other
+        remaining = await EntityNode.get_by_group_ids(driver, ['g'])
+        assert {node.uuid for node in remaining} == {bob.uuid, carol.uuid}
+        with pytest.raises(NodeNotFoundError):
+            await EpisodicNode.get_by_uuid(driver, first.uuid)
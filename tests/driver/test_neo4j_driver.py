@@ -0,0 +1,98 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.driver.neo4j_driver import Neo4jDriver, Neo4jDriverConfig
+
+
+def _make_driver(config: Neo4jDriverConfig | None = None) -> tuple[Neo4jDriver, MagicMock]:
+    # Index creation is scheduled on construction when an event loop is running
+    with (
+        patch('graphiti_core.driver.neo4j_driver.AsyncGraphDatabase') as graph_database,
+        patch.object(Neo4jDriver, 'build_indices_and_constraints', new=AsyncMock()),
+    ):
+        driver = Neo4jDriver('neo4j://localhost:7687', 'neo4j', 'password', config=config)
+    return driver, graph_database
+
+
+class TestNeo4jDriverConfig:
+    def test_only_set_options_are_passed_to_the_driver(self):
+        _, graph_database = _make_driver(
+            Neo4jDriverConfig(max_connection_pool_size=200, fetch_size=500)
+        )
+
+        graph_database.driver.assert_called_once_with(
+            uri='neo4j://localhost:7687',
+            auth=('neo4j', 'password'),
+            max_connection_pool_size=200,
+            fetch_size=500,
+        )
+
+    def test_sessions_share_the_execute_query_bookmarks(self):
+        driver, _ = _make_driver()
+
+        driver.session()
+
+        driver.client.session.assert_called_once_with(
+            database='neo4j',
+            bookmark_manager=driver.client.execute_query_bookmark_manager,
+        )
+
+    @pytest.mark.asyncio
+    async def test_without_causal_consistency_no_bookmarks_are_used(self):
+        driver, _ = _make_driver(Neo4jDriverConfig(causal_consistency=False))
+        driver.client.execute_query = AsyncMock()
+
+        driver.session()
+        await driver.execute_query('MATCH (n) RETURN n', routing_='r')
+
+        driver.client.session.assert_called_once_with(database='neo4j')
+        driver.client.execute_query.assert_awaited_once_with(
+            'MATCH (n) RETURN n',
+            parameters_={'database_': 'neo4j'},
+            routing_='r',
+            bookmark_manager_=None,
+        )
+
+
+class TestNeo4jDriverSession:
+    @pytest.mark.asyncio
+    async def test_session_and_transaction_queries_are_recorded_in_driver_stats(self):
+        driver, _ = _make_driver()
+        tx = MagicMock()
+        tx.run = AsyncMock()
+        native_session = driver.client.session.return_value
+        native_session.run = AsyncMock()
+
+        async def execute_write(func):
+            return await func(tx)
+
+        native_session.execute_write = execute_write
+
+        async def write(tx, name):
+            await tx.run('CREATE (n:Entity {name: $name})', name=name)
+
+        async with driver.session() as session:
+            await session.run('MATCH (n) RETURN n', limit=1)
+            await session.execute_write(write, 'Alice')
+
+        native_session.run.assert_awaited_once_with('MATCH (n) RETURN n', limit=1)
+        tx.run.assert_awaited_once_with('CREATE (n:Entity {name: $name})', name='Alice')
+        assert sum(template.calls for template in driver.stats().values()) == 2
+        assert driver.query_stats.round_trips == 2
@@ -0,0 +1,138 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+try:
+    from graphiti_core.driver.neptune_driver import NeptuneDriver
+
+    HAS_NEPTUNE = True
+except ImportError:
+    NeptuneDriver = None
+    HAS_NEPTUNE = False
+
+pytestmark = pytest.mark.skipif(not HAS_NEPTUNE, reason='Neptune dependencies are not installed')
+
+
+@pytest.fixture
+def driver():
+    with (
+        patch('graphiti_core.driver.neptune_driver.NeptuneGraph'),
+        patch('graphiti_core.driver.neptune_driver.boto3'),
+        patch('graphiti_core.driver.neptune_driver.OpenSearch'),
+    ):
+        neptune_driver = NeptuneDriver(
+            host='neptune-db://localhost', aoss_host='aoss', max_workers=4
+        )
+    neptune_driver.client = MagicMock()
+    yield neptune_driver
+    neptune_driver._executor.shutdown(wait=False)
+
+
+class TestNeptuneDriver:
+    @pytest.mark.asyncio
+    async def test_query_does_not_block_event_loop(self, driver):
+        loop_thread = threading.get_ident()
+        query_threads = []
+
+        def slow_query(query, params):
+            query_threads.append(threading.get_ident())
+            time.sleep(0.2)
+            return [{'n': 1}]
+
+        driver.client.query.side_effect = slow_query
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        result, _, _ = (await asyncio.gather(driver.execute_query('RETURN 1'), ticker()))[0]
+
+        assert result == [{'n': 1}]
+        assert ticks == 5
+        assert query_threads and query_threads[0] != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_read_query_lists_run_concurrently(self, driver):
+        barrier = threading.Barrier(2, timeout=2)
+
+        def query(cypher_query, params):
+            # Both queries must be in flight at once to pass the barrier
+            barrier.wait()
+            return [{'q': cypher_query}]
+
+        driver.client.query.side_effect = query
+        result, _, _ = await driver.execute_query(
+            [('RETURN 1', {}), ('RETURN 2', {})], routing_='r'
+        )
+
+        assert result == [{'q': 'RETURN 2'}]
+
+    @pytest.mark.asyncio
+    async def test_write_query_lists_run_in_order(self, driver):
+        driver.client.query.side_effect = lambda q, params: [{'q': q}]
+        result, _, _ = await driver.execute_query([('CREATE (a)', {}), ('CREATE (b)', {})])
+
+        assert [c.args[0] for c in driver.client.query.call_args_list] == [
+            'CREATE (a)',
+            'CREATE (b)',
+        ]
+        assert result == [{'q': 'CREATE (b)'}]
+
+    def test_sanitize_parameters(self, driver):
+        moment = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        params = {
+            'created_at': moment,
+            'times': [moment],
+            'times_extra': ['T'],
+            'rows': [{'valid_at': moment, 'name': 'Tom'}],
+        }
+
+        query, sanitized = driver._sanitize_parameters(
+            'WHERE n.created_at IN $times AND n.x IN $times_extra', params
+        )
+
+        assert query == 'WHERE n.created_at IN [x IN $times | datetime(x)] AND n.x IN $times_extra'
+        assert sanitized == {
+            'created_at': moment.isoformat(),
+            'times': [moment.isoformat()],
+            'times_extra': ['T'],
+            'rows': [{'valid_at': moment.isoformat(), 'name': 'Tom'}],
+        }
+        # The caller's parameters are not modified
+        assert params['times'] == [moment]
+
+    def test_embeddings_are_encoded(self, driver):
+        from graphiti_core.utils.embedding_encoding import EmbeddingEncoding, decode_embedding
+
+        driver.embedding_encoding = EmbeddingEncoding.FLOAT32
+        _, sanitized = driver._sanitize_parameters(
+            'RETURN 1',
+            {'entity_data': {'name_embedding': [0.5, 1.0]}, 'nodes': [{'name_embedding': None}]},
+        )
+
+        assert sanitized['entity_data']['name_embedding'].startswith('f32:')
+        assert decode_embedding(sanitized['entity_data']['name_embedding']).tolist() == [0.5, 1.0]
+        assert sanitized['nodes'] == [{'name_embedding': ''}]
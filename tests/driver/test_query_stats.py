@@ -0,0 +1,133 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from graphiti_core.driver.memory_driver import MemoryDriver
+from graphiti_core.driver.query_stats import (
+    LatencyHistogram,
+    QueryStats,
+    estimate_size,
+    normalize_query,
+)
+from graphiti_core.tracer import Tracer
+
+
+class RecordingTracer(Tracer):
+    def __init__(self):
+        self.spans: list[tuple[str, MagicMock]] = []
+
+    @contextmanager
+    def start_span(self, name: str):
+        span = MagicMock()
+        self.spans.append((name, span))
+        yield span
+
+
+def issue_queries(driver: MemoryDriver, count: int) -> None:
+    for i in range(count):
+        with driver.observe_query(f"MATCH (n:Entity {{name: 'n{i}'}}) LIMIT {i}", {}) as result:
+            result.rows = [1]
+
+
+class TestQueryStats:
+    def test_literals_and_whitespace_share_a_template(self):
+        stats = QueryStats()
+
+        first = stats.fingerprint("MATCH (n {name: 'Alice'})\n  RETURN n LIMIT 10")
+        second = stats.fingerprint('MATCH (n {name: "Bob"}) RETURN n LIMIT 5')
+
+        assert first == second
+        assert first[1] == 'MATCH (n {name: ?}) RETURN n LIMIT ?'
+        assert normalize_query('MATCH (e1) RETURN e1') == 'MATCH (e1) RETURN e1'
+
+    def test_histogram_percentiles(self):
+        histogram = LatencyHistogram()
+        for duration_ms in [0.5] * 90 + [40.0] * 9 + [20000.0]:
+            histogram.record(duration_ms)
+
+        assert histogram.count == 100
+        assert histogram.percentile(0.5) == 1
+        assert histogram.percentile(0.95) == 50
+        assert histogram.percentile(1.0) == 20000.0
+
+    def test_parameter_sizes_count_embeddings_by_length(self):
+        assert estimate_size({'uuid': 'abc', 'embedding': [0.1] * 1024}) == 4 + 3 + 9 + 8 * 1024
+
+
+class TestDriverInstrumentation:
+    def test_queries_are_recorded_per_template_and_caller(self):
+        driver = MemoryDriver()
+
+        issue_queries(driver, 3)
+        with driver.observe_queries([('RETURN 1', {'a': 'xy'}), ('RETURN 2', {})]) as result:
+            result.rows = [2, 5]
+
+        stats = driver.stats()
+        match_stats = next(s for s in stats.values() if s.template.startswith('MATCH'))
+        caller = f'{__name__}.issue_queries'
+        assert match_stats.calls == 3
+        assert match_stats.rows_per_call == 1
+        assert list(match_stats.by_caller) == [caller]
+        assert match_stats.by_caller[caller].calls == 3
+        # Both queries of the pipelined round-trip share the `RETURN ?` template
+        assert [s.calls for s in stats.values() if s is not match_stats] == [2]
+        assert driver.query_stats.round_trips == 4
+
+    def test_errors_are_counted_and_traced(self):
+        driver = MemoryDriver()
+        tracer = RecordingTracer()
+        driver.set_tracer(tracer)
+
+        with pytest.raises(RuntimeError), driver.observe_query('MATCH (n) RETURN n', {}):
+            raise RuntimeError('boom')
+
+        (template_stats,) = driver.stats().values()
+        name, span = tracer.spans[0]
+        attributes = span.add_attributes.call_args.args[0]
+        assert template_stats.errors == 1
+        assert name == 'db.query'
+        span.set_status.assert_called_once_with('error', 'boom')
+        assert attributes['db.query.fingerprint'] == template_stats.fingerprint
+        assert attributes['db.query.caller'] == (
+            f'{__name__}.TestDriverInstrumentation.test_errors_are_counted_and_traced'
+        )
+
+    def test_untraced_queries_are_not_inspected_without_stats(self):
+        driver = MemoryDriver()
+        driver.collect_query_stats = False
+
+        with (
+            patch('graphiti_core.driver.driver.find_caller') as find_caller,
+            patch('graphiti_core.driver.driver.estimate_size') as size,
+        ):
+            issue_queries(driver, 2)
+
+        find_caller.assert_not_called()
+        size.assert_not_called()
+        assert driver.stats() == {}
+
+    def test_drivers_for_other_databases_share_stats(self):
+        driver = MemoryDriver()
+
+        issue_queries(driver.with_database('other'), 1)
+
+        assert driver.query_stats.round_trips == 1
+        driver.query_stats.reset()
+        assert driver.stats() == {}
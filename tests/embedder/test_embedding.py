@@ -0,0 +1,102 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.edges import EntityEdge
+from graphiti_core.embedder.embedding import (
+    embedding_to_list,
+    normalize_rows,
+    stack_embeddings,
+    to_embedding,
+)
+from graphiti_core.nodes import CommunityNode, EntityNode
+from graphiti_core.utils.datetime_utils import utc_now
+
+
+def make_edge(**kwargs) -> EntityEdge:
+    return EntityEdge(
+        source_node_uuid='a',
+        target_node_uuid='b',
+        name='KNOWS',
+        fact='A knows B',
+        group_id='g',
+        created_at=utc_now(),
+        **kwargs,
+    )
+
+
+def test_models_hold_float32_arrays_and_dump_lists():
+    node = EntityNode(name='Alice', group_id='g', name_embedding=[0.5, 1.0])
+    community = CommunityNode(name='C', group_id='g', name_embedding=np.array([0.5, 1.0]))
+    edge = make_edge(fact_embedding=[0.25, 0.5])
+
+    assert node.name_embedding.dtype == np.float32
+    assert community.name_embedding.dtype == np.float32
+    assert edge.fact_embedding.dtype == np.float32
+    assert node.model_dump()['name_embedding'] == [0.5, 1.0]
+    assert '"fact_embedding":[0.25,0.5]' in edge.model_dump_json()
+    assert EntityNode(name='Bob', group_id='g').model_dump()['name_embedding'] is None
+    assert EntityNode.model_json_schema()['properties']['name_embedding']['anyOf'][0] == {
+        'type': 'array',
+        'items': {'type': 'number'},
+    }
+
+
+def test_arrays_are_much_smaller_than_lists():
+    values = np.random.default_rng(0).standard_normal(1536).tolist()
+
+    array = to_embedding(values)
+    list_size = sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values)
+
+    assert array is not None
+    assert array.nbytes * 5 < list_size
+    # Float32 arrays are kept as they are
+    assert to_embedding(array) is array
+
+
+def test_stacking_helpers():
+    embeddings = [[3.0, 4.0], np.array([0.0, 0.0]), np.array([1.0, 0.0], dtype=np.float16)]
+
+    matrix = normalize_rows(stack_embeddings(embeddings))
+
+    assert matrix.dtype == np.float32
+    assert np.allclose(matrix, [[0.6, 0.8], [0.0, 0.0], [1.0, 0.0]])
+    assert stack_embeddings([]).shape == (0, 0)
+    assert embedding_to_list(np.array([0.5], dtype=np.float32)) == [0.5]
+    assert embedding_to_list(None) is None
+
+
+@pytest.mark.asyncio
+async def test_embeddings_are_saved_as_lists():
+    driver = MagicMock()
+    driver.provider = GraphProvider.NEO4J
+    driver.graph_operations_interface = None
+    driver.execute_query = AsyncMock(return_value=([], None, None))
+    node = EntityNode(name='Alice', group_id='g', name_embedding=[0.5, 1.0])
+    edge = make_edge(fact_embedding=[0.25, 0.5])
+
+    await node.save(driver)
+    await edge.save(driver)
+
+    node_params, edge_params = (call.kwargs for call in driver.execute_query.await_args_list)
+    assert node_params['entity_data']['name_embedding'] == [0.5, 1.0]
+    assert edge_params['edge_data']['fact_embedding'] == [0.25, 0.5]
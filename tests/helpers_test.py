@@ -24,7 +24,12 @@ from dotenv import load_dotenv
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.edges import EntityEdge, EpisodicEdge
 from graphiti_core.embedder.client import EmbedderClient
-from graphiti_core.helpers import lucene_sanitize
+from graphiti_core.helpers import (
+    compute_content_hash,
+    compute_fact_hash,
+    lucene_sanitize,
+    normalize_exact,
+)
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data
 
@@ -189,6 +194,20 @@ def test_lucene_sanitize():
         assert assert_result == result
 
 
+def test_normalize_exact_and_compute_fact_hash():
+    assert normalize_exact('  Alice\t  SMITH \n') == 'alice smith'
+
+    fact_hash = compute_fact_hash('a', 'b', 'Alice likes Bob')
+    assert fact_hash == compute_fact_hash('a', 'b', ' alice  LIKES bob')
+    assert fact_hash != compute_fact_hash('b', 'a', 'Alice likes Bob')
+    assert fact_hash != compute_fact_hash('a', 'b', 'Alice likes Carol')
+
+
+def test_compute_content_hash_is_exact():
+    assert compute_content_hash('Alice likes Bob') == compute_content_hash('Alice likes Bob')
+    assert compute_content_hash('Alice likes Bob') != compute_content_hash('alice likes Bob')
+
+
 async def get_node_count(driver: GraphDriver, uuids: list[str]) -> int:
     results, _, _ = await driver.execute_query(
         """
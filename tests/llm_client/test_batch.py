@@ -0,0 +1,163 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from graphiti_core.llm_client.batch import (
+    BatchExecutor,
+    BatchRequest,
+    BatchResult,
+    LocalFileBatchBackend,
+    write_jsonl,
+)
+from graphiti_core.llm_client.client import LLMClient
+from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.llm_client.errors import BatchError
+from graphiti_core.prompts.models import Message
+
+
+class Answer(BaseModel):
+    text: str
+
+
+class LiveCallLLMClient(LLMClient):
+    async def _generate_response(
+        self, messages, response_model=None, max_tokens=None, model_size=None
+    ):
+        raise AssertionError('live calls are disabled in batch mode')
+
+
+async def echo_handler(request: BatchRequest) -> dict:
+    return {'text': request.messages[-1]['content']}
+
+
+async def test_concurrent_requests_are_sent_as_one_batch(tmp_path):
+    backend = LocalFileBatchBackend(tmp_path, handler=echo_handler)
+    client = LiveCallLLMClient(LLMConfig(model='batch-model'))
+    client.set_batch_executor(BatchExecutor(backend, flush_interval=0.01, poll_interval=0.01))
+
+    responses = await asyncio.gather(
+        *[
+            client._rate_limited_generate_response(
+                [Message(role='user', content=f'prompt {i}')], Answer, 100
+            )
+            for i in range(5)
+        ]
+    )
+
+    assert [r['text'] for r in responses] == [f'prompt {i}' for i in range(5)]
+    input_files = list(tmp_path.glob('*.input.jsonl'))
+    assert len(input_files) == 1
+    requests = [
+        BatchRequest.model_validate_json(line) for line in input_files[0].read_text().splitlines()
+    ]
+    assert len(requests) == 5
+    assert requests[0].model == 'batch-model'
+    assert requests[0].response_schema_name == 'Answer'
+
+
+async def test_max_batch_size_splits_batches(tmp_path):
+    backend = LocalFileBatchBackend(tmp_path, handler=echo_handler)
+    executor = BatchExecutor(backend, max_batch_size=2, flush_interval=0.01, poll_interval=0.01)
+
+    await asyncio.gather(
+        *[
+            executor.submit(BatchRequest(messages=[{'role': 'user', 'content': 'x'}], max_tokens=1))
+            for _ in range(5)
+        ]
+    )
+
+    assert len(list(tmp_path.glob('*.input.jsonl'))) == 3
+
+
+async def test_request_errors_are_raised_to_their_caller(tmp_path):
+    async def handler(request: BatchRequest) -> dict:
+        if request.messages[0]['content'] == 'bad':
+            raise ValueError('invalid request')
+        return {'ok': True}
+
+    executor = BatchExecutor(
+        LocalFileBatchBackend(tmp_path, handler=handler), flush_interval=0.01, poll_interval=0.01
+    )
+
+    good, bad = await asyncio.gather(
+        executor.submit(BatchRequest(messages=[{'role': 'user', 'content': 'ok'}], max_tokens=1)),
+        executor.submit(BatchRequest(messages=[{'role': 'user', 'content': 'bad'}], max_tokens=1)),
+        return_exceptions=True,
+    )
+
+    assert good == {'ok': True}
+    assert isinstance(bad, BatchError)
+    assert 'invalid request' in str(bad)
+
+
+async def test_results_written_by_an_external_process(tmp_path):
+    backend = LocalFileBatchBackend(tmp_path)
+    executor = BatchExecutor(backend, flush_interval=0.01, poll_interval=0.01)
+    request = BatchRequest(messages=[{'role': 'user', 'content': 'hi'}], max_tokens=1)
+
+    pending = asyncio.create_task(executor.submit(request))
+    while not list(tmp_path.glob('*.input.jsonl')):
+        await asyncio.sleep(0.01)
+    batch_id = next(tmp_path.glob('*.input.jsonl')).name.removesuffix('.input.jsonl')
+    assert not pending.done()
+
+    write_jsonl(
+        backend.output_path(batch_id),
+        [BatchResult(custom_id=request.custom_id, response={'text': 'hello'})],
+    )
+
+    assert await asyncio.wait_for(pending, timeout=1) == {'text': 'hello'}
+
+
+async def test_failed_batch_fails_every_request(tmp_path):
+    backend = LocalFileBatchBackend(tmp_path)
+    executor = BatchExecutor(backend, flush_interval=0.01, poll_interval=0.01)
+
+    pending = asyncio.create_task(
+        executor.submit(BatchRequest(messages=[{'role': 'user', 'content': 'hi'}], max_tokens=1))
+    )
+    while not list(tmp_path.glob('*.input.jsonl')):
+        await asyncio.sleep(0.01)
+    batch_id = next(tmp_path.glob('*.input.jsonl')).name.removesuffix('.input.jsonl')
+    backend.error_path(batch_id).write_text('expired')
+
+    with pytest.raises(BatchError):
+        await asyncio.wait_for(pending, timeout=1)
+
+
+async def test_failed_batch_request_is_not_retried(tmp_path):
+    from graphiti_core.llm_client.openai_generic_client import OpenAIGenericClient
+
+    async def failing_handler(request: BatchRequest) -> dict:
+        raise ValueError('invalid request')
+
+    client = OpenAIGenericClient(LLMConfig(api_key='test', model='batch-model'))
+    client.set_batch_executor(
+        BatchExecutor(
+            LocalFileBatchBackend(tmp_path, handler=failing_handler),
+            flush_interval=0.01,
+            poll_interval=0.01,
+        )
+    )
+
+    with pytest.raises(BatchError):
+        await client.generate_response([Message(role='user', content='hi')], Answer)
+
+    assert len(list(tmp_path.glob('*.input.jsonl'))) == 1
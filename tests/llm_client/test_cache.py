@@ -0,0 +1,119 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import patch
+
+from graphiti_core.llm_client.cache import (
+    DiskLLMCache,
+    InMemoryLLMCache,
+    TieredLLMCache,
+)
+from graphiti_core.llm_client.client import LLMClient
+from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.prompts.models import Message
+
+
+class CountingLLMClient(LLMClient):
+    def __init__(self):
+        super().__init__(LLMConfig())
+        self.calls = 0
+
+    async def _generate_response(
+        self, messages, response_model=None, max_tokens=None, model_size=None
+    ):
+        self.calls += 1
+        return {'content': f'response {self.calls}'}
+
+
+async def test_memory_cache_evicts_least_recently_used():
+    cache = InMemoryLLMCache(max_entries=2)
+    await cache.set('a', {'v': 1})
+    await cache.set('b', {'v': 2})
+    assert await cache.get('a') == {'v': 1}
+
+    await cache.set('c', {'v': 3})
+
+    assert await cache.get('b') is None
+    assert await cache.get('a') == {'v': 1}
+    assert await cache.get('c') == {'v': 3}
+    stats = cache.stats()['memory']
+    assert stats.hits == 3
+    assert stats.misses == 1
+    assert stats.evictions == 1
+
+
+async def test_memory_cache_expires_entries():
+    cache = InMemoryLLMCache(ttl=10)
+    with patch('graphiti_core.llm_client.cache.monotonic', return_value=100.0):
+        await cache.set('a', {'v': 1})
+    with patch('graphiti_core.llm_client.cache.monotonic', return_value=105.0):
+        assert await cache.get('a') == {'v': 1}
+    with patch('graphiti_core.llm_client.cache.monotonic', return_value=111.0):
+        assert await cache.get('a') is None
+    assert len(cache) == 0
+
+
+async def test_memory_cache_returns_copies():
+    cache = InMemoryLLMCache()
+    value = {'items': [1]}
+    await cache.set('a', value)
+    value['items'].append(2)
+
+    cached = await cache.get('a')
+    assert cached == {'items': [1]}
+    cached['items'].append(3)
+    assert await cache.get('a') == {'items': [1]}
+
+
+async def test_tiered_cache_backfills_memory_from_disk(tmp_path):
+    disk = DiskLLMCache(str(tmp_path))
+    await disk.set('a', {'v': 1})
+    memory = InMemoryLLMCache()
+    cache = TieredLLMCache([memory, disk])
+
+    assert await cache.get('a') == {'v': 1}
+    assert await memory.get('a') == {'v': 1}
+    assert await cache.get('missing') is None
+
+    stats = cache.stats()
+    assert stats['tiered'].hits == 1
+    assert stats['tiered'].misses == 1
+    assert stats['disk'].hits == 1
+    await cache.close()
+
+
+async def test_client_serves_repeated_requests_from_cache():
+    client = CountingLLMClient()
+    client.set_cache(InMemoryLLMCache())
+
+    first = await client.generate_response([Message(role='user', content='hello')])
+    second = await client.generate_response([Message(role='user', content='hello')])
+    other = await client.generate_response([Message(role='user', content='hello')], group_id='g')
+
+    assert first == second == {'content': 'response 1'}
+    assert other == {'content': 'response 2'}
+    assert client.calls == 2
+
+
+async def test_client_cache_key_matches_with_coalescing_disabled():
+    client = CountingLLMClient()
+    client.set_cache(InMemoryLLMCache())
+    await client.generate_response([Message(role='user', content='hello')])
+
+    client.coalesce_enabled = False
+    await client.generate_response([Message(role='user', content='hello')])
+
+    assert client.calls == 1
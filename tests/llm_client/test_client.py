@@ -14,8 +14,21 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from graphiti_core.llm_client.client import LLMClient
+import asyncio
+from types import SimpleNamespace
+
+from pydantic import BaseModel
+
+from graphiti_core.llm_client.client import (
+    LLMClient,
+    PromptUsage,
+    _prompt_usage,
+    get_response_schema,
+    get_serialized_response_schema,
+    record_prompt_usage,
+)
 from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.prompts.models import Message
 
 
 class MockLLMClient(LLMClient):
@@ -55,3 +68,113 @@ def test_clean_input():
 
     for input_str, expected in test_cases:
         assert client._clean_input(input_str) == expected, f'Failed for input: {repr(input_str)}'
+
+
+class CountingLLMClient(LLMClient):
+    """LLMClient that counts provider calls and holds them open until released"""
+
+    def __init__(self):
+        super().__init__(LLMConfig())
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def _generate_response(
+        self, messages, response_model=None, max_tokens=None, model_size=None
+    ):
+        self.calls += 1
+        await self.release.wait()
+        return {'content': messages[-1].content, 'items': []}
+
+
+async def test_generate_response_coalesces_identical_requests():
+    client = CountingLLMClient()
+
+    tasks = [
+        asyncio.create_task(client.generate_response([Message(role='user', content='hello')]))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    client.release.set()
+    responses = await asyncio.gather(*tasks)
+
+    assert client.calls == 1
+    assert all(response == responses[0] for response in responses)
+    # Every caller receives its own copy of the shared response
+    responses[0]['items'].append('mutated')
+    assert responses[1]['items'] == []
+    assert client._in_flight == {}
+
+
+async def test_generate_response_does_not_coalesce_different_requests():
+    client = CountingLLMClient()
+    client.release.set()
+
+    await asyncio.gather(
+        client.generate_response([Message(role='user', content='hello')]),
+        client.generate_response([Message(role='user', content='hello')], group_id='other'),
+        client.generate_response([Message(role='user', content='goodbye')]),
+    )
+
+    assert client.calls == 3
+
+
+async def test_generate_response_coalescing_disabled():
+    client = CountingLLMClient()
+    client.coalesce_enabled = False
+    client.release.set()
+
+    await asyncio.gather(
+        *[client.generate_response([Message(role='user', content='hello')]) for _ in range(3)]
+    )
+
+    assert client.calls == 3
+
+
+class Answer(BaseModel):
+    answer: str
+
+
+async def test_response_schema_is_memoized_and_placed_in_system_message():
+    client = CountingLLMClient()
+    client.release.set()
+
+    assert get_response_schema(Answer) is get_response_schema(Answer)
+    assert get_serialized_response_schema(Answer) is get_serialized_response_schema(Answer)
+
+    messages = [
+        Message(role='system', content='Instructions'),
+        Message(role='user', content='Dynamic content'),
+    ]
+    await client.generate_response(messages, response_model=Answer)
+
+    # The schema follows the static instructions; the user message is left untouched
+    assert messages[0].content.startswith('Instructions')
+    assert messages[0].content.endswith(get_serialized_response_schema(Answer))
+    assert messages[1].content == 'Dynamic content'
+
+
+def test_record_prompt_usage_reads_provider_usage_shapes():
+    usages = [
+        # OpenAI chat completions
+        SimpleNamespace(prompt_tokens=100, prompt_tokens_details=SimpleNamespace(cached_tokens=80)),
+        # OpenAI responses
+        SimpleNamespace(input_tokens=100, input_tokens_details=SimpleNamespace(cached_tokens=80)),
+        # Anthropic, where input_tokens excludes cache reads and writes
+        SimpleNamespace(
+            input_tokens=10, cache_read_input_tokens=80, cache_creation_input_tokens=10
+        ),
+        # Gemini
+        SimpleNamespace(prompt_token_count=100, cached_content_token_count=80),
+    ]
+    for usage in usages:
+        prompt_usage = PromptUsage()
+        token = _prompt_usage.set(prompt_usage)
+        try:
+            record_prompt_usage(usage)
+        finally:
+            _prompt_usage.reset(token)
+        assert (prompt_usage.input_tokens, prompt_usage.cached_input_tokens) == (100, 80)
+        assert prompt_usage.cached_token_ratio == 0.8
+
+    # Outside of a provider request there is nothing to record into
+    record_prompt_usage(usages[0])
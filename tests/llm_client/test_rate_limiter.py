@@ -0,0 +1,175 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from graphiti_core.llm_client.client import LLMClient, record_response_headers
+from graphiti_core.llm_client.config import LLMConfig, ModelSize
+from graphiti_core.llm_client.errors import RateLimitError
+from graphiti_core.llm_client.rate_limiter import (
+    AdaptiveConcurrencyLimiter,
+    ProviderRateLimiter,
+    _parse_duration,
+    get_rate_limit_headers,
+)
+from graphiti_core.prompts.models import Message
+
+
+def test_parse_duration():
+    assert _parse_duration('2') == 2.0
+    assert _parse_duration('1m30s') == 90.0
+    assert _parse_duration('250ms') == 0.25
+    assert _parse_duration('soon') is None
+
+
+def test_concurrency_decreases_on_rate_limit_and_recovers():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=8, increase_after=2)
+
+    limiter.record_rate_limit()
+    assert limiter.limit == 4
+    limiter.record_rate_limit()
+    assert limiter.limit == 2
+
+    limiter.record_success()
+    assert limiter.limit == 2
+    limiter.record_success()
+    assert limiter.limit == 3
+
+    for _ in range(20):
+        limiter.record_success()
+    assert limiter.limit == 8
+
+
+def test_unbounded_concurrency_starts_from_in_flight():
+    limiter = AdaptiveConcurrencyLimiter()
+    limiter.in_flight = 12
+
+    limiter.record_rate_limit()
+
+    assert limiter.limit == 6
+
+
+async def test_concurrency_limit_blocks_until_release():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=1)
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.release()
+    await asyncio.wait_for(waiter, timeout=1)
+    assert limiter.in_flight == 1
+
+
+async def test_wakeup_of_cancelled_waiter_goes_to_next_waiter():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=1)
+    await limiter.acquire()
+    cancelled = asyncio.create_task(limiter.acquire())
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    # The slot is handed to the first waiter, which is cancelled before it resumes
+    limiter.release()
+    cancelled.cancel()
+
+    await asyncio.wait_for(waiting, timeout=1)
+    assert cancelled.cancelled()
+    assert limiter.in_flight == 1
+
+
+def test_budgets_learned_from_headers():
+    limiter = ProviderRateLimiter('openai', 'test-model')
+
+    limiter.update_from_headers(
+        {
+            'x-ratelimit-limit-requests': '500',
+            'x-ratelimit-remaining-requests': '3',
+            'x-ratelimit-limit-tokens': '30000',
+            'x-ratelimit-remaining-tokens': '1000',
+        }
+    )
+
+    assert limiter.request_bucket is not None
+    assert limiter.request_bucket.capacity == 500
+    assert limiter.request_bucket.tokens <= 3
+    assert limiter.token_bucket is not None
+    assert limiter.token_bucket.capacity == 30000
+    assert limiter.token_bucket.tokens <= 1000
+
+
+def test_explicit_budgets_are_not_overridden_by_headers():
+    limiter = ProviderRateLimiter('openai', 'test-model', requests_per_minute=60)
+
+    limiter.update_from_headers({'x-ratelimit-limit-requests': '500'})
+
+    assert limiter.request_bucket is not None
+    assert limiter.request_bucket.capacity == 60
+
+
+def test_rate_limit_headers_found_on_exception_chain():
+    provider_error = Exception('429')
+    provider_error.response = MagicMock(headers={'retry-after': '3'})  # type: ignore[attr-defined]
+    try:
+        try:
+            raise provider_error
+        except Exception as e:
+            raise RateLimitError() from e
+    except RateLimitError as error:
+        assert get_rate_limit_headers(error) == {'retry-after': '3'}
+
+
+class RateLimitedLLMClient(LLMClient):
+    async def _generate_response(
+        self, messages, response_model=None, max_tokens=None, model_size=None
+    ):
+        raise RateLimitError()
+
+
+async def test_client_shrinks_shared_limit_on_rate_limit():
+    client = RateLimitedLLMClient(LLMConfig(model='rate-limited-model', max_concurrency=10))
+    limiter = client._get_rate_limiter(ModelSize.medium)
+
+    with pytest.raises(RateLimitError):
+        await client._rate_limited_generate_response(
+            [Message(role='user', content='hello')], model_size=ModelSize.medium
+        )
+
+    assert limiter.concurrency.limit == 5
+    assert limiter.concurrency.in_flight == 0
+
+
+class HeaderReportingLLMClient(LLMClient):
+    async def _generate_response(
+        self, messages, response_model=None, max_tokens=None, model_size=None
+    ):
+        record_response_headers({'x-ratelimit-limit-requests': '120'})
+        return {'content': 'ok'}
+
+
+async def test_client_learns_budgets_from_successful_responses():
+    client = HeaderReportingLLMClient(LLMConfig(model='header-reporting-model'))
+    limiter = client._get_rate_limiter(ModelSize.medium)
+
+    await client._rate_limited_generate_response(
+        [Message(role='user', content='hello')], model_size=ModelSize.medium
+    )
+
+    assert limiter.request_bucket is not None
+    assert limiter.request_bucket.capacity == 120
@@ -0,0 +1,99 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+
+import pytest
+
+from graphiti_core.concurrency import DB_POOL, LLM_POOL, ConcurrencyGovernor, KeyedLocks
+from graphiti_core.helpers import semaphore_gather
+
+
+async def _work(result: int = 0) -> int:
+    await asyncio.sleep(0.001)
+    return result
+
+
+@pytest.mark.asyncio
+async def test_nested_gathers_share_one_pool_budget():
+    governor = ConcurrencyGovernor(limits={DB_POOL: 3})
+
+    async def fan_out(i: int) -> list[int]:
+        # Nested gather without a governor inherits the enclosing one
+        return await semaphore_gather(*[_work(i * 10 + j) for j in range(10)])
+
+    results = await semaphore_gather(
+        *[fan_out(i) for i in range(10)], governor=governor, pool=DB_POOL
+    )
+
+    assert results == [[i * 10 + j for j in range(10)] for i in range(10)]
+    assert governor.pools[DB_POOL].peak_in_flight == 3
+    assert governor.pools[DB_POOL].in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_pools_are_independent():
+    governor = ConcurrencyGovernor(limits={DB_POOL: 1, LLM_POOL: 2})
+
+    async def llm_then_db(i: int) -> int:
+        await _work()
+        (result,) = await semaphore_gather(_work(i), pool=DB_POOL)
+        return result
+
+    results = await semaphore_gather(
+        *[llm_then_db(i) for i in range(6)], governor=governor, pool=LLM_POOL
+    )
+
+    assert results == list(range(6))
+    assert governor.pools[LLM_POOL].peak_in_flight == 2
+    assert governor.pools[DB_POOL].peak_in_flight == 1
+    assert all(pool['in_flight'] == 0 for pool in governor.stats().values())
+
+
+@pytest.mark.asyncio
+async def test_slot_released_when_coroutine_fails():
+    governor = ConcurrencyGovernor(limits={DB_POOL: 1})
+
+    async def fail():
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        await semaphore_gather(fail(), governor=governor, pool=DB_POOL)
+
+    assert governor.pools[DB_POOL].in_flight == 0
+    assert await semaphore_gather(_work(1), governor=governor) == [1]
+
+
+@pytest.mark.asyncio
+async def test_ungoverned_gather_keeps_per_call_limit():
+    assert await semaphore_gather(*[_work(i) for i in range(5)], max_coroutines=2) == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_keyed_locks_serialize_same_key_only():
+    locks = KeyedLocks()
+    held = await locks.acquire(['a', 'b'])
+
+    same_key = asyncio.create_task(locks.acquire(['b']))
+    other_key = asyncio.create_task(locks.acquire(['c']))
+    await asyncio.sleep(0)
+    assert not same_key.done()
+    assert await asyncio.wait_for(other_key, timeout=1) == ['c']
+
+    locks.release(held)
+    assert await asyncio.wait_for(same_key, timeout=1) == ['b']
+    locks.release(['b', 'c'])
+    assert locks._locks == {}
@@ -16,6 +16,7 @@ limitations under the License.
 
 from datetime import datetime, timedelta
 from unittest.mock import Mock
+from uuid import uuid4
 
 import numpy as np
 import pytest
@@ -23,7 +24,9 @@ import pytest
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.edges import CommunityEdge, EntityEdge, EpisodicEdge
 from graphiti_core.graphiti import Graphiti
+from graphiti_core.helpers import compute_content_hash, compute_fact_hash, get_default_group_id
 from graphiti_core.llm_client import LLMClient
+from graphiti_core.migrations.backfill_exact_match_keys import backfill_exact_match_keys
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodeType, EpisodicNode
 from graphiti_core.search.search_filters import ComparisonOperator, DateFilter, SearchFilters
 from graphiti_core.search.search_utils import (
@@ -2066,3 +2069,255 @@ async def test_get_embeddings_for_communities(graph_driver, mock_embedder):
     assert len(embeddings) == 1
     assert community_node_1.uuid in embeddings
     assert np.allclose(embeddings[community_node_1.uuid], community_node_1.name_embedding)
+
+
+@pytest.mark.asyncio
+async def test_exact_match_lookups_and_backfill(graph_driver, mock_embedder):
+    alice = EntityNode(
+        name='Alice Smith',
+        labels=[],
+        created_at=datetime.now(),
+        group_id=group_id,
+    )
+    await alice.generate_name_embedding(mock_embedder)
+    bob = EntityNode(
+        name='Bob',
+        labels=[],
+        created_at=datetime.now(),
+        group_id=group_id,
+    )
+    await bob.generate_name_embedding(mock_embedder)
+    edge = EntityEdge(
+        source_node_uuid=alice.uuid,
+        target_node_uuid=bob.uuid,
+        name='LIKES',
+        fact='Alice likes Bob',
+        created_at=datetime.now(),
+        group_id=group_id,
+    )
+    await edge.generate_embedding(mock_embedder)
+    await alice.save(graph_driver)
+    await bob.save(graph_driver)
+    await edge.save(graph_driver)
+
+    nodes = await EntityNode.get_by_normalized_names(
+        graph_driver, group_id, ['  alice   SMITH', 'Carol']
+    )
+    assert [node.uuid for node in nodes] == [alice.uuid]
+    assert 'name_normalized' not in nodes[0].attributes
+    assert await EntityNode.get_by_normalized_names(graph_driver, group_id_2, ['Alice Smith']) == []
+
+    fact_hash = compute_fact_hash(alice.uuid, bob.uuid, 'alice LIKES bob')
+    edges = await EntityEdge.get_by_fact_hashes(graph_driver, [fact_hash])
+    assert [e.uuid for e in edges] == [edge.uuid]
+    assert 'fact_hash' not in edges[0].attributes
+    reversed_hash = compute_fact_hash(bob.uuid, alice.uuid, 'alice likes bob')
+    assert await EntityEdge.get_by_fact_hashes(graph_driver, [reversed_hash]) == []
+
+    # Data written before the keys existed is found again once backfilled
+    if graph_driver.provider == GraphProvider.KUZU:
+        await graph_driver.execute_query('MATCH (e:RelatesToNode_) SET e.fact_hash = NULL')
+    else:
+        await graph_driver.execute_query('MATCH ()-[e:RELATES_TO]->() SET e.fact_hash = NULL')
+    await graph_driver.execute_query('MATCH (n:Entity) SET n.name_normalized = NULL')
+    assert await EntityNode.get_by_normalized_names(graph_driver, group_id, ['Bob']) == []
+
+    assert await backfill_exact_match_keys(graph_driver, batch_size=1) == (2, 1)
+    assert len(await EntityNode.get_by_normalized_names(graph_driver, group_id, ['Bob'])) == 1
+    assert len(await EntityEdge.get_by_fact_hashes(graph_driver, [fact_hash])) == 1
+    assert await backfill_exact_match_keys(graph_driver) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_idempotent_add_episode(
+    graph_driver, mock_llm_client, mock_embedder, mock_cross_encoder_client
+):
+    graphiti = Graphiti(
+        graph_driver=graph_driver,
+        llm_client=mock_llm_client,
+        embedder=mock_embedder,
+        cross_encoder=mock_cross_encoder_client,
+    )
+    # add_episode switches databases for explicit group ids, so stay in the default group
+    episode_group_id = get_default_group_id(graph_driver.provider)
+    reference_time = datetime.now()
+    content = 'Alice likes Bob'
+
+    alice = EntityNode(
+        name='Alice', labels=[], created_at=datetime.now(), group_id=episode_group_id
+    )
+    await alice.generate_name_embedding(mock_embedder)
+    bob = EntityNode(name='Bob', labels=[], created_at=datetime.now(), group_id=episode_group_id)
+    await bob.generate_name_embedding(mock_embedder)
+    edge = EntityEdge(
+        source_node_uuid=alice.uuid,
+        target_node_uuid=bob.uuid,
+        name='LIKES',
+        fact=content,
+        created_at=datetime.now(),
+        group_id=episode_group_id,
+    )
+    await edge.generate_embedding(mock_embedder)
+    episode = EpisodicNode(
+        name='message',
+        group_id=episode_group_id,
+        labels=[],
+        source=EpisodeType.message,
+        source_description='chat',
+        content=content,
+        created_at=datetime.now(),
+        valid_at=reference_time,
+        entity_edges=[edge.uuid],
+        content_hash=compute_content_hash(content),
+    )
+    mentions = [
+        EpisodicEdge(
+            source_node_uuid=episode.uuid,
+            target_node_uuid=node.uuid,
+            created_at=datetime.now(),
+            group_id=episode_group_id,
+        )
+        for node in (alice, bob)
+    ]
+    await add_nodes_and_edges_bulk(
+        graph_driver, [episode], mentions, [alice, bob], [edge], mock_embedder
+    )
+
+    stored = await EpisodicNode.get_by_content_hashes(
+        graph_driver, episode_group_id, [compute_content_hash(content)]
+    )
+    assert [e.uuid for e in stored] == [episode.uuid]
+    assert stored[0].content_hash == episode.content_hash
+    assert (
+        await EpisodicNode.get_by_content_hashes(graph_driver, group_id_2, [episode.content_hash])
+        == []
+    )
+
+    results = await graphiti.add_episode(
+        name='message (redelivered)',
+        episode_body=content,
+        source_description='chat',
+        reference_time=reference_time,
+        source=EpisodeType.message,
+        idempotent=True,
+    )
+
+    assert results.episode.uuid == episode.uuid
+    assert {node.uuid for node in results.nodes} == {alice.uuid, bob.uuid}
+    assert [e.uuid for e in results.edges] == [edge.uuid]
+    assert {e.uuid for e in results.episodic_edges} == {e.uuid for e in mentions}
+    mock_llm_client.generate_response.assert_not_called()
+    assert await get_node_count(graph_driver, [episode.uuid]) == 1
+
+    # Redeliveries that carry the stored episode's uuid are short-circuited too
+    results = await graphiti.add_episode(
+        uuid=episode.uuid,
+        name='message (redelivered)',
+        episode_body=content,
+        source_description='chat',
+        reference_time=reference_time,
+        source=EpisodeType.message,
+        idempotent=True,
+    )
+
+    assert results.episode.uuid == episode.uuid
+    assert [e.uuid for e in results.edges] == [edge.uuid]
+    mock_llm_client.generate_response.assert_not_called()
+
+    # Within a batch only the first copy of new content is kept
+    def copy_of(source: EpisodicNode) -> EpisodicNode:
+        return source.model_copy(update={'uuid': str(uuid4()), 'entity_edges': []})
+
+    new_episode = copy_of(episode).model_copy(
+        update={
+            'content': 'Bob likes Carol',
+            'content_hash': compute_content_hash('Bob likes Carol'),
+        }
+    )
+    to_ingest, redelivered = await graphiti._split_redelivered_episodes(
+        episode_group_id, [copy_of(episode), new_episode, copy_of(new_episode), episode]
+    )
+    assert [e.uuid for e in to_ingest] == [new_episode.uuid, episode.uuid]
+    assert [e.uuid for e in redelivered] == [episode.uuid]
+
+
+@pytest.mark.asyncio
+async def test_kuzu_bulk_load_copies_new_rows_and_merges_existing(graph_driver, mock_embedder):
+    if graph_driver.provider != GraphProvider.KUZU:
+        pytest.skip('Kuzu-specific bulk loading')
+
+    now = datetime.now()
+    episode = EpisodicNode(
+        name='episode',
+        group_id=group_id,
+        labels=[],
+        source=EpisodeType.message,
+        source_description='chat',
+        content='Alice likes Bob',
+        created_at=now,
+        valid_at=now,
+    )
+    embedding = [0.5, 0.5]
+    alice = EntityNode(
+        name='Alice', labels=['Person'], created_at=now, group_id=group_id, name_embedding=embedding
+    )
+    bob = EntityNode(
+        name='Bob', labels=[], created_at=now, group_id=group_id, name_embedding=embedding
+    )
+    edge = EntityEdge(
+        source_node_uuid=alice.uuid,
+        target_node_uuid=bob.uuid,
+        name='LIKES',
+        fact='Alice likes Bob',
+        created_at=now,
+        group_id=group_id,
+        episodes=[episode.uuid],
+        fact_embedding=embedding,
+    )
+    dangling_edge = EntityEdge(
+        source_node_uuid=alice.uuid,
+        target_node_uuid=str(uuid4()),
+        name='KNOWS',
+        fact='Alice knows someone',
+        created_at=now,
+        group_id=group_id,
+        fact_embedding=embedding,
+    )
+    mention = EpisodicEdge(
+        source_node_uuid=episode.uuid,
+        target_node_uuid=alice.uuid,
+        created_at=now,
+        group_id=group_id,
+    )
+    await add_nodes_and_edges_bulk(
+        graph_driver,
+        [episode],
+        [mention],
+        [alice, bob, alice],
+        [edge, dangling_edge],
+        mock_embedder,
+    )
+
+    assert await get_node_count(graph_driver, [episode.uuid, alice.uuid, bob.uuid]) == 3
+    assert await get_node_count(graph_driver, [edge.uuid, dangling_edge.uuid]) == 1
+    assert await get_edge_count(graph_driver, [mention.uuid]) == 1
+    stored_edge = await EntityEdge.get_by_uuid(graph_driver, edge.uuid)
+    assert (stored_edge.source_node_uuid, stored_edge.target_node_uuid) == (alice.uuid, bob.uuid)
+    stored_alice = await EntityNode.get_by_uuid(graph_driver, alice.uuid)
+    assert stored_alice.summary == ''
+    assert set(stored_alice.labels) == {'Entity', 'Person'}
+
+    # Saving the same uuids again merges them instead of copying duplicates
+    alice.summary = 'Alice likes Bob'
+    edge.fact = 'Alice really likes Bob'
+    carol = EntityNode(
+        name='Carol', labels=[], created_at=now, group_id=group_id, name_embedding=embedding
+    )
+    await add_nodes_and_edges_bulk(
+        graph_driver, [episode], [mention], [alice, carol], [edge], mock_embedder
+    )
+
+    assert (await EntityNode.get_by_uuid(graph_driver, alice.uuid)).summary == 'Alice likes Bob'
+    assert (await EntityEdge.get_by_uuid(graph_driver, edge.uuid)).fact == 'Alice really likes Bob'
+    assert await get_node_count(graph_driver, [alice.uuid, carol.uuid, edge.uuid]) == 3
+    assert await get_edge_count(graph_driver, [mention.uuid]) == 1
@@ -5,12 +5,14 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from pydantic import BaseModel
 
+from graphiti_core.concurrency import ConcurrencyGovernor
 from graphiti_core.edges import EntityEdge
 from graphiti_core.nodes import EntityNode, EpisodicNode
 from graphiti_core.search.search_config import SearchResults
 from graphiti_core.utils.maintenance.edge_operations import (
     resolve_extracted_edge,
     resolve_extracted_edges,
+    resolve_extracted_edges_batch,
 )
 
 
@@ -151,6 +153,70 @@ async def test_resolve_extracted_edge_exact_fact_short_circuit(
     mock_llm_client.generate_response.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_resolve_extracted_edges_reuses_stored_duplicate_by_fact_hash(monkeypatch):
+    from graphiti_core.utils.maintenance import edge_operations as edge_ops
+
+    monkeypatch.setattr(edge_ops, 'create_entity_edge_embeddings', AsyncMock(return_value=None))
+    search_mock = AsyncMock(return_value=SearchResults())
+    monkeypatch.setattr(edge_ops, 'search', search_mock)
+    get_between_nodes = AsyncMock(return_value=[])
+    monkeypatch.setattr(EntityEdge, 'get_between_nodes', get_between_nodes)
+
+    now = datetime.now(timezone.utc)
+    stored = EntityEdge(
+        source_node_uuid='source_uuid',
+        target_node_uuid='target_uuid',
+        name='LIKES',
+        group_id='group_1',
+        fact='Alice likes Bob',
+        episodes=['older_episode'],
+        created_at=now,
+    )
+    get_by_fact_hashes = AsyncMock(return_value=[stored])
+    monkeypatch.setattr(EntityEdge, 'get_by_fact_hashes', get_by_fact_hashes)
+
+    extracted = EntityEdge(
+        source_node_uuid='source_uuid',
+        target_node_uuid='target_uuid',
+        name='LIKES',
+        group_id='group_1',
+        fact='  alice LIKES bob ',
+        episodes=[],
+        created_at=now,
+    )
+    episode = EpisodicNode(
+        uuid='episode_uuid',
+        name='Episode',
+        group_id='group_1',
+        source='message',
+        source_description='desc',
+        content='Episode content',
+        valid_at=now,
+    )
+    llm_client = MagicMock()
+    llm_client.generate_response = AsyncMock()
+    clients = SimpleNamespace(
+        driver=MagicMock(),
+        llm_client=llm_client,
+        embedder=MagicMock(),
+        cross_encoder=MagicMock(),
+        governor=ConcurrencyGovernor(),
+    )
+
+    resolved_edges, invalidated_edges = await resolve_extracted_edges(
+        clients, [extracted], episode, [], {}, {}
+    )
+
+    assert resolved_edges == [stored]
+    assert stored.episodes == ['older_episode', 'episode_uuid']
+    assert invalidated_edges == []
+    get_by_fact_hashes.assert_awaited_once()
+    search_mock.assert_not_awaited()
+    get_between_nodes.assert_not_awaited()
+    llm_client.generate_response.assert_not_awaited()
+
+
 class OccurredAtEdge(BaseModel):
     """Edge model stub for OCCURRED_AT."""
 
@@ -161,8 +227,9 @@ async def test_resolve_extracted_edges_keeps_unknown_names(monkeypatch):
 
     monkeypatch.setattr(edge_ops, 'create_entity_edge_embeddings', AsyncMock(return_value=None))
     monkeypatch.setattr(EntityEdge, 'get_between_nodes', AsyncMock(return_value=[]))
+    monkeypatch.setattr(EntityEdge, 'get_by_fact_hashes', AsyncMock(return_value=[]))
 
-    async def immediate_gather(*aws, max_coroutines=None):
+    async def immediate_gather(*aws, **_kwargs):
         return [await aw for aw in aws]
 
     monkeypatch.setattr(edge_ops, 'semaphore_gather', immediate_gather)
@@ -181,6 +248,7 @@ async def test_resolve_extracted_edges_keeps_unknown_names(monkeypatch):
         llm_client=llm_client,
         embedder=MagicMock(),
         cross_encoder=MagicMock(),
+        governor=ConcurrencyGovernor(),
     )
 
     source_node = EntityNode(
@@ -336,6 +404,7 @@ async def test_resolve_extracted_edges_fast_path_deduplication(monkeypatch):
 
     monkeypatch.setattr(edge_ops, 'create_entity_edge_embeddings', AsyncMock(return_value=None))
     monkeypatch.setattr(EntityEdge, 'get_between_nodes', AsyncMock(return_value=[]))
+    monkeypatch.setattr(EntityEdge, 'get_by_fact_hashes', AsyncMock(return_value=[]))
 
     # Track how many times resolve_extracted_edge is called
     resolve_call_count = 0
@@ -353,7 +422,7 @@ async def test_resolve_extracted_edges_fast_path_deduplication(monkeypatch):
         return extracted_edge, [], []
 
     # Mock semaphore_gather to execute awaitable immediately
-    async def immediate_gather(*aws, max_coroutines=None):
+    async def immediate_gather(*aws, **_kwargs):
         results = []
         for aw in aws:
             results.append(await aw)
@@ -369,6 +438,7 @@ async def test_resolve_extracted_edges_fast_path_deduplication(monkeypatch):
         llm_client=llm_client,
         embedder=MagicMock(),
         cross_encoder=MagicMock(),
+        governor=ConcurrencyGovernor(),
     )
 
     source_node = EntityNode(
@@ -445,3 +515,98 @@ async def test_resolve_extracted_edges_fast_path_deduplication(monkeypatch):
     assert resolve_call_count == 1
     assert len(resolved_edges) == 1
     assert invalidated_edges == []
+
+
+def _make_edge(fact: str, source: str = 'source_uuid', target: str = 'target_uuid') -> EntityEdge:
+    return EntityEdge(
+        source_node_uuid=source,
+        target_node_uuid=target,
+        name='test_edge',
+        group_id='group_1',
+        fact=fact,
+        episodes=[],
+        created_at=datetime.now(timezone.utc),
+        valid_at=None,
+        invalid_at=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_resolve_extracted_edges_batch_uses_one_prompt(mock_llm_client, mock_current_episode):
+    mock_llm_client.generate_response.return_value = {
+        'edge_resolutions': [
+            {'id': 0, 'duplicate_facts': [0], 'contradicted_facts': []},
+            {'id': 1, 'duplicate_facts': [], 'contradicted_facts': [0]},
+        ]
+    }
+    new_edges = [_make_edge('User likes yoga'), _make_edge('User lives in Paris')]
+    duplicate = _make_edge('User enjoys yoga')
+    contradicted = _make_edge('User lives in Berlin')
+    contradicted.valid_at = datetime.now(timezone.utc) - timedelta(days=10)
+    new_edges[1].valid_at = datetime.now(timezone.utc)
+
+    results = await resolve_extracted_edges_batch(
+        mock_llm_client,
+        new_edges,
+        [[duplicate], []],
+        [[], [contradicted]],
+        mock_current_episode,
+        [{}, {}],
+    )
+
+    mock_llm_client.generate_response.assert_called_once()
+    assert mock_llm_client.generate_response.call_args.kwargs['prompt_name'] == (
+        'dedupe_edges.resolve_edges'
+    )
+    assert results[0][0] is duplicate
+    assert mock_current_episode.uuid in duplicate.episodes
+    assert results[1][0] is new_edges[1]
+    assert results[1][1] == [contradicted]
+    assert contradicted.invalid_at == new_edges[1].valid_at
+
+
+@pytest.mark.asyncio
+async def test_resolve_extracted_edges_batch_falls_back_for_missing_ids(
+    mock_llm_client, mock_current_episode
+):
+    mock_llm_client.generate_response.side_effect = [
+        {
+            'edge_resolutions': [
+                {'id': 0, 'duplicate_facts': [], 'contradicted_facts': []},
+                {'id': 7, 'duplicate_facts': [0], 'contradicted_facts': []},
+            ]
+        },
+        {'duplicate_facts': [0], 'contradicted_facts': []},
+    ]
+    new_edges = [_make_edge('User likes yoga'), _make_edge('User likes tea')]
+    related = [[_make_edge('User enjoys yoga')], [_make_edge('User enjoys tea')]]
+
+    results = await resolve_extracted_edges_batch(
+        mock_llm_client, new_edges, related, [[], []], mock_current_episode, [{}, {}]
+    )
+
+    assert mock_llm_client.generate_response.call_count == 2
+    fallback_call = mock_llm_client.generate_response.call_args_list[1]
+    assert fallback_call.kwargs['prompt_name'] == 'dedupe_edges.resolve_edge'
+    assert results[0][0] is new_edges[0]
+    assert results[1][0] is related[1][0]
+
+
+@pytest.mark.asyncio
+async def test_resolve_extracted_edges_batch_falls_back_on_parse_failure(
+    mock_llm_client, mock_current_episode
+):
+    mock_llm_client.generate_response.side_effect = [
+        {'unexpected': []},
+        {'duplicate_facts': [], 'contradicted_facts': []},
+        {'duplicate_facts': [], 'contradicted_facts': []},
+    ]
+    new_edges = [_make_edge('User likes yoga'), _make_edge('User likes tea')]
+    related = [[_make_edge('User enjoys yoga')], [_make_edge('User enjoys tea')]]
+
+    results = await resolve_extracted_edges_batch(
+        mock_llm_client, new_edges, related, [[], []], mock_current_episode, [{}, {}]
+    )
+
+    assert mock_llm_client.generate_response.call_count == 3
+    assert [result[0] for result in results] == new_edges
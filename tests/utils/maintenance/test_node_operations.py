@@ -3,11 +3,13 @@ from collections import defaultdict
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from pydantic import BaseModel, Field
 
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
 from graphiti_core.search.search_config import SearchResults
 from graphiti_core.utils.datetime_utils import utc_now
+from graphiti_core.utils.entity_name_cache import EntityNameCache
 from graphiti_core.utils.maintenance.dedup_helpers import (
     DedupCandidateIndexes,
     DedupResolutionState,
@@ -18,9 +20,11 @@ from graphiti_core.utils.maintenance.dedup_helpers import (
     _jaccard_similarity,
     _lsh_bands,
     _minhash_signature,
+    _minhash_signatures,
     _name_entropy,
     _normalize_name_for_fuzzy,
     _normalize_string_exact,
+    _resolve_with_embeddings,
     _resolve_with_similarity,
     _shingles,
 )
@@ -31,11 +35,16 @@ from graphiti_core.utils.maintenance.node_operations import (
     extract_attributes_from_nodes,
     resolve_extracted_nodes,
 )
+from graphiti_core.utils.resolution_memo import InMemoryEntityResolutionMemo
 
 
 def _make_clients():
     driver = MagicMock()
+    driver.graph_operations_interface = None
+    # No entity matches by exact name unless a test says otherwise
+    driver.execute_query = AsyncMock(return_value=([], None, None))
     embedder = MagicMock()
+    embedder.create_batch = AsyncMock(side_effect=lambda names: [[0.0, 1.0] for _ in names])
     cross_encoder = MagicMock()
     llm_client = MagicMock()
     llm_generate = AsyncMock()
@@ -151,6 +160,106 @@ async def test_resolve_nodes_fuzzy_match(monkeypatch):
     llm_generate.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_resolve_nodes_uses_resolution_memo(monkeypatch):
+    clients, llm_generate = _make_clients()
+    clients.resolution_memo = InMemoryEntityResolutionMemo()
+
+    canonical = EntityNode(name='ACME Corporation', group_id='group', labels=['Entity'])
+    search_mock = AsyncMock(return_value=SearchResults(nodes=[canonical]))
+    monkeypatch.setattr('graphiti_core.utils.maintenance.node_operations.search', search_mock)
+    monkeypatch.setattr(
+        'graphiti_core.utils.maintenance.node_operations.get_embeddings_for_nodes',
+        AsyncMock(return_value={}),
+    )
+    llm_generate.return_value = {
+        'entity_resolutions': [{'id': 0, 'name': 'ACME', 'duplicate_name': 'ACME Corporation'}]
+    }
+
+    first = EntityNode(name='ACME', group_id='group', labels=['Entity'])
+    resolved, _, _ = await resolve_extracted_nodes(
+        clients, [first], episode=_make_episode(), previous_episodes=[]
+    )
+    assert resolved[0].uuid == canonical.uuid
+    assert search_mock.await_count == 1
+    assert llm_generate.await_count == 1
+
+    get_by_uuids = AsyncMock(return_value=[canonical])
+    monkeypatch.setattr(EntityNode, 'get_by_uuids', get_by_uuids)
+
+    second = EntityNode(name='acme', group_id='group', labels=['Entity'])
+    resolved, uuid_map, _ = await resolve_extracted_nodes(
+        clients, [second], episode=_make_episode(), previous_episodes=[]
+    )
+    assert resolved[0].uuid == canonical.uuid
+    assert uuid_map[second.uuid] == canonical.uuid
+    # The repeat resolves without another search or LLM call
+    assert search_mock.await_count == 1
+    assert llm_generate.await_count == 1
+
+    # Once the entity is gone the memo entry is dropped and resolution runs again
+    get_by_uuids.return_value = []
+    search_mock.return_value = SearchResults(nodes=[])
+    llm_generate.return_value = {
+        'entity_resolutions': [{'id': 0, 'name': 'acme', 'duplicate_name': ''}]
+    }
+    third = EntityNode(name='acme', group_id='group', labels=['Entity'])
+    resolved, _, _ = await resolve_extracted_nodes(
+        clients, [third], episode=_make_episode(), previous_episodes=[]
+    )
+    assert resolved[0].uuid == third.uuid
+    assert search_mock.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_nodes_matches_exact_names_before_search(monkeypatch):
+    clients, llm_generate = _make_clients()
+    alice = EntityNode(name='Alice Smith', group_id='group', labels=['Entity'])
+    bob = EntityNode(name='Bob', group_id='group', labels=['Entity'])
+    other_bob = EntityNode(name='bob', group_id='group', labels=['Entity'])
+    get_by_names = AsyncMock(return_value=[alice, bob, other_bob])
+    monkeypatch.setattr(EntityNode, 'get_by_normalized_names', get_by_names)
+
+    search_mock = AsyncMock(return_value=SearchResults(nodes=[]))
+    monkeypatch.setattr('graphiti_core.utils.maintenance.node_operations.search', search_mock)
+    llm_generate.return_value = {'entity_resolutions': []}
+
+    extracted_alice = EntityNode(name='alice  smith', group_id='group', labels=['Entity'])
+    extracted_bob = EntityNode(name='Bob', group_id='group', labels=['Entity'])
+    resolved, uuid_map, _ = await resolve_extracted_nodes(
+        clients, [extracted_alice, extracted_bob], episode=_make_episode(), previous_episodes=[]
+    )
+
+    get_by_names.assert_awaited_once()
+    assert uuid_map[extracted_alice.uuid] == alice.uuid
+    # An ambiguous name is left to candidate search and the dedupe tiers
+    assert uuid_map[extracted_bob.uuid] == extracted_bob.uuid
+    assert search_mock.await_count == 1
+    assert search_mock.await_args.kwargs['query'] == 'Bob'
+
+
+@pytest.mark.asyncio
+async def test_resolve_nodes_uses_entity_name_cache(monkeypatch):
+    clients, llm_generate = _make_clients()
+    existing = EntityNode(name='Alice Smith', group_id='group', labels=['Entity'])
+    clients.entity_name_cache = EntityNameCache()
+    monkeypatch.setattr(EntityNode, 'get_by_group_ids', AsyncMock(return_value=[existing]))
+    monkeypatch.setattr(EntityNode, 'get_by_uuids', AsyncMock(return_value=[existing]))
+
+    search_mock = AsyncMock(return_value=SearchResults(nodes=[]))
+    monkeypatch.setattr('graphiti_core.utils.maintenance.node_operations.search', search_mock)
+
+    extracted = EntityNode(name='alice  smith', group_id='group', labels=['Entity'])
+    resolved, uuid_map, _ = await resolve_extracted_nodes(
+        clients, [extracted], episode=_make_episode(), previous_episodes=[]
+    )
+
+    assert resolved[0].uuid == existing.uuid
+    assert uuid_map[extracted.uuid] == existing.uuid
+    search_mock.assert_not_awaited()
+    llm_generate.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_collect_candidate_nodes_dedupes_and_merges_override(monkeypatch):
     clients, _ = _make_clients()
@@ -222,8 +331,26 @@ def test_hash_minhash_and_lsh():
     assert len(signature) == 32
     bands = _lsh_bands(signature)
     assert all(len(band) == 4 for band in bands)
-    hashed = {_hash_shingle(s, 0) for s in shingles}
+    hashed = {_hash_shingle(s) for s in shingles}
     assert len(hashed) == len(shingles)
+    # Deterministic, and the batched form agrees with the single-set form
+    assert _minhash_signature(shingles) == signature
+    batch = _minhash_signatures([shingles, set(), {'xyz'}])
+    assert tuple(batch[0].tolist()) == signature
+    assert not batch[1].any()
+    assert tuple(batch[2].tolist()) == _minhash_signature({'xyz'})
+    assert _minhash_signature(set()) == ()
+
+
+def test_minhash_estimates_jaccard_similarity():
+    a = _shingles('international business machines')
+    b = _shingles('international business machine')
+    c = _shingles('completely unrelated company')
+    sig_a, sig_b, sig_c = (_minhash_signature(s) for s in (a, b, c))
+    agreement_ab = sum(x == y for x, y in zip(sig_a, sig_b, strict=True)) / len(sig_a)
+    agreement_ac = sum(x == y for x, y in zip(sig_a, sig_c, strict=True)) / len(sig_a)
+    assert agreement_ab > 0.7
+    assert agreement_ac < 0.2
 
 
 def test_jaccard_similarity_edges():
@@ -282,6 +409,65 @@ def test_resolve_with_similarity_multiple_exact_matches_defers_to_llm():
     assert state.duplicate_pairs == []
 
 
+def test_resolve_with_embeddings_settles_confident_nodes_only():
+    candidate = EntityNode(
+        name='Acme Corporation', group_id='group', labels=['Entity'], name_embedding=[1.0, 0.0]
+    )
+    other = EntityNode(
+        name='Globex Inc', group_id='group', labels=['Entity'], name_embedding=[0.0, 1.0]
+    )
+    # Near-identical embedding: merged without the LLM
+    duplicate = EntityNode(
+        name='ACME Corp.', group_id='group', labels=['Entity'], name_embedding=[0.999, 0.02]
+    )
+    # Unlike every candidate: kept as a new entity
+    unrelated = EntityNode(
+        name='Blue Whale', group_id='group', labels=['Entity'], name_embedding=[-1.0, 0.0]
+    )
+    # In between: left to the LLM
+    ambiguous = EntityNode(
+        name='Acme Globex Venture',
+        group_id='group',
+        labels=['Entity'],
+        name_embedding=[0.7, 0.7],
+    )
+    extracted = [duplicate, unrelated, ambiguous]
+
+    indexes = _build_candidate_indexes([candidate, other])
+    state = DedupResolutionState(
+        resolved_nodes=[None] * 3, uuid_map={}, unresolved_indices=[0, 1, 2]
+    )
+
+    _resolve_with_embeddings(extracted, indexes, state)
+
+    assert state.resolved_nodes[0] is candidate
+    assert state.duplicate_pairs == [(duplicate, candidate)]
+    assert state.resolved_nodes[1] is unrelated
+    assert state.uuid_map[unrelated.uuid] == unrelated.uuid
+    assert state.resolved_nodes[2] is None
+    assert state.unresolved_indices == [2]
+
+
+def test_resolve_with_embeddings_requires_compatible_labels():
+    candidate = EntityNode(
+        name='Jordan River', group_id='group', labels=['Entity', 'Place'], name_embedding=[1.0, 0.0]
+    )
+    extracted = EntityNode(
+        name='Jordan Rivers',
+        group_id='group',
+        labels=['Entity', 'Person'],
+        name_embedding=[1.0, 0.0],
+    )
+
+    indexes = _build_candidate_indexes([candidate])
+    state = DedupResolutionState(resolved_nodes=[None], uuid_map={}, unresolved_indices=[0])
+
+    _resolve_with_embeddings([extracted], indexes, state)
+
+    assert state.resolved_nodes[0] is None
+    assert state.unresolved_indices == [0]
+
+
 @pytest.mark.asyncio
 async def test_resolve_with_llm_updates_unresolved(monkeypatch):
     extracted = EntityNode(name='Dizzy', group_id='group', labels=['Entity'])
@@ -682,3 +868,110 @@ async def test_extract_attributes_calls_llm_for_long_summary():
     # LLM should have been called to condense the long summary
     assert llm_client.generate_response.call_count == 1
     assert result.summary == 'Condensed summary'
+
+
+class Person(BaseModel):
+    occupation: str | None = Field(None, description='The person occupation')
+
+
+def _long_summary_edges(node: EntityNode) -> list:
+    from graphiti_core.edges import EntityEdge
+    from graphiti_core.utils.text_utils import MAX_SUMMARY_CHARS
+
+    return [
+        EntityEdge(
+            group_id='group',
+            source_node_uuid=node.uuid,
+            target_node_uuid='other-uuid',
+            name='test_edge',
+            fact='x' * (MAX_SUMMARY_CHARS * 5),
+            created_at=utc_now(),
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_extract_attributes_fuses_attributes_and_summary():
+    llm_client = MagicMock()
+    llm_client.generate_response = AsyncMock(
+        return_value={'occupation': 'Engineer', 'summary': 'Alice is an engineer.'}
+    )
+    node = EntityNode(name='Alice', group_id='group', labels=['Entity', 'Person'])
+
+    result = await extract_attributes_from_node(
+        llm_client,
+        node,
+        episode=_make_episode(),
+        previous_episodes=[],
+        entity_type=Person,
+        edges=_long_summary_edges(node),
+    )
+
+    llm_client.generate_response.assert_called_once()
+    call = llm_client.generate_response.call_args
+    assert call.kwargs['prompt_name'] == 'extract_nodes.extract_attributes_and_summary'
+    assert set(call.kwargs['response_model'].model_fields) == {'occupation', 'summary'}
+    assert result.attributes == {'occupation': 'Engineer'}
+    assert result.summary == 'Alice is an engineer.'
+
+
+@pytest.mark.asyncio
+async def test_extract_attributes_from_nodes_hydrates_nodes_in_one_call():
+    clients, llm_generate = _make_clients()
+    clients.embedder.create_batch = AsyncMock(return_value=[[0.1], [0.2]])
+    llm_generate.return_value = {
+        'entity_0': {'occupation': 'Engineer', 'summary': 'Alice is an engineer.'},
+        'entity_1': {'occupation': 'Doctor'},
+    }
+    alice = EntityNode(name='Alice', group_id='group', labels=['Entity', 'Person'])
+    bob = EntityNode(name='Bob', group_id='group', labels=['Entity', 'Person'], summary='Bob')
+    edges = _long_summary_edges(alice)
+
+    results = await extract_attributes_from_nodes(
+        clients,
+        [alice, bob],
+        episode=_make_episode(),
+        previous_episodes=[],
+        entity_types={'Person': Person},
+        edges=edges,
+    )
+
+    llm_generate.assert_called_once()
+    assert (
+        llm_generate.call_args.kwargs['prompt_name']
+        == 'extract_nodes.extract_attributes_and_summaries'
+    )
+    assert results == [alice, bob]
+    assert alice.attributes == {'occupation': 'Engineer'}
+    assert alice.summary == 'Alice is an engineer.'
+    assert bob.attributes == {'occupation': 'Doctor'}
+    assert bob.summary == 'Bob'
+
+
+@pytest.mark.asyncio
+async def test_extract_attributes_from_nodes_falls_back_for_missing_nodes():
+    clients, llm_generate = _make_clients()
+    clients.embedder.create_batch = AsyncMock(return_value=[[0.1], [0.2]])
+    llm_generate.side_effect = [
+        {'entity_0': {'occupation': 'Engineer', 'summary': 'Alice'}},
+        {'occupation': 'Doctor', 'summary': 'Bob'},
+    ]
+    alice = EntityNode(name='Alice', group_id='group', labels=['Entity', 'Person'])
+    bob = EntityNode(name='Bob', group_id='group', labels=['Entity', 'Person'])
+
+    await extract_attributes_from_nodes(
+        clients,
+        [alice, bob],
+        episode=_make_episode(),
+        previous_episodes=[],
+        entity_types={'Person': Person},
+    )
+
+    assert llm_generate.call_count == 2
+    assert (
+        llm_generate.call_args.kwargs['prompt_name']
+        == 'extract_nodes.extract_attributes_and_summary'
+    )
+    assert alice.attributes == {'occupation': 'Engineer'}
+    assert bob.attributes == {'occupation': 'Doctor'}
+    assert bob.summary == 'Bob'
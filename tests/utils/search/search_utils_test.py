@@ -1,10 +1,15 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
 from graphiti_core.nodes import EntityNode
 from graphiti_core.search.search_filters import SearchFilters
-from graphiti_core.search.search_utils import hybrid_node_search
+from graphiti_core.search.search_utils import (
+    get_embeddings_for_nodes,
+    hybrid_node_search,
+    maximal_marginal_relevance,
+)
 
 
 @pytest.mark.asyncio
@@ -161,3 +166,27 @@ async def test_hybrid_node_search_with_limit_and_duplicates():
         mock_similarity_search.assert_called_with(
             mock_driver, [0.1, 0.2, 0.3], SearchFilters(), ['1'], 4
         )
+
+
+@pytest.mark.asyncio
+async def test_embeddings_from_driver_hooks_are_float32_arrays():
+    driver = MagicMock()
+    driver.graph_operations_interface.node_load_embeddings_bulk = AsyncMock(
+        return_value={'1': [0.1, 0.2], '2': None}
+    )
+    node = EntityNode(uuid='1', name='Alice', labels=['Entity'], group_id='1')
+
+    embeddings = await get_embeddings_for_nodes(driver, [node])
+
+    assert list(embeddings) == ['1']
+    assert embeddings['1'].dtype == np.float32
+
+
+def test_mmr_penalizes_near_duplicates():
+    query = [1.0, 0.0]
+    candidates = {'a': [1.0, 0.1], 'b': [1.0, 0.11], 'c': [0.7, 0.7]}
+
+    uuids, _ = maximal_marginal_relevance(query, candidates, mmr_lambda=0.3)
+
+    assert uuids[0] == 'c'
+    assert maximal_marginal_relevance(query, {}) == ([], [])
@@ -0,0 +1,101 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.migrations.reencode_embeddings import reencode_embeddings
+from graphiti_core.utils.embedding_encoding import (
+    EmbeddingEncoding,
+    decode_embedding,
+    encode_embedding,
+)
+
+EMBEDDING = [0.25, -1.5, 3.0, 0.125]
+
+
+@pytest.mark.parametrize(
+    'encoding', [EmbeddingEncoding.CSV, EmbeddingEncoding.FLOAT32, EmbeddingEncoding.FLOAT16]
+)
+def test_round_trip(encoding):
+    encoded = encode_embedding(EMBEDDING, encoding)
+
+    assert decode_embedding(encoded).tolist() == EMBEDDING
+
+
+def test_compact_encodings_are_smaller():
+    embedding = (np.random.default_rng(0).standard_normal(1024) / 32).tolist()
+
+    csv = encode_embedding(embedding)
+    float32 = encode_embedding(embedding, EmbeddingEncoding.FLOAT32)
+    float16 = encode_embedding(embedding, EmbeddingEncoding.FLOAT16)
+    int8 = encode_embedding(embedding, EmbeddingEncoding.INT8)
+
+    assert len(float32) * 3 < len(csv)
+    assert len(float16) * 2 < len(float32) + 8
+    assert len(int8) * 3 < len(float32)
+    assert decode_embedding(float32) == pytest.approx(embedding, abs=1e-6)
+    assert decode_embedding(int8) == pytest.approx(embedding, abs=1e-3)
+
+
+def test_decodes_values_from_any_driver():
+    assert decode_embedding(None) is None
+    assert decode_embedding('') is None
+    assert decode_embedding(EMBEDDING).dtype == np.float32
+    assert decode_embedding(EMBEDDING).tolist() == EMBEDDING
+    # Older Neptune queries split the stored string without converting it
+    assert decode_embedding(['0.25', '-1.5']).tolist() == [0.25, -1.5]
+    assert encode_embedding(None) == ''
+
+
+def test_csv_encodes_float32_arrays_with_short_decimals():
+    embedding = np.array([0.1, -0.2], dtype=np.float32)
+
+    assert encode_embedding(embedding) == '0.1,-0.2'
+    assert np.array_equal(decode_embedding(encode_embedding(embedding)), embedding)
+
+
+@pytest.mark.asyncio
+async def test_reencode_embeddings_rewrites_stale_embeddings_in_batches():
+    driver = MagicMock()
+    driver.provider = GraphProvider.NEPTUNE
+    driver.embedding_encoding = EmbeddingEncoding.FLOAT32
+    stale = [{'uuid': 'a', 'embedding': '0.25,-1.5'}, {'uuid': 'b', 'embedding': '3.0'}]
+    # A full batch of entities, then an empty one, then no communities or edges
+    driver.execute_query = AsyncMock(
+        side_effect=[(stale, None, None), (None, None, None)] + [([], None, None)] * 4
+    )
+
+    assert await reencode_embeddings(driver, batch_size=2) == 2
+
+    select, update = driver.execute_query.await_args_list[:2]
+    assert "NOT n.name_embedding STARTS WITH 'f32:'" in select.args[0]
+    assert update.kwargs['rows'] == [
+        {'uuid': 'a', 'embedding': encode_embedding([0.25, -1.5], EmbeddingEncoding.FLOAT32)},
+        {'uuid': 'b', 'embedding': encode_embedding([3.0], EmbeddingEncoding.FLOAT32)},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reencode_embeddings_requires_neptune():
+    driver = MagicMock()
+    driver.provider = GraphProvider.NEO4J
+
+    with pytest.raises(ValueError):
+        await reencode_embeddings(driver)
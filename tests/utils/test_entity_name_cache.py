@@ -0,0 +1,116 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.nodes import EntityNode
+from graphiti_core.utils.entity_name_cache import EntityNameCache
+
+
+def _make_node(name: str, group_id: str = 'group') -> EntityNode:
+    return EntityNode(name=name, group_id=group_id, labels=['Entity'])
+
+
+@pytest.mark.asyncio
+async def test_lookup_warms_group_by_pages(monkeypatch):
+    nodes = [_make_node(f'Entity {i}') for i in range(5)]
+
+    async def get_by_group_ids(driver, group_ids, limit=None, uuid_cursor=None):
+        start = 0 if uuid_cursor is None else [n.uuid for n in nodes].index(uuid_cursor) + 1
+        return nodes[start : start + limit]
+
+    get_mock = AsyncMock(side_effect=get_by_group_ids)
+    monkeypatch.setattr(EntityNode, 'get_by_group_ids', get_mock)
+    cache = EntityNameCache(page_size=2)
+
+    hits = await cache.lookup(MagicMock(), 'group', ['entity 4', 'ENTITY 0', 'Unknown'])
+    assert hits == {'entity 4': {nodes[4].uuid}, 'ENTITY 0': {nodes[0].uuid}}
+    assert get_mock.await_count == 3
+
+    # The group is warmed only once
+    await cache.lookup(MagicMock(), 'group', ['Entity 1'])
+    assert get_mock.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_warm_limit_caps_loaded_entities(monkeypatch):
+    nodes = [_make_node(f'Entity {i}') for i in range(5)]
+    monkeypatch.setattr(
+        EntityNode,
+        'get_by_group_ids',
+        AsyncMock(
+            side_effect=lambda driver, group_ids, limit=None, uuid_cursor=None: nodes[:limit]
+        ),
+    )
+    cache = EntityNameCache(warm_limit=2, page_size=10)
+
+    hits = await cache.lookup(MagicMock(), 'group', ['Entity 0', 'Entity 4'])
+    assert set(hits) == {'Entity 0'}
+
+
+@pytest.mark.asyncio
+async def test_failed_warm_is_retried(monkeypatch):
+    node = _make_node('Alice')
+    get_mock = AsyncMock(side_effect=[RuntimeError('boom'), [node]])
+    monkeypatch.setattr(EntityNode, 'get_by_group_ids', get_mock)
+    cache = EntityNameCache()
+
+    with pytest.raises(RuntimeError):
+        await cache.lookup(MagicMock(), 'group', ['Alice'])
+    assert await cache.lookup(MagicMock(), 'group', ['Alice']) == {'Alice': {node.uuid}}
+
+
+@pytest.mark.asyncio
+async def test_add_and_remove_keep_cache_current(monkeypatch):
+    monkeypatch.setattr(EntityNode, 'get_by_group_ids', AsyncMock(return_value=[]))
+    cache = EntityNameCache()
+    first = _make_node('Alice')
+    second = _make_node('alice')
+
+    cache.add([first, second])
+    hits = await cache.lookup(MagicMock(), 'group', ['Alice'])
+    assert hits == {'Alice': {first.uuid, second.uuid}}
+
+    cache.remove_uuids([first.uuid])
+    assert await cache.lookup(MagicMock(), 'group', ['Alice']) == {'Alice': {second.uuid}}
+
+    # Renaming an entity moves it to its new name
+    second.name = 'Alicia'
+    cache.add([second])
+    assert await cache.lookup(MagicMock(), 'group', ['Alice', 'Alicia']) == {
+        'Alicia': {second.uuid}
+    }
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_group_is_evicted(monkeypatch):
+    get_mock = AsyncMock(return_value=[])
+    monkeypatch.setattr(EntityNode, 'get_by_group_ids', get_mock)
+    cache = EntityNameCache(max_groups=2)
+
+    await cache.lookup(MagicMock(), 'a', [])
+    await cache.lookup(MagicMock(), 'b', [])
+    await cache.lookup(MagicMock(), 'a', [])
+    await cache.lookup(MagicMock(), 'c', [])
+    assert get_mock.await_count == 3
+
+    # 'b' was evicted and is warmed again, 'a' was not
+    await cache.lookup(MagicMock(), 'a', [])
+    assert get_mock.await_count == 3
+    await cache.lookup(MagicMock(), 'b', [])
+    assert get_mock.await_count == 4
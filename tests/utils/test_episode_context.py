@@ -0,0 +1,136 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.nodes import EpisodeType, EpisodicNode
+from graphiti_core.utils.datetime_utils import utc_now
+from graphiti_core.utils.episode_context import (
+    OLDER_EPISODES_SUMMARY_PREFIX,
+    EpisodeSummaryCache,
+    assemble_previous_episodes,
+    truncate_to_relevant_sentences,
+)
+
+BASE_TIME = utc_now()
+
+
+def _make_episode(content: str, minutes: int, group_id: str = 'group') -> EpisodicNode:
+    return EpisodicNode(
+        name=f'episode-{minutes}',
+        group_id=group_id,
+        source=EpisodeType.message,
+        source_description='test',
+        content=content,
+        valid_at=BASE_TIME + timedelta(minutes=minutes),
+    )
+
+
+class TestTruncateToRelevantSentences:
+    def test_short_text_unchanged(self):
+        assert truncate_to_relevant_sentences('One. Two.', 100) == 'One. Two.'
+
+    def test_keeps_most_recent_sentences_without_query(self):
+        text = 'First sentence here. Second sentence here. Third sentence here.'
+        assert truncate_to_relevant_sentences(text, 7) == 'Third sentence here.'
+
+    def test_prefers_sentences_sharing_words_with_query(self):
+        text = 'Alice moved to Paris. The weather was mild. Bob bought a bicycle.'
+        truncated = truncate_to_relevant_sentences(text, 7, query='Where does Alice live?')
+        assert truncated == 'Alice moved to Paris.'
+
+    def test_selected_sentences_keep_original_order(self):
+        text = 'Alice met Bob. Filler text goes here. Bob called Alice.'
+        truncated = truncate_to_relevant_sentences(text, 8, query='Alice and Bob')
+        assert truncated == 'Alice met Bob. Bob called Alice.'
+
+
+class TestAssemblePreviousEpisodes:
+    def test_everything_fits(self):
+        episodes = [_make_episode('second', 2), _make_episode('first', 1)]
+        context = assemble_previous_episodes(episodes, token_budget=100)
+        # Chronological order regardless of input order
+        assert context.contents == ['first', 'second']
+        assert context.omitted == []
+
+    def test_recent_episodes_kept_and_older_truncated_or_omitted(self):
+        oldest = _make_episode('x' * 400, 0)
+        older = _make_episode('Old news. ' * 40, 1)
+        recent = _make_episode('r' * 200, 2)
+        context = assemble_previous_episodes([recent, older, oldest], token_budget=100)
+
+        assert context.contents[-1] == recent.content
+        assert len(context.contents) == 2
+        assert context.contents[0].startswith('Old news.')
+        assert len(context.contents[0]) < len(older.content)
+        assert context.omitted == [oldest]
+
+    def test_older_summary_comes_first(self):
+        episodes = [_make_episode('recent', 1)]
+        context = assemble_previous_episodes(episodes, token_budget=100, older_summary='Old')
+        assert context.contents == [OLDER_EPISODES_SUMMARY_PREFIX + 'Old', 'recent']
+
+    def test_empty(self):
+        assert assemble_previous_episodes(None).contents == []
+
+
+class TestEpisodeSummaryCache:
+    @pytest.mark.asyncio
+    async def test_fold_summarizes_each_episode_once(self):
+        llm_client = MagicMock()
+        llm_client.generate_response = AsyncMock(return_value={'summary': 'Alice lives in Paris'})
+        cache = EpisodeSummaryCache()
+        episodes = [_make_episode('Alice moved to Paris.', 0)]
+
+        assert await cache.fold(llm_client, 'group', episodes) == 'Alice lives in Paris'
+        assert await cache.fold(llm_client, 'group', episodes) == 'Alice lives in Paris'
+
+        assert llm_client.generate_response.await_count == 1
+        assert cache.get('group') == 'Alice lives in Paris'
+        assert cache.get('other') is None
+
+    @pytest.mark.asyncio
+    async def test_failed_fold_can_be_retried(self):
+        llm_client = MagicMock()
+        llm_client.generate_response = AsyncMock(
+            side_effect=[RuntimeError('boom'), {'summary': 's'}]
+        )
+        cache = EpisodeSummaryCache()
+        episodes = [_make_episode('content', 0)]
+
+        with pytest.raises(RuntimeError):
+            await cache.fold(llm_client, 'group', episodes)
+        assert await cache.fold(llm_client, 'group', episodes) == 's'
+
+    @pytest.mark.asyncio
+    async def test_fold_uses_rolling_summary_prompt_within_budget(self):
+        llm_client = MagicMock()
+        llm_client.generate_response = AsyncMock(return_value={'summary': 'summary'})
+        small_cache = EpisodeSummaryCache(token_budget=400)
+        large_cache = EpisodeSummaryCache(token_budget=4000)
+        episodes = [_make_episode('Alice moved to Paris.', 0)]
+
+        await small_cache.fold(llm_client, 'group', episodes)
+        messages = llm_client.generate_response.await_args.args[0]
+        assert llm_client.generate_response.await_args.kwargs['prompt_name'] == (
+            'summarize_episodes.rolling_summary'
+        )
+        assert f'LESS THAN {small_cache.summary_max_characters} CHARACTERS' in messages[1].content
+        assert 'Alice moved to Paris.' in messages[1].content
+        assert large_cache.summary_max_characters == 10 * small_cache.summary_max_characters
@@ -0,0 +1,65 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pytest
+
+from graphiti_core.nodes import EntityNode
+from graphiti_core.utils.resolution_memo import (
+    InMemoryEntityResolutionMemo,
+    SQLiteEntityResolutionMemo,
+    resolution_memo_key,
+)
+
+
+def test_resolution_memo_key_normalizes_name_and_labels():
+    node = EntityNode(name='  ACME   Corp ', group_id='group', labels=['Organization', 'Entity'])
+    assert resolution_memo_key(node) == ('group', 'acme corp', 'Organization')
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('backend', ['memory', 'sqlite'])
+async def test_resolution_memo_roundtrip_and_invalidation(backend, tmp_path):
+    memo = (
+        InMemoryEntityResolutionMemo()
+        if backend == 'memory'
+        else SQLiteEntityResolutionMemo(tmp_path / 'memo.sqlite')
+    )
+    acme = ('group', 'acme corp', 'Organization')
+    manager = ('group', 'my manager', '')
+
+    await memo.set_many({acme: 'uuid-1', manager: 'uuid-2'})
+    assert await memo.get_many([acme, manager, ('other', 'acme corp', '')]) == {
+        acme: 'uuid-1',
+        manager: 'uuid-2',
+    }
+
+    await memo.invalidate_uuids(['uuid-1'])
+    assert await memo.get_many([acme, manager]) == {manager: 'uuid-2'}
+    await memo.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_resolution_memo_persists(tmp_path):
+    path = tmp_path / 'memo.sqlite'
+    key = ('group', 'the api', '')
+
+    memo = SQLiteEntityResolutionMemo(path)
+    await memo.set_many({key: 'uuid-1'})
+    await memo.close()
+
+    reopened = SQLiteEntityResolutionMemo(path)
+    assert await reopened.get_many([key]) == {key: 'uuid-1'}
+    await reopened.close()